@@ -1,2 +1,22 @@
 # http://www.python.org/dev/peps/pep-0396/
 __version__ = '0.4.10'
+
+# The ASN.1 modules are not imported with the package.  Each one is
+# imported on first attribute access (PEP 562), so that, for example,
+# pyasn1_alt_modules.rfc5280.Certificate works after a bare
+# "import pyasn1_alt_modules" without paying for the other modules.
+
+import importlib
+
+from pyasn1_alt_modules._index import modules as _modules
+
+
+def __getattr__(name):
+    if name in _modules:
+        return importlib.import_module('.' + name, __name__)
+    raise AttributeError(
+        'module %r has no attribute %r' % (__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_modules))
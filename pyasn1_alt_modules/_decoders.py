@@ -0,0 +1,5875 @@
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+# Generated by tools/mkdecoders.py -- do not edit.
+#
+
+from pyasn1_alt_modules.codegen import Fallback
+from pyasn1_alt_modules.plan import _BitStringNode
+from pyasn1_alt_modules.plan import _BooleanNode
+from pyasn1_alt_modules.plan import _NullNode
+from pyasn1_alt_modules.plan import _node
+from pyasn1_alt_modules.tlv import readHeader as _h
+from pyasn1_alt_modules import rfc3161
+from pyasn1_alt_modules import rfc5280
+from pyasn1_alt_modules import rfc5652
+from pyasn1_alt_modules import rfc6960
+
+generatorVersion = 3
+
+_bitString = _BitStringNode.convert
+_boolean = _BooleanNode.convert
+_null = _NullNode.convert
+
+_S0 = rfc5280.Certificate()
+_S1 = _S0.componentType[0].asn1Object
+_S2 = _S0.componentType[1].asn1Object
+_S3 = _S0.componentType[2].asn1Object
+_S4 = _S1.componentType[0].asn1Object
+_S5 = _S1.componentType[1].asn1Object
+_S6 = _S1.componentType[2].asn1Object
+_S7 = _S1.componentType[3].asn1Object
+_S8 = _S1.componentType[4].asn1Object
+_S9 = _S1.componentType[5].asn1Object
+_S10 = _S1.componentType[6].asn1Object
+_S11 = _S1.componentType[7].asn1Object
+_S12 = _S1.componentType[8].asn1Object
+_S13 = _S1.componentType[9].asn1Object
+_S14 = _S2.componentType[0].asn1Object
+_P14 = _node(_S14)
+_S15 = _S2.componentType[1].asn1Object
+_S16 = _S7.componentType[0].asn1Object
+_S17 = _S8.componentType[0].asn1Object
+_S18 = _S8.componentType[1].asn1Object
+_S19 = _S10.componentType[0].asn1Object
+_S20 = _S10.componentType[1].asn1Object
+_S21 = _S13.componentType
+_S22 = _S16.componentType
+_S23 = _S17.componentType[0].asn1Object
+_S24 = _S17.componentType[1].asn1Object
+_S25 = _S21.componentType[0].asn1Object
+_P25 = _node(_S25)
+_S26 = _S21.componentType[1].asn1Object
+_S27 = _S21.componentType[2].asn1Object
+_S28 = _S22.componentType
+_S29 = _S28.componentType[0].asn1Object
+_P29 = _node(_S29)
+_S30 = _S28.componentType[1].asn1Object
+_S31 = rfc5280.CertificateList()
+_S32 = _S31.componentType[0].asn1Object
+_S33 = _S31.componentType[1].asn1Object
+_S34 = _S31.componentType[2].asn1Object
+_S35 = _S32.componentType[0].asn1Object
+_S36 = _S32.componentType[1].asn1Object
+_S37 = _S32.componentType[2].asn1Object
+_S38 = _S32.componentType[3].asn1Object
+_S39 = _S32.componentType[4].asn1Object
+_S40 = _S32.componentType[5].asn1Object
+_S41 = _S32.componentType[6].asn1Object
+_S42 = _S40.componentType
+_S43 = _S42.componentType[0].asn1Object
+_S44 = _S42.componentType[1].asn1Object
+_S45 = _S42.componentType[2].asn1Object
+_S46 = rfc6960.BasicOCSPResponse()
+_S47 = _S46.componentType[0].asn1Object
+_S48 = _S46.componentType[1].asn1Object
+_S49 = _S46.componentType[2].asn1Object
+_S50 = _S46.componentType[3].asn1Object
+_S51 = _S47.componentType[0].asn1Object
+_S52 = _S47.componentType[1].asn1Object
+_S53 = _S47.componentType[2].asn1Object
+_S54 = _S47.componentType[3].asn1Object
+_S55 = _S47.componentType[4].asn1Object
+_S56 = _S50.componentType
+_S57 = _S52.componentType[0].asn1Object
+_S58 = _S52.componentType[1].asn1Object
+_S59 = _S54.componentType
+_S60 = _S59.componentType[0].asn1Object
+_S61 = _S59.componentType[1].asn1Object
+_S62 = _S59.componentType[2].asn1Object
+_S63 = _S59.componentType[3].asn1Object
+_S64 = _S59.componentType[4].asn1Object
+_S65 = _S60.componentType[0].asn1Object
+_S66 = _S60.componentType[1].asn1Object
+_S67 = _S60.componentType[2].asn1Object
+_S68 = _S60.componentType[3].asn1Object
+_S69 = _S61.componentType[0].asn1Object
+_S70 = _S61.componentType[1].asn1Object
+_S71 = _S61.componentType[2].asn1Object
+_S72 = _S70.componentType[0].asn1Object
+_S73 = _S70.componentType[1].asn1Object
+_S74 = rfc5652.SignedData()
+_S75 = _S74.componentType[0].asn1Object
+_S76 = _S74.componentType[1].asn1Object
+_S77 = _S74.componentType[2].asn1Object
+_S78 = _S74.componentType[3].asn1Object
+_S79 = _S74.componentType[4].asn1Object
+_S80 = _S74.componentType[5].asn1Object
+_S81 = _S76.componentType
+_S82 = _S77.componentType[0].asn1Object
+_P82 = _node(_S82)
+_S83 = _S77.componentType[1].asn1Object
+_S84 = _S78.componentType
+_S85 = _S79.componentType
+_S86 = _S80.componentType
+_S87 = _S84.componentType[0].asn1Object
+_S88 = _S84.componentType[1].asn1Object
+_S89 = _S84.componentType[2].asn1Object
+_S90 = _S84.componentType[3].asn1Object
+_S91 = _S84.componentType[4].asn1Object
+_S92 = _S85.componentType[0].asn1Object
+_S93 = _S85.componentType[1].asn1Object
+_S94 = _S86.componentType[0].asn1Object
+_S95 = _S86.componentType[1].asn1Object
+_S96 = _S86.componentType[2].asn1Object
+_S97 = _S86.componentType[3].asn1Object
+_S98 = _S86.componentType[4].asn1Object
+_S99 = _S86.componentType[5].asn1Object
+_S100 = _S86.componentType[6].asn1Object
+_S101 = _S88.componentType[0].asn1Object
+_S102 = _S88.componentType[1].asn1Object
+_S103 = _S88.componentType[2].asn1Object
+_S104 = _S89.componentType[0].asn1Object
+_S105 = _S89.componentType[1].asn1Object
+_S106 = _S89.componentType[2].asn1Object
+_S107 = _S90.componentType[0].asn1Object
+_S108 = _S90.componentType[1].asn1Object
+_S109 = _S90.componentType[2].asn1Object
+_S110 = _S91.componentType[0].asn1Object
+_P110 = _node(_S110)
+_S111 = _S91.componentType[1].asn1Object
+_S112 = _S93.componentType[0].asn1Object
+_P112 = _node(_S112)
+_S113 = _S93.componentType[1].asn1Object
+_S114 = _S95.componentType[0].asn1Object
+_S115 = _S95.componentType[1].asn1Object
+_S116 = _S97.componentType
+_S117 = _S100.componentType
+_S118 = _S101.componentType[0].asn1Object
+_S119 = _S101.componentType[1].asn1Object
+_S120 = _S101.componentType[2].asn1Object
+_S121 = _S104.componentType[0].asn1Object
+_S122 = _S104.componentType[1].asn1Object
+_S123 = _S104.componentType[2].asn1Object
+_S124 = _S104.componentType[3].asn1Object
+_S125 = _S104.componentType[4].asn1Object
+_S126 = _S104.componentType[5].asn1Object
+_S127 = _S104.componentType[6].asn1Object
+_S128 = _S104.componentType[7].asn1Object
+_S129 = _S104.componentType[8].asn1Object
+_S130 = _S107.componentType[0].asn1Object
+_S131 = _S107.componentType[1].asn1Object
+_S132 = _S107.componentType[2].asn1Object
+_S133 = _S107.componentType[3].asn1Object
+_S134 = _S107.componentType[4].asn1Object
+_S135 = _S107.componentType[5].asn1Object
+_S136 = _S107.componentType[6].asn1Object
+_S137 = _S107.componentType[7].asn1Object
+_S138 = _S107.componentType[8].asn1Object
+_S139 = _S108.componentType[0].asn1Object
+_P139 = _node(_S139)
+_S140 = _S108.componentType[1].asn1Object
+_S141 = _S114.componentType[0].asn1Object
+_S142 = _S114.componentType[1].asn1Object
+_S143 = _S116.componentType[0].asn1Object
+_P143 = _node(_S143)
+_S144 = _S116.componentType[1].asn1Object
+_S145 = _S120.componentType
+_S146 = _S122.componentType[0].asn1Object
+_S147 = _S122.componentType[1].asn1Object
+_S148 = _S123.componentType
+_S149 = _S126.componentType[0].asn1Object
+_S150 = _S126.componentType[1].asn1Object
+_S151 = _S127.componentType
+_S152 = _S131.componentType[0].asn1Object
+_S153 = _S131.componentType[1].asn1Object
+_S154 = _S131.componentType[2].asn1Object
+_S155 = _S132.componentType[0].asn1Object
+_S156 = _S132.componentType[1].asn1Object
+_S157 = _S136.componentType
+_S158 = _S138.componentType
+_S159 = _S144.componentType
+_S160 = _S146.componentType[0].asn1Object
+_S161 = _S146.componentType[1].asn1Object
+_S162 = _S146.componentType[2].asn1Object
+_S163 = _S148.componentType[0].asn1Object
+_S164 = _S148.componentType[1].asn1Object
+_S165 = _S148.componentType[2].asn1Object
+_S166 = _S148.componentType[3].asn1Object
+_S167 = _S148.componentType[4].asn1Object
+_S168 = _S148.componentType[5].asn1Object
+_S169 = _S148.componentType[6].asn1Object
+_S170 = _S148.componentType[7].asn1Object
+_S171 = _S148.componentType[8].asn1Object
+_P171 = _node(_S171)
+_S172 = _S151.componentType[0].asn1Object
+_P172 = _node(_S172)
+_S173 = _S151.componentType[1].asn1Object
+_S174 = _S153.componentType
+_S175 = _S154.componentType[0].asn1Object
+_S176 = _S154.componentType[1].asn1Object
+_P176 = _node(_S176)
+_S177 = _S154.componentType[2].asn1Object
+_S178 = _S154.componentType[3].asn1Object
+_S179 = _S156.componentType[0].asn1Object
+_S180 = _S156.componentType[1].asn1Object
+_S181 = _S156.componentType[2].asn1Object
+_S182 = _S157.componentType[0].asn1Object
+_P182 = _node(_S182)
+_S183 = _S157.componentType[1].asn1Object
+_S184 = _S158.componentType[0].asn1Object
+_P184 = _node(_S184)
+_S185 = _S158.componentType[1].asn1Object
+_S186 = _S158.componentType[2].asn1Object
+_S187 = _S163.componentType[0].asn1Object
+_P187 = _node(_S187)
+_S188 = _S163.componentType[1].asn1Object
+_S189 = _S166.componentType[0].asn1Object
+_S190 = _S166.componentType[1].asn1Object
+_S191 = _S166.componentType[2].asn1Object
+_S192 = _S168.componentType[0].asn1Object
+_S193 = _S168.componentType[1].asn1Object
+_S194 = _S173.componentType
+_S195 = _S174.componentType[0].asn1Object
+_S196 = _S174.componentType[1].asn1Object
+_S197 = _S174.componentType[2].asn1Object
+_S198 = _S174.componentType[3].asn1Object
+_S199 = _S174.componentType[4].asn1Object
+_S200 = _S174.componentType[5].asn1Object
+_S201 = _S174.componentType[6].asn1Object
+_S202 = _S174.componentType[7].asn1Object
+_S203 = _S174.componentType[8].asn1Object
+_P203 = _node(_S203)
+_S204 = _S183.componentType
+_S205 = _S189.componentType[0].asn1Object
+_S206 = _S189.componentType[1].asn1Object
+_S207 = _S189.componentType[2].asn1Object
+_S208 = _S189.componentType[3].asn1Object
+_S209 = _S189.componentType[4].asn1Object
+_S210 = _S189.componentType[5].asn1Object
+_S211 = _S189.componentType[6].asn1Object
+_S212 = _S189.componentType[7].asn1Object
+_P212 = _node(_S212)
+_S213 = _S189.componentType[8].asn1Object
+_S214 = _S190.componentType
+_S215 = _S191.componentType
+_S216 = _S192.componentType[0].asn1Object
+_S217 = _S192.componentType[1].asn1Object
+_S218 = _S192.componentType[2].asn1Object
+_S219 = _S192.componentType[3].asn1Object
+_S220 = _S192.componentType[4].asn1Object
+_S221 = _S195.componentType[0].asn1Object
+_P221 = _node(_S221)
+_S222 = _S195.componentType[1].asn1Object
+_S223 = _S198.componentType[0].asn1Object
+_S224 = _S198.componentType[1].asn1Object
+_S225 = _S198.componentType[2].asn1Object
+_S226 = _S199.componentType[0].asn1Object
+_S227 = _S200.componentType[0].asn1Object
+_S228 = _S200.componentType[1].asn1Object
+_S229 = _S205.componentType[0].asn1Object
+_S230 = _S205.componentType[1].asn1Object
+_S231 = _S206.componentType[0].asn1Object
+_S232 = _S206.componentType[1].asn1Object
+_S233 = _S209.componentType[0].asn1Object
+_S234 = _S209.componentType[1].asn1Object
+_S235 = _S213.componentType
+_S236 = _S214.componentType[0].asn1Object
+_S237 = _S214.componentType[1].asn1Object
+_S238 = _S215.componentType[0].asn1Object
+_S239 = _S215.componentType[1].asn1Object
+_S240 = _S223.componentType[0].asn1Object
+_S241 = _S223.componentType[1].asn1Object
+_S242 = _S223.componentType[2].asn1Object
+_S243 = _S223.componentType[3].asn1Object
+_S244 = _S223.componentType[4].asn1Object
+_S245 = _S223.componentType[5].asn1Object
+_S246 = _S223.componentType[6].asn1Object
+_S247 = _S223.componentType[7].asn1Object
+_P247 = _node(_S247)
+_S248 = _S223.componentType[8].asn1Object
+_S249 = _S224.componentType
+_S250 = _S225.componentType
+_S251 = _S226.componentType
+_S252 = _S227.componentType[0].asn1Object
+_S253 = _S227.componentType[1].asn1Object
+_S254 = _S227.componentType[2].asn1Object
+_S255 = _S227.componentType[3].asn1Object
+_S256 = _S227.componentType[4].asn1Object
+_S257 = _S240.componentType[0].asn1Object
+_S258 = _S240.componentType[1].asn1Object
+_S259 = _S241.componentType[0].asn1Object
+_S260 = _S241.componentType[1].asn1Object
+_S261 = _S244.componentType[0].asn1Object
+_S262 = _S244.componentType[1].asn1Object
+_S263 = _S248.componentType
+_S264 = _S249.componentType[0].asn1Object
+_S265 = _S249.componentType[1].asn1Object
+_S266 = _S250.componentType[0].asn1Object
+_S267 = _S250.componentType[1].asn1Object
+_S268 = _S251.componentType
+_S269 = _S268.componentType[0].asn1Object
+_P269 = _node(_S269)
+_S270 = _S268.componentType[1].asn1Object
+_S271 = rfc3161.TSTInfo()
+_S272 = _S271.componentType[0].asn1Object
+_S273 = _S271.componentType[1].asn1Object
+_P273 = _node(_S273)
+_S274 = _S271.componentType[2].asn1Object
+_S275 = _S271.componentType[3].asn1Object
+_S276 = _S271.componentType[4].asn1Object
+_S277 = _S271.componentType[5].asn1Object
+_S278 = _S271.componentType[6].asn1Object
+_S279 = _S271.componentType[7].asn1Object
+_S280 = _S271.componentType[8].asn1Object
+_S281 = _S271.componentType[9].asn1Object
+_S282 = _S274.componentType[0].asn1Object
+_S283 = _S274.componentType[1].asn1Object
+_S284 = _S277.componentType[0].asn1Object
+_S285 = _S277.componentType[1].asn1Object
+_S286 = _S277.componentType[2].asn1Object
+
+
+def _d0(s, p, k, vs, ve, f):
+    # Certificate
+    if not f:
+        raise Fallback
+    o = _S0.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # tbsCertificate
+    if k != 0x10:
+        raise Fallback
+    v = _d1(s, p, k, vs, ve, f)
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # signatureAlgorithm
+    if k != 0x10:
+        raise Fallback
+    v = _d2(s, p, k, vs, ve, f)
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # signature
+    if k != 0x3:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S3.clone(_bitString(s[vs:ve]))
+    o.setComponentByPosition(2, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d1(s, p, k, vs, ve, f):
+    # TBSCertificate
+    if not f:
+        raise Fallback
+    o = _S1.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # version
+    if k == 0x80:
+        k, f, vs, e1 = _h(s, vs, ve)
+        if k != 0x2 or e1 != ve:
+            raise Fallback
+        if f:
+            raise Fallback
+        v = _S4.clone(int.from_bytes(s[vs:ve], 'big', signed=True))
+        o.setComponentByPosition(0, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # serialNumber
+    if k != 0x2:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S5.clone(int.from_bytes(s[vs:ve], 'big', signed=True))
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # signature
+    if k != 0x10:
+        raise Fallback
+    v = _d6(s, p, k, vs, ve, f)
+    o.setComponentByPosition(2, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # issuer
+    if k != 0x10:
+        raise Fallback
+    v = _d7(s, p, k, vs, ve, f)
+    o.setComponentByPosition(3, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # validity
+    if k != 0x10:
+        raise Fallback
+    v = _d8(s, p, k, vs, ve, f)
+    o.setComponentByPosition(4, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # subject
+    if k != 0x10:
+        raise Fallback
+    v = _d9(s, p, k, vs, ve, f)
+    o.setComponentByPosition(5, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # subjectPublicKeyInfo
+    if k != 0x10:
+        raise Fallback
+    v = _d10(s, p, k, vs, ve, f)
+    o.setComponentByPosition(6, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # issuerUniqueID
+    if k == 0x81:
+        if f:
+            raise Fallback
+        v = _S11.clone(_bitString(s[vs:ve]))
+        o.setComponentByPosition(7, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # subjectUniqueID
+    if k == 0x82:
+        if f:
+            raise Fallback
+        v = _S12.clone(_bitString(s[vs:ve]))
+        o.setComponentByPosition(8, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # extensions
+    if k == 0x83:
+        v = _d13(s, p, k, vs, ve, f)
+        o.setComponentByPosition(9, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d2(s, p, k, vs, ve, f):
+    # AlgorithmIdentifier
+    if not f:
+        raise Fallback
+    o = _S2.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # algorithm
+    if k != 0x6:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _P14.table.intern(s[vs:ve])
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # parameters
+    if k is not None:
+        v = _S15.clone(s[p:ve])
+        o.setComponentByPosition(1, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d6(s, p, k, vs, ve, f):
+    # AlgorithmIdentifier
+    if not f:
+        raise Fallback
+    o = _S6.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # algorithm
+    if k != 0x6:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _P14.table.intern(s[vs:ve])
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # parameters
+    if k is not None:
+        v = _S15.clone(s[p:ve])
+        o.setComponentByPosition(1, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d7(s, p, k, vs, ve, f):
+    # Name
+    o = _S7.clone()
+    if k == 0x10:  # rdnSequence
+        v = _d16(s, p, k, vs, ve, f)
+        o.setComponentByPosition(0, v, False, False, False)
+    else:
+        raise Fallback
+    return o
+
+
+def _d8(s, p, k, vs, ve, f):
+    # Validity
+    if not f:
+        raise Fallback
+    o = _S8.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # notBefore
+    if k not in (0x17, 0x18):
+        raise Fallback
+    v = _d17(s, p, k, vs, ve, f)
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # notAfter
+    if k not in (0x17, 0x18):
+        raise Fallback
+    v = _d18(s, p, k, vs, ve, f)
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d9(s, p, k, vs, ve, f):
+    # Name
+    o = _S9.clone()
+    if k == 0x10:  # rdnSequence
+        v = _d16(s, p, k, vs, ve, f)
+        o.setComponentByPosition(0, v, False, False, False)
+    else:
+        raise Fallback
+    return o
+
+
+def _d10(s, p, k, vs, ve, f):
+    # SubjectPublicKeyInfo
+    if not f:
+        raise Fallback
+    o = _S10.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # algorithm
+    if k != 0x10:
+        raise Fallback
+    v = _d19(s, p, k, vs, ve, f)
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # subjectPublicKey
+    if k != 0x3:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S20.clone(_bitString(s[vs:ve]))
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d13(s, p, k, vs, ve, f):
+    # Extensions
+    k, f, vs, e1 = _h(s, vs, ve)
+    if k != 0x10 or e1 != ve:
+        raise Fallback
+    if not f:
+        raise Fallback
+    o = _S13.clone()
+    o.clear()
+    e = ve
+    p = vs
+    i = 0
+    while p < e:
+        k, f, vs, ve = _h(s, p, e)
+        if k != 0x10:
+            raise Fallback
+        v = _d21(s, p, k, vs, ve, f)
+        o.setComponentByPosition(i, v, False, False, False)
+        i += 1
+        p = ve
+    return o
+
+
+def _d16(s, p, k, vs, ve, f):
+    # RDNSequence
+    if not f:
+        raise Fallback
+    o = _S16.clone()
+    o.clear()
+    e = ve
+    p = vs
+    i = 0
+    while p < e:
+        k, f, vs, ve = _h(s, p, e)
+        if k != 0x11:
+            raise Fallback
+        v = _d22(s, p, k, vs, ve, f)
+        o.setComponentByPosition(i, v, False, False, False)
+        i += 1
+        p = ve
+    return o
+
+
+def _d17(s, p, k, vs, ve, f):
+    # Time
+    o = _S17.clone()
+    if k == 0x17:  # utcTime
+        if f:
+            raise Fallback
+        v = _S23.clone(s[vs:ve])
+        o.setComponentByPosition(0, v, False, False, False)
+    elif k == 0x18:  # generalTime
+        if f:
+            raise Fallback
+        v = _S24.clone(s[vs:ve])
+        o.setComponentByPosition(1, v, False, False, False)
+    else:
+        raise Fallback
+    return o
+
+
+def _d18(s, p, k, vs, ve, f):
+    # Time
+    o = _S18.clone()
+    if k == 0x17:  # utcTime
+        if f:
+            raise Fallback
+        v = _S23.clone(s[vs:ve])
+        o.setComponentByPosition(0, v, False, False, False)
+    elif k == 0x18:  # generalTime
+        if f:
+            raise Fallback
+        v = _S24.clone(s[vs:ve])
+        o.setComponentByPosition(1, v, False, False, False)
+    else:
+        raise Fallback
+    return o
+
+
+def _d19(s, p, k, vs, ve, f):
+    # AlgorithmIdentifier
+    if not f:
+        raise Fallback
+    o = _S19.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # algorithm
+    if k != 0x6:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _P14.table.intern(s[vs:ve])
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # parameters
+    if k is not None:
+        v = _S15.clone(s[p:ve])
+        o.setComponentByPosition(1, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d21(s, p, k, vs, ve, f):
+    # Extension
+    if not f:
+        raise Fallback
+    o = _S21.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # extnID
+    if k != 0x6:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _P25.table.intern(s[vs:ve])
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # critical
+    if k == 0x1:
+        if f:
+            raise Fallback
+        v = _S26.clone(_boolean(s[vs:ve]))
+        o.setComponentByPosition(1, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # extnValue
+    if k != 0x4:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S27.clone(s[vs:ve])
+    o.setComponentByPosition(2, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d22(s, p, k, vs, ve, f):
+    # RelativeDistinguishedName
+    if not f:
+        raise Fallback
+    o = _S22.clone()
+    o.clear()
+    e = ve
+    p = vs
+    i = 0
+    while p < e:
+        k, f, vs, ve = _h(s, p, e)
+        if k != 0x10:
+            raise Fallback
+        v = _d28(s, p, k, vs, ve, f)
+        o.setComponentByPosition(i, v, False, False, False)
+        i += 1
+        p = ve
+    return o
+
+
+def _d28(s, p, k, vs, ve, f):
+    # AttributeTypeAndValue
+    if not f:
+        raise Fallback
+    o = _S28.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # type
+    if k != 0x6:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _P29.table.intern(s[vs:ve])
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # value
+    if k is None:
+        raise Fallback
+    v = _S30.clone(s[p:ve])
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def decode_rfc5280_Certificate(s):
+    p = 0
+    k, f, vs, ve = _h(s, 0, len(s))
+    if k != 0x10:
+        raise Fallback
+    v = _d0(s, p, k, vs, ve, f)
+    return v, ve
+
+
+def _d31(s, p, k, vs, ve, f):
+    # CertificateList
+    if not f:
+        raise Fallback
+    o = _S31.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # tbsCertList
+    if k != 0x10:
+        raise Fallback
+    v = _d32(s, p, k, vs, ve, f)
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # signatureAlgorithm
+    if k != 0x10:
+        raise Fallback
+    v = _d33(s, p, k, vs, ve, f)
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # signature
+    if k != 0x3:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S34.clone(_bitString(s[vs:ve]))
+    o.setComponentByPosition(2, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d32(s, p, k, vs, ve, f):
+    # TBSCertList
+    if not f:
+        raise Fallback
+    o = _S32.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # version
+    if k == 0x2:
+        if f:
+            raise Fallback
+        v = _S35.clone(int.from_bytes(s[vs:ve], 'big', signed=True))
+        o.setComponentByPosition(0, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # signature
+    if k != 0x10:
+        raise Fallback
+    v = _d36(s, p, k, vs, ve, f)
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # issuer
+    if k != 0x10:
+        raise Fallback
+    v = _d37(s, p, k, vs, ve, f)
+    o.setComponentByPosition(2, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # thisUpdate
+    if k not in (0x17, 0x18):
+        raise Fallback
+    v = _d38(s, p, k, vs, ve, f)
+    o.setComponentByPosition(3, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # nextUpdate
+    if k in (0x17, 0x18):
+        v = _d39(s, p, k, vs, ve, f)
+        o.setComponentByPosition(4, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # revokedCertificates
+    if k == 0x10:
+        v = _d40(s, p, k, vs, ve, f)
+        o.setComponentByPosition(5, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # crlExtensions
+    if k == 0x80:
+        v = _d41(s, p, k, vs, ve, f)
+        o.setComponentByPosition(6, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d33(s, p, k, vs, ve, f):
+    # AlgorithmIdentifier
+    if not f:
+        raise Fallback
+    o = _S33.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # algorithm
+    if k != 0x6:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _P14.table.intern(s[vs:ve])
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # parameters
+    if k is not None:
+        v = _S15.clone(s[p:ve])
+        o.setComponentByPosition(1, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d36(s, p, k, vs, ve, f):
+    # AlgorithmIdentifier
+    if not f:
+        raise Fallback
+    o = _S36.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # algorithm
+    if k != 0x6:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _P14.table.intern(s[vs:ve])
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # parameters
+    if k is not None:
+        v = _S15.clone(s[p:ve])
+        o.setComponentByPosition(1, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d37(s, p, k, vs, ve, f):
+    # Name
+    o = _S37.clone()
+    if k == 0x10:  # rdnSequence
+        v = _d16(s, p, k, vs, ve, f)
+        o.setComponentByPosition(0, v, False, False, False)
+    else:
+        raise Fallback
+    return o
+
+
+def _d38(s, p, k, vs, ve, f):
+    # Time
+    o = _S38.clone()
+    if k == 0x17:  # utcTime
+        if f:
+            raise Fallback
+        v = _S23.clone(s[vs:ve])
+        o.setComponentByPosition(0, v, False, False, False)
+    elif k == 0x18:  # generalTime
+        if f:
+            raise Fallback
+        v = _S24.clone(s[vs:ve])
+        o.setComponentByPosition(1, v, False, False, False)
+    else:
+        raise Fallback
+    return o
+
+
+def _d39(s, p, k, vs, ve, f):
+    # Time
+    o = _S39.clone()
+    if k == 0x17:  # utcTime
+        if f:
+            raise Fallback
+        v = _S23.clone(s[vs:ve])
+        o.setComponentByPosition(0, v, False, False, False)
+    elif k == 0x18:  # generalTime
+        if f:
+            raise Fallback
+        v = _S24.clone(s[vs:ve])
+        o.setComponentByPosition(1, v, False, False, False)
+    else:
+        raise Fallback
+    return o
+
+
+def _d40(s, p, k, vs, ve, f):
+    # SequenceOf
+    if not f:
+        raise Fallback
+    o = _S40.clone()
+    o.clear()
+    e = ve
+    p = vs
+    i = 0
+    while p < e:
+        k, f, vs, ve = _h(s, p, e)
+        if k != 0x10:
+            raise Fallback
+        v = _d42(s, p, k, vs, ve, f)
+        o.setComponentByPosition(i, v, False, False, False)
+        i += 1
+        p = ve
+    return o
+
+
+def _d41(s, p, k, vs, ve, f):
+    # Extensions
+    k, f, vs, e1 = _h(s, vs, ve)
+    if k != 0x10 or e1 != ve:
+        raise Fallback
+    if not f:
+        raise Fallback
+    o = _S41.clone()
+    o.clear()
+    e = ve
+    p = vs
+    i = 0
+    while p < e:
+        k, f, vs, ve = _h(s, p, e)
+        if k != 0x10:
+            raise Fallback
+        v = _d21(s, p, k, vs, ve, f)
+        o.setComponentByPosition(i, v, False, False, False)
+        i += 1
+        p = ve
+    return o
+
+
+def _d42(s, p, k, vs, ve, f):
+    # Sequence
+    if not f:
+        raise Fallback
+    o = _S42.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # userCertificate
+    if k != 0x2:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S43.clone(int.from_bytes(s[vs:ve], 'big', signed=True))
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # revocationDate
+    if k not in (0x17, 0x18):
+        raise Fallback
+    v = _d44(s, p, k, vs, ve, f)
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # crlEntryExtensions
+    if k == 0x10:
+        v = _d45(s, p, k, vs, ve, f)
+        o.setComponentByPosition(2, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d44(s, p, k, vs, ve, f):
+    # Time
+    o = _S44.clone()
+    if k == 0x17:  # utcTime
+        if f:
+            raise Fallback
+        v = _S23.clone(s[vs:ve])
+        o.setComponentByPosition(0, v, False, False, False)
+    elif k == 0x18:  # generalTime
+        if f:
+            raise Fallback
+        v = _S24.clone(s[vs:ve])
+        o.setComponentByPosition(1, v, False, False, False)
+    else:
+        raise Fallback
+    return o
+
+
+def _d45(s, p, k, vs, ve, f):
+    # Extensions
+    if not f:
+        raise Fallback
+    o = _S45.clone()
+    o.clear()
+    e = ve
+    p = vs
+    i = 0
+    while p < e:
+        k, f, vs, ve = _h(s, p, e)
+        if k != 0x10:
+            raise Fallback
+        v = _d21(s, p, k, vs, ve, f)
+        o.setComponentByPosition(i, v, False, False, False)
+        i += 1
+        p = ve
+    return o
+
+
+def decode_rfc5280_CertificateList(s):
+    p = 0
+    k, f, vs, ve = _h(s, 0, len(s))
+    if k != 0x10:
+        raise Fallback
+    v = _d31(s, p, k, vs, ve, f)
+    return v, ve
+
+
+def _d46(s, p, k, vs, ve, f):
+    # BasicOCSPResponse
+    if not f:
+        raise Fallback
+    o = _S46.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # tbsResponseData
+    if k != 0x10:
+        raise Fallback
+    v = _d47(s, p, k, vs, ve, f)
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # signatureAlgorithm
+    if k != 0x10:
+        raise Fallback
+    v = _d48(s, p, k, vs, ve, f)
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # signature
+    if k != 0x3:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S49.clone(_bitString(s[vs:ve]))
+    o.setComponentByPosition(2, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # certs
+    if k == 0x80:
+        v = _d50(s, p, k, vs, ve, f)
+        o.setComponentByPosition(3, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d47(s, p, k, vs, ve, f):
+    # ResponseData
+    if not f:
+        raise Fallback
+    o = _S47.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # version
+    if k == 0x80:
+        k, f, vs, e1 = _h(s, vs, ve)
+        if k != 0x2 or e1 != ve:
+            raise Fallback
+        if f:
+            raise Fallback
+        v = _S51.clone(int.from_bytes(s[vs:ve], 'big', signed=True))
+        o.setComponentByPosition(0, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # responderID
+    if k not in (0x81, 0x82):
+        raise Fallback
+    v = _d52(s, p, k, vs, ve, f)
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # producedAt
+    if k != 0x18:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S53.clone(s[vs:ve])
+    o.setComponentByPosition(2, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # responses
+    if k != 0x10:
+        raise Fallback
+    v = _d54(s, p, k, vs, ve, f)
+    o.setComponentByPosition(3, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # responseExtensions
+    if k == 0x81:
+        v = _d55(s, p, k, vs, ve, f)
+        o.setComponentByPosition(4, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d48(s, p, k, vs, ve, f):
+    # AlgorithmIdentifier
+    if not f:
+        raise Fallback
+    o = _S48.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # algorithm
+    if k != 0x6:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _P14.table.intern(s[vs:ve])
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # parameters
+    if k is not None:
+        v = _S15.clone(s[p:ve])
+        o.setComponentByPosition(1, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d50(s, p, k, vs, ve, f):
+    # SequenceOf
+    k, f, vs, e1 = _h(s, vs, ve)
+    if k != 0x10 or e1 != ve:
+        raise Fallback
+    if not f:
+        raise Fallback
+    o = _S50.clone()
+    o.clear()
+    e = ve
+    p = vs
+    i = 0
+    while p < e:
+        k, f, vs, ve = _h(s, p, e)
+        if k != 0x10:
+            raise Fallback
+        v = _d56(s, p, k, vs, ve, f)
+        o.setComponentByPosition(i, v, False, False, False)
+        i += 1
+        p = ve
+    return o
+
+
+def _d52(s, p, k, vs, ve, f):
+    # ResponderID
+    o = _S52.clone()
+    if k == 0x81:  # byName
+        v = _d57(s, p, k, vs, ve, f)
+        o.setComponentByPosition(0, v, False, False, False)
+    elif k == 0x82:  # byKey
+        k, f, vs, e1 = _h(s, vs, ve)
+        if k != 0x4 or e1 != ve:
+            raise Fallback
+        if f:
+            raise Fallback
+        v = _S58.clone(s[vs:ve])
+        o.setComponentByPosition(1, v, False, False, False)
+    else:
+        raise Fallback
+    return o
+
+
+def _d54(s, p, k, vs, ve, f):
+    # SequenceOf
+    if not f:
+        raise Fallback
+    o = _S54.clone()
+    o.clear()
+    e = ve
+    p = vs
+    i = 0
+    while p < e:
+        k, f, vs, ve = _h(s, p, e)
+        if k != 0x10:
+            raise Fallback
+        v = _d59(s, p, k, vs, ve, f)
+        o.setComponentByPosition(i, v, False, False, False)
+        i += 1
+        p = ve
+    return o
+
+
+def _d55(s, p, k, vs, ve, f):
+    # Extensions
+    k, f, vs, e1 = _h(s, vs, ve)
+    if k != 0x10 or e1 != ve:
+        raise Fallback
+    if not f:
+        raise Fallback
+    o = _S55.clone()
+    o.clear()
+    e = ve
+    p = vs
+    i = 0
+    while p < e:
+        k, f, vs, ve = _h(s, p, e)
+        if k != 0x10:
+            raise Fallback
+        v = _d21(s, p, k, vs, ve, f)
+        o.setComponentByPosition(i, v, False, False, False)
+        i += 1
+        p = ve
+    return o
+
+
+def _d56(s, p, k, vs, ve, f):
+    # Certificate
+    if not f:
+        raise Fallback
+    o = _S56.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # tbsCertificate
+    if k != 0x10:
+        raise Fallback
+    v = _d1(s, p, k, vs, ve, f)
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # signatureAlgorithm
+    if k != 0x10:
+        raise Fallback
+    v = _d2(s, p, k, vs, ve, f)
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # signature
+    if k != 0x3:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S3.clone(_bitString(s[vs:ve]))
+    o.setComponentByPosition(2, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d57(s, p, k, vs, ve, f):
+    # Name
+    p = vs
+    k, f, vs, e1 = _h(s, p, ve)
+    if e1 != ve:
+        raise Fallback
+    o = _S57.clone()
+    if k == 0x10:  # rdnSequence
+        v = _d16(s, p, k, vs, ve, f)
+        o.setComponentByPosition(0, v, False, False, False)
+    else:
+        raise Fallback
+    return o
+
+
+def _d59(s, p, k, vs, ve, f):
+    # SingleResponse
+    if not f:
+        raise Fallback
+    o = _S59.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # certID
+    if k != 0x10:
+        raise Fallback
+    v = _d60(s, p, k, vs, ve, f)
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # certStatus
+    if k not in (0x80, 0x81, 0x82):
+        raise Fallback
+    v = _d61(s, p, k, vs, ve, f)
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # thisUpdate
+    if k != 0x18:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S62.clone(s[vs:ve])
+    o.setComponentByPosition(2, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # nextUpdate
+    if k == 0x80:
+        k, f, vs, e1 = _h(s, vs, ve)
+        if k != 0x18 or e1 != ve:
+            raise Fallback
+        if f:
+            raise Fallback
+        v = _S63.clone(s[vs:ve])
+        o.setComponentByPosition(3, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # singleExtensions
+    if k == 0x81:
+        v = _d64(s, p, k, vs, ve, f)
+        o.setComponentByPosition(4, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d60(s, p, k, vs, ve, f):
+    # CertID
+    if not f:
+        raise Fallback
+    o = _S60.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # hashAlgorithm
+    if k != 0x10:
+        raise Fallback
+    v = _d65(s, p, k, vs, ve, f)
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # issuerNameHash
+    if k != 0x4:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S66.clone(s[vs:ve])
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # issuerKeyHash
+    if k != 0x4:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S67.clone(s[vs:ve])
+    o.setComponentByPosition(2, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # serialNumber
+    if k != 0x2:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S68.clone(int.from_bytes(s[vs:ve], 'big', signed=True))
+    o.setComponentByPosition(3, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d61(s, p, k, vs, ve, f):
+    # CertStatus
+    o = _S61.clone()
+    if k == 0x80:  # good
+        if f:
+            raise Fallback
+        v = _S69.clone(_null(s[vs:ve]))
+        o.setComponentByPosition(0, v, False, False, False)
+    elif k == 0x81:  # revoked
+        v = _d70(s, p, k, vs, ve, f)
+        o.setComponentByPosition(1, v, False, False, False)
+    elif k == 0x82:  # unknown
+        if f:
+            raise Fallback
+        v = _S71.clone(_null(s[vs:ve]))
+        o.setComponentByPosition(2, v, False, False, False)
+    else:
+        raise Fallback
+    return o
+
+
+def _d64(s, p, k, vs, ve, f):
+    # Extensions
+    k, f, vs, e1 = _h(s, vs, ve)
+    if k != 0x10 or e1 != ve:
+        raise Fallback
+    if not f:
+        raise Fallback
+    o = _S64.clone()
+    o.clear()
+    e = ve
+    p = vs
+    i = 0
+    while p < e:
+        k, f, vs, ve = _h(s, p, e)
+        if k != 0x10:
+            raise Fallback
+        v = _d21(s, p, k, vs, ve, f)
+        o.setComponentByPosition(i, v, False, False, False)
+        i += 1
+        p = ve
+    return o
+
+
+def _d65(s, p, k, vs, ve, f):
+    # AlgorithmIdentifier
+    if not f:
+        raise Fallback
+    o = _S65.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # algorithm
+    if k != 0x6:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _P14.table.intern(s[vs:ve])
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # parameters
+    if k is not None:
+        v = _S15.clone(s[p:ve])
+        o.setComponentByPosition(1, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d70(s, p, k, vs, ve, f):
+    # RevokedInfo
+    if not f:
+        raise Fallback
+    o = _S70.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # revocationTime
+    if k != 0x18:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S72.clone(s[vs:ve])
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # revocationReason
+    if k == 0x80:
+        k, f, vs, e1 = _h(s, vs, ve)
+        if k != 0xa or e1 != ve:
+            raise Fallback
+        if f:
+            raise Fallback
+        v = _S73.clone(int.from_bytes(s[vs:ve], 'big', signed=True))
+        o.setComponentByPosition(1, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def decode_rfc6960_BasicOCSPResponse(s):
+    p = 0
+    k, f, vs, ve = _h(s, 0, len(s))
+    if k != 0x10:
+        raise Fallback
+    v = _d46(s, p, k, vs, ve, f)
+    return v, ve
+
+
+def _d74(s, p, k, vs, ve, f):
+    # SignedData
+    if not f:
+        raise Fallback
+    o = _S74.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # version
+    if k != 0x2:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S75.clone(int.from_bytes(s[vs:ve], 'big', signed=True))
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # digestAlgorithms
+    if k != 0x11:
+        raise Fallback
+    v = _d76(s, p, k, vs, ve, f)
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # encapContentInfo
+    if k != 0x10:
+        raise Fallback
+    v = _d77(s, p, k, vs, ve, f)
+    o.setComponentByPosition(2, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # certificates
+    if k == 0x80:
+        v = _d78(s, p, k, vs, ve, f)
+        o.setComponentByPosition(3, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # crls
+    if k == 0x81:
+        v = _d79(s, p, k, vs, ve, f)
+        o.setComponentByPosition(4, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # signerInfos
+    if k != 0x11:
+        raise Fallback
+    v = _d80(s, p, k, vs, ve, f)
+    o.setComponentByPosition(5, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d76(s, p, k, vs, ve, f):
+    # DigestAlgorithmIdentifiers
+    if not f:
+        raise Fallback
+    o = _S76.clone()
+    o.clear()
+    e = ve
+    p = vs
+    i = 0
+    while p < e:
+        k, f, vs, ve = _h(s, p, e)
+        if k != 0x10:
+            raise Fallback
+        v = _d81(s, p, k, vs, ve, f)
+        o.setComponentByPosition(i, v, False, False, False)
+        i += 1
+        p = ve
+    return o
+
+
+def _d77(s, p, k, vs, ve, f):
+    # EncapsulatedContentInfo
+    if not f:
+        raise Fallback
+    o = _S77.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # eContentType
+    if k != 0x6:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _P82.table.intern(s[vs:ve])
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # eContent
+    if k == 0x80:
+        k, f, vs, e1 = _h(s, vs, ve)
+        if k != 0x4 or e1 != ve:
+            raise Fallback
+        if f:
+            raise Fallback
+        v = _S83.clone(s[vs:ve])
+        o.setComponentByPosition(1, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d78(s, p, k, vs, ve, f):
+    # CertificateSet
+    if not f:
+        raise Fallback
+    o = _S78.clone()
+    o.clear()
+    e = ve
+    p = vs
+    i = 0
+    while p < e:
+        k, f, vs, ve = _h(s, p, e)
+        if k not in (0x10, 0x80, 0x81, 0x82, 0x83):
+            raise Fallback
+        v = _d84(s, p, k, vs, ve, f)
+        o.setComponentByPosition(i, v, False, False, False)
+        i += 1
+        p = ve
+    return o
+
+
+def _d79(s, p, k, vs, ve, f):
+    # RevocationInfoChoices
+    if not f:
+        raise Fallback
+    o = _S79.clone()
+    o.clear()
+    e = ve
+    p = vs
+    i = 0
+    while p < e:
+        k, f, vs, ve = _h(s, p, e)
+        if k not in (0x10, 0x81):
+            raise Fallback
+        v = _d85(s, p, k, vs, ve, f)
+        o.setComponentByPosition(i, v, False, False, False)
+        i += 1
+        p = ve
+    return o
+
+
+def _d80(s, p, k, vs, ve, f):
+    # SignerInfos
+    if not f:
+        raise Fallback
+    o = _S80.clone()
+    o.clear()
+    e = ve
+    p = vs
+    i = 0
+    while p < e:
+        k, f, vs, ve = _h(s, p, e)
+        if k != 0x10:
+            raise Fallback
+        v = _d86(s, p, k, vs, ve, f)
+        o.setComponentByPosition(i, v, False, False, False)
+        i += 1
+        p = ve
+    return o
+
+
+def _d81(s, p, k, vs, ve, f):
+    # DigestAlgorithmIdentifier
+    if not f:
+        raise Fallback
+    o = _S81.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # algorithm
+    if k != 0x6:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _P14.table.intern(s[vs:ve])
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # parameters
+    if k is not None:
+        v = _S15.clone(s[p:ve])
+        o.setComponentByPosition(1, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d84(s, p, k, vs, ve, f):
+    # CertificateChoices
+    o = _S84.clone()
+    if k == 0x10:  # certificate
+        v = _d87(s, p, k, vs, ve, f)
+        o.setComponentByPosition(0, v, False, False, False)
+    elif k == 0x80:  # extendedCertificate
+        v = _d88(s, p, k, vs, ve, f)
+        o.setComponentByPosition(1, v, False, False, False)
+    elif k == 0x81:  # v1AttrCert
+        v = _d89(s, p, k, vs, ve, f)
+        o.setComponentByPosition(2, v, False, False, False)
+    elif k == 0x82:  # v2AttrCert
+        v = _d90(s, p, k, vs, ve, f)
+        o.setComponentByPosition(3, v, False, False, False)
+    elif k == 0x83:  # other
+        v = _d91(s, p, k, vs, ve, f)
+        o.setComponentByPosition(4, v, False, False, False)
+    else:
+        raise Fallback
+    return o
+
+
+def _d85(s, p, k, vs, ve, f):
+    # RevocationInfoChoice
+    o = _S85.clone()
+    if k == 0x10:  # crl
+        v = _d92(s, p, k, vs, ve, f)
+        o.setComponentByPosition(0, v, False, False, False)
+    elif k == 0x81:  # other
+        v = _d93(s, p, k, vs, ve, f)
+        o.setComponentByPosition(1, v, False, False, False)
+    else:
+        raise Fallback
+    return o
+
+
+def _d86(s, p, k, vs, ve, f):
+    # SignerInfo
+    if not f:
+        raise Fallback
+    o = _S86.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # version
+    if k != 0x2:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S94.clone(int.from_bytes(s[vs:ve], 'big', signed=True))
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # sid
+    if k not in (0x10, 0x80):
+        raise Fallback
+    v = _d95(s, p, k, vs, ve, f)
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # digestAlgorithm
+    if k != 0x10:
+        raise Fallback
+    v = _d96(s, p, k, vs, ve, f)
+    o.setComponentByPosition(2, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # signedAttrs
+    if k == 0x80:
+        v = _d97(s, p, k, vs, ve, f)
+        o.setComponentByPosition(3, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # signatureAlgorithm
+    if k != 0x10:
+        raise Fallback
+    v = _d98(s, p, k, vs, ve, f)
+    o.setComponentByPosition(4, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # signature
+    if k != 0x4:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S99.clone(s[vs:ve])
+    o.setComponentByPosition(5, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # unsignedAttrs
+    if k == 0x81:
+        v = _d100(s, p, k, vs, ve, f)
+        o.setComponentByPosition(6, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d87(s, p, k, vs, ve, f):
+    # Certificate
+    if not f:
+        raise Fallback
+    o = _S87.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # tbsCertificate
+    if k != 0x10:
+        raise Fallback
+    v = _d1(s, p, k, vs, ve, f)
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # signatureAlgorithm
+    if k != 0x10:
+        raise Fallback
+    v = _d2(s, p, k, vs, ve, f)
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # signature
+    if k != 0x3:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S3.clone(_bitString(s[vs:ve]))
+    o.setComponentByPosition(2, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d88(s, p, k, vs, ve, f):
+    # ExtendedCertificate
+    if not f:
+        raise Fallback
+    o = _S88.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # extendedCertificateInfo
+    if k != 0x10:
+        raise Fallback
+    v = _d101(s, p, k, vs, ve, f)
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # signatureAlgorithm
+    if k != 0x10:
+        raise Fallback
+    v = _d102(s, p, k, vs, ve, f)
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # signature
+    if k != 0x3:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S103.clone(_bitString(s[vs:ve]))
+    o.setComponentByPosition(2, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d89(s, p, k, vs, ve, f):
+    # AttributeCertificateV1
+    if not f:
+        raise Fallback
+    o = _S89.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # acInfo
+    if k != 0x10:
+        raise Fallback
+    v = _d104(s, p, k, vs, ve, f)
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # signatureAlgorithm
+    if k != 0x10:
+        raise Fallback
+    v = _d105(s, p, k, vs, ve, f)
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # signature
+    if k != 0x3:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S106.clone(_bitString(s[vs:ve]))
+    o.setComponentByPosition(2, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d90(s, p, k, vs, ve, f):
+    # AttributeCertificateV2
+    if not f:
+        raise Fallback
+    o = _S90.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # acinfo
+    if k != 0x10:
+        raise Fallback
+    v = _d107(s, p, k, vs, ve, f)
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # signatureAlgorithm
+    if k != 0x10:
+        raise Fallback
+    v = _d108(s, p, k, vs, ve, f)
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # signatureValue
+    if k != 0x3:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S109.clone(_bitString(s[vs:ve]))
+    o.setComponentByPosition(2, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d91(s, p, k, vs, ve, f):
+    # OtherCertificateFormat
+    if not f:
+        raise Fallback
+    o = _S91.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # otherCertFormat
+    if k != 0x6:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _P110.table.intern(s[vs:ve])
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # otherCert
+    if k is None:
+        raise Fallback
+    v = _S111.clone(s[p:ve])
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d92(s, p, k, vs, ve, f):
+    # CertificateList
+    if not f:
+        raise Fallback
+    o = _S92.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # tbsCertList
+    if k != 0x10:
+        raise Fallback
+    v = _d32(s, p, k, vs, ve, f)
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # signatureAlgorithm
+    if k != 0x10:
+        raise Fallback
+    v = _d33(s, p, k, vs, ve, f)
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # signature
+    if k != 0x3:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S34.clone(_bitString(s[vs:ve]))
+    o.setComponentByPosition(2, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d93(s, p, k, vs, ve, f):
+    # OtherRevocationInfoFormat
+    if not f:
+        raise Fallback
+    o = _S93.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # otherRevInfoFormat
+    if k != 0x6:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _P112.table.intern(s[vs:ve])
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # otherRevInfo
+    if k is None:
+        raise Fallback
+    v = _S113.clone(s[p:ve])
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d95(s, p, k, vs, ve, f):
+    # SignerIdentifier
+    o = _S95.clone()
+    if k == 0x10:  # issuerAndSerialNumber
+        v = _d114(s, p, k, vs, ve, f)
+        o.setComponentByPosition(0, v, False, False, False)
+    elif k == 0x80:  # subjectKeyIdentifier
+        if f:
+            raise Fallback
+        v = _S115.clone(s[vs:ve])
+        o.setComponentByPosition(1, v, False, False, False)
+    else:
+        raise Fallback
+    return o
+
+
+def _d96(s, p, k, vs, ve, f):
+    # DigestAlgorithmIdentifier
+    if not f:
+        raise Fallback
+    o = _S96.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # algorithm
+    if k != 0x6:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _P14.table.intern(s[vs:ve])
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # parameters
+    if k is not None:
+        v = _S15.clone(s[p:ve])
+        o.setComponentByPosition(1, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d97(s, p, k, vs, ve, f):
+    # SignedAttributes
+    if not f:
+        raise Fallback
+    o = _S97.clone()
+    o.clear()
+    e = ve
+    p = vs
+    i = 0
+    while p < e:
+        k, f, vs, ve = _h(s, p, e)
+        if k != 0x10:
+            raise Fallback
+        v = _d116(s, p, k, vs, ve, f)
+        o.setComponentByPosition(i, v, False, False, False)
+        i += 1
+        p = ve
+    return o
+
+
+def _d98(s, p, k, vs, ve, f):
+    # SignatureAlgorithmIdentifier
+    if not f:
+        raise Fallback
+    o = _S98.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # algorithm
+    if k != 0x6:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _P14.table.intern(s[vs:ve])
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # parameters
+    if k is not None:
+        v = _S15.clone(s[p:ve])
+        o.setComponentByPosition(1, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d100(s, p, k, vs, ve, f):
+    # UnsignedAttributes
+    if not f:
+        raise Fallback
+    o = _S100.clone()
+    o.clear()
+    e = ve
+    p = vs
+    i = 0
+    while p < e:
+        k, f, vs, ve = _h(s, p, e)
+        if k != 0x10:
+            raise Fallback
+        v = _d117(s, p, k, vs, ve, f)
+        o.setComponentByPosition(i, v, False, False, False)
+        i += 1
+        p = ve
+    return o
+
+
+def _d101(s, p, k, vs, ve, f):
+    # ExtendedCertificateInfo
+    if not f:
+        raise Fallback
+    o = _S101.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # version
+    if k != 0x2:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S118.clone(int.from_bytes(s[vs:ve], 'big', signed=True))
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # certificate
+    if k != 0x10:
+        raise Fallback
+    v = _d119(s, p, k, vs, ve, f)
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # attributes
+    if k != 0x11:
+        raise Fallback
+    v = _d120(s, p, k, vs, ve, f)
+    o.setComponentByPosition(2, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d102(s, p, k, vs, ve, f):
+    # SignatureAlgorithmIdentifier
+    if not f:
+        raise Fallback
+    o = _S102.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # algorithm
+    if k != 0x6:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _P14.table.intern(s[vs:ve])
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # parameters
+    if k is not None:
+        v = _S15.clone(s[p:ve])
+        o.setComponentByPosition(1, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d104(s, p, k, vs, ve, f):
+    # AttributeCertificateInfoV1
+    if not f:
+        raise Fallback
+    o = _S104.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # version
+    if k == 0x2:
+        if f:
+            raise Fallback
+        v = _S121.clone(int.from_bytes(s[vs:ve], 'big', signed=True))
+        o.setComponentByPosition(0, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # subject
+    if k not in (0x80, 0x81):
+        raise Fallback
+    v = _d122(s, p, k, vs, ve, f)
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # issuer
+    if k != 0x10:
+        raise Fallback
+    v = _d123(s, p, k, vs, ve, f)
+    o.setComponentByPosition(2, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # signature
+    if k != 0x10:
+        raise Fallback
+    v = _d124(s, p, k, vs, ve, f)
+    o.setComponentByPosition(3, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # serialNumber
+    if k != 0x2:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S125.clone(int.from_bytes(s[vs:ve], 'big', signed=True))
+    o.setComponentByPosition(4, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # attCertValidityPeriod
+    if k != 0x10:
+        raise Fallback
+    v = _d126(s, p, k, vs, ve, f)
+    o.setComponentByPosition(5, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # attributes
+    if k != 0x10:
+        raise Fallback
+    v = _d127(s, p, k, vs, ve, f)
+    o.setComponentByPosition(6, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # issuerUniqueID
+    if k == 0x3:
+        if f:
+            raise Fallback
+        v = _S128.clone(_bitString(s[vs:ve]))
+        o.setComponentByPosition(7, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # extensions
+    if k == 0x10:
+        v = _d129(s, p, k, vs, ve, f)
+        o.setComponentByPosition(8, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d105(s, p, k, vs, ve, f):
+    # AlgorithmIdentifier
+    if not f:
+        raise Fallback
+    o = _S105.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # algorithm
+    if k != 0x6:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _P14.table.intern(s[vs:ve])
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # parameters
+    if k is not None:
+        v = _S15.clone(s[p:ve])
+        o.setComponentByPosition(1, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d107(s, p, k, vs, ve, f):
+    # AttributeCertificateInfo
+    if not f:
+        raise Fallback
+    o = _S107.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # version
+    if k != 0x2:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S130.clone(int.from_bytes(s[vs:ve], 'big', signed=True))
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # holder
+    if k != 0x10:
+        raise Fallback
+    v = _d131(s, p, k, vs, ve, f)
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # issuer
+    if k not in (0x10, 0x80):
+        raise Fallback
+    v = _d132(s, p, k, vs, ve, f)
+    o.setComponentByPosition(2, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # signature
+    if k != 0x10:
+        raise Fallback
+    v = _d133(s, p, k, vs, ve, f)
+    o.setComponentByPosition(3, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # serialNumber
+    if k != 0x2:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S134.clone(int.from_bytes(s[vs:ve], 'big', signed=True))
+    o.setComponentByPosition(4, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # attrCertValidityPeriod
+    if k != 0x10:
+        raise Fallback
+    v = _d135(s, p, k, vs, ve, f)
+    o.setComponentByPosition(5, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # attributes
+    if k != 0x10:
+        raise Fallback
+    v = _d136(s, p, k, vs, ve, f)
+    o.setComponentByPosition(6, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # issuerUniqueID
+    if k == 0x3:
+        if f:
+            raise Fallback
+        v = _S137.clone(_bitString(s[vs:ve]))
+        o.setComponentByPosition(7, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # extensions
+    if k == 0x10:
+        v = _d138(s, p, k, vs, ve, f)
+        o.setComponentByPosition(8, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d108(s, p, k, vs, ve, f):
+    # AlgorithmIdentifier
+    if not f:
+        raise Fallback
+    o = _S108.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # algorithm
+    if k != 0x6:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _P139.table.intern(s[vs:ve])
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # parameters
+    if k is not None:
+        v = _S140.clone(s[p:ve])
+        o.setComponentByPosition(1, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d114(s, p, k, vs, ve, f):
+    # IssuerAndSerialNumber
+    if not f:
+        raise Fallback
+    o = _S114.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # issuer
+    if k != 0x10:
+        raise Fallback
+    v = _d141(s, p, k, vs, ve, f)
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # serialNumber
+    if k != 0x2:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S142.clone(int.from_bytes(s[vs:ve], 'big', signed=True))
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d116(s, p, k, vs, ve, f):
+    # Attribute
+    if not f:
+        raise Fallback
+    o = _S116.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # attrType
+    if k != 0x6:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _P143.table.intern(s[vs:ve])
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # attrValues
+    if k != 0x11:
+        raise Fallback
+    v = _d144(s, p, k, vs, ve, f)
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d117(s, p, k, vs, ve, f):
+    # Attribute
+    if not f:
+        raise Fallback
+    o = _S117.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # attrType
+    if k != 0x6:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _P143.table.intern(s[vs:ve])
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # attrValues
+    if k != 0x11:
+        raise Fallback
+    v = _d144(s, p, k, vs, ve, f)
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d119(s, p, k, vs, ve, f):
+    # Certificate
+    if not f:
+        raise Fallback
+    o = _S119.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # tbsCertificate
+    if k != 0x10:
+        raise Fallback
+    v = _d1(s, p, k, vs, ve, f)
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # signatureAlgorithm
+    if k != 0x10:
+        raise Fallback
+    v = _d2(s, p, k, vs, ve, f)
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # signature
+    if k != 0x3:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S3.clone(_bitString(s[vs:ve]))
+    o.setComponentByPosition(2, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d120(s, p, k, vs, ve, f):
+    # UnauthAttributes
+    if not f:
+        raise Fallback
+    o = _S120.clone()
+    o.clear()
+    e = ve
+    p = vs
+    i = 0
+    while p < e:
+        k, f, vs, ve = _h(s, p, e)
+        if k != 0x10:
+            raise Fallback
+        v = _d145(s, p, k, vs, ve, f)
+        o.setComponentByPosition(i, v, False, False, False)
+        i += 1
+        p = ve
+    return o
+
+
+def _d122(s, p, k, vs, ve, f):
+    # Choice
+    o = _S122.clone()
+    if k == 0x80:  # baseCertificateID
+        v = _d146(s, p, k, vs, ve, f)
+        o.setComponentByPosition(0, v, False, False, False)
+    elif k == 0x81:  # subjectName
+        v = _d147(s, p, k, vs, ve, f)
+        o.setComponentByPosition(1, v, False, False, False)
+    else:
+        raise Fallback
+    return o
+
+
+def _d123(s, p, k, vs, ve, f):
+    # GeneralNames
+    if not f:
+        raise Fallback
+    o = _S123.clone()
+    o.clear()
+    e = ve
+    p = vs
+    i = 0
+    while p < e:
+        k, f, vs, ve = _h(s, p, e)
+        if k not in (0x80, 0x81, 0x82, 0x83, 0x84, 0x85, 0x86, 0x87, 0x88):
+            raise Fallback
+        v = _d148(s, p, k, vs, ve, f)
+        o.setComponentByPosition(i, v, False, False, False)
+        i += 1
+        p = ve
+    return o
+
+
+def _d124(s, p, k, vs, ve, f):
+    # AlgorithmIdentifier
+    if not f:
+        raise Fallback
+    o = _S124.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # algorithm
+    if k != 0x6:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _P14.table.intern(s[vs:ve])
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # parameters
+    if k is not None:
+        v = _S15.clone(s[p:ve])
+        o.setComponentByPosition(1, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d126(s, p, k, vs, ve, f):
+    # AttCertValidityPeriod
+    if not f:
+        raise Fallback
+    o = _S126.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # notBeforeTime
+    if k != 0x18:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S149.clone(s[vs:ve])
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # notAfterTime
+    if k != 0x18:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S150.clone(s[vs:ve])
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d127(s, p, k, vs, ve, f):
+    # SequenceOf
+    if not f:
+        raise Fallback
+    o = _S127.clone()
+    o.clear()
+    e = ve
+    p = vs
+    i = 0
+    while p < e:
+        k, f, vs, ve = _h(s, p, e)
+        if k != 0x10:
+            raise Fallback
+        v = _d151(s, p, k, vs, ve, f)
+        o.setComponentByPosition(i, v, False, False, False)
+        i += 1
+        p = ve
+    return o
+
+
+def _d129(s, p, k, vs, ve, f):
+    # Extensions
+    if not f:
+        raise Fallback
+    o = _S129.clone()
+    o.clear()
+    e = ve
+    p = vs
+    i = 0
+    while p < e:
+        k, f, vs, ve = _h(s, p, e)
+        if k != 0x10:
+            raise Fallback
+        v = _d21(s, p, k, vs, ve, f)
+        o.setComponentByPosition(i, v, False, False, False)
+        i += 1
+        p = ve
+    return o
+
+
+def _d131(s, p, k, vs, ve, f):
+    # Holder
+    if not f:
+        raise Fallback
+    o = _S131.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # baseCertificateID
+    if k == 0x80:
+        v = _d152(s, p, k, vs, ve, f)
+        o.setComponentByPosition(0, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # entityName
+    if k == 0x81:
+        v = _d153(s, p, k, vs, ve, f)
+        o.setComponentByPosition(1, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # objectDigestInfo
+    if k == 0x82:
+        v = _d154(s, p, k, vs, ve, f)
+        o.setComponentByPosition(2, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d132(s, p, k, vs, ve, f):
+    # AttCertIssuer
+    o = _S132.clone()
+    if k == 0x10:  # v1Form
+        v = _d155(s, p, k, vs, ve, f)
+        o.setComponentByPosition(0, v, False, False, False)
+    elif k == 0x80:  # v2Form
+        v = _d156(s, p, k, vs, ve, f)
+        o.setComponentByPosition(1, v, False, False, False)
+    else:
+        raise Fallback
+    return o
+
+
+def _d133(s, p, k, vs, ve, f):
+    # AlgorithmIdentifier
+    if not f:
+        raise Fallback
+    o = _S133.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # algorithm
+    if k != 0x6:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _P139.table.intern(s[vs:ve])
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # parameters
+    if k is not None:
+        v = _S140.clone(s[p:ve])
+        o.setComponentByPosition(1, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d135(s, p, k, vs, ve, f):
+    # AttCertValidityPeriod
+    if not f:
+        raise Fallback
+    o = _S135.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # notBeforeTime
+    if k != 0x18:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S149.clone(s[vs:ve])
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # notAfterTime
+    if k != 0x18:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S150.clone(s[vs:ve])
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d136(s, p, k, vs, ve, f):
+    # SequenceOf
+    if not f:
+        raise Fallback
+    o = _S136.clone()
+    o.clear()
+    e = ve
+    p = vs
+    i = 0
+    while p < e:
+        k, f, vs, ve = _h(s, p, e)
+        if k != 0x10:
+            raise Fallback
+        v = _d157(s, p, k, vs, ve, f)
+        o.setComponentByPosition(i, v, False, False, False)
+        i += 1
+        p = ve
+    return o
+
+
+def _d138(s, p, k, vs, ve, f):
+    # Extensions
+    if not f:
+        raise Fallback
+    o = _S138.clone()
+    o.clear()
+    e = ve
+    p = vs
+    i = 0
+    while p < e:
+        k, f, vs, ve = _h(s, p, e)
+        if k != 0x10:
+            raise Fallback
+        v = _d158(s, p, k, vs, ve, f)
+        o.setComponentByPosition(i, v, False, False, False)
+        i += 1
+        p = ve
+    return o
+
+
+def _d141(s, p, k, vs, ve, f):
+    # Name
+    o = _S141.clone()
+    if k == 0x10:  # rdnSequence
+        v = _d16(s, p, k, vs, ve, f)
+        o.setComponentByPosition(0, v, False, False, False)
+    else:
+        raise Fallback
+    return o
+
+
+def _d144(s, p, k, vs, ve, f):
+    # SetOf
+    if not f:
+        raise Fallback
+    o = _S144.clone()
+    o.clear()
+    e = ve
+    p = vs
+    i = 0
+    while p < e:
+        k, f, vs, ve = _h(s, p, e)
+        v = _S159.clone(s[p:ve])
+        o.setComponentByPosition(i, v, False, False, False)
+        i += 1
+        p = ve
+    return o
+
+
+def _d145(s, p, k, vs, ve, f):
+    # Attribute
+    if not f:
+        raise Fallback
+    o = _S145.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # attrType
+    if k != 0x6:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _P143.table.intern(s[vs:ve])
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # attrValues
+    if k != 0x11:
+        raise Fallback
+    v = _d144(s, p, k, vs, ve, f)
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d146(s, p, k, vs, ve, f):
+    # IssuerSerial
+    k, f, vs, e1 = _h(s, vs, ve)
+    if k != 0x10 or e1 != ve:
+        raise Fallback
+    if not f:
+        raise Fallback
+    o = _S146.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # issuer
+    if k != 0x10:
+        raise Fallback
+    v = _d160(s, p, k, vs, ve, f)
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # serial
+    if k != 0x2:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S161.clone(int.from_bytes(s[vs:ve], 'big', signed=True))
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # issuerUID
+    if k == 0x3:
+        if f:
+            raise Fallback
+        v = _S162.clone(_bitString(s[vs:ve]))
+        o.setComponentByPosition(2, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d147(s, p, k, vs, ve, f):
+    # GeneralNames
+    k, f, vs, e1 = _h(s, vs, ve)
+    if k != 0x10 or e1 != ve:
+        raise Fallback
+    if not f:
+        raise Fallback
+    o = _S147.clone()
+    o.clear()
+    e = ve
+    p = vs
+    i = 0
+    while p < e:
+        k, f, vs, ve = _h(s, p, e)
+        if k not in (0x80, 0x81, 0x82, 0x83, 0x84, 0x85, 0x86, 0x87, 0x88):
+            raise Fallback
+        v = _d148(s, p, k, vs, ve, f)
+        o.setComponentByPosition(i, v, False, False, False)
+        i += 1
+        p = ve
+    return o
+
+
+def _d148(s, p, k, vs, ve, f):
+    # GeneralName
+    o = _S148.clone()
+    if k == 0x80:  # otherName
+        v = _d163(s, p, k, vs, ve, f)
+        o.setComponentByPosition(0, v, False, False, False)
+    elif k == 0x81:  # rfc822Name
+        if f:
+            raise Fallback
+        v = _S164.clone(s[vs:ve])
+        o.setComponentByPosition(1, v, False, False, False)
+    elif k == 0x82:  # dNSName
+        if f:
+            raise Fallback
+        v = _S165.clone(s[vs:ve])
+        o.setComponentByPosition(2, v, False, False, False)
+    elif k == 0x83:  # x400Address
+        v = _d166(s, p, k, vs, ve, f)
+        o.setComponentByPosition(3, v, False, False, False)
+    elif k == 0x84:  # directoryName
+        v = _d167(s, p, k, vs, ve, f)
+        o.setComponentByPosition(4, v, False, False, False)
+    elif k == 0x85:  # ediPartyName
+        v = _d168(s, p, k, vs, ve, f)
+        o.setComponentByPosition(5, v, False, False, False)
+    elif k == 0x86:  # uniformResourceIdentifier
+        if f:
+            raise Fallback
+        v = _S169.clone(s[vs:ve])
+        o.setComponentByPosition(6, v, False, False, False)
+    elif k == 0x87:  # iPAddress
+        if f:
+            raise Fallback
+        v = _S170.clone(s[vs:ve])
+        o.setComponentByPosition(7, v, False, False, False)
+    elif k == 0x88:  # registeredID
+        if f:
+            raise Fallback
+        v = _P171.table.intern(s[vs:ve])
+        o.setComponentByPosition(8, v, False, False, False)
+    else:
+        raise Fallback
+    return o
+
+
+def _d151(s, p, k, vs, ve, f):
+    # Attribute
+    if not f:
+        raise Fallback
+    o = _S151.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # type
+    if k != 0x6:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _P172.table.intern(s[vs:ve])
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # values
+    if k != 0x11:
+        raise Fallback
+    v = _d173(s, p, k, vs, ve, f)
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d152(s, p, k, vs, ve, f):
+    # IssuerSerial
+    if not f:
+        raise Fallback
+    o = _S152.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # issuer
+    if k != 0x10:
+        raise Fallback
+    v = _d160(s, p, k, vs, ve, f)
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # serial
+    if k != 0x2:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S161.clone(int.from_bytes(s[vs:ve], 'big', signed=True))
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # issuerUID
+    if k == 0x3:
+        if f:
+            raise Fallback
+        v = _S162.clone(_bitString(s[vs:ve]))
+        o.setComponentByPosition(2, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d153(s, p, k, vs, ve, f):
+    # GeneralNames
+    if not f:
+        raise Fallback
+    o = _S153.clone()
+    o.clear()
+    e = ve
+    p = vs
+    i = 0
+    while p < e:
+        k, f, vs, ve = _h(s, p, e)
+        if k not in (0x80, 0x81, 0x82, 0x83, 0x84, 0x85, 0x86, 0x87, 0x88):
+            raise Fallback
+        v = _d174(s, p, k, vs, ve, f)
+        o.setComponentByPosition(i, v, False, False, False)
+        i += 1
+        p = ve
+    return o
+
+
+def _d154(s, p, k, vs, ve, f):
+    # ObjectDigestInfo
+    if not f:
+        raise Fallback
+    o = _S154.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # digestedObjectType
+    if k != 0xa:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S175.clone(int.from_bytes(s[vs:ve], 'big', signed=True))
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # otherObjectTypeID
+    if k == 0x6:
+        if f:
+            raise Fallback
+        v = _P176.table.intern(s[vs:ve])
+        o.setComponentByPosition(1, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # digestAlgorithm
+    if k != 0x10:
+        raise Fallback
+    v = _d177(s, p, k, vs, ve, f)
+    o.setComponentByPosition(2, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # objectDigest
+    if k != 0x3:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S178.clone(_bitString(s[vs:ve]))
+    o.setComponentByPosition(3, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d155(s, p, k, vs, ve, f):
+    # GeneralNames
+    if not f:
+        raise Fallback
+    o = _S155.clone()
+    o.clear()
+    e = ve
+    p = vs
+    i = 0
+    while p < e:
+        k, f, vs, ve = _h(s, p, e)
+        if k not in (0x80, 0x81, 0x82, 0x83, 0x84, 0x85, 0x86, 0x87, 0x88):
+            raise Fallback
+        v = _d174(s, p, k, vs, ve, f)
+        o.setComponentByPosition(i, v, False, False, False)
+        i += 1
+        p = ve
+    return o
+
+
+def _d156(s, p, k, vs, ve, f):
+    # V2Form
+    if not f:
+        raise Fallback
+    o = _S156.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # issuerName
+    if k == 0x10:
+        v = _d179(s, p, k, vs, ve, f)
+        o.setComponentByPosition(0, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # baseCertificateID
+    if k == 0x80:
+        v = _d180(s, p, k, vs, ve, f)
+        o.setComponentByPosition(1, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # objectDigestInfo
+    if k == 0x81:
+        v = _d181(s, p, k, vs, ve, f)
+        o.setComponentByPosition(2, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d157(s, p, k, vs, ve, f):
+    # Attribute
+    if not f:
+        raise Fallback
+    o = _S157.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # type
+    if k != 0x6:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _P182.table.intern(s[vs:ve])
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # values
+    if k != 0x11:
+        raise Fallback
+    v = _d183(s, p, k, vs, ve, f)
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d158(s, p, k, vs, ve, f):
+    # Extension
+    if not f:
+        raise Fallback
+    o = _S158.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # extnID
+    if k != 0x6:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _P184.table.intern(s[vs:ve])
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # critical
+    if k == 0x1:
+        if f:
+            raise Fallback
+        v = _S185.clone(_boolean(s[vs:ve]))
+        o.setComponentByPosition(1, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # extnValue
+    if k != 0x4:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S186.clone(s[vs:ve])
+    o.setComponentByPosition(2, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d160(s, p, k, vs, ve, f):
+    # GeneralNames
+    if not f:
+        raise Fallback
+    o = _S160.clone()
+    o.clear()
+    e = ve
+    p = vs
+    i = 0
+    while p < e:
+        k, f, vs, ve = _h(s, p, e)
+        if k not in (0x80, 0x81, 0x82, 0x83, 0x84, 0x85, 0x86, 0x87, 0x88):
+            raise Fallback
+        v = _d174(s, p, k, vs, ve, f)
+        o.setComponentByPosition(i, v, False, False, False)
+        i += 1
+        p = ve
+    return o
+
+
+def _d163(s, p, k, vs, ve, f):
+    # AnotherName
+    if not f:
+        raise Fallback
+    o = _S163.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # type-id
+    if k != 0x6:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _P187.table.intern(s[vs:ve])
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # value
+    if k is None:
+        raise Fallback
+    v = _S188.clone(s[vs:ve] if k == 0x80 else s[p:ve])
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d166(s, p, k, vs, ve, f):
+    # ORAddress
+    if not f:
+        raise Fallback
+    o = _S166.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # built-in-standard-attributes
+    if k != 0x10:
+        raise Fallback
+    v = _d189(s, p, k, vs, ve, f)
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # built-in-domain-defined-attributes
+    if k == 0x10:
+        v = _d190(s, p, k, vs, ve, f)
+        o.setComponentByPosition(1, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # extension-attributes
+    if k == 0x11:
+        v = _d191(s, p, k, vs, ve, f)
+        o.setComponentByPosition(2, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d167(s, p, k, vs, ve, f):
+    # Name
+    p = vs
+    k, f, vs, e1 = _h(s, p, ve)
+    if e1 != ve:
+        raise Fallback
+    o = _S167.clone()
+    if k == 0x10:  # rdnSequence
+        v = _d16(s, p, k, vs, ve, f)
+        o.setComponentByPosition(0, v, False, False, False)
+    else:
+        raise Fallback
+    return o
+
+
+def _d168(s, p, k, vs, ve, f):
+    # EDIPartyName
+    if not f:
+        raise Fallback
+    o = _S168.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # nameAssigner
+    if k == 0x80:
+        v = _d192(s, p, k, vs, ve, f)
+        o.setComponentByPosition(0, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # partyName
+    if k != 0x81:
+        raise Fallback
+    v = _d193(s, p, k, vs, ve, f)
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d173(s, p, k, vs, ve, f):
+    # SetOf
+    if not f:
+        raise Fallback
+    o = _S173.clone()
+    o.clear()
+    e = ve
+    p = vs
+    i = 0
+    while p < e:
+        k, f, vs, ve = _h(s, p, e)
+        v = _S194.clone(s[p:ve])
+        o.setComponentByPosition(i, v, False, False, False)
+        i += 1
+        p = ve
+    return o
+
+
+def _d174(s, p, k, vs, ve, f):
+    # GeneralName
+    o = _S174.clone()
+    if k == 0x80:  # otherName
+        v = _d195(s, p, k, vs, ve, f)
+        o.setComponentByPosition(0, v, False, False, False)
+    elif k == 0x81:  # rfc822Name
+        if f:
+            raise Fallback
+        v = _S196.clone(s[vs:ve])
+        o.setComponentByPosition(1, v, False, False, False)
+    elif k == 0x82:  # dNSName
+        if f:
+            raise Fallback
+        v = _S197.clone(s[vs:ve])
+        o.setComponentByPosition(2, v, False, False, False)
+    elif k == 0x83:  # x400Address
+        v = _d198(s, p, k, vs, ve, f)
+        o.setComponentByPosition(3, v, False, False, False)
+    elif k == 0x84:  # directoryName
+        v = _d199(s, p, k, vs, ve, f)
+        o.setComponentByPosition(4, v, False, False, False)
+    elif k == 0x85:  # ediPartyName
+        v = _d200(s, p, k, vs, ve, f)
+        o.setComponentByPosition(5, v, False, False, False)
+    elif k == 0x86:  # uniformResourceIdentifier
+        if f:
+            raise Fallback
+        v = _S201.clone(s[vs:ve])
+        o.setComponentByPosition(6, v, False, False, False)
+    elif k == 0x87:  # iPAddress
+        if f:
+            raise Fallback
+        v = _S202.clone(s[vs:ve])
+        o.setComponentByPosition(7, v, False, False, False)
+    elif k == 0x88:  # registeredID
+        if f:
+            raise Fallback
+        v = _P203.table.intern(s[vs:ve])
+        o.setComponentByPosition(8, v, False, False, False)
+    else:
+        raise Fallback
+    return o
+
+
+def _d177(s, p, k, vs, ve, f):
+    # AlgorithmIdentifier
+    if not f:
+        raise Fallback
+    o = _S177.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # algorithm
+    if k != 0x6:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _P139.table.intern(s[vs:ve])
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # parameters
+    if k is not None:
+        v = _S140.clone(s[p:ve])
+        o.setComponentByPosition(1, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d179(s, p, k, vs, ve, f):
+    # GeneralNames
+    if not f:
+        raise Fallback
+    o = _S179.clone()
+    o.clear()
+    e = ve
+    p = vs
+    i = 0
+    while p < e:
+        k, f, vs, ve = _h(s, p, e)
+        if k not in (0x80, 0x81, 0x82, 0x83, 0x84, 0x85, 0x86, 0x87, 0x88):
+            raise Fallback
+        v = _d174(s, p, k, vs, ve, f)
+        o.setComponentByPosition(i, v, False, False, False)
+        i += 1
+        p = ve
+    return o
+
+
+def _d180(s, p, k, vs, ve, f):
+    # IssuerSerial
+    if not f:
+        raise Fallback
+    o = _S180.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # issuer
+    if k != 0x10:
+        raise Fallback
+    v = _d160(s, p, k, vs, ve, f)
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # serial
+    if k != 0x2:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S161.clone(int.from_bytes(s[vs:ve], 'big', signed=True))
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # issuerUID
+    if k == 0x3:
+        if f:
+            raise Fallback
+        v = _S162.clone(_bitString(s[vs:ve]))
+        o.setComponentByPosition(2, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d181(s, p, k, vs, ve, f):
+    # ObjectDigestInfo
+    if not f:
+        raise Fallback
+    o = _S181.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # digestedObjectType
+    if k != 0xa:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S175.clone(int.from_bytes(s[vs:ve], 'big', signed=True))
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # otherObjectTypeID
+    if k == 0x6:
+        if f:
+            raise Fallback
+        v = _P176.table.intern(s[vs:ve])
+        o.setComponentByPosition(1, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # digestAlgorithm
+    if k != 0x10:
+        raise Fallback
+    v = _d177(s, p, k, vs, ve, f)
+    o.setComponentByPosition(2, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # objectDigest
+    if k != 0x3:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S178.clone(_bitString(s[vs:ve]))
+    o.setComponentByPosition(3, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d183(s, p, k, vs, ve, f):
+    # SetOf
+    if not f:
+        raise Fallback
+    o = _S183.clone()
+    o.clear()
+    e = ve
+    p = vs
+    i = 0
+    while p < e:
+        k, f, vs, ve = _h(s, p, e)
+        v = _S204.clone(s[p:ve])
+        o.setComponentByPosition(i, v, False, False, False)
+        i += 1
+        p = ve
+    return o
+
+
+def _d189(s, p, k, vs, ve, f):
+    # BuiltInStandardAttributes
+    if not f:
+        raise Fallback
+    o = _S189.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # country-name
+    if k == 0x41:
+        v = _d205(s, p, k, vs, ve, f)
+        o.setComponentByPosition(0, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # administration-domain-name
+    if k == 0x42:
+        v = _d206(s, p, k, vs, ve, f)
+        o.setComponentByPosition(1, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # network-address
+    if k == 0x80:
+        if f:
+            raise Fallback
+        v = _S207.clone(s[vs:ve])
+        o.setComponentByPosition(2, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # terminal-identifier
+    if k == 0x81:
+        if f:
+            raise Fallback
+        v = _S208.clone(s[vs:ve])
+        o.setComponentByPosition(3, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # private-domain-name
+    if k == 0x82:
+        v = _d209(s, p, k, vs, ve, f)
+        o.setComponentByPosition(4, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # organization-name
+    if k == 0x83:
+        if f:
+            raise Fallback
+        v = _S210.clone(s[vs:ve])
+        o.setComponentByPosition(5, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # numeric-user-identifier
+    if k == 0x84:
+        if f:
+            raise Fallback
+        v = _S211.clone(s[vs:ve])
+        o.setComponentByPosition(6, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # personal-name
+    if k == 0x85:
+        v = _P212.decode(s, p, k, vs, ve, f, None)
+        o.setComponentByPosition(7, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # organizational-unit-names
+    if k == 0x86:
+        v = _d213(s, p, k, vs, ve, f)
+        o.setComponentByPosition(8, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d190(s, p, k, vs, ve, f):
+    # BuiltInDomainDefinedAttributes
+    if not f:
+        raise Fallback
+    o = _S190.clone()
+    o.clear()
+    e = ve
+    p = vs
+    i = 0
+    while p < e:
+        k, f, vs, ve = _h(s, p, e)
+        if k != 0x10:
+            raise Fallback
+        v = _d214(s, p, k, vs, ve, f)
+        o.setComponentByPosition(i, v, False, False, False)
+        i += 1
+        p = ve
+    return o
+
+
+def _d191(s, p, k, vs, ve, f):
+    # ExtensionAttributes
+    if not f:
+        raise Fallback
+    o = _S191.clone()
+    o.clear()
+    e = ve
+    p = vs
+    i = 0
+    while p < e:
+        k, f, vs, ve = _h(s, p, e)
+        if k != 0x10:
+            raise Fallback
+        v = _d215(s, p, k, vs, ve, f)
+        o.setComponentByPosition(i, v, False, False, False)
+        i += 1
+        p = ve
+    return o
+
+
+def _d192(s, p, k, vs, ve, f):
+    # DirectoryString
+    p = vs
+    k, f, vs, e1 = _h(s, p, ve)
+    if e1 != ve:
+        raise Fallback
+    o = _S192.clone()
+    if k == 0x14:  # teletexString
+        if f:
+            raise Fallback
+        v = _S216.clone(s[vs:ve])
+        o.setComponentByPosition(0, v, False, False, False)
+    elif k == 0x13:  # printableString
+        if f:
+            raise Fallback
+        v = _S217.clone(s[vs:ve])
+        o.setComponentByPosition(1, v, False, False, False)
+    elif k == 0x1c:  # universalString
+        if f:
+            raise Fallback
+        v = _S218.clone(s[vs:ve])
+        o.setComponentByPosition(2, v, False, False, False)
+    elif k == 0xc:  # utf8String
+        if f:
+            raise Fallback
+        v = _S219.clone(s[vs:ve])
+        o.setComponentByPosition(3, v, False, False, False)
+    elif k == 0x1e:  # bmpString
+        if f:
+            raise Fallback
+        v = _S220.clone(s[vs:ve])
+        o.setComponentByPosition(4, v, False, False, False)
+    else:
+        raise Fallback
+    return o
+
+
+def _d193(s, p, k, vs, ve, f):
+    # DirectoryString
+    p = vs
+    k, f, vs, e1 = _h(s, p, ve)
+    if e1 != ve:
+        raise Fallback
+    o = _S193.clone()
+    if k == 0x14:  # teletexString
+        if f:
+            raise Fallback
+        v = _S216.clone(s[vs:ve])
+        o.setComponentByPosition(0, v, False, False, False)
+    elif k == 0x13:  # printableString
+        if f:
+            raise Fallback
+        v = _S217.clone(s[vs:ve])
+        o.setComponentByPosition(1, v, False, False, False)
+    elif k == 0x1c:  # universalString
+        if f:
+            raise Fallback
+        v = _S218.clone(s[vs:ve])
+        o.setComponentByPosition(2, v, False, False, False)
+    elif k == 0xc:  # utf8String
+        if f:
+            raise Fallback
+        v = _S219.clone(s[vs:ve])
+        o.setComponentByPosition(3, v, False, False, False)
+    elif k == 0x1e:  # bmpString
+        if f:
+            raise Fallback
+        v = _S220.clone(s[vs:ve])
+        o.setComponentByPosition(4, v, False, False, False)
+    else:
+        raise Fallback
+    return o
+
+
+def _d195(s, p, k, vs, ve, f):
+    # AnotherName
+    if not f:
+        raise Fallback
+    o = _S195.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # type-id
+    if k != 0x6:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _P221.table.intern(s[vs:ve])
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # value
+    if k is None:
+        raise Fallback
+    v = _S222.clone(s[vs:ve] if k == 0x80 else s[p:ve])
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d198(s, p, k, vs, ve, f):
+    # ORAddress
+    if not f:
+        raise Fallback
+    o = _S198.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # built-in-standard-attributes
+    if k != 0x10:
+        raise Fallback
+    v = _d223(s, p, k, vs, ve, f)
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # built-in-domain-defined-attributes
+    if k == 0x10:
+        v = _d224(s, p, k, vs, ve, f)
+        o.setComponentByPosition(1, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # extension-attributes
+    if k == 0x11:
+        v = _d225(s, p, k, vs, ve, f)
+        o.setComponentByPosition(2, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d199(s, p, k, vs, ve, f):
+    # Name
+    p = vs
+    k, f, vs, e1 = _h(s, p, ve)
+    if e1 != ve:
+        raise Fallback
+    o = _S199.clone()
+    if k == 0x10:  # rdnSequence
+        v = _d226(s, p, k, vs, ve, f)
+        o.setComponentByPosition(0, v, False, False, False)
+    else:
+        raise Fallback
+    return o
+
+
+def _d200(s, p, k, vs, ve, f):
+    # EDIPartyName
+    if not f:
+        raise Fallback
+    o = _S200.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # nameAssigner
+    if k == 0x80:
+        v = _d227(s, p, k, vs, ve, f)
+        o.setComponentByPosition(0, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # partyName
+    if k != 0x81:
+        raise Fallback
+    v = _d228(s, p, k, vs, ve, f)
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d205(s, p, k, vs, ve, f):
+    # CountryName
+    p = vs
+    k, f, vs, e1 = _h(s, p, ve)
+    if e1 != ve:
+        raise Fallback
+    o = _S205.clone()
+    if k == 0x12:  # x121-dcc-code
+        if f:
+            raise Fallback
+        v = _S229.clone(s[vs:ve])
+        o.setComponentByPosition(0, v, False, False, False)
+    elif k == 0x13:  # iso-3166-alpha2-code
+        if f:
+            raise Fallback
+        v = _S230.clone(s[vs:ve])
+        o.setComponentByPosition(1, v, False, False, False)
+    else:
+        raise Fallback
+    return o
+
+
+def _d206(s, p, k, vs, ve, f):
+    # AdministrationDomainName
+    p = vs
+    k, f, vs, e1 = _h(s, p, ve)
+    if e1 != ve:
+        raise Fallback
+    o = _S206.clone()
+    if k == 0x12:  # numeric
+        if f:
+            raise Fallback
+        v = _S231.clone(s[vs:ve])
+        o.setComponentByPosition(0, v, False, False, False)
+    elif k == 0x13:  # printable
+        if f:
+            raise Fallback
+        v = _S232.clone(s[vs:ve])
+        o.setComponentByPosition(1, v, False, False, False)
+    else:
+        raise Fallback
+    return o
+
+
+def _d209(s, p, k, vs, ve, f):
+    # PrivateDomainName
+    p = vs
+    k, f, vs, e1 = _h(s, p, ve)
+    if e1 != ve:
+        raise Fallback
+    o = _S209.clone()
+    if k == 0x12:  # numeric
+        if f:
+            raise Fallback
+        v = _S233.clone(s[vs:ve])
+        o.setComponentByPosition(0, v, False, False, False)
+    elif k == 0x13:  # printable
+        if f:
+            raise Fallback
+        v = _S234.clone(s[vs:ve])
+        o.setComponentByPosition(1, v, False, False, False)
+    else:
+        raise Fallback
+    return o
+
+
+def _d213(s, p, k, vs, ve, f):
+    # OrganizationalUnitNames
+    if not f:
+        raise Fallback
+    o = _S213.clone()
+    o.clear()
+    e = ve
+    p = vs
+    i = 0
+    while p < e:
+        k, f, vs, ve = _h(s, p, e)
+        if k != 0x13:
+            raise Fallback
+        if f:
+            raise Fallback
+        v = _S235.clone(s[vs:ve])
+        o.setComponentByPosition(i, v, False, False, False)
+        i += 1
+        p = ve
+    return o
+
+
+def _d214(s, p, k, vs, ve, f):
+    # BuiltInDomainDefinedAttribute
+    if not f:
+        raise Fallback
+    o = _S214.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # type
+    if k != 0x13:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S236.clone(s[vs:ve])
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # value
+    if k != 0x13:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S237.clone(s[vs:ve])
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d215(s, p, k, vs, ve, f):
+    # ExtensionAttribute
+    if not f:
+        raise Fallback
+    o = _S215.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # extension-attribute-type
+    if k != 0x80:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S238.clone(int.from_bytes(s[vs:ve], 'big', signed=True))
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # extension-attribute-value
+    if k is None:
+        raise Fallback
+    v = _S239.clone(s[vs:ve] if k == 0x81 else s[p:ve])
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d223(s, p, k, vs, ve, f):
+    # BuiltInStandardAttributes
+    if not f:
+        raise Fallback
+    o = _S223.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # country-name
+    if k == 0x41:
+        v = _d240(s, p, k, vs, ve, f)
+        o.setComponentByPosition(0, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # administration-domain-name
+    if k == 0x42:
+        v = _d241(s, p, k, vs, ve, f)
+        o.setComponentByPosition(1, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # network-address
+    if k == 0x80:
+        if f:
+            raise Fallback
+        v = _S242.clone(s[vs:ve])
+        o.setComponentByPosition(2, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # terminal-identifier
+    if k == 0x81:
+        if f:
+            raise Fallback
+        v = _S243.clone(s[vs:ve])
+        o.setComponentByPosition(3, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # private-domain-name
+    if k == 0x82:
+        v = _d244(s, p, k, vs, ve, f)
+        o.setComponentByPosition(4, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # organization-name
+    if k == 0x83:
+        if f:
+            raise Fallback
+        v = _S245.clone(s[vs:ve])
+        o.setComponentByPosition(5, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # numeric-user-identifier
+    if k == 0x84:
+        if f:
+            raise Fallback
+        v = _S246.clone(s[vs:ve])
+        o.setComponentByPosition(6, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # personal-name
+    if k == 0x85:
+        v = _P247.decode(s, p, k, vs, ve, f, None)
+        o.setComponentByPosition(7, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # organizational-unit-names
+    if k == 0x86:
+        v = _d248(s, p, k, vs, ve, f)
+        o.setComponentByPosition(8, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d224(s, p, k, vs, ve, f):
+    # BuiltInDomainDefinedAttributes
+    if not f:
+        raise Fallback
+    o = _S224.clone()
+    o.clear()
+    e = ve
+    p = vs
+    i = 0
+    while p < e:
+        k, f, vs, ve = _h(s, p, e)
+        if k != 0x10:
+            raise Fallback
+        v = _d249(s, p, k, vs, ve, f)
+        o.setComponentByPosition(i, v, False, False, False)
+        i += 1
+        p = ve
+    return o
+
+
+def _d225(s, p, k, vs, ve, f):
+    # ExtensionAttributes
+    if not f:
+        raise Fallback
+    o = _S225.clone()
+    o.clear()
+    e = ve
+    p = vs
+    i = 0
+    while p < e:
+        k, f, vs, ve = _h(s, p, e)
+        if k != 0x10:
+            raise Fallback
+        v = _d250(s, p, k, vs, ve, f)
+        o.setComponentByPosition(i, v, False, False, False)
+        i += 1
+        p = ve
+    return o
+
+
+def _d226(s, p, k, vs, ve, f):
+    # RDNSequence
+    if not f:
+        raise Fallback
+    o = _S226.clone()
+    o.clear()
+    e = ve
+    p = vs
+    i = 0
+    while p < e:
+        k, f, vs, ve = _h(s, p, e)
+        if k != 0x11:
+            raise Fallback
+        v = _d251(s, p, k, vs, ve, f)
+        o.setComponentByPosition(i, v, False, False, False)
+        i += 1
+        p = ve
+    return o
+
+
+def _d227(s, p, k, vs, ve, f):
+    # DirectoryString
+    p = vs
+    k, f, vs, e1 = _h(s, p, ve)
+    if e1 != ve:
+        raise Fallback
+    o = _S227.clone()
+    if k == 0x14:  # teletexString
+        if f:
+            raise Fallback
+        v = _S252.clone(s[vs:ve])
+        o.setComponentByPosition(0, v, False, False, False)
+    elif k == 0x13:  # printableString
+        if f:
+            raise Fallback
+        v = _S253.clone(s[vs:ve])
+        o.setComponentByPosition(1, v, False, False, False)
+    elif k == 0x1c:  # universalString
+        if f:
+            raise Fallback
+        v = _S254.clone(s[vs:ve])
+        o.setComponentByPosition(2, v, False, False, False)
+    elif k == 0xc:  # utf8String
+        if f:
+            raise Fallback
+        v = _S255.clone(s[vs:ve])
+        o.setComponentByPosition(3, v, False, False, False)
+    elif k == 0x1e:  # bmpString
+        if f:
+            raise Fallback
+        v = _S256.clone(s[vs:ve])
+        o.setComponentByPosition(4, v, False, False, False)
+    else:
+        raise Fallback
+    return o
+
+
+def _d228(s, p, k, vs, ve, f):
+    # DirectoryString
+    p = vs
+    k, f, vs, e1 = _h(s, p, ve)
+    if e1 != ve:
+        raise Fallback
+    o = _S228.clone()
+    if k == 0x14:  # teletexString
+        if f:
+            raise Fallback
+        v = _S252.clone(s[vs:ve])
+        o.setComponentByPosition(0, v, False, False, False)
+    elif k == 0x13:  # printableString
+        if f:
+            raise Fallback
+        v = _S253.clone(s[vs:ve])
+        o.setComponentByPosition(1, v, False, False, False)
+    elif k == 0x1c:  # universalString
+        if f:
+            raise Fallback
+        v = _S254.clone(s[vs:ve])
+        o.setComponentByPosition(2, v, False, False, False)
+    elif k == 0xc:  # utf8String
+        if f:
+            raise Fallback
+        v = _S255.clone(s[vs:ve])
+        o.setComponentByPosition(3, v, False, False, False)
+    elif k == 0x1e:  # bmpString
+        if f:
+            raise Fallback
+        v = _S256.clone(s[vs:ve])
+        o.setComponentByPosition(4, v, False, False, False)
+    else:
+        raise Fallback
+    return o
+
+
+def _d240(s, p, k, vs, ve, f):
+    # CountryName
+    p = vs
+    k, f, vs, e1 = _h(s, p, ve)
+    if e1 != ve:
+        raise Fallback
+    o = _S240.clone()
+    if k == 0x12:  # x121-dcc-code
+        if f:
+            raise Fallback
+        v = _S257.clone(s[vs:ve])
+        o.setComponentByPosition(0, v, False, False, False)
+    elif k == 0x13:  # iso-3166-alpha2-code
+        if f:
+            raise Fallback
+        v = _S258.clone(s[vs:ve])
+        o.setComponentByPosition(1, v, False, False, False)
+    else:
+        raise Fallback
+    return o
+
+
+def _d241(s, p, k, vs, ve, f):
+    # AdministrationDomainName
+    p = vs
+    k, f, vs, e1 = _h(s, p, ve)
+    if e1 != ve:
+        raise Fallback
+    o = _S241.clone()
+    if k == 0x12:  # numeric
+        if f:
+            raise Fallback
+        v = _S259.clone(s[vs:ve])
+        o.setComponentByPosition(0, v, False, False, False)
+    elif k == 0x13:  # printable
+        if f:
+            raise Fallback
+        v = _S260.clone(s[vs:ve])
+        o.setComponentByPosition(1, v, False, False, False)
+    else:
+        raise Fallback
+    return o
+
+
+def _d244(s, p, k, vs, ve, f):
+    # PrivateDomainName
+    p = vs
+    k, f, vs, e1 = _h(s, p, ve)
+    if e1 != ve:
+        raise Fallback
+    o = _S244.clone()
+    if k == 0x12:  # numeric
+        if f:
+            raise Fallback
+        v = _S261.clone(s[vs:ve])
+        o.setComponentByPosition(0, v, False, False, False)
+    elif k == 0x13:  # printable
+        if f:
+            raise Fallback
+        v = _S262.clone(s[vs:ve])
+        o.setComponentByPosition(1, v, False, False, False)
+    else:
+        raise Fallback
+    return o
+
+
+def _d248(s, p, k, vs, ve, f):
+    # OrganizationalUnitNames
+    if not f:
+        raise Fallback
+    o = _S248.clone()
+    o.clear()
+    e = ve
+    p = vs
+    i = 0
+    while p < e:
+        k, f, vs, ve = _h(s, p, e)
+        if k != 0x13:
+            raise Fallback
+        if f:
+            raise Fallback
+        v = _S263.clone(s[vs:ve])
+        o.setComponentByPosition(i, v, False, False, False)
+        i += 1
+        p = ve
+    return o
+
+
+def _d249(s, p, k, vs, ve, f):
+    # BuiltInDomainDefinedAttribute
+    if not f:
+        raise Fallback
+    o = _S249.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # type
+    if k != 0x13:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S264.clone(s[vs:ve])
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # value
+    if k != 0x13:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S265.clone(s[vs:ve])
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d250(s, p, k, vs, ve, f):
+    # ExtensionAttribute
+    if not f:
+        raise Fallback
+    o = _S250.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # extension-attribute-type
+    if k != 0x80:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S266.clone(int.from_bytes(s[vs:ve], 'big', signed=True))
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # extension-attribute-value
+    if k is None:
+        raise Fallback
+    v = _S267.clone(s[vs:ve] if k == 0x81 else s[p:ve])
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d251(s, p, k, vs, ve, f):
+    # RelativeDistinguishedName
+    if not f:
+        raise Fallback
+    o = _S251.clone()
+    o.clear()
+    e = ve
+    p = vs
+    i = 0
+    while p < e:
+        k, f, vs, ve = _h(s, p, e)
+        if k != 0x10:
+            raise Fallback
+        v = _d268(s, p, k, vs, ve, f)
+        o.setComponentByPosition(i, v, False, False, False)
+        i += 1
+        p = ve
+    return o
+
+
+def _d268(s, p, k, vs, ve, f):
+    # AttributeTypeAndValue
+    if not f:
+        raise Fallback
+    o = _S268.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # type
+    if k != 0x6:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _P269.table.intern(s[vs:ve])
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # value
+    if k is None:
+        raise Fallback
+    v = _S270.clone(s[p:ve])
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def decode_rfc5652_SignedData(s):
+    p = 0
+    k, f, vs, ve = _h(s, 0, len(s))
+    if k != 0x10:
+        raise Fallback
+    v = _d74(s, p, k, vs, ve, f)
+    return v, ve
+
+
+def _d271(s, p, k, vs, ve, f):
+    # TSTInfo
+    if not f:
+        raise Fallback
+    o = _S271.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # version
+    if k != 0x2:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S272.clone(int.from_bytes(s[vs:ve], 'big', signed=True))
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # policy
+    if k != 0x6:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _P273.table.intern(s[vs:ve])
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # messageImprint
+    if k != 0x10:
+        raise Fallback
+    v = _d274(s, p, k, vs, ve, f)
+    o.setComponentByPosition(2, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # serialNumber
+    if k != 0x2:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S275.clone(int.from_bytes(s[vs:ve], 'big', signed=True))
+    o.setComponentByPosition(3, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # genTime
+    if k != 0x18:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S276.clone(s[vs:ve])
+    o.setComponentByPosition(4, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # accuracy
+    if k == 0x10:
+        v = _d277(s, p, k, vs, ve, f)
+        o.setComponentByPosition(5, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # ordering
+    if k == 0x1:
+        if f:
+            raise Fallback
+        v = _S278.clone(_boolean(s[vs:ve]))
+        o.setComponentByPosition(6, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # nonce
+    if k == 0x2:
+        if f:
+            raise Fallback
+        v = _S279.clone(int.from_bytes(s[vs:ve], 'big', signed=True))
+        o.setComponentByPosition(7, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # tsa
+    if k == 0x80:
+        v = _d280(s, p, k, vs, ve, f)
+        o.setComponentByPosition(8, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # extensions
+    if k == 0x81:
+        v = _d281(s, p, k, vs, ve, f)
+        o.setComponentByPosition(9, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d274(s, p, k, vs, ve, f):
+    # MessageImprint
+    if not f:
+        raise Fallback
+    o = _S274.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # hashAlgorithm
+    if k != 0x10:
+        raise Fallback
+    v = _d282(s, p, k, vs, ve, f)
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # hashedMessage
+    if k != 0x4:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _S283.clone(s[vs:ve])
+    o.setComponentByPosition(1, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d277(s, p, k, vs, ve, f):
+    # Accuracy
+    if not f:
+        raise Fallback
+    o = _S277.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # seconds
+    if k == 0x2:
+        if f:
+            raise Fallback
+        v = _S284.clone(int.from_bytes(s[vs:ve], 'big', signed=True))
+        o.setComponentByPosition(0, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # millis
+    if k == 0x80:
+        if f:
+            raise Fallback
+        v = _S285.clone(int.from_bytes(s[vs:ve], 'big', signed=True))
+        o.setComponentByPosition(1, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    # micros
+    if k == 0x81:
+        if f:
+            raise Fallback
+        v = _S286.clone(int.from_bytes(s[vs:ve], 'big', signed=True))
+        o.setComponentByPosition(2, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def _d280(s, p, k, vs, ve, f):
+    # GeneralName
+    p = vs
+    k, f, vs, e1 = _h(s, p, ve)
+    if e1 != ve:
+        raise Fallback
+    o = _S280.clone()
+    if k == 0x80:  # otherName
+        v = _d163(s, p, k, vs, ve, f)
+        o.setComponentByPosition(0, v, False, False, False)
+    elif k == 0x81:  # rfc822Name
+        if f:
+            raise Fallback
+        v = _S164.clone(s[vs:ve])
+        o.setComponentByPosition(1, v, False, False, False)
+    elif k == 0x82:  # dNSName
+        if f:
+            raise Fallback
+        v = _S165.clone(s[vs:ve])
+        o.setComponentByPosition(2, v, False, False, False)
+    elif k == 0x83:  # x400Address
+        v = _d166(s, p, k, vs, ve, f)
+        o.setComponentByPosition(3, v, False, False, False)
+    elif k == 0x84:  # directoryName
+        v = _d167(s, p, k, vs, ve, f)
+        o.setComponentByPosition(4, v, False, False, False)
+    elif k == 0x85:  # ediPartyName
+        v = _d168(s, p, k, vs, ve, f)
+        o.setComponentByPosition(5, v, False, False, False)
+    elif k == 0x86:  # uniformResourceIdentifier
+        if f:
+            raise Fallback
+        v = _S169.clone(s[vs:ve])
+        o.setComponentByPosition(6, v, False, False, False)
+    elif k == 0x87:  # iPAddress
+        if f:
+            raise Fallback
+        v = _S170.clone(s[vs:ve])
+        o.setComponentByPosition(7, v, False, False, False)
+    elif k == 0x88:  # registeredID
+        if f:
+            raise Fallback
+        v = _P171.table.intern(s[vs:ve])
+        o.setComponentByPosition(8, v, False, False, False)
+    else:
+        raise Fallback
+    return o
+
+
+def _d281(s, p, k, vs, ve, f):
+    # Extensions
+    if not f:
+        raise Fallback
+    o = _S281.clone()
+    o.clear()
+    e = ve
+    p = vs
+    i = 0
+    while p < e:
+        k, f, vs, ve = _h(s, p, e)
+        if k != 0x10:
+            raise Fallback
+        v = _d21(s, p, k, vs, ve, f)
+        o.setComponentByPosition(i, v, False, False, False)
+        i += 1
+        p = ve
+    return o
+
+
+def _d282(s, p, k, vs, ve, f):
+    # AlgorithmIdentifier
+    if not f:
+        raise Fallback
+    o = _S282.clone()
+    o.clear()
+    e = ve
+    p = vs
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # algorithm
+    if k != 0x6:
+        raise Fallback
+    if f:
+        raise Fallback
+    v = _P14.table.intern(s[vs:ve])
+    o.setComponentByPosition(0, v, False, False, False)
+    p = ve
+    if p < e:
+        k, f, vs, ve = _h(s, p, e)
+    else:
+        k = None
+    # parameters
+    if k is not None:
+        v = _S15.clone(s[p:ve])
+        o.setComponentByPosition(1, v, False, False, False)
+        p = ve
+        if p < e:
+            k, f, vs, ve = _h(s, p, e)
+        else:
+            k = None
+    if k is not None:
+        raise Fallback
+    return o
+
+
+def decode_rfc3161_TSTInfo(s):
+    p = 0
+    k, f, vs, ve = _h(s, 0, len(s))
+    if k != 0x10:
+        raise Fallback
+    v = _d271(s, p, k, vs, ve, f)
+    return v, ve
+
+
+decoders = {
+    ('pyasn1_alt_modules.rfc5280', 'Certificate'): (decode_rfc5280_Certificate, 'b3361f8964e3357c6ad07d1370a63305'),
+    ('pyasn1_alt_modules.rfc5280', 'CertificateList'): (decode_rfc5280_CertificateList, '5f05b7fc721b792718266e089a5e58d4'),
+    ('pyasn1_alt_modules.rfc6960', 'BasicOCSPResponse'): (decode_rfc6960_BasicOCSPResponse, 'f2cbd7e6576cfd732054475952a262fd'),
+    ('pyasn1_alt_modules.rfc5652', 'SignedData'): (decode_rfc5652_SignedData, 'c688beda0e7e94579ca2f963949ebe3b'),
+    ('pyasn1_alt_modules.rfc3161', 'TSTInfo'): (decode_rfc3161_TSTInfo, '2b9508bee79b4d14a58a4f935b5ee0b2'),
+}
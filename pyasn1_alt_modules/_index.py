@@ -0,0 +1,991 @@
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+# Generated by tools/mkindex.py -- do not edit.
+#
+
+modules = (
+    'alphabet',
+    'bulk',
+    'cache',
+    'certview',
+    'cmsstream',
+    'codegen',
+    'crl',
+    'lazycert',
+    'ocsp',
+    'oids',
+    'opentypemap',
+    'pem',
+    'pkcs12',
+    'plan',
+    'projection',
+    'rfc10002',
+    'rfc1155',
+    'rfc1157',
+    'rfc1901',
+    'rfc1902',
+    'rfc1905',
+    'rfc2040',
+    'rfc2251',
+    'rfc2314',
+    'rfc2315',
+    'rfc2437',
+    'rfc2459',
+    'rfc2511',
+    'rfc2528',
+    'rfc2560',
+    'rfc2631',
+    'rfc2634',
+    'rfc2743',
+    'rfc2876',
+    'rfc2898',
+    'rfc2985',
+    'rfc2986',
+    'rfc3058',
+    'rfc3114',
+    'rfc3125',
+    'rfc3161',
+    'rfc3217',
+    'rfc3274',
+    'rfc3279',
+    'rfc3280',
+    'rfc3281',
+    'rfc3370',
+    'rfc3412',
+    'rfc3414',
+    'rfc3447',
+    'rfc3537',
+    'rfc3546',
+    'rfc3560',
+    'rfc3565',
+    'rfc3657',
+    'rfc3709',
+    'rfc3739',
+    'rfc3770',
+    'rfc3779',
+    'rfc3820',
+    'rfc3852',
+    'rfc3874',
+    'rfc4010',
+    'rfc4043',
+    'rfc4055',
+    'rfc4056',
+    'rfc4059',
+    'rfc4073',
+    'rfc4108',
+    'rfc4210',
+    'rfc4211',
+    'rfc4212',
+    'rfc4231',
+    'rfc4262',
+    'rfc4334',
+    'rfc4357',
+    'rfc4366',
+    'rfc4387',
+    'rfc4476',
+    'rfc4490',
+    'rfc4491',
+    'rfc4683',
+    'rfc4985',
+    'rfc4998',
+    'rfc5035',
+    'rfc5055',
+    'rfc5083',
+    'rfc5084',
+    'rfc5126',
+    'rfc5208',
+    'rfc5275',
+    'rfc5276',
+    'rfc5280',
+    'rfc5480',
+    'rfc5544',
+    'rfc5636',
+    'rfc5639',
+    'rfc5649',
+    'rfc5652',
+    'rfc5697',
+    'rfc5698',
+    'rfc5751',
+    'rfc5752',
+    'rfc5753',
+    'rfc5755',
+    'rfc5794',
+    'rfc5913',
+    'rfc5914',
+    'rfc5915',
+    'rfc5916',
+    'rfc5917',
+    'rfc5924',
+    'rfc5934',
+    'rfc5940',
+    'rfc5958',
+    'rfc5990',
+    'rfc6010',
+    'rfc6019',
+    'rfc6031',
+    'rfc6032',
+    'rfc6066',
+    'rfc6120',
+    'rfc6170',
+    'rfc6187',
+    'rfc6210',
+    'rfc6211',
+    'rfc6402',
+    'rfc6482',
+    'rfc6484',
+    'rfc6486',
+    'rfc6487',
+    'rfc6492',
+    'rfc6493',
+    'rfc6494',
+    'rfc6664',
+    'rfc6955',
+    'rfc6960',
+    'rfc6962',
+    'rfc7030',
+    'rfc7191',
+    'rfc7229',
+    'rfc7292',
+    'rfc7296',
+    'rfc7508',
+    'rfc7585',
+    'rfc7633',
+    'rfc7693',
+    'rfc7773',
+    'rfc7836',
+    'rfc7894',
+    'rfc7906',
+    'rfc7914',
+    'rfc8017',
+    'rfc8018',
+    'rfc8103',
+    'rfc8209',
+    'rfc8226',
+    'rfc8295',
+    'rfc8358',
+    'rfc8360',
+    'rfc8366',
+    'rfc8398',
+    'rfc8410',
+    'rfc8418',
+    'rfc8419',
+    'rfc8479',
+    'rfc8494',
+    'rfc8520',
+    'rfc8619',
+    'rfc8649',
+    'rfc8692',
+    'rfc8696',
+    'rfc8702',
+    'rfc8708',
+    'rfc8737',
+    'rfc8769',
+    'rfc8894',
+    'rfc8951',
+    'rfc8954',
+    'rfc8994',
+    'rfc8995',
+    'rfc9044',
+    'rfc9092',
+    'rfc9118',
+    'rfc9174',
+    'rfc9189',
+    'rfc9215',
+    'rfc9286',
+    'rfc9289',
+    'rfc9310',
+    'rfc9323',
+    'rfc9336',
+    'rfc9337',
+    'rfc9345',
+    'rfc9385',
+    'rfc9399',
+    'rfc9480',
+    'rfc9481',
+    'rfc9509',
+    'rfc9548',
+    'rfc9579',
+    'rfc9582',
+    'rfc9598',
+    'rfc9608',
+    'rfc9629',
+    'rfc9632',
+    'rfc9654',
+    'rfc9688',
+    'rfc9690',
+    'rfc9691',
+    'rfc9708',
+    'rfc9709',
+    'rfc9734',
+    'rfc9763',
+    'rfc9802',
+    'rfc9809',
+    'rfc9810',
+    'rfc9814',
+    'rfc9879',
+    'rfc9881',
+    'rfc9882',
+    'rfc9883',
+    'rfc9908',
+    'rfc9909',
+    'rfc9925',
+    'rfc9935',
+    'rfc9936',
+    'rfc9939',
+    'rfc9977',
+    'rfc9999',
+    'spans',
+    'tlv',
+)
+
+opentypeMaps = {
+    'algorithmIdentifierMap': {
+        '1.0.18033.2.2.4': 'rfc5990',
+        '1.2.392.200011.61.1.1.1.2': 'rfc3657',
+        '1.2.392.200011.61.1.1.1.3': 'rfc3657',
+        '1.2.392.200011.61.1.1.1.4': 'rfc3657',
+        '1.2.410.200004.1.4': 'rfc4010',
+        '1.2.410.200004.7.1.1.1': 'rfc4010',
+        '1.2.410.200046.1.1.1': 'rfc5794',
+        '1.2.410.200046.1.1.2': 'rfc5794',
+        '1.2.410.200046.1.1.3': 'rfc5794',
+        '1.2.410.200046.1.1.4': 'rfc5794',
+        '1.2.410.200046.1.1.5': 'rfc5794',
+        '1.2.410.200046.1.1.6': 'rfc5794',
+        '1.2.410.200046.1.1.7': 'rfc5794',
+        '1.2.410.200046.1.1.8': 'rfc5794',
+        '1.2.410.200046.1.1.9': 'rfc5794',
+        '1.2.410.200046.1.1.10': 'rfc5794',
+        '1.2.410.200046.1.1.11': 'rfc5794',
+        '1.2.410.200046.1.1.12': 'rfc5794',
+        '1.2.410.200046.1.1.13': 'rfc5794',
+        '1.2.410.200046.1.1.14': 'rfc5794',
+        '1.2.410.200046.1.1.15': 'rfc5794',
+        '1.2.410.200046.1.1.21': 'rfc5794',
+        '1.2.410.200046.1.1.22': 'rfc5794',
+        '1.2.410.200046.1.1.23': 'rfc5794',
+        '1.2.410.200046.1.1.31': 'rfc5794',
+        '1.2.410.200046.1.1.32': 'rfc5794',
+        '1.2.410.200046.1.1.33': 'rfc5794',
+        '1.2.410.200046.1.1.34': 'rfc5794',
+        '1.2.410.200046.1.1.35': 'rfc5794',
+        '1.2.410.200046.1.1.36': 'rfc5794',
+        '1.2.410.200046.1.1.37': 'rfc5794',
+        '1.2.410.200046.1.1.38': 'rfc5794',
+        '1.2.410.200046.1.1.39': 'rfc5794',
+        '1.2.643.2.2.9': 'rfc4357',
+        '1.2.643.2.2.13.0': 'rfc4490',
+        '1.2.643.2.2.13.1': 'rfc4490',
+        '1.2.643.2.2.14.0': 'rfc4357',
+        '1.2.643.2.2.14.1': 'rfc4357',
+        '1.2.643.2.2.19': 'rfc4357',
+        '1.2.643.2.2.20': 'rfc4357',
+        '1.2.643.2.2.20.1': 'rfc4357',
+        '1.2.643.2.2.20.2': 'rfc4357',
+        '1.2.643.2.2.20.3': 'rfc4357',
+        '1.2.643.2.2.20.4': 'rfc4357',
+        '1.2.643.2.2.21': 'rfc4357',
+        '1.2.643.2.2.30.0': 'rfc4357',
+        '1.2.643.2.2.30.1': 'rfc4357',
+        '1.2.643.2.2.31.0': 'rfc4357',
+        '1.2.643.2.2.31.1': 'rfc4357',
+        '1.2.643.2.2.31.2': 'rfc4357',
+        '1.2.643.2.2.31.3': 'rfc4357',
+        '1.2.643.2.2.31.4': 'rfc4357',
+        '1.2.643.2.2.32.0': 'rfc4357',
+        '1.2.643.2.2.32.2': 'rfc4357',
+        '1.2.643.2.2.32.3': 'rfc4357',
+        '1.2.643.2.2.32.4': 'rfc4357',
+        '1.2.643.2.2.32.5': 'rfc4357',
+        '1.2.643.2.2.33.1': 'rfc4357',
+        '1.2.643.2.2.33.2': 'rfc4357',
+        '1.2.643.2.2.33.3': 'rfc4357',
+        '1.2.643.7.1.1.1.1': 'rfc9215',
+        '1.2.643.7.1.1.1.2': 'rfc9215',
+        '1.2.643.7.1.1.4.2': 'rfc9337',
+        '1.2.643.7.1.1.5.1.1': 'rfc9337',
+        '1.2.643.7.1.1.5.1.2': 'rfc9337',
+        '1.2.643.7.1.1.5.2.1': 'rfc9337',
+        '1.2.643.7.1.1.5.2.2': 'rfc9337',
+        '1.2.840.10040.4.1': 'rfc3279',
+        '1.2.840.10045.2.1': 'rfc3279',
+        '1.2.840.10046.2.1': 'rfc3279',
+        '1.2.840.113533.7.66.13': 'rfc9480',
+        '1.2.840.113533.7.66.16': 'rfc9810',
+        '1.2.840.113533.7.66.30': 'rfc9480',
+        '1.2.840.113549.1.1.1': 'rfc3279',
+        '1.2.840.113549.1.1.2': 'rfc3279',
+        '1.2.840.113549.1.1.4': 'rfc3279',
+        '1.2.840.113549.1.1.5': 'rfc3279',
+        '1.2.840.113549.1.1.7': 'rfc4055',
+        '1.2.840.113549.1.1.8': 'rfc4055',
+        '1.2.840.113549.1.1.9': 'rfc4055',
+        '1.2.840.113549.1.1.10': 'rfc4055',
+        '1.2.840.113549.1.1.11': 'rfc4055',
+        '1.2.840.113549.1.1.12': 'rfc4055',
+        '1.2.840.113549.1.1.13': 'rfc4055',
+        '1.2.840.113549.1.1.14': 'rfc4055',
+        '1.2.840.113549.1.1.15': 'rfc8017',
+        '1.2.840.113549.1.1.16': 'rfc8017',
+        '1.2.840.113549.1.5.1': 'rfc8018',
+        '1.2.840.113549.1.5.3': 'rfc8018',
+        '1.2.840.113549.1.5.4': 'rfc8018',
+        '1.2.840.113549.1.5.6': 'rfc8018',
+        '1.2.840.113549.1.5.10': 'rfc8018',
+        '1.2.840.113549.1.5.11': 'rfc8018',
+        '1.2.840.113549.1.5.12': 'rfc8018',
+        '1.2.840.113549.1.5.13': 'rfc8018',
+        '1.2.840.113549.1.5.14': 'rfc8018',
+        '1.2.840.113549.1.9.16.3.5': 'rfc3370',
+        '1.2.840.113549.1.9.16.3.6': 'rfc5990',
+        '1.2.840.113549.1.9.16.3.7': 'rfc3370',
+        '1.2.840.113549.1.9.16.3.10': 'rfc3370',
+        '1.2.840.113549.1.9.16.3.11': 'rfc3537',
+        '1.2.840.113549.1.9.16.3.12': 'rfc3537',
+        '1.2.840.113549.1.9.16.3.13': 'rfc6210',
+        '1.2.840.113549.1.9.16.3.14': 'rfc5990',
+        '1.2.840.113549.1.9.16.3.31': 'rfc9709',
+        '1.2.840.113549.1.12.1.1': 'rfc7292',
+        '1.2.840.113549.1.12.1.2': 'rfc7292',
+        '1.2.840.113549.1.12.1.3': 'rfc7292',
+        '1.2.840.113549.1.12.1.4': 'rfc7292',
+        '1.2.840.113549.1.12.1.5': 'rfc7292',
+        '1.2.840.113549.1.12.1.6': 'rfc7292',
+        '1.2.840.113549.2.2': 'rfc3279',
+        '1.2.840.113549.2.5': 'rfc3279',
+        '1.2.840.113549.2.7': 'rfc8018',
+        '1.2.840.113549.2.8': 'rfc8018',
+        '1.2.840.113549.2.9': 'rfc8018',
+        '1.2.840.113549.2.10': 'rfc8018',
+        '1.2.840.113549.2.11': 'rfc8018',
+        '1.2.840.113549.2.12': 'rfc8018',
+        '1.2.840.113549.2.13': 'rfc8018',
+        '1.2.840.113549.3.2': 'rfc8018',
+        '1.2.840.113549.3.7': 'rfc8018',
+        '1.2.840.113549.3.8': 'rfc2040',
+        '1.2.840.113549.3.9': 'rfc8018',
+        '1.3.6.1.4.1.188.7.1.1.2': 'rfc3058',
+        '1.3.6.1.4.1.188.7.1.1.6': 'rfc3058',
+        '1.3.6.1.4.1.1722.12.2.1.5': 'rfc7693',
+        '1.3.6.1.4.1.1722.12.2.1.8': 'rfc7693',
+        '1.3.6.1.4.1.1722.12.2.1.12': 'rfc7693',
+        '1.3.6.1.4.1.1722.12.2.1.16': 'rfc7693',
+        '1.3.6.1.4.1.1722.12.2.2.4': 'rfc7693',
+        '1.3.6.1.4.1.1722.12.2.2.5': 'rfc7693',
+        '1.3.6.1.4.1.1722.12.2.2.7': 'rfc7693',
+        '1.3.6.1.4.1.1722.12.2.2.8': 'rfc7693',
+        '1.3.6.1.4.1.11591.4.11': 'rfc7914',
+        '1.3.6.1.5.5.7.6.3': 'rfc6955',
+        '1.3.6.1.5.5.7.6.4': 'rfc6955',
+        '1.3.6.1.5.5.7.6.5': 'rfc6955',
+        '1.3.6.1.5.5.7.6.6': 'rfc6955',
+        '1.3.6.1.5.5.7.6.7': 'rfc6955',
+        '1.3.6.1.5.5.7.6.8': 'rfc6955',
+        '1.3.6.1.5.5.7.6.15': 'rfc6955',
+        '1.3.6.1.5.5.7.6.16': 'rfc6955',
+        '1.3.6.1.5.5.7.6.17': 'rfc6955',
+        '1.3.6.1.5.5.7.6.18': 'rfc6955',
+        '1.3.6.1.5.5.7.6.25': 'rfc6955',
+        '1.3.6.1.5.5.7.6.26': 'rfc6955',
+        '1.3.6.1.5.5.7.6.27': 'rfc6955',
+        '1.3.6.1.5.5.7.6.28': 'rfc6955',
+        '1.3.6.1.5.5.8.1.2': 'rfc3370',
+        '1.3.14.3.2.7': 'rfc8018',
+        '1.3.14.3.2.26': 'rfc3279',
+        '1.3.132.1.11.0': 'rfc5753',
+        '1.3.132.1.11.1': 'rfc5753',
+        '1.3.132.1.11.2': 'rfc5753',
+        '1.3.132.1.11.3': 'rfc5753',
+        '1.3.132.1.12': 'rfc5480',
+        '1.3.132.1.13': 'rfc5480',
+        '1.3.132.1.14.0': 'rfc5753',
+        '1.3.132.1.14.1': 'rfc5753',
+        '1.3.132.1.14.2': 'rfc5753',
+        '1.3.132.1.14.3': 'rfc5753',
+        '1.3.132.1.15.0': 'rfc5753',
+        '1.3.132.1.15.1': 'rfc5753',
+        '1.3.132.1.15.2': 'rfc5753',
+        '1.3.132.1.15.3': 'rfc5753',
+        '1.3.133.16.840.9.44.1.1': 'rfc5990',
+        '1.3.133.16.840.9.44.1.2': 'rfc5990',
+        '1.3.133.16.840.63.0.2': 'rfc5753',
+        '1.3.133.16.840.63.0.3': 'rfc5753',
+        '1.3.133.16.840.63.0.16': 'rfc5753',
+        '2.16.840.1.101.2.1.1.4': 'rfc2876',
+        '2.16.840.1.101.2.1.1.22': 'rfc3279',
+        '2.16.840.1.101.2.1.1.24': 'rfc2876',
+        '2.16.840.1.101.3.4.1.2': 'rfc3565',
+        '2.16.840.1.101.3.4.1.5': 'rfc3565',
+        '2.16.840.1.101.3.4.1.6': 'rfc5084',
+        '2.16.840.1.101.3.4.1.7': 'rfc5084',
+        '2.16.840.1.101.3.4.1.9': 'rfc9044',
+        '2.16.840.1.101.3.4.1.22': 'rfc3565',
+        '2.16.840.1.101.3.4.1.25': 'rfc3565',
+        '2.16.840.1.101.3.4.1.26': 'rfc5084',
+        '2.16.840.1.101.3.4.1.27': 'rfc5084',
+        '2.16.840.1.101.3.4.1.29': 'rfc9044',
+        '2.16.840.1.101.3.4.1.42': 'rfc3565',
+        '2.16.840.1.101.3.4.1.45': 'rfc3565',
+        '2.16.840.1.101.3.4.1.46': 'rfc5084',
+        '2.16.840.1.101.3.4.1.47': 'rfc5084',
+        '2.16.840.1.101.3.4.1.49': 'rfc9044',
+        '2.16.840.1.101.3.4.2.1': 'rfc5990',
+        '2.16.840.1.101.3.4.2.2': 'rfc5990',
+        '2.16.840.1.101.3.4.2.3': 'rfc5990',
+        '2.16.840.1.101.3.4.2.4': 'rfc5990',
+        '2.16.840.1.101.3.4.2.5': 'rfc8017',
+        '2.16.840.1.101.3.4.2.6': 'rfc8017',
+        '2.16.840.1.101.3.4.2.18': 'rfc8419',
+        '2.16.840.1.101.3.4.2.19': 'rfc8702',
+        '2.16.840.1.101.3.4.2.20': 'rfc8702',
+        '2.16.840.1.101.3.4.2.21': 'rfc9688',
+        '2.16.840.1.101.3.4.2.22': 'rfc9688',
+        '2.16.840.1.101.3.4.3.13': 'rfc9688',
+        '2.16.840.1.101.3.4.3.14': 'rfc9688',
+        '2.16.840.1.101.3.4.3.15': 'rfc9688',
+        '2.16.840.1.101.3.4.3.16': 'rfc9688',
+    },
+    'certificateAttributesMap': {
+        '0.9.2342.19200300.100.1.25': 'rfc5280',
+        '1.2.643.3.131.1.1': 'rfc9215',
+        '1.2.643.100.1': 'rfc9215',
+        '1.2.643.100.3': 'rfc9215',
+        '1.2.643.100.4': 'rfc9215',
+        '1.2.643.100.5': 'rfc9215',
+        '1.2.643.100.114': 'rfc9215',
+        '1.2.840.113549.1.9.1': 'rfc5280',
+        '1.2.840.113549.1.9.2': 'rfc2985',
+        '1.2.840.113549.1.9.7': 'rfc2985',
+        '1.2.840.113549.1.9.8': 'rfc2985',
+        '1.2.840.113549.1.9.9': 'rfc2985',
+        '1.2.840.113549.1.9.14': 'rfc2985',
+        '1.2.840.113549.1.9.16.2.60': 'rfc9763',
+        '1.2.840.113549.1.9.16.2.61': 'rfc9908',
+        '1.2.840.113549.1.9.16.2.62': 'rfc9908',
+        '1.2.840.113549.1.9.25.2': 'rfc2985',
+        '1.2.840.113549.1.9.25.5': 'rfc2985',
+        '1.3.6.1.4.1.22112.2.1': 'rfc9883',
+        '1.3.6.1.5.5.7.9.1': 'rfc2985',
+        '1.3.6.1.5.5.7.9.2': 'rfc2985',
+        '1.3.6.1.5.5.7.9.3': 'rfc2985',
+        '1.3.6.1.5.5.7.9.4': 'rfc2985',
+        '1.3.6.1.5.5.7.9.5': 'rfc2985',
+        '1.3.6.1.5.5.7.10.1': 'rfc5755',
+        '1.3.6.1.5.5.7.10.2': 'rfc5755',
+        '1.3.6.1.5.5.7.10.3': 'rfc5755',
+        '1.3.6.1.5.5.7.10.4': 'rfc5755',
+        '1.3.6.1.5.5.7.10.6': 'rfc5755',
+        '1.3.6.1.5.5.7.10.7': 'rfc3770',
+        '1.3.6.1.5.5.7.25.1': 'rfc9925',
+        '2.5.1.5.55': 'rfc5755',
+        '2.5.4.3': 'rfc5280',
+        '2.5.4.4': 'rfc5280',
+        '2.5.4.5': 'rfc5280',
+        '2.5.4.6': 'rfc5280',
+        '2.5.4.7': 'rfc5280',
+        '2.5.4.8': 'rfc5280',
+        '2.5.4.10': 'rfc5280',
+        '2.5.4.11': 'rfc5280',
+        '2.5.4.12': 'rfc5280',
+        '2.5.4.41': 'rfc5280',
+        '2.5.4.42': 'rfc5280',
+        '2.5.4.43': 'rfc5280',
+        '2.5.4.44': 'rfc5280',
+        '2.5.4.46': 'rfc5280',
+        '2.5.4.55': 'rfc5755',
+        '2.5.4.65': 'rfc5280',
+        '2.5.4.72': 'rfc5755',
+        '2.16.840.1.101.2.1.5.68': 'rfc5917',
+        '2.16.840.1.101.2.1.5.69': 'rfc5916',
+        '2.16.840.1.113730.3.1.216': 'rfc2985',
+    },
+    'certificateExtensionsMap': {
+        '1.2.643.100.111': 'rfc9215',
+        '1.2.643.100.112': 'rfc9215',
+        '1.2.752.201.5.1': 'rfc7773',
+        '1.2.840.113549.1.9.15': 'rfc4262',
+        '1.3.6.1.4.1.11129.2.4.2': 'rfc6962',
+        '1.3.6.1.4.1.11129.2.4.5': 'rfc6962',
+        '1.3.6.1.4.1.44363.44': 'rfc9345',
+        '1.3.6.1.4.1.51483.2.1': 'rfc8649',
+        '1.3.6.1.5.5.7.1.1': 'rfc5280',
+        '1.3.6.1.5.5.7.1.2': 'rfc3739',
+        '1.3.6.1.5.5.7.1.3': 'rfc3739',
+        '1.3.6.1.5.5.7.1.4': 'rfc5755',
+        '1.3.6.1.5.5.7.1.6': 'rfc5755',
+        '1.3.6.1.5.5.7.1.7': 'rfc3779',
+        '1.3.6.1.5.5.7.1.8': 'rfc3779',
+        '1.3.6.1.5.5.7.1.10': 'rfc5755',
+        '1.3.6.1.5.5.7.1.12': 'rfc3709',
+        '1.3.6.1.5.5.7.1.13': 'rfc3770',
+        '1.3.6.1.5.5.7.1.14': 'rfc3820',
+        '1.3.6.1.5.5.7.1.15': 'rfc4476',
+        '1.3.6.1.5.5.7.1.16': 'rfc4059',
+        '1.3.6.1.5.5.7.1.18': 'rfc6010',
+        '1.3.6.1.5.5.7.1.19': 'rfc5697',
+        '1.3.6.1.5.5.7.1.20': 'rfc5934',
+        '1.3.6.1.5.5.7.1.21': 'rfc5913',
+        '1.3.6.1.5.5.7.1.24': 'rfc7633',
+        '1.3.6.1.5.5.7.1.25': 'rfc8520',
+        '1.3.6.1.5.5.7.1.26': 'rfc8226',
+        '1.3.6.1.5.5.7.1.27': 'rfc8226',
+        '1.3.6.1.5.5.7.1.28': 'rfc8360',
+        '1.3.6.1.5.5.7.1.29': 'rfc8360',
+        '1.3.6.1.5.5.7.1.30': 'rfc8520',
+        '1.3.6.1.5.5.7.1.31': 'rfc8737',
+        '1.3.6.1.5.5.7.1.32': 'rfc8995',
+        '1.3.6.1.5.5.7.1.33': 'rfc9118',
+        '1.3.6.1.5.5.7.1.34': 'rfc9310',
+        '1.3.6.1.5.5.7.1.35': 'rfc9999',
+        '1.3.6.1.5.5.7.1.36': 'rfc9763',
+        '1.3.6.1.5.5.7.48.1.2': 'rfc6960',
+        '1.3.6.1.5.5.7.48.1.3': 'rfc6960',
+        '1.3.6.1.5.5.7.48.1.4': 'rfc6960',
+        '1.3.6.1.5.5.7.48.1.5': 'rfc6960',
+        '1.3.6.1.5.5.7.48.1.6': 'rfc6960',
+        '1.3.6.1.5.5.7.48.1.7': 'rfc6960',
+        '1.3.6.1.5.5.7.48.1.8': 'rfc6960',
+        '1.3.6.1.5.5.7.48.1.9': 'rfc6960',
+        '2.5.29.9': 'rfc5280',
+        '2.5.29.14': 'rfc5280',
+        '2.5.29.15': 'rfc5280',
+        '2.5.29.16': 'rfc5280',
+        '2.5.29.17': 'rfc5280',
+        '2.5.29.18': 'rfc5280',
+        '2.5.29.19': 'rfc5280',
+        '2.5.29.20': 'rfc5280',
+        '2.5.29.21': 'rfc5280',
+        '2.5.29.23': 'rfc5280',
+        '2.5.29.24': 'rfc5280',
+        '2.5.29.27': 'rfc5280',
+        '2.5.29.28': 'rfc5280',
+        '2.5.29.29': 'rfc5280',
+        '2.5.29.30': 'rfc5280',
+        '2.5.29.31': 'rfc5280',
+        '2.5.29.32': 'rfc5280',
+        '2.5.29.33': 'rfc5280',
+        '2.5.29.35': 'rfc5280',
+        '2.5.29.36': 'rfc5280',
+        '2.5.29.37': 'rfc5280',
+        '2.5.29.55': 'rfc5755',
+        '2.5.29.56': 'rfc5755',
+    },
+    'cmpInfoTypeAndValueMap': {
+        '1.3.6.1.5.5.7.4.1': 'rfc9480',
+        '1.3.6.1.5.5.7.4.2': 'rfc9480',
+        '1.3.6.1.5.5.7.4.3': 'rfc9480',
+        '1.3.6.1.5.5.7.4.4': 'rfc9480',
+        '1.3.6.1.5.5.7.4.5': 'rfc9480',
+        '1.3.6.1.5.5.7.4.6': 'rfc9480',
+        '1.3.6.1.5.5.7.4.7': 'rfc9480',
+        '1.3.6.1.5.5.7.4.10': 'rfc9480',
+        '1.3.6.1.5.5.7.4.11': 'rfc9480',
+        '1.3.6.1.5.5.7.4.12': 'rfc9480',
+        '1.3.6.1.5.5.7.4.13': 'rfc9480',
+        '1.3.6.1.5.5.7.4.14': 'rfc9480',
+        '1.3.6.1.5.5.7.4.15': 'rfc9480',
+        '1.3.6.1.5.5.7.4.16': 'rfc9480',
+        '1.3.6.1.5.5.7.4.17': 'rfc9480',
+        '1.3.6.1.5.5.7.4.18': 'rfc9480',
+        '1.3.6.1.5.5.7.4.19': 'rfc9480',
+        '1.3.6.1.5.5.7.4.20': 'rfc9480',
+        '1.3.6.1.5.5.7.4.21': 'rfc9480',
+        '1.3.6.1.5.5.7.4.22': 'rfc9480',
+        '1.3.6.1.5.5.7.4.23': 'rfc9480',
+        '1.3.6.1.5.5.7.4.24': 'rfc9810',
+    },
+    'cmsAttributesMap': {
+        '1.2.840.113549.1.9.3': 'rfc5652',
+        '1.2.840.113549.1.9.4': 'rfc5652',
+        '1.2.840.113549.1.9.5': 'rfc5652',
+        '1.2.840.113549.1.9.6': 'rfc5652',
+        '1.2.840.113549.1.9.13': 'rfc2985',
+        '1.2.840.113549.1.9.14': 'rfc10002',
+        '1.2.840.113549.1.9.15': 'rfc5751',
+        '1.2.840.113549.1.9.16.2.1': 'rfc2634',
+        '1.2.840.113549.1.9.16.2.2': 'rfc2634',
+        '1.2.840.113549.1.9.16.2.3': 'rfc2634',
+        '1.2.840.113549.1.9.16.2.4': 'rfc2634',
+        '1.2.840.113549.1.9.16.2.5': 'rfc2634',
+        '1.2.840.113549.1.9.16.2.7': 'rfc2634',
+        '1.2.840.113549.1.9.16.2.9': 'rfc2634',
+        '1.2.840.113549.1.9.16.2.10': 'rfc2634',
+        '1.2.840.113549.1.9.16.2.11': 'rfc5751',
+        '1.2.840.113549.1.9.16.2.12': 'rfc2634',
+        '1.2.840.113549.1.9.16.2.14': 'rfc5126',
+        '1.2.840.113549.1.9.16.2.15': 'rfc5126',
+        '1.2.840.113549.1.9.16.2.16': 'rfc5126',
+        '1.2.840.113549.1.9.16.2.17': 'rfc5126',
+        '1.2.840.113549.1.9.16.2.18': 'rfc5126',
+        '1.2.840.113549.1.9.16.2.19': 'rfc5126',
+        '1.2.840.113549.1.9.16.2.20': 'rfc5126',
+        '1.2.840.113549.1.9.16.2.21': 'rfc5126',
+        '1.2.840.113549.1.9.16.2.22': 'rfc5126',
+        '1.2.840.113549.1.9.16.2.23': 'rfc5126',
+        '1.2.840.113549.1.9.16.2.24': 'rfc5126',
+        '1.2.840.113549.1.9.16.2.25': 'rfc5126',
+        '1.2.840.113549.1.9.16.2.26': 'rfc5126',
+        '1.2.840.113549.1.9.16.2.35': 'rfc4108',
+        '1.2.840.113549.1.9.16.2.36': 'rfc4108',
+        '1.2.840.113549.1.9.16.2.37': 'rfc4108',
+        '1.2.840.113549.1.9.16.2.38': 'rfc4108',
+        '1.2.840.113549.1.9.16.2.39': 'rfc4108',
+        '1.2.840.113549.1.9.16.2.40': 'rfc4108',
+        '1.2.840.113549.1.9.16.2.41': 'rfc4108',
+        '1.2.840.113549.1.9.16.2.42': 'rfc4108',
+        '1.2.840.113549.1.9.16.2.43': 'rfc4108',
+        '1.2.840.113549.1.9.16.2.44': 'rfc5126',
+        '1.2.840.113549.1.9.16.2.45': 'rfc5126',
+        '1.2.840.113549.1.9.16.2.46': 'rfc6019',
+        '1.2.840.113549.1.9.16.2.47': 'rfc5035',
+        '1.2.840.113549.1.9.16.2.48': 'rfc5126',
+        '1.2.840.113549.1.9.16.2.50': 'rfc4998',
+        '1.2.840.113549.1.9.16.2.51': 'rfc5752',
+        '1.2.840.113549.1.9.16.2.54': 'rfc7030',
+        '1.2.840.113549.1.9.16.2.55': 'rfc7508',
+        '1.2.840.113549.1.9.16.2.56': 'rfc7894',
+        '1.2.840.113549.1.9.16.2.57': 'rfc7894',
+        '1.2.840.113549.1.9.16.2.58': 'rfc7894',
+        '1.2.840.113549.1.9.16.8.1': 'rfc5275',
+        '1.2.840.113549.1.9.16.8.2': 'rfc5275',
+        '1.2.840.113549.1.9.16.8.3': 'rfc5275',
+        '1.2.840.113549.1.9.16.8.4': 'rfc5275',
+        '1.2.840.113549.1.9.16.8.5': 'rfc5275',
+        '1.2.840.113549.1.9.16.8.6': 'rfc5275',
+        '1.2.840.113549.1.9.16.8.7': 'rfc5275',
+        '1.2.840.113549.1.9.16.8.8': 'rfc5275',
+        '1.2.840.113549.1.9.16.8.9': 'rfc5275',
+        '1.2.840.113549.1.9.16.8.11': 'rfc5275',
+        '1.2.840.113549.1.9.16.8.12': 'rfc5275',
+        '1.2.840.113549.1.9.16.8.13': 'rfc5275',
+        '1.2.840.113549.1.9.16.8.14': 'rfc5275',
+        '1.2.840.113549.1.9.16.8.15': 'rfc5275',
+        '1.2.840.113549.1.9.20': 'rfc7292',
+        '1.2.840.113549.1.9.21': 'rfc7292',
+        '1.2.840.113549.1.9.25.3': 'rfc2985',
+        '1.2.840.113549.1.9.25.4': 'rfc2985',
+        '1.2.840.113549.1.9.52': 'rfc6211',
+        '1.3.6.1.4.1.2312.18.8.1': 'rfc8479',
+        '1.3.6.1.5.5.7.1.11': 'rfc7906',
+        '1.3.6.1.5.5.7.5.1.1': 'rfc4211',
+        '1.3.6.1.5.5.7.5.1.2': 'rfc4211',
+        '1.3.6.1.5.5.7.5.1.3': 'rfc4211',
+        '1.3.6.1.5.5.7.5.1.4': 'rfc4211',
+        '1.3.6.1.5.5.7.5.1.5': 'rfc4211',
+        '1.3.6.1.5.5.7.5.1.6': 'rfc4211',
+        '1.3.6.1.5.5.7.5.1.7': 'rfc4212',
+        '1.3.6.1.5.5.7.5.1.7.1': 'rfc4212',
+        '1.3.6.1.5.5.7.5.1.7.2': 'rfc4212',
+        '1.3.6.1.5.5.7.5.1.11': 'rfc9480',
+        '1.3.6.1.5.5.7.5.1.12': 'rfc9480',
+        '1.3.6.1.5.5.7.7.1': 'rfc10002',
+        '1.3.6.1.5.5.7.7.2': 'rfc10002',
+        '1.3.6.1.5.5.7.7.3': 'rfc10002',
+        '1.3.6.1.5.5.7.7.4': 'rfc10002',
+        '1.3.6.1.5.5.7.7.5': 'rfc10002',
+        '1.3.6.1.5.5.7.7.6': 'rfc10002',
+        '1.3.6.1.5.5.7.7.7': 'rfc10002',
+        '1.3.6.1.5.5.7.7.8': 'rfc10002',
+        '1.3.6.1.5.5.7.7.9': 'rfc10002',
+        '1.3.6.1.5.5.7.7.10': 'rfc10002',
+        '1.3.6.1.5.5.7.7.11': 'rfc10002',
+        '1.3.6.1.5.5.7.7.15': 'rfc10002',
+        '1.3.6.1.5.5.7.7.16': 'rfc10002',
+        '1.3.6.1.5.5.7.7.17': 'rfc10002',
+        '1.3.6.1.5.5.7.7.18': 'rfc10002',
+        '1.3.6.1.5.5.7.7.19': 'rfc10002',
+        '1.3.6.1.5.5.7.7.21': 'rfc10002',
+        '1.3.6.1.5.5.7.7.22': 'rfc10002',
+        '1.3.6.1.5.5.7.7.23': 'rfc10002',
+        '1.3.6.1.5.5.7.7.24': 'rfc10002',
+        '1.3.6.1.5.5.7.7.25': 'rfc10002',
+        '1.3.6.1.5.5.7.7.26': 'rfc10002',
+        '1.3.6.1.5.5.7.7.27': 'rfc10002',
+        '1.3.6.1.5.5.7.7.28': 'rfc10002',
+        '1.3.6.1.5.5.7.7.29': 'rfc10002',
+        '1.3.6.1.5.5.7.7.30': 'rfc10002',
+        '1.3.6.1.5.5.7.7.31': 'rfc10002',
+        '1.3.6.1.5.5.7.7.32': 'rfc10002',
+        '1.3.6.1.5.5.7.7.33': 'rfc10002',
+        '1.3.6.1.5.5.7.7.34': 'rfc10002',
+        '2.5.4.36': 'rfc7906',
+        '2.5.4.70': 'rfc7906',
+        '2.16.840.1.101.2.1.5.63': 'rfc5934',
+        '2.16.840.1.101.2.1.5.65': 'rfc7191',
+        '2.16.840.1.101.2.1.5.66': 'rfc6032',
+        '2.16.840.1.101.2.1.5.70': 'rfc7906',
+        '2.16.840.1.101.2.1.5.71': 'rfc7906',
+        '2.16.840.1.101.2.1.5.72': 'rfc7906',
+        '2.16.840.1.101.2.1.13.1': 'rfc7906',
+        '2.16.840.1.101.2.1.13.3': 'rfc7906',
+        '2.16.840.1.101.2.1.13.5': 'rfc7906',
+        '2.16.840.1.101.2.1.13.6': 'rfc7906',
+        '2.16.840.1.101.2.1.13.7': 'rfc7906',
+        '2.16.840.1.101.2.1.13.11': 'rfc7906',
+        '2.16.840.1.101.2.1.13.12': 'rfc7906',
+        '2.16.840.1.101.2.1.13.13': 'rfc7906',
+        '2.16.840.1.101.2.1.13.14': 'rfc7906',
+        '2.16.840.1.101.2.1.13.15': 'rfc7906',
+        '2.16.840.1.101.2.1.13.16': 'rfc7906',
+        '2.16.840.1.101.2.1.13.19': 'rfc7906',
+        '2.16.840.1.101.2.1.13.20': 'rfc7906',
+        '2.16.840.1.101.2.1.13.21': 'rfc7906',
+        '2.16.840.1.101.2.1.13.22': 'rfc7906',
+    },
+    'cmsContentTypesMap': {
+        '1.2.410.200004.10.1.1.1': 'rfc5636',
+        '1.2.410.200004.10.1.1.2': 'rfc5636',
+        '1.2.410.200004.10.1.1.3': 'rfc5636',
+        '1.2.840.113549.1.7.1': 'rfc5652',
+        '1.2.840.113549.1.7.2': 'rfc5652',
+        '1.2.840.113549.1.7.3': 'rfc5652',
+        '1.2.840.113549.1.7.5': 'rfc5652',
+        '1.2.840.113549.1.7.6': 'rfc5652',
+        '1.2.840.113549.1.9.16.1.1': 'rfc2634',
+        '1.2.840.113549.1.9.16.1.2': 'rfc5652',
+        '1.2.840.113549.1.9.16.1.6': 'rfc5652',
+        '1.2.840.113549.1.9.16.1.9': 'rfc3274',
+        '1.2.840.113549.1.9.16.1.10': 'rfc5055',
+        '1.2.840.113549.1.9.16.1.11': 'rfc5055',
+        '1.2.840.113549.1.9.16.1.12': 'rfc5055',
+        '1.2.840.113549.1.9.16.1.13': 'rfc5055',
+        '1.2.840.113549.1.9.16.1.16': 'rfc4108',
+        '1.2.840.113549.1.9.16.1.17': 'rfc4108',
+        '1.2.840.113549.1.9.16.1.18': 'rfc4108',
+        '1.2.840.113549.1.9.16.1.19': 'rfc4073',
+        '1.2.840.113549.1.9.16.1.20': 'rfc4073',
+        '1.2.840.113549.1.9.16.1.23': 'rfc5083',
+        '1.2.840.113549.1.9.16.1.24': 'rfc6482',
+        '1.2.840.113549.1.9.16.1.25': 'rfc6031',
+        '1.2.840.113549.1.9.16.1.26': 'rfc6486',
+        '1.2.840.113549.1.9.16.1.27': 'rfc8358',
+        '1.2.840.113549.1.9.16.1.28': 'rfc6492',
+        '1.2.840.113549.1.9.16.1.29': 'rfc8358',
+        '1.2.840.113549.1.9.16.1.30': 'rfc8358',
+        '1.2.840.113549.1.9.16.1.31': 'rfc5544',
+        '1.2.840.113549.1.9.16.1.37': 'rfc8358',
+        '1.2.840.113549.1.9.16.1.38': 'rfc8358',
+        '1.2.840.113549.1.9.16.1.39': 'rfc8358',
+        '1.2.840.113549.1.9.16.1.40': 'rfc8366',
+        '1.2.840.113549.1.9.16.1.41': 'rfc8520',
+        '1.2.840.113549.1.9.16.1.47': 'rfc9092',
+        '1.2.840.113549.1.9.16.1.48': 'rfc9323',
+        '1.2.840.113549.1.9.16.1.50': 'rfc9691',
+        '1.2.840.113549.1.9.16.1.52': 'rfc9939',
+        '1.2.840.113549.1.9.16.1.53': 'rfc9939',
+        '1.2.840.113549.1.9.16.1.57': 'rfc9977',
+        '1.3.6.1.5.5.7.12.2': 'rfc10002',
+        '1.3.6.1.5.5.7.12.3': 'rfc10002',
+        '1.3.6.1.5.5.11.1.6': 'rfc5698',
+        '2.16.840.1.101.2.1.2.77.1': 'rfc5934',
+        '2.16.840.1.101.2.1.2.77.2': 'rfc5934',
+        '2.16.840.1.101.2.1.2.77.3': 'rfc5934',
+        '2.16.840.1.101.2.1.2.77.4': 'rfc5934',
+        '2.16.840.1.101.2.1.2.77.5': 'rfc5934',
+        '2.16.840.1.101.2.1.2.77.6': 'rfc5934',
+        '2.16.840.1.101.2.1.2.77.7': 'rfc5934',
+        '2.16.840.1.101.2.1.2.77.8': 'rfc5934',
+        '2.16.840.1.101.2.1.2.77.9': 'rfc5934',
+        '2.16.840.1.101.2.1.2.77.10': 'rfc5934',
+        '2.16.840.1.101.2.1.2.77.11': 'rfc5934',
+        '2.16.840.1.101.2.1.2.78.2': 'rfc6032',
+        '2.16.840.1.101.2.1.2.78.3': 'rfc7191',
+        '2.16.840.1.101.2.1.2.78.5': 'rfc5958',
+        '2.16.840.1.101.2.1.2.78.6': 'rfc7191',
+    },
+    'ocspResponseMap': {
+        '1.3.6.1.5.5.7.48.1.1': 'rfc6960',
+    },
+    'orAddressExtensionAttributesMap': {
+        1: 'rfc5280',
+        2: 'rfc5280',
+        3: 'rfc5280',
+        4: 'rfc5280',
+        5: 'rfc5280',
+        6: 'rfc5280',
+        7: 'rfc5280',
+        8: 'rfc5280',
+        9: 'rfc5280',
+        10: 'rfc5280',
+        11: 'rfc5280',
+        12: 'rfc5280',
+        13: 'rfc5280',
+        14: 'rfc5280',
+        15: 'rfc5280',
+        16: 'rfc5280',
+        17: 'rfc5280',
+        18: 'rfc5280',
+        19: 'rfc5280',
+        20: 'rfc5280',
+        21: 'rfc5280',
+        22: 'rfc5280',
+        23: 'rfc5280',
+    },
+    'otherNamesMap': {
+        '1.3.6.1.5.5.7.8.3': 'rfc4043',
+        '1.3.6.1.5.5.7.8.4': 'rfc4108',
+        '1.3.6.1.5.5.7.8.5': 'rfc6120',
+        '1.3.6.1.5.5.7.8.6': 'rfc4683',
+        '1.3.6.1.5.5.7.8.7': 'rfc4985',
+        '1.3.6.1.5.5.7.8.8': 'rfc7585',
+        '1.3.6.1.5.5.7.8.9': 'rfc8398',
+        '1.3.6.1.5.5.7.8.10': 'rfc8994',
+        '1.3.6.1.5.5.7.8.11': 'rfc9174',
+    },
+    'otherRecipientInfoMap': {
+        '1.2.840.113549.1.9.16.13.1': 'rfc8696',
+        '1.2.840.113549.1.9.16.13.2': 'rfc8696',
+        '1.2.840.113549.1.9.16.13.3': 'rfc9629',
+    },
+    'otherRevInfoFormatMap': {
+        '1.3.6.1.5.5.7.16.2': 'rfc5940',
+        '1.3.6.1.5.5.7.16.4': 'rfc5940',
+    },
+    'pkcs12BagTypeMap': {
+        '1.2.840.113549.1.12.10.1.1': 'rfc7292',
+        '1.2.840.113549.1.12.10.1.2': 'rfc7292',
+        '1.2.840.113549.1.12.10.1.3': 'rfc7292',
+        '1.2.840.113549.1.12.10.1.4': 'rfc7292',
+        '1.2.840.113549.1.12.10.1.5': 'rfc7292',
+        '1.2.840.113549.1.12.10.1.6': 'rfc7292',
+    },
+    'pkcs12CRLBagMap': {
+        '1.2.840.113549.1.9.23.1': 'rfc7292',
+    },
+    'pkcs12CertBagMap': {
+        '1.2.840.113549.1.9.22.1': 'rfc7292',
+        '1.2.840.113549.1.9.22.2': 'rfc7292',
+    },
+    'policyQualifierInfosMap': {
+        '1.3.6.1.5.5.7.2.1': 'rfc5280',
+        '1.3.6.1.5.5.7.2.2': 'rfc5280',
+        '1.3.6.1.5.5.7.2.4': 'rfc4476',
+        '1.3.6.1.5.5.7.2.5': 'rfc4476',
+    },
+    'scvpValidationAlgMap': {
+        '1.3.6.1.5.5.7.19.2': 'rfc5055',
+    },
+    'scvpWantBackMap': {
+        '1.3.6.1.5.5.7.18.1': 'rfc5055',
+        '1.3.6.1.5.5.7.18.2': 'rfc5055',
+        '1.3.6.1.5.5.7.18.4': 'rfc5055',
+        '1.3.6.1.5.5.7.18.5': 'rfc5055',
+        '1.3.6.1.5.5.7.18.6': 'rfc5055',
+        '1.3.6.1.5.5.7.18.7': 'rfc5055',
+        '1.3.6.1.5.5.7.18.9': 'rfc5055',
+        '1.3.6.1.5.5.7.18.10': 'rfc5055',
+        '1.3.6.1.5.5.7.18.11': 'rfc5055',
+        '1.3.6.1.5.5.7.18.12': 'rfc5055',
+        '1.3.6.1.5.5.7.18.13': 'rfc5055',
+        '1.3.6.1.5.5.7.18.14': 'rfc5055',
+        '1.3.6.1.5.5.7.18.15': 'rfc5276',
+        '1.3.6.1.5.5.7.18.16': 'rfc5276',
+        '1.3.6.1.5.5.7.18.17': 'rfc5276',
+        '1.3.6.1.5.5.7.18.18': 'rfc5276',
+        '1.3.6.1.5.5.7.18.19': 'rfc5276',
+        '1.3.6.1.5.5.7.18.20': 'rfc5276',
+    },
+    'securityCategoryMap': {
+        '1.2.840.113549.1.9.16.7.4': 'rfc3114',
+    },
+    'sigQualifiersMap': {
+        '1.2.840.113549.1.9.16.5.1': 'rfc5126',
+        '1.2.840.113549.1.9.16.5.2': 'rfc5126',
+    },
+    'smimeCapabilityMap': {
+        '1.0.18033.2.2.4': 'rfc5990',
+        '1.2.392.200011.61.1.1.1.2': 'rfc3657',
+        '1.2.392.200011.61.1.1.1.3': 'rfc3657',
+        '1.2.392.200011.61.1.1.1.4': 'rfc3657',
+        '1.2.392.200011.61.1.1.3.2': 'rfc3657',
+        '1.2.392.200011.61.1.1.3.3': 'rfc3657',
+        '1.2.392.200011.61.1.1.3.4': 'rfc3657',
+        '1.2.410.200004.1.4': 'rfc4010',
+        '1.2.410.200004.7.1.1.1': 'rfc4010',
+        '1.2.840.10040.4.1': 'rfc6664',
+        '1.2.840.10045.2.1': 'rfc6664',
+        '1.2.840.10046.2.1': 'rfc6664',
+        '1.2.840.113549.1.1.1': 'rfc6664',
+        '1.2.840.113549.1.1.7': 'rfc6664',
+        '1.2.840.113549.1.1.8': 'rfc6664',
+        '1.2.840.113549.1.1.10': 'rfc6664',
+        '1.2.840.113549.1.5.1': 'rfc8018',
+        '1.2.840.113549.1.5.3': 'rfc8018',
+        '1.2.840.113549.1.5.4': 'rfc8018',
+        '1.2.840.113549.1.5.6': 'rfc8018',
+        '1.2.840.113549.1.5.10': 'rfc8018',
+        '1.2.840.113549.1.5.11': 'rfc8018',
+        '1.2.840.113549.1.5.12': 'rfc8018',
+        '1.2.840.113549.1.5.13': 'rfc8018',
+        '1.2.840.113549.1.5.14': 'rfc8018',
+        '1.2.840.113549.1.9.16.3.5': 'rfc3370',
+        '1.2.840.113549.1.9.16.3.6': 'rfc5990',
+        '1.2.840.113549.1.9.16.3.7': 'rfc3370',
+        '1.2.840.113549.1.9.16.3.10': 'rfc3370',
+        '1.2.840.113549.1.9.16.3.11': 'rfc3537',
+        '1.2.840.113549.1.9.16.3.12': 'rfc3537',
+        '1.2.840.113549.1.9.16.3.14': 'rfc5990',
+        '1.2.840.113549.2.7': 'rfc8018',
+        '1.2.840.113549.2.8': 'rfc8018',
+        '1.2.840.113549.2.9': 'rfc8018',
+        '1.2.840.113549.2.10': 'rfc8018',
+        '1.2.840.113549.2.11': 'rfc8018',
+        '1.2.840.113549.2.12': 'rfc8018',
+        '1.2.840.113549.2.13': 'rfc8018',
+        '1.2.840.113549.3.2': 'rfc8018',
+        '1.2.840.113549.3.7': 'rfc8018',
+        '1.2.840.113549.3.8': 'rfc2040',
+        '1.2.840.113549.3.9': 'rfc8018',
+        '1.3.6.1.4.1.1722.12.2.1.5': 'rfc7693',
+        '1.3.6.1.4.1.1722.12.2.1.8': 'rfc7693',
+        '1.3.6.1.4.1.1722.12.2.1.12': 'rfc7693',
+        '1.3.6.1.4.1.1722.12.2.1.16': 'rfc7693',
+        '1.3.6.1.4.1.1722.12.2.2.4': 'rfc7693',
+        '1.3.6.1.4.1.1722.12.2.2.5': 'rfc7693',
+        '1.3.6.1.4.1.1722.12.2.2.7': 'rfc7693',
+        '1.3.6.1.4.1.1722.12.2.2.8': 'rfc7693',
+        '1.3.6.1.5.5.8.1.2': 'rfc3370',
+        '1.3.14.3.2.7': 'rfc8018',
+        '1.3.14.3.2.26': 'rfc5990',
+        '1.3.132.1.11.0': 'rfc5753',
+        '1.3.132.1.11.1': 'rfc5753',
+        '1.3.132.1.11.2': 'rfc5753',
+        '1.3.132.1.11.3': 'rfc5753',
+        '1.3.132.1.12': 'rfc6664',
+        '1.3.132.1.13': 'rfc6664',
+        '1.3.132.1.14.0': 'rfc5753',
+        '1.3.132.1.14.1': 'rfc5753',
+        '1.3.132.1.14.2': 'rfc5753',
+        '1.3.132.1.14.3': 'rfc5753',
+        '1.3.132.1.15.0': 'rfc5753',
+        '1.3.132.1.15.1': 'rfc5753',
+        '1.3.132.1.15.2': 'rfc5753',
+        '1.3.132.1.15.3': 'rfc5753',
+        '1.3.133.16.840.9.44.1.1': 'rfc5990',
+        '1.3.133.16.840.9.44.1.2': 'rfc5990',
+        '1.3.133.16.840.63.0.2': 'rfc5753',
+        '1.3.133.16.840.63.0.3': 'rfc5753',
+        '1.3.133.16.840.63.0.16': 'rfc5753',
+        '2.16.840.1.101.2.1.1.24': 'rfc2876',
+        '2.16.840.1.101.3.4.1.2': 'rfc8018',
+        '2.16.840.1.101.3.4.1.9': 'rfc9044',
+        '2.16.840.1.101.3.4.1.22': 'rfc8018',
+        '2.16.840.1.101.3.4.1.29': 'rfc9044',
+        '2.16.840.1.101.3.4.1.42': 'rfc8018',
+        '2.16.840.1.101.3.4.1.49': 'rfc9044',
+        '2.16.840.1.101.3.4.2.1': 'rfc5990',
+        '2.16.840.1.101.3.4.2.2': 'rfc5990',
+        '2.16.840.1.101.3.4.2.3': 'rfc5990',
+        '2.16.840.1.101.3.4.2.4': 'rfc5990',
+        '2.16.840.1.101.3.4.2.21': 'rfc9688',
+        '2.16.840.1.101.3.4.2.22': 'rfc9688',
+        '2.16.840.1.101.3.4.3.13': 'rfc9688',
+        '2.16.840.1.101.3.4.3.14': 'rfc9688',
+        '2.16.840.1.101.3.4.3.15': 'rfc9688',
+        '2.16.840.1.101.3.4.3.16': 'rfc9688',
+    },
+}
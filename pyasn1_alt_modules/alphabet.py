@@ -0,0 +1,52 @@
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+# A permitted alphabet constraint that checks a whole string at once
+# with tables made from the alphabet, for the character string types
+# that are decoded many times, like the file names in an RPKI manifest.
+# The ASN.1 modules keep the pyasn1 constraint; a caller that checks
+# many strings outside of decoding can subtype with this one.
+#
+
+import re
+
+from pyasn1.type import constraint
+from pyasn1.type import error
+
+
+class PermittedAlphabetConstraint(constraint.PermittedAlphabetConstraint):
+    """A drop-in for the pyasn1 PermittedAlphabetConstraint.
+
+    An ASCII str value is checked by deleting the characters of the
+    alphabet with bytes.translate() and looking for anything left, and
+    any other str value by searching it with a regular expression for a
+    character outside the alphabet, rather than by one set lookup per
+    character.  Other values are checked by the pyasn1 constraint.
+    Values are accepted and rejected alike, and the constraint keeps the
+    class name, so it compares and hashes equal to a pyasn1
+    PermittedAlphabetConstraint with the same alphabet.
+    """
+
+    def _setValues(self, values):
+        constraint.PermittedAlphabetConstraint._setValues(self, values)
+        characters = ''.join(sorted(
+            value for value in self._set
+            if isinstance(value, str) and len(value) == 1))
+        self._asciiCharacters = ''.join(
+            character for character in characters if character < '\x80').encode()
+        pattern = characters and '[^%s]' % re.escape(characters) or '(?s).'
+        self._search = re.compile(pattern).search
+
+    def _testValue(self, value, idx):
+        if isinstance(value, str):
+            if value.isascii():
+                rest = value.encode().translate(None, self._asciiCharacters)
+            else:
+                rest = self._search(value)
+            if rest:
+                raise error.ValueConstraintError(value)
+        else:
+            constraint.PermittedAlphabetConstraint._testValue(self, value, idx)
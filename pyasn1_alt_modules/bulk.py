@@ -0,0 +1,102 @@
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+# Decode many DER objects of the same type across a pool of processes.
+#
+
+import collections
+import importlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from pyasn1 import error
+from pyasn1.codec.der.decoder import decode as der_decoder
+
+from pyasn1_alt_modules import opentypemap
+
+_worker = {}
+
+
+def _initWorker(specModule, specName, modules, autoImport, decodeOpenTypes, transform):
+    for name in (specModule,) + tuple(modules):
+        importlib.import_module(name)
+    if autoImport:
+        opentypemap.enableAutoImport()
+    specModule = importlib.import_module(specModule)
+    _worker['asn1Spec'] = getattr(specModule, specName)()
+    _worker['decodeOpenTypes'] = decodeOpenTypes
+    _worker['transform'] = transform
+
+
+def _decodeChunk(substrates):
+    asn1Spec = _worker['asn1Spec']
+    decodeOpenTypes = _worker['decodeOpenTypes']
+    transform = _worker['transform']
+    results = []
+    for substrate in substrates:
+        asn1Object, rest = der_decoder(
+            substrate, asn1Spec=asn1Spec, decodeOpenTypes=decodeOpenTypes)
+        if rest:
+            raise error.PyAsn1Error(
+                '%d octets of trailing data' % len(rest))
+        results.append(transform(asn1Object))
+    return results
+
+
+def decodeAll(substrates, asn1Spec, transform, modules=(),
+              autoImport=False, decodeOpenTypes=False, maxWorkers=None,
+              chunkSize=256):
+    """Decode DER objects in worker processes and yield them in order.
+
+    The asn1Spec is a class from this package, such as
+    rfc5280.Certificate, or an instance of one.  Only the class is sent
+    to the workers, so an instance with other tags, constraints, or
+    components than the class gives, such as one from
+    projection.projectSpec(), is rejected.  Each worker imports the
+    module that defines it and the listed modules once, when it starts,
+    so their opentype maps are populated; autoImport calls
+    opentypemap.enableAutoImport() in each worker.
+
+    The substrates are sent to the workers in chunks of chunkSize, and
+    a limited number of chunks are in flight, so the input can be a
+    generator, such as tlv.splitTlvs().
+
+    The transform is a function at module level that is applied to each
+    decoded object in the worker, and its result is yielded.  It should
+    return plain values, such as the serial number or the DER of the
+    subject: a decoded object carries its spec, including the opentype
+    maps, so sending one back costs more than decoding it.
+    """
+    if not isinstance(asn1Spec, type):
+        default = type(asn1Spec)()
+        if (asn1Spec.tagSet != default.tagSet or
+                asn1Spec.subtypeSpec != default.subtypeSpec or
+                getattr(asn1Spec, 'componentType', None) is not
+                getattr(default, 'componentType', None)):
+            raise error.PyAsn1Error(
+                'asn1Spec differs from %s()' % type(asn1Spec).__name__)
+        asn1Spec = type(asn1Spec)
+    initargs = (asn1Spec.__module__, asn1Spec.__name__, tuple(modules),
+                autoImport, decodeOpenTypes, transform)
+
+    maxWorkers = maxWorkers or os.cpu_count() or 1
+    maxPending = 2 * maxWorkers
+
+    substrates = iter(substrates)
+    with ProcessPoolExecutor(max_workers=maxWorkers, initializer=_initWorker,
+                             initargs=initargs) as executor:
+        pending = collections.deque()
+        while True:
+            while len(pending) < maxPending:
+                chunk = [bytes(x) for x in islice(substrates, chunkSize)]
+                if not chunk:
+                    break
+                pending.append(executor.submit(_decodeChunk, chunk))
+            if not pending:
+                break
+            for result in pending.popleft().result():
+                yield result
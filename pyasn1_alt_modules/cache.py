@@ -0,0 +1,209 @@
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+# A bounded cache of decoded objects keyed by their DER encoding, so
+# that a certificate, CRL, or Name that is seen again is not decoded
+# again.
+#
+
+import collections
+
+from pyasn1 import error
+from pyasn1.codec.der.decoder import decode as der_decoder
+from pyasn1.codec.der.encoder import encode as der_encoder
+from pyasn1.type import char
+from pyasn1.type import univ
+
+from pyasn1_alt_modules import plan
+from pyasn1_alt_modules import projection
+from pyasn1_alt_modules import rfc5280
+from pyasn1_alt_modules import rfc5652
+from pyasn1_alt_modules import tlv
+
+CacheInfo = collections.namedtuple(
+    'CacheInfo', ['hits', 'misses', 'evictions', 'maxSize', 'currSize'])
+
+
+class DecodeCache(object):
+    """A bounded cache of decoded DER objects.
+
+    An entry is keyed by the asn1Spec, the decodeOpenTypes flag, and
+    the octets of the TLV, so a lookup hashes the encoding once and
+    compares it only on a hash match.  Like plan.compileSpec(), the
+    asn1Spec is taken by its class, tagSet, componentType, and
+    subtypeSpec, so every rfc5280.Certificate() shares its entries, and
+    a projection of one has entries of its own.  At most maxSize entries
+    are held, and the policy picks the one evicted to make room: 'lru',
+    the default, evicts the least recently used entry, and 'fifo' the
+    oldest one, which spares a hit the cost of reordering the entries
+    but lets a busy entry be evicted and decoded again.
+
+    The decoded objects are shared by every caller that decodes the same
+    encoding, so they must be treated as read-only; clone a copy of the
+    object before changing it.
+    """
+
+    policies = ('lru', 'fifo')
+
+    def __init__(self, maxSize=1024, policy='lru'):
+        if policy not in self.policies:
+            raise error.PyAsn1Error('unknown eviction policy %r' % (policy,))
+        self.maxSize = maxSize
+        self.policy = policy
+        self._entries = collections.OrderedDict()
+        self.hits = self.misses = self.evictions = 0
+
+    def decode(self, substrate, asn1Spec, decodeOpenTypes=False):
+        """Decode the first TLV in substrate, like der_decoder().
+
+        Returns (asn1Object, rest), where asn1Object may come from the
+        cache.
+        """
+        length = tlv.tlvLength(substrate)
+        octets = bytes(substrate[:length])
+        # the decoded object shares the componentType and subtypeSpec of
+        # the asn1Spec, so their ids are not reused while it is cached
+        asn1Object = self._get(
+            (type(asn1Spec), asn1Spec.tagSet,
+             id(getattr(asn1Spec, 'componentType', None)), id(asn1Spec.subtypeSpec),
+             decodeOpenTypes, octets),
+            lambda: der_decoder(octets, asn1Spec=asn1Spec,
+                                decodeOpenTypes=decodeOpenTypes)[0])
+        return asn1Object, substrate[length:]
+
+    def _get(self, key, build):
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            value = self._entries[key] = build()
+            if len(self._entries) > self.maxSize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        else:
+            self.hits += 1
+            if self.policy == 'lru':
+                self._entries.move_to_end(key)
+        return value
+
+    def info(self):
+        """Return the hit, miss, and eviction counters and the size."""
+        return CacheInfo(self.hits, self.misses, self.evictions,
+                         self.maxSize, len(self._entries))
+
+    def clear(self):
+        """Empty the cache and reset the counters."""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+InternedName = collections.namedtuple(
+    'InternedName', ['asn1Object', 'canonical'])
+
+
+def _canonicalValue(value):
+    while isinstance(value, univ.Choice):
+        value = value.getComponent()
+    if isinstance(value, char.AbstractCharacterString):
+        return ('s', ' '.join(str(value).split()).casefold())
+    return ('b', der_encoder(value))
+
+
+def canonicalName(name):
+    """Return a hashable form of a decoded rfc5280.Name for comparison.
+
+    Each RDN becomes a sorted tuple of (type OID tuple, value) pairs.  A
+    string value, found through the CHOICE of DirectoryString and the
+    like, is case-folded and has its runs of white space collapsed, in
+    the spirit of the name matching of RFC 5280 section 7.1; any other
+    value is kept as its DER.  The values must have been decoded with
+    decodeOpenTypes=True for the strings to be found.
+    """
+    return tuple(
+        tuple(sorted((tuple(atv['type']), _canonicalValue(atv['value']))
+                     for atv in rdn))
+        for rdn in name['rdnSequence'])
+
+
+class NameCache(DecodeCache):
+    """An interning cache of decoded rfc5280.Name values.
+
+    A Name is keyed by its DER, so the issuers and subjects that repeat
+    across many certificates are decoded once, with their attribute
+    values decoded through certificateAttributesMap, and share one
+    object.  Each entry also holds the canonicalName() of the Name, so
+    matching the issuer of a certificate to the subject of another is a
+    comparison or a dict lookup.  The size bound, the eviction policy,
+    the counters, and the read-only rule are those of DecodeCache.
+    """
+
+    def __init__(self, maxSize=4096, policy='lru'):
+        DecodeCache.__init__(self, maxSize, policy)
+
+    def intern(self, name):
+        """Return the InternedName for a Name given as DER or decoded.
+
+        A decoded Name is looked up by its DER encoding, and the object
+        returned is the one in the cache, not the one passed in.
+        """
+        if isinstance(name, univ.Choice):
+            octets = der_encoder(name)
+        else:
+            octets = bytes(name[:tlv.tlvLength(name)])
+        return self._get(octets, lambda: self._build(octets))
+
+    @staticmethod
+    def _build(octets):
+        asn1Object, rest = plan.decode(octets, rfc5280.Name(), decodeOpenTypes=True)
+        return InternedName(asn1Object, canonicalName(asn1Object))
+
+
+_signedDataSpec = projection.projectSpec(
+    rfc5652.SignedData(), 'version', 'digestAlgorithms', 'encapContentInfo',
+    'signerInfos')
+
+
+def _decodeChoices(cache, contents, setOf, choiceName, asn1Spec,
+                   decodeOpenTypes):
+    setOf.clear()
+    for item in tlv.splitTlvs(contents):
+        item = bytes(item)
+        choice = setOf.componentType.clone()
+        if item[0] == 0x30:
+            choice[choiceName], rest = cache.decode(
+                item, asn1Spec, decodeOpenTypes=decodeOpenTypes)
+        else:
+            choice, rest = der_decoder(
+                item, asn1Spec=choice, decodeOpenTypes=decodeOpenTypes)
+        setOf.append(choice)
+
+
+def decodeSignedData(substrate, cache, decodeOpenTypes=False):
+    """Decode a CMS SignedData, taking its certificates and CRLs from cache.
+
+    The rest of the SignedData is decoded as usual, and the result is an
+    rfc5652.SignedData whose certificate and crl entries are the shared
+    objects held by cache.  Returns (asn1Object, rest).
+    """
+    projected, rest = der_decoder(
+        substrate, asn1Spec=_signedDataSpec, decodeOpenTypes=decodeOpenTypes)
+
+    asn1Object = rfc5652.SignedData()
+    for name in ('version', 'digestAlgorithms', 'encapContentInfo'):
+        asn1Object[name] = projected[name]
+    if projected['certificates'].isValue:
+        _decodeChoices(cache, projected['certificates'].asOctets(),
+                       asn1Object['certificates'], 'certificate',
+                       rfc5280.Certificate(), decodeOpenTypes)
+    if projected['crls'].isValue:
+        _decodeChoices(cache, projected['crls'].asOctets(),
+                       asn1Object['crls'], 'crl',
+                       rfc5280.CertificateList(), decodeOpenTypes)
+    asn1Object['signerInfos'] = projected['signerInfos']
+    return asn1Object, rest
@@ -0,0 +1,325 @@
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+# A compact, read-only view of an X.509 certificate, built from tuples
+# of Python ints, bytes, and OID tuples instead of pyasn1 objects, for
+# holding many certificates in memory.  A view converts back to a full
+# rfc5280.Certificate on demand.
+#
+
+import collections
+
+from pyasn1 import error
+from pyasn1.codec.der.encoder import encode as der_encoder
+from pyasn1.type import univ
+from pyasn1.type import useful
+
+from pyasn1_alt_modules import oids
+from pyasn1_alt_modules import plan
+from pyasn1_alt_modules import rfc5280
+from pyasn1_alt_modules import tlv
+
+_objectIdentifier = plan._ObjectIdentifierNode.convert
+
+_timeTypes = {
+    0x17: useful.UTCTime,
+    0x18: useful.GeneralizedTime,
+}
+
+
+def _tlv(identifier, contents):
+    return bytes((identifier,)) + tlv.encodeLength(len(contents)) + contents
+
+
+def _encodeInteger(value):
+    width = ((value if value >= 0 else ~value).bit_length() + 8) // 8
+    return _tlv(0x02, value.to_bytes(width, 'big', signed=True))
+
+
+def _encodeOid(arcs):
+    return _tlv(0x06, oids.encodeContents(arcs))
+
+
+def _encodeBitString(octets):
+    return _tlv(0x03, b'\x00' + octets)
+
+
+def _children(substrate, start, end):
+    children = []
+    while start < end:
+        key, constructed, valueStart, valueEnd = tlv.readHeader(substrate, start, end)
+        children.append((key, start, valueStart, valueEnd))
+        start = valueEnd
+    return children
+
+
+def _expect(child, key, what):
+    if child[0] != key:
+        raise error.PyAsn1Error('unexpected tag %#x for %s' % (child[0], what))
+    return child
+
+
+def _integer(substrate, child):
+    key, start, valueStart, valueEnd = _expect(child, 0x02, 'INTEGER')
+    return int.from_bytes(substrate[valueStart:valueEnd], 'big', signed=True)
+
+
+def _oid(substrate, child):
+    key, start, valueStart, valueEnd = _expect(child, 0x06, 'OBJECT IDENTIFIER')
+    return _objectIdentifier(substrate[valueStart:valueEnd])
+
+
+def _bitString(substrate, child):
+    key, start, valueStart, valueEnd = _expect(child, 0x03, 'BIT STRING')
+    if valueStart == valueEnd or substrate[valueStart]:
+        raise error.PyAsn1Error('BIT STRING is not a whole number of octets')
+    return substrate[valueStart + 1:valueEnd]
+
+
+def _sequence(substrate, child, what):
+    key, start, valueStart, valueEnd = _expect(child, 0x10, what)
+    return _children(substrate, valueStart, valueEnd)
+
+
+class AlgorithmIdentifier(collections.namedtuple(
+        'AlgorithmIdentifier', ['algorithm', 'parameters'])):
+    """The algorithm OID tuple and the DER of the parameters, or None."""
+
+    __slots__ = ()
+
+    @classmethod
+    def fromDer(cls, substrate, child):
+        children = _sequence(substrate, child, 'AlgorithmIdentifier')
+        if not 1 <= len(children) <= 2:
+            raise error.PyAsn1Error('AlgorithmIdentifier has %d components' % len(children))
+        parameters = None
+        if len(children) == 2:
+            key, start, valueStart, valueEnd = children[1]
+            parameters = substrate[start:valueEnd]
+        return cls(_oid(substrate, children[0]), parameters)
+
+    def encode(self):
+        return _tlv(0x30, _encodeOid(self.algorithm) + (self.parameters or b''))
+
+
+class Name(collections.namedtuple('Name', ['rdnSequence'])):
+    """A tuple of RDNs, each a tuple of (type OID, DER of the value) pairs."""
+
+    __slots__ = ()
+
+    @classmethod
+    def fromDer(cls, substrate, child):
+        rdnSequence = []
+        for rdnChild in _sequence(substrate, child, 'Name'):
+            key, start, valueStart, valueEnd = _expect(
+                rdnChild, 0x11, 'RelativeDistinguishedName')
+            rdn = []
+            for attributeChild in _children(substrate, valueStart, valueEnd):
+                children = _sequence(substrate, attributeChild, 'AttributeTypeAndValue')
+                if len(children) != 2:
+                    raise error.PyAsn1Error(
+                        'AttributeTypeAndValue has %d components' % len(children))
+                key, start, valueStart, valueEnd = children[1]
+                rdn.append((_oid(substrate, children[0]), substrate[start:valueEnd]))
+            rdnSequence.append(tuple(rdn))
+        return cls(tuple(rdnSequence))
+
+    def encode(self):
+        return _tlv(0x30, b''.join(
+            _tlv(0x31, b''.join(
+                _tlv(0x30, _encodeOid(attributeType) + value)
+                for attributeType, value in rdn))
+            for rdn in self.rdnSequence))
+
+
+class Extension(collections.namedtuple(
+        'Extension', ['extnID', 'critical', 'extnValue'])):
+    """The extension OID tuple, the critical flag, and the extnValue octets."""
+
+    __slots__ = ()
+
+    @classmethod
+    def fromDer(cls, substrate, child):
+        children = _sequence(substrate, child, 'Extension')
+        critical = False
+        if len(children) == 3:
+            key, start, valueStart, valueEnd = _expect(children[1], 0x01, 'BOOLEAN')
+            critical = substrate[valueStart:valueEnd] != b'\x00'
+        elif len(children) != 2:
+            raise error.PyAsn1Error('Extension has %d components' % len(children))
+        key, start, valueStart, valueEnd = _expect(children[-1], 0x04, 'OCTET STRING')
+        return cls(_oid(substrate, children[0]), critical,
+                   substrate[valueStart:valueEnd])
+
+    def encode(self):
+        return _tlv(0x30, _encodeOid(self.extnID) +
+                    (self.critical and b'\x01\x01\xff' or b'') +
+                    _tlv(0x04, self.extnValue))
+
+    def decodeValue(self):
+        """Return the extnValue decoded with certificateExtensionsMap.
+
+        The result is None when the map has no entry for the extnID.
+        """
+        asn1Spec = rfc5280.certificateExtensionsMap.get(
+            univ.ObjectIdentifier(self.extnID))
+        if asn1Spec is None:
+            return None
+        asn1Object, rest = plan.decode(self.extnValue, asn1Spec)
+        return asn1Object
+
+
+class SubjectPublicKeyInfo(collections.namedtuple(
+        'SubjectPublicKeyInfo', ['algorithm', 'subjectPublicKey'])):
+    """The AlgorithmIdentifier view and the public key octets."""
+
+    __slots__ = ()
+
+    @classmethod
+    def fromDer(cls, substrate, child):
+        children = _sequence(substrate, child, 'SubjectPublicKeyInfo')
+        if len(children) != 2:
+            raise error.PyAsn1Error('SubjectPublicKeyInfo has %d components' % len(children))
+        return cls(AlgorithmIdentifier.fromDer(substrate, children[0]),
+                   _bitString(substrate, children[1]))
+
+    def encode(self):
+        return _tlv(0x30, self.algorithm.encode() +
+                    _encodeBitString(self.subjectPublicKey))
+
+
+class TBSCertificate(collections.namedtuple('TBSCertificate', [
+        'version', 'serialNumber', 'signature', 'issuer', 'notBefore',
+        'notAfter', 'subject', 'subjectPublicKeyInfo', 'issuerUniqueID',
+        'subjectUniqueID', 'extensions'])):
+    """The TBSCertificate, with the Validity flattened into two fields.
+
+    The version is an int, 0 for v1.  The notBefore and notAfter fields
+    hold the DER of the UTCTime or GeneralizedTime, and validity()
+    returns them as datetime objects.  The unique identifiers are their
+    DER, or None, and extensions is a tuple of Extension views, or None.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def fromDer(cls, substrate, child):
+        children = _sequence(substrate, child, 'TBSCertificate')
+        version = 0
+        if children and children[0][0] == 0x80:
+            key, start, valueStart, valueEnd = children.pop(0)
+            version = _integer(substrate, _children(substrate, valueStart, valueEnd)[0])
+        if len(children) < 6:
+            raise error.PyAsn1Error('TBSCertificate has %d components' % len(children))
+        validity = _sequence(substrate, children[3], 'Validity')
+        if len(validity) != 2:
+            raise error.PyAsn1Error('Validity has %d components' % len(validity))
+        times = []
+        for key, start, valueStart, valueEnd in validity:
+            if key not in _timeTypes:
+                raise error.PyAsn1Error('unexpected tag %#x for Time' % key)
+            times.append(substrate[start:valueEnd])
+        optional = {}
+        for key, start, valueStart, valueEnd in children[6:]:
+            if key in optional or key not in (0x81, 0x82, 0x83):
+                raise error.PyAsn1Error('unexpected tag %#x in TBSCertificate' % key)
+            optional[key] = (start, valueStart, valueEnd)
+        extensions = None
+        if 0x83 in optional:
+            start, valueStart, valueEnd = optional[0x83]
+            extensions = tuple(
+                Extension.fromDer(substrate, extension) for extension in _sequence(
+                    substrate, _children(substrate, valueStart, valueEnd)[0],
+                    'Extensions'))
+        uniqueIDs = [None, None]
+        for n, key in enumerate((0x81, 0x82)):
+            if key in optional:
+                start, valueStart, valueEnd = optional[key]
+                uniqueIDs[n] = substrate[start:valueEnd]
+        return cls(version, _integer(substrate, children[0]),
+                   AlgorithmIdentifier.fromDer(substrate, children[1]),
+                   Name.fromDer(substrate, children[2]), times[0], times[1],
+                   Name.fromDer(substrate, children[4]),
+                   SubjectPublicKeyInfo.fromDer(substrate, children[5]),
+                   uniqueIDs[0], uniqueIDs[1], extensions)
+
+    def encode(self):
+        octets = b''
+        if self.version:
+            octets += _tlv(0xA0, _encodeInteger(self.version))
+        octets += (_encodeInteger(self.serialNumber) + self.signature.encode() +
+                   self.issuer.encode() +
+                   _tlv(0x30, self.notBefore + self.notAfter) +
+                   self.subject.encode() + self.subjectPublicKeyInfo.encode() +
+                   (self.issuerUniqueID or b'') + (self.subjectUniqueID or b''))
+        if self.extensions is not None:
+            octets += _tlv(0xA3, _tlv(0x30, b''.join(
+                extension.encode() for extension in self.extensions)))
+        return _tlv(0x30, octets)
+
+    def validity(self):
+        """Return (notBefore, notAfter) as datetime objects."""
+        return tuple(_timeTypes[octets[0]](octets[2:].decode('ascii')).asDateTime
+                     for octets in (self.notBefore, self.notAfter))
+
+    def extension(self, extnID):
+        """Return the Extension view with extnID, an OID tuple, or None."""
+        for extension in self.extensions or ():
+            if extension.extnID == extnID:
+                return extension
+        return None
+
+
+class Certificate(collections.namedtuple(
+        'Certificate', ['tbsCertificate', 'signatureAlgorithm', 'signature'])):
+    """A read-only view of an rfc5280.Certificate.
+
+    Build one with decode() or fromAsn1(), and use toAsn1() for the full
+    pyasn1 object.  The fields are Python ints, bytes, OID tuples, None,
+    and the tuples of the other views in this module, so a view is
+    hashable and compares by value.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def fromDer(cls, substrate, child):
+        children = _sequence(substrate, child, 'Certificate')
+        if len(children) != 3:
+            raise error.PyAsn1Error('Certificate has %d components' % len(children))
+        return cls(TBSCertificate.fromDer(substrate, children[0]),
+                   AlgorithmIdentifier.fromDer(substrate, children[1]),
+                   _bitString(substrate, children[2]))
+
+    @classmethod
+    def fromAsn1(cls, asn1Object):
+        """Return the view of a decoded rfc5280.Certificate."""
+        view, rest = decode(der_encoder(asn1Object))
+        return view
+
+    def encode(self):
+        """Return the DER encoding of the certificate."""
+        return _tlv(0x30, self.tbsCertificate.encode() +
+                    self.signatureAlgorithm.encode() +
+                    _encodeBitString(self.signature))
+
+    def toAsn1(self):
+        """Return the certificate as a full rfc5280.Certificate."""
+        asn1Object, rest = plan.decode(self.encode(), rfc5280.Certificate())
+        return asn1Object
+
+
+def decode(substrate):
+    """Decode a DER certificate into a Certificate view.
+
+    Returns (view, rest).  Only the structure of the certificate is
+    checked; the attribute values, the extension values, and the
+    algorithm parameters are kept as their DER.
+    """
+    substrate = bytes(substrate)
+    key, constructed, start, end = tlv.readHeader(substrate, 0, len(substrate))
+    view = Certificate.fromDer(substrate, (key, 0, start, end))
+    return view, substrate[end:]
@@ -0,0 +1,338 @@
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+# Read a CMS SignedData from a file object without holding its content
+# in memory.  The eContent, which can be a BER constructed OCTET STRING
+# of any size, is passed on in chunks as it is read, and is hashed with
+# the digest algorithms of the SignedData on the way.  Write a CMS
+# EnvelopedData or AuthEnvelopedData with its encryptedContent given in
+# chunks, in the same way.
+#
+
+import collections
+import hashlib
+
+from pyasn1 import error
+from pyasn1.codec.ber.decoder import decode as ber_decoder
+from pyasn1.codec.der.encoder import encode as der_encoder
+from pyasn1.type import tag
+from pyasn1.type import univ
+
+from pyasn1_alt_modules import rfc5083
+from pyasn1_alt_modules import rfc5480
+from pyasn1_alt_modules import rfc5652
+from pyasn1_alt_modules import tlv
+
+_sequence = univ.Sequence.tagSet[0]
+
+_explicit0 = tag.Tag(tag.tagClassContext, tag.tagFormatConstructed, 0)
+
+hashAlgorithms = {
+    rfc5480.id_md5: 'md5',
+    rfc5480.id_sha1: 'sha1',
+    rfc5480.id_sha224: 'sha224',
+    rfc5480.id_sha256: 'sha256',
+    rfc5480.id_sha384: 'sha384',
+    rfc5480.id_sha512: 'sha512',
+}
+
+StreamedSignedData = collections.namedtuple(
+    'StreamedSignedData', ['signedData', 'eContentLength', 'digests'])
+
+
+def _decode(substrate, asn1Spec):
+    asn1Object, rest = ber_decoder(substrate, asn1Spec=asn1Spec)
+    if rest:
+        raise error.PyAsn1Error('%d octets of trailing data' % len(rest))
+    return asn1Object
+
+
+class _Stream(object):
+    # reads TLVs from a file object and counts the octets read
+
+    def __init__(self, fileObj):
+        self.fileObj = fileObj
+        self.pos = 0
+
+    def read(self, size):
+        octets = self.fileObj.read(size)
+        if len(octets) != size:
+            raise error.SubstrateUnderrunError(
+                'end of stream at offset %d' % (self.pos + len(octets)))
+        self.pos += size
+        return octets
+
+    def readHeader(self):
+        """Return (tag, header octets, value length or None)."""
+        header = self.read(2)
+        if header[0] & 0x1F != 0x1F and 0x80 < header[1] < 0xFF:
+            header += self.read(header[1] & 0x7F)
+        while True:
+            try:
+                tagObj, headerLength, valueLength = tlv.decodeHeader(header)
+            except error.SubstrateUnderrunError:
+                header += self.read(1)
+            else:
+                return tagObj, header, valueLength
+
+    def children(self, valueLength):
+        """Yield the header of each TLV in a value, up to its end."""
+        end = None if valueLength is None else self.pos + valueLength
+        while end is None or self.pos < end:
+            tagObj, header, childLength = self.readHeader()
+            if end is None and header == b'\x00\x00':
+                return
+            yield tagObj, header, childLength
+            if end is not None and self.pos > end:
+                raise error.PyAsn1Error(
+                    'TLV at offset %d runs past its parent' % self.pos)
+
+    def readValue(self, valueLength):
+        """Return the octets of a value, end-of-contents included."""
+        if valueLength is not None:
+            return self.read(valueLength)
+        octets = []
+        for tagObj, header, childLength in self.children(None):
+            octets.append(header)
+            octets.append(self.readValue(childLength))
+        octets.append(b'\x00\x00')
+        return b''.join(octets)
+
+    def streamOctetString(self, tagObj, valueLength, write, chunkSize):
+        """Pass the content of an OCTET STRING to write(), in chunks."""
+        if tagObj.tagFormat == tag.tagFormatSimple:
+            if valueLength is None:
+                raise error.PyAsn1Error('indefinite length for primitive TLV')
+            while valueLength:
+                size = min(valueLength, chunkSize)
+                write(self.read(size))
+                valueLength -= size
+            return
+        for tagObj, header, childLength in self.children(valueLength):
+            if not _isOctetString(tagObj):
+                raise error.PyAsn1Error(
+                    'segment of a constructed OCTET STRING is not an OCTET STRING')
+            self.streamOctetString(tagObj, childLength, write, chunkSize)
+
+
+def _sinkWriter(sink):
+    update = getattr(sink, 'update', None)
+    if update is not None:
+        return update
+    return sink
+
+
+def _expect(children, tagObj, what):
+    for childTag, header, valueLength in children:
+        if tagObj is None or childTag == tagObj:
+            return header, valueLength
+        break
+    raise error.PyAsn1Error('expected %s' % what)
+
+
+def _isOctetString(tagObj):
+    return tagObj.tagClass == tag.tagClassUniversal and tagObj.tagId == 4
+
+
+def _streamEContent(stream, valueLength, writers, chunkSize):
+    # the value of the [0] EXPLICIT that holds the eContent
+    length = [0]
+
+    def write(chunk):
+        length[0] += len(chunk)
+        for writer in writers:
+            writer(chunk)
+
+    children = stream.children(valueLength)
+    for tagObj, header, valueLength in children:
+        if not _isOctetString(tagObj):
+            raise error.PyAsn1Error('eContent is not an OCTET STRING')
+        stream.streamOctetString(tagObj, valueLength, write, chunkSize)
+        for tagObj, header, valueLength in children:
+            raise error.PyAsn1Error('unexpected TLV after eContent')
+        return length[0]
+    raise error.PyAsn1Error('expected eContent')
+
+
+def readSignedData(fileObj, sinks=(), chunkSize=65536):
+    """Read a BER or DER SignedData from fileObj, streaming the eContent.
+
+    The stream holds an rfc5652.ContentInfo with a SignedData, or a bare
+    SignedData.  Each chunk of the eContent, which is at most chunkSize
+    octets, is given to every sink, which is a hashlib object or other
+    object with an update() method, or a callable.  It is also hashed
+    with each digest algorithm of the SignedData that hashAlgorithms
+    knows.  Only the rest of the SignedData is held in memory.
+
+    Returns a StreamedSignedData of the rfc5652.SignedData without its
+    eContent, the number of octets of eContent, or None when the content
+    is detached, and a dict of the digests of the eContent by digest
+    algorithm OID.
+    """
+    stream = _Stream(fileObj)
+    tagObj, header, valueLength = stream.readHeader()
+    if tagObj != _sequence:
+        raise error.PyAsn1Error('not a ContentInfo or a SignedData')
+    outerChildren = stream.children(valueLength)
+    enclosing = ()
+
+    header, valueLength = _expect(outerChildren, None, 'ContentInfo or SignedData')
+    if header[0] == 0x06:
+        contentType = _decode(header + stream.readValue(valueLength),
+                              rfc5652.ContentType())
+        if contentType != rfc5652.id_signedData:
+            raise error.PyAsn1Error('content type %s is not SignedData' % contentType)
+        header, valueLength = _expect(outerChildren, _explicit0, 'content')
+        explicitChildren = stream.children(valueLength)
+        header, valueLength = _expect(explicitChildren, _sequence, 'SignedData')
+        signedDataChildren = stream.children(valueLength)
+        enclosing = (explicitChildren, outerChildren)
+        header, valueLength = _expect(signedDataChildren, None, 'version')
+    else:
+        signedDataChildren = outerChildren
+
+    components = [header + stream.readValue(valueLength)]
+    header, valueLength = _expect(signedDataChildren, None, 'digestAlgorithms')
+    digestAlgorithms = header + stream.readValue(valueLength)
+    components.append(digestAlgorithms)
+
+    writers = [_sinkWriter(sink) for sink in sinks]
+    hashers = {}
+    for algorithm in _decode(digestAlgorithms, rfc5652.DigestAlgorithmIdentifiers()):
+        name = hashAlgorithms.get(algorithm['algorithm'])
+        if name is not None and algorithm['algorithm'] not in hashers:
+            hashers[algorithm['algorithm']] = hashlib.new(name)
+    writers.extend(hasher.update for hasher in hashers.values())
+
+    header, valueLength = _expect(signedDataChildren, _sequence, 'encapContentInfo')
+    encapChildren = stream.children(valueLength)
+    header, valueLength = _expect(encapChildren, None, 'eContentType')
+    eContentType = header + stream.readValue(valueLength)
+    components.append(b'\x30' + tlv.encodeLength(len(eContentType)) + eContentType)
+
+    eContentLength = None
+    for tagObj, header, valueLength in encapChildren:
+        if tagObj != _explicit0 or eContentLength is not None:
+            raise error.PyAsn1Error('unexpected TLV in encapContentInfo')
+        eContentLength = _streamEContent(stream, valueLength, writers, chunkSize)
+
+    for tagObj, header, valueLength in signedDataChildren:
+        components.append(header + stream.readValue(valueLength))
+    for children in enclosing:
+        for tagObj, header, valueLength in children:
+            raise error.PyAsn1Error(
+                'unexpected TLV at offset %d' % (stream.pos - len(header)))
+
+    body = b''.join(components)
+    signedData = _decode(b'\x30' + tlv.encodeLength(len(body)) + body,
+                         rfc5652.SignedData())
+    digests = {}
+    if eContentLength is not None:
+        digests = dict((algorithm, hasher.digest())
+                       for algorithm, hasher in hashers.items())
+    return StreamedSignedData(signedData, eContentLength, digests)
+
+
+_envelopeContentTypes = (
+    (rfc5083.AuthEnvelopedData, rfc5083.id_ct_authEnvelopedData),
+    (rfc5652.EnvelopedData, rfc5652.id_envelopedData),
+)
+
+
+def _encodeComponents(asn1Object, start, end):
+    namedTypes = asn1Object.componentType.namedTypes
+    octets = []
+    for idx in range(start, end):
+        component = asn1Object.getComponentByPosition(idx, instantiate=False)
+        if component is not univ.noValue and component.isValue:
+            octets.append(der_encoder(component))
+        elif not (namedTypes[idx].isOptional or namedTypes[idx].isDefaulted):
+            raise error.PyAsn1Error('%s has no %s' % (
+                asn1Object.__class__.__name__, namedTypes[idx].name))
+    return b''.join(octets)
+
+
+class EnvelopedDataWriter(object):
+    """Write a BER EnvelopedData or AuthEnvelopedData, streaming its content.
+
+    The envelope is an rfc5652.EnvelopedData or rfc5083.AuthEnvelopedData
+    with the components before its EncryptedContentInfo set, and the
+    contentType and contentEncryptionAlgorithm of that; any
+    encryptedContent in it is ignored.  These are written in DER when the
+    writer is made, inside a ContentInfo unless contentInfo is False.
+    Each write() adds one segment of the encryptedContent, and close()
+    writes the components after the EncryptedContentInfo, such as
+    unprotectedAttrs or mac, and ends the message.  The enclosing TLVs
+    use the indefinite length form, so nothing is buffered.
+    """
+
+    def __init__(self, fileObj, envelope, contentInfo=True):
+        for specClass, contentType in _envelopeContentTypes:
+            if isinstance(envelope, specClass):
+                break
+        else:
+            raise error.PyAsn1Error(
+                '%s is not an enveloped content type' % envelope.__class__.__name__)
+        for idx, namedType in enumerate(envelope.componentType.namedTypes):
+            if isinstance(namedType.asn1Object, rfc5652.EncryptedContentInfo):
+                break
+        self.fileObj = fileObj
+        self.envelope = envelope
+        self.contentInfo = contentInfo
+        self.length = 0
+        self._split = idx
+        self._closed = False
+
+        encryptedContentInfo = envelope.getComponentByPosition(idx)
+        octets = []
+        if contentInfo:
+            octets.append(b'\x30\x80' + der_encoder(contentType) + b'\xa0\x80')
+        octets.append(b'\x30\x80' + _encodeComponents(envelope, 0, idx))
+        octets.append(b'\x30\x80' + _encodeComponents(encryptedContentInfo, 0, 2))
+        octets.append(b'\xa0\x80')
+        fileObj.write(b''.join(octets))
+
+    def write(self, chunk):
+        """Write chunk as the next segment of the encryptedContent."""
+        if self._closed:
+            raise error.PyAsn1Error('write to a closed EnvelopedDataWriter')
+        if chunk:
+            self.fileObj.write(b'\x04' + tlv.encodeLength(len(chunk)))
+            self.fileObj.write(chunk)
+            self.length += len(chunk)
+
+    def close(self, envelope=None):
+        """End the message with the components after the content.
+
+        They are taken from envelope, when given, and otherwise from the
+        envelope that the writer was made with, so a mac or attributes
+        that depend on the content can be added at the end.
+        """
+        if self._closed:
+            return
+        if envelope is None:
+            envelope = self.envelope
+        octets = [b'\x00\x00\x00\x00']
+        octets.append(_encodeComponents(
+            envelope, self._split + 1, len(envelope.componentType)))
+        octets.append(b'\x00\x00')
+        if self.contentInfo:
+            octets.append(b'\x00\x00\x00\x00')
+        self.fileObj.write(b''.join(octets))
+        self._closed = True
+
+
+def writeEnvelopedData(fileObj, envelope, chunks, contentInfo=True):
+    """Write envelope with an EnvelopedDataWriter and the chunks given.
+
+    The chunks are the octets of the encryptedContent, from any
+    iterable.  Returns the number of octets of encryptedContent.
+    """
+    writer = EnvelopedDataWriter(fileObj, envelope, contentInfo=contentInfo)
+    for chunk in chunks:
+        writer.write(chunk)
+    writer.close()
+    return writer.length
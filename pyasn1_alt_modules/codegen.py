@@ -0,0 +1,406 @@
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+# Generated DER decoders: the decode plan of a spec is turned into
+# straight-line Python, with the tag checks inlined, and written to
+# _decoders.py by tools/mkdecoders.py.  A generated decoder is used only
+# while the spec still has the fingerprint it was generated from, and
+# any input it does not expect goes to the generic plan.decode().
+#
+
+import hashlib
+import importlib
+
+from pyasn1 import error
+
+from pyasn1_alt_modules import plan
+
+GENERATOR_VERSION = 3
+
+DEFAULT_SPECS = (
+    ('rfc5280', 'Certificate'),
+    ('rfc5280', 'CertificateList'),
+    ('rfc6960', 'BasicOCSPResponse'),
+    ('rfc5652', 'SignedData'),
+    ('rfc3161', 'TSTInfo'),
+)
+
+HEADER = """\
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+# Generated by tools/mkdecoders.py -- do not edit.
+#
+"""
+
+
+class Fallback(Exception):
+    """Raised by a generated decoder on input that it does not handle."""
+
+
+_constructed = (plan._SequenceNode, plan._SequenceOfNode, plan._ChoiceNode)
+
+_converters = {
+    plan._BooleanNode: '_boolean',
+    plan._BitStringNode: '_bitString',
+    plan._NullNode: '_null',
+}
+
+
+def _keyTest(keys):
+    if keys is None:
+        return 'k is not None'
+    if len(keys) == 1:
+        return 'k == %#x' % list(keys)[0]
+    return 'k in (%s)' % ', '.join('%#x' % key for key in sorted(keys))
+
+
+def _keyMismatch(keys):
+    if keys is None:
+        return 'k is None'
+    if len(keys) == 1:
+        return 'k != %#x' % list(keys)[0]
+    return 'k not in (%s)' % ', '.join('%#x' % key for key in sorted(keys))
+
+
+def _describe(node, index):
+    spec = node.spec
+    parts = [type(node).__name__,
+             '%s.%s' % (type(spec).__module__, type(spec).__name__),
+             _keyTest(node.keys), repr(node.inner)]
+    if isinstance(node, plan._AnyNode):
+        parts.append(repr(sorted(node.tagKeys)))
+    elif isinstance(node, plan._SequenceNode):
+        namedTypes = spec.componentType.namedTypes
+        for idx, keys, child, skippable in node.components:
+            parts.append('%s:%d:%d' % (namedTypes[idx].name, skippable, index(child)))
+    elif isinstance(node, plan._ChoiceNode):
+        for key in sorted(node.alternatives):
+            idx, child = node.alternatives[key]
+            parts.append('%#x:%d:%d' % (key, idx, index(child)))
+        if node.default is not None:
+            parts.append('*:%d:%d' % (node.default[0], index(node.default[1])))
+    elif isinstance(node, plan._SequenceOfNode):
+        parts.append('%d' % index(node.component))
+    return '|'.join(parts)
+
+
+def fingerprint(asn1Spec):
+    """Return a digest of the structure that the decode plan of asn1Spec has.
+
+    It covers the tags, the order and optionality of the components, and
+    the class of every type in the plan, so a change to any of them in
+    the ASN.1 modules makes a generated decoder stale.
+    """
+    seen = {}
+    lines = []
+
+    def index(node):
+        try:
+            return seen[id(node)]
+        except KeyError:
+            pass
+        seen[id(node)] = len(seen)
+        slot = len(lines)
+        lines.append(None)
+        lines[slot] = _describe(node, index)
+        return seen[id(node)]
+
+    index(plan.compileSpec(asn1Spec))
+    return hashlib.sha256('\n'.join(lines).encode('utf-8')).hexdigest()[:32]
+
+
+class _Generator(object):
+
+    def __init__(self):
+        self.imports = set()
+        self.specLines = []
+        self.functions = []
+        self.numbers = {}
+        self.pending = []
+
+    def bind(self, node, expr):
+        try:
+            return self.numbers[id(node)]
+        except KeyError:
+            pass
+        n = len(self.numbers)
+        self.numbers[id(node)] = n
+        self.specLines.append('_S%d = %s' % (n, expr))
+        if isinstance(node, _constructed):
+            self.pending.append(node)
+        elif not isinstance(node, (plan._AnyNode, plan._IntegerNode,
+                                   plan._OctetStringNode)) and type(node) not in _converters:
+            self.specLines.append('_P%d = _node(_S%d)' % (n, n))
+        return n
+
+    def unwrapLines(self, node, indent):
+        lines = []
+        for key in node.inner:
+            lines.append(indent + 'k, f, vs, e1 = _h(s, vs, ve)')
+            lines.append(indent + 'if k != %#x or e1 != ve:' % key)
+            lines.append(indent + '    raise Fallback')
+        return lines
+
+    def valueLines(self, node, expr, indent):
+        """Return the lines that decode the TLV at p into v."""
+        n = self.bind(node, expr)
+        if isinstance(node, _constructed):
+            return [indent + 'v = _d%d(s, p, k, vs, ve, f)' % n]
+        if isinstance(node, plan._AnyNode):
+            if node.tagKeys:
+                return [indent + 'v = _S%d.clone(s[vs:ve] if %s else s[p:ve])' % (
+                    n, _keyTest(node.tagKeys))]
+            return [indent + 'v = _S%d.clone(s[p:ve])' % n]
+        if isinstance(node, plan._IntegerNode):
+            value = "int.from_bytes(s[vs:ve], 'big', signed=True)"
+        elif isinstance(node, plan._OctetStringNode):
+            value = 's[vs:ve]'
+        elif type(node) in _converters:
+            value = '%s(s[vs:ve])' % _converters[type(node)]
+        elif isinstance(node, plan._ObjectIdentifierNode):
+            lines = self.unwrapLines(node, indent)
+            lines.append(indent + 'if f:')
+            lines.append(indent + '    raise Fallback')
+            lines.append(indent + 'v = _P%d.table.intern(s[vs:ve])' % n)
+            return lines
+        else:
+            return [indent + 'v = _P%d.decode(s, p, k, vs, ve, f, None)' % n]
+        lines = self.unwrapLines(node, indent)
+        lines.append(indent + 'if f:')
+        lines.append(indent + '    raise Fallback')
+        lines.append(indent + 'v = _S%d.clone(%s)' % (n, value))
+        return lines
+
+    def nextLines(self, indent):
+        return [indent + 'p = ve',
+                indent + 'if p < e:',
+                indent + '    k, f, vs, ve = _h(s, p, e)',
+                indent + 'else:',
+                indent + '    k = None']
+
+    def sequence(self, node, n):
+        lines = self.unwrapLines(node, '    ')
+        lines.extend(['    if not f:',
+                      '        raise Fallback',
+                      '    o = _S%d.clone()' % n,
+                      '    o.clear()',
+                      '    e = ve',
+                      '    p = vs'])
+        lines.extend(self.nextLines('    ')[1:])
+        namedTypes = node.spec.componentType.namedTypes
+        for idx, keys, child, skippable in node.components:
+            lines.append('    # %s' % namedTypes[idx].name)
+            expr = '_S%d.componentType[%d].asn1Object' % (n, idx)
+            if skippable:
+                lines.append('    if %s:' % _keyTest(keys))
+                indent = '        '
+            else:
+                lines.append('    if %s:' % _keyMismatch(keys))
+                lines.append('        raise Fallback')
+                indent = '    '
+            lines.extend(self.valueLines(child, expr, indent))
+            lines.append(indent + 'o.setComponentByPosition(%d, v, False, False, False)' % idx)
+            lines.extend(self.nextLines(indent))
+        lines.append('    if k is not None:')
+        lines.append('        raise Fallback')
+        lines.append('    return o')
+        return lines
+
+    def sequenceOf(self, node, n):
+        lines = self.unwrapLines(node, '    ')
+        lines.extend(['    if not f:',
+                      '        raise Fallback',
+                      '    o = _S%d.clone()' % n,
+                      '    o.clear()',
+                      '    e = ve',
+                      '    p = vs',
+                      '    i = 0',
+                      '    while p < e:',
+                      '        k, f, vs, ve = _h(s, p, e)'])
+        if node.component.keys is not None:
+            lines.append('        if %s:' % _keyMismatch(node.component.keys))
+            lines.append('            raise Fallback')
+        lines.extend(self.valueLines(
+            node.component, '_S%d.componentType' % n, '        '))
+        lines.extend(['        o.setComponentByPosition(i, v, False, False, False)',
+                      '        i += 1',
+                      '        p = ve',
+                      '    return o'])
+        return lines
+
+    def choice(self, node, n):
+        lines = []
+        if node.inner:
+            for key in node.inner[:-1]:
+                lines.append('    k, f, vs, e1 = _h(s, vs, ve)')
+                lines.append('    if k != %#x or e1 != ve:' % key)
+                lines.append('        raise Fallback')
+            lines.extend(['    p = vs',
+                          '    k, f, vs, e1 = _h(s, p, ve)',
+                          '    if e1 != ve:',
+                          '        raise Fallback'])
+        lines.append('    o = _S%d.clone()' % n)
+        namedTypes = node.spec.componentType.namedTypes
+        alternatives = {}
+        for key, (idx, child) in node.alternatives.items():
+            alternatives.setdefault(idx, set()).add(key)
+        keyword = 'if'
+        for idx in sorted(alternatives):
+            child = namedTypes[idx].asn1Object
+            childNode = plan._node(child)
+            lines.append('    %s %s:  # %s' % (
+                keyword, _keyTest(alternatives[idx]), namedTypes[idx].name))
+            lines.extend(self.valueLines(
+                childNode, '_S%d.componentType[%d].asn1Object' % (n, idx), '        '))
+            lines.append('        o.setComponentByPosition(%d, v, False, False, False)' % idx)
+            keyword = 'elif'
+        lines.append('    else:')
+        if node.default is not None:
+            idx, childNode = node.default
+            lines.append('        # %s' % namedTypes[idx].name)
+            lines.extend(self.valueLines(
+                childNode, '_S%d.componentType[%d].asn1Object' % (n, idx), '        '))
+            lines.append('        o.setComponentByPosition(%d, v, False, False, False)' % idx)
+        else:
+            lines.append('        raise Fallback')
+        lines.append('    return o')
+        return lines
+
+    def function(self, node):
+        n = self.numbers[id(node)]
+        if isinstance(node, plan._SequenceNode):
+            body = self.sequence(node, n)
+        elif isinstance(node, plan._SequenceOfNode):
+            body = self.sequenceOf(node, n)
+        else:
+            body = self.choice(node, n)
+        self.functions.append('\n'.join(
+            ['def _d%d(s, p, k, vs, ve, f):' % n,
+             '    # %s' % node.spec.__class__.__name__] + body))
+
+    def root(self, moduleName, className):
+        self.imports.add(moduleName)
+        asn1Spec = getattr(importlib.import_module(
+            'pyasn1_alt_modules.' + moduleName), className)()
+        node = plan.compileSpec(asn1Spec)
+        name = 'decode_%s_%s' % (moduleName, className)
+        lines = ['def %s(s):' % name,
+                 '    p = 0',
+                 '    k, f, vs, ve = _h(s, 0, len(s))',
+                 '    if %s:' % _keyMismatch(node.keys),
+                 '        raise Fallback']
+        lines.extend(self.valueLines(
+            node, '%s.%s()' % (moduleName, className), '    '))
+        lines.append('    return v, ve')
+        while self.pending:
+            self.function(self.pending.pop(0))
+        self.functions.append('\n'.join(lines))
+        return name, fingerprint(asn1Spec)
+
+
+def generate(specs=DEFAULT_SPECS):
+    """Return the source of a module with a generated decoder for each spec.
+
+    The specs are (module name, class name) pairs of this package.
+    """
+    generator = _Generator()
+    roots = []
+    for moduleName, className in specs:
+        name, digest = generator.root(moduleName, className)
+        roots.append((moduleName, className, name, digest))
+
+    lines = [HEADER,
+             'from pyasn1_alt_modules.codegen import Fallback',
+             'from pyasn1_alt_modules.plan import _BitStringNode',
+             'from pyasn1_alt_modules.plan import _BooleanNode',
+             'from pyasn1_alt_modules.plan import _NullNode',
+             'from pyasn1_alt_modules.plan import _node',
+             'from pyasn1_alt_modules.tlv import readHeader as _h']
+    lines.extend('from pyasn1_alt_modules import %s' % moduleName
+                 for moduleName in sorted(generator.imports))
+    lines.extend(['',
+                  'generatorVersion = %d' % GENERATOR_VERSION,
+                  '',
+                  '_bitString = _BitStringNode.convert',
+                  '_boolean = _BooleanNode.convert',
+                  '_null = _NullNode.convert',
+                  ''])
+    lines.extend(generator.specLines)
+    for function in generator.functions:
+        lines.extend(['', '', function])
+    lines.extend(['', '', 'decoders = {'])
+    for moduleName, className, name, digest in roots:
+        lines.append("    ('pyasn1_alt_modules.%s', '%s'): (%s, '%s')," % (
+            moduleName, className, name, digest))
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+_generated = None
+
+_decoders = {}
+
+
+def _loadGenerated():
+    global _generated
+    if _generated is None:
+        try:
+            module = importlib.import_module('pyasn1_alt_modules._decoders')
+        except ImportError:
+            _generated = {}
+        else:
+            if module.generatorVersion == GENERATOR_VERSION:
+                _generated = module.decoders
+            else:
+                _generated = {}
+    return _generated
+
+
+def decoderFor(asn1Spec):
+    """Return the generated decoder for asn1Spec, or None.
+
+    There is none when _decoders.py has no decoder for the class of
+    asn1Spec, or when the spec has changed since it was generated.
+    """
+    key = (type(asn1Spec), asn1Spec.tagSet,
+           id(getattr(asn1Spec, 'componentType', None)), id(asn1Spec.subtypeSpec))
+    try:
+        return _decoders[key][1]
+    except KeyError:
+        pass
+    entry = _loadGenerated().get(
+        (type(asn1Spec).__module__, type(asn1Spec).__name__))
+    decoder = None
+    if entry is not None and entry[1] == fingerprint(asn1Spec):
+        decoder = entry[0]
+    _decoders[key] = (asn1Spec, decoder)
+    return decoder
+
+
+def decode(substrate, asn1Spec, decodeOpenTypes=False, openTypes=None):
+    """Decode DER with the generated decoder for asn1Spec, like der_decoder().
+
+    Returns (asn1Object, rest).  Specs without a current generated
+    decoder, such as those from projection.projectSpec(), open types,
+    and any input that the generated decoder does not expect, including
+    malformed input, are left to plan.decode().
+    """
+    substrate = bytes(substrate)
+    if not (decodeOpenTypes or openTypes):
+        decoder = decoderFor(asn1Spec)
+        if decoder is not None:
+            try:
+                asn1Object, end = decoder(substrate)
+            except (Fallback, error.PyAsn1Error):
+                pass
+            else:
+                return asn1Object, substrate[end:]
+    return plan.decode(substrate, asn1Spec, decodeOpenTypes=decodeOpenTypes,
+                       openTypes=openTypes)
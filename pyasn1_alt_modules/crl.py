@@ -0,0 +1,446 @@
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+# Read the revoked certificates of a large CRL one at a time, instead
+# of decoding the whole rfc5280.CertificateList at once, and index them
+# by serial number.
+#
+
+import datetime
+import mmap
+import struct
+import sys
+from array import array
+
+from pyasn1 import error
+from pyasn1.codec.der.decoder import decode as der_decoder
+from pyasn1.type import univ
+from pyasn1.type import useful
+
+from pyasn1_alt_modules import rfc5280
+from pyasn1_alt_modules import tlv
+
+_sequence = univ.Sequence.tagSet[0]
+
+_integer = univ.Integer.tagSet[0]
+
+_timeTypes = {
+    useful.UTCTime.tagSet[0]: useful.UTCTime,
+    useful.GeneralizedTime.tagSet[0]: useful.GeneralizedTime,
+}
+
+
+def _decode(substrate, asn1Spec):
+    asn1Object, rest = der_decoder(substrate, asn1Spec=asn1Spec)
+    if rest:
+        raise error.PyAsn1Error('%d octets of trailing data' % len(rest))
+    return asn1Object
+
+
+def entryExtensions(extensions):
+    """Return a dict of the extension values in an rfc5280.Extensions.
+
+    The keys are the extnIDs.  A value is decoded with the spec from
+    certificateExtensionsMap, such as rfc5280.CRLReason for
+    id_ce_cRLReasons, and left as the extnValue OCTET STRING when the
+    map has no spec for it.
+    """
+    values = {}
+    for extension in extensions:
+        extnID = extension['extnID']
+        extnValue = extension['extnValue']
+        if extnID in rfc5280.certificateExtensionsMap:
+            extnValue = _decode(
+                extnValue, rfc5280.certificateExtensionsMap[extnID])
+        values[extnID] = extnValue
+    return values
+
+
+class CertificateListReader(object):
+    """Read a DER-encoded CertificateList without decoding every entry.
+
+    The substrate can be bytes or, for a CRL on disk, an mmap of the
+    file.  The TBSCertList is decoded when the reader is created, with
+    every component except revokedCertificates, and so are the
+    signatureAlgorithm and the signature.  Iterating over the reader
+    yields (serial, revocationDate, extensions) for each revoked
+    certificate, in the order of the CRL, where serial is an int,
+    revocationDate is a datetime, and extensions is a dict from
+    entryExtensions(), empty when the entry has none.  Only one entry is
+    decoded at a time.
+    """
+
+    def __init__(self, substrate):
+        view = memoryview(substrate)
+        if view.format != 'B' or view.ndim != 1:
+            view = view.cast('B')
+        self._view = view
+
+        children = list(tlv.iterChildren(view))
+        if len(children) != 3 or children[0][0] != _sequence:
+            raise error.PyAsn1Error('not a CertificateList')
+        tagObj, offset, length = children[1]
+        self.signatureAlgorithm = _decode(
+            bytes(view[offset:offset + length]), rfc5280.AlgorithmIdentifier())
+        tagObj, offset, length = children[2]
+        self.signature = _decode(
+            bytes(view[offset:offset + length]), univ.BitString())
+
+        self._revoked = None
+        header = []
+        tbsChildren = list(tlv.iterChildren(view, children[0][1]))
+        # revokedCertificates is the only SEQUENCE after thisUpdate
+        start = 4 if tbsChildren and tbsChildren[0][0] == _integer else 3
+        for idx, (tagObj, offset, length) in enumerate(tbsChildren):
+            if idx >= start and tagObj == _sequence and self._revoked is None:
+                self._revoked = (offset, length)
+            else:
+                header.append(bytes(view[offset:offset + length]))
+        header = b''.join(header)
+        self.tbsCertList = _decode(
+            b'\x30' + tlv.encodeLength(len(header)) + header, rfc5280.TBSCertList())
+
+    def __iter__(self):
+        if self._revoked is None:
+            return
+        view = self._view
+        for tagObj, offset, length in tlv.iterChildren(view, self._revoked[0]):
+            entry = list(tlv.iterChildren(view, offset))
+            if len(entry) not in (2, 3) or entry[0][0] != _integer:
+                raise error.PyAsn1Error(
+                    'bad revoked certificate at offset %d' % offset)
+
+            tagObj, offset, length = entry[0]
+            headerLength = tlv.decodeHeader(view, offset)[1]
+            serial = int.from_bytes(
+                view[offset + headerLength:offset + length], 'big', signed=True)
+
+            tagObj, offset, length = entry[1]
+            if tagObj not in _timeTypes:
+                raise error.PyAsn1Error(
+                    'bad revocationDate at offset %d' % offset)
+            headerLength = tlv.decodeHeader(view, offset)[1]
+            revocationDate = _timeTypes[tagObj](
+                bytes(view[offset + headerLength:offset + length])).asDateTime
+
+            extensions = {}
+            if len(entry) == 3:
+                tagObj, offset, length = entry[2]
+                extensions = entryExtensions(_decode(
+                    bytes(view[offset:offset + length]), rfc5280.Extensions()))
+
+            yield serial, revocationDate, extensions
+
+
+def iterEntries(certificateList):
+    """Yield (serial, revocationDate, extensions) for a decoded CRL.
+
+    The certificateList is an rfc5280.CertificateList, and the tuples
+    are the same as those of CertificateListReader.
+    """
+    revokedCertificates = certificateList['tbsCertList']['revokedCertificates']
+    if not revokedCertificates.isValue:
+        return
+    for entry in revokedCertificates:
+        extensions = {}
+        if entry['crlEntryExtensions'].isValue:
+            extensions = entryExtensions(entry['crlEntryExtensions'])
+        yield (int(entry['userCertificate']),
+               entry['revocationDate'].getComponent().asDateTime, extensions)
+
+
+def _serialWidth(serial):
+    if serial < 0:
+        serial = -serial - 1
+    return serial.bit_length() // 8 + 1
+
+
+def _encodeSerial(serial, width):
+    # offset binary, so that the octets sort in the order of the numbers
+    value = serial + (1 << (8 * width - 1))
+    if not 0 <= value < 1 << (8 * width):
+        return None
+    return value.to_bytes(width, 'big')
+
+
+def _decodeSerial(octets, width):
+    return int.from_bytes(octets, 'big') - (1 << (8 * width - 1))
+
+
+def _bisect(serials, key, width, lo, hi):
+    # the position of the first serial not less than key
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if serials[mid * width:(mid + 1) * width] < key:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+class RevocationIndex(object):
+    """A sorted index of the serial numbers revoked by a CRL.
+
+    The serials are held as fixed-width octets in one buffer, sorted, so
+    a lookup is a binary search, and the revocation dates and reason
+    codes are held in parallel arrays: seconds since the epoch, and the
+    CRLReason value or -1 when the entry has no reason code.  The
+    crlNumber is the cRLNumber of the CRL, or None.
+
+    Build the index with fromCertificateList(), apply delta CRLs with
+    merge(), and write it with save().  An index opened with load() maps
+    the file with mmap, so processes that open the same file share one
+    copy of it.
+    """
+
+    indexMagic = 'CRLIDX1\n'.encode()
+
+    indexHeader = struct.Struct('<IIQ')
+
+    def __init__(self, serials, dates, reasons, width, crlNumber=None):
+        self.width = width
+        self.crlNumber = crlNumber
+        self._serials = serials
+        self._dates = dates
+        self._reasons = reasons
+        self._map = None
+
+    @classmethod
+    def _fromEntries(cls, entries, crlNumber):
+        entries = sorted(entries.items())
+        width = max([_serialWidth(serial) for serial, value in entries] or [1])
+        serials = b''.join(_encodeSerial(serial, width) for serial, value in entries)
+        dates = array('q', [value[0] for serial, value in entries])
+        reasons = array('b', [value[1] for serial, value in entries])
+        return cls(serials, dates, reasons, width, crlNumber)
+
+    @staticmethod
+    def _readCrl(certificateList):
+        if isinstance(certificateList, CertificateListReader):
+            tbsCertList = certificateList.tbsCertList
+            entries = iter(certificateList)
+        else:
+            tbsCertList = certificateList['tbsCertList']
+            entries = iterEntries(certificateList)
+        extensions = {}
+        if tbsCertList['crlExtensions'].isValue:
+            extensions = entryExtensions(tbsCertList['crlExtensions'])
+        crlNumber = extensions.get(rfc5280.id_ce_cRLNumber)
+        if crlNumber is not None:
+            crlNumber = int(crlNumber)
+        baseCrlNumber = extensions.get(rfc5280.id_ce_deltaCRLIndicator)
+        if baseCrlNumber is not None:
+            baseCrlNumber = int(baseCrlNumber)
+
+        revoked = {}
+        for serial, revocationDate, values in entries:
+            reason = values.get(rfc5280.id_ce_cRLReasons)
+            revoked[serial] = (int(revocationDate.timestamp()),
+                               -1 if reason is None else int(reason))
+        return crlNumber, baseCrlNumber, revoked
+
+    @classmethod
+    def fromCertificateList(cls, certificateList):
+        """Build the index of a complete CRL.
+
+        The certificateList is a decoded rfc5280.CertificateList or a
+        CertificateListReader.
+        """
+        crlNumber, baseCrlNumber, revoked = cls._readCrl(certificateList)
+        if baseCrlNumber is not None:
+            raise error.PyAsn1Error('cannot build an index from a delta CRL')
+        return cls._fromEntries(revoked, crlNumber)
+
+    def merge(self, certificateList):
+        """Return a new index with a delta CRL applied to this one.
+
+        The delta CRL must have a deltaCRLIndicator whose BaseCRLNumber
+        is not greater than the crlNumber of this index, and a cRLNumber
+        that is greater.  Its entries are added or replace those with the
+        same serial, except that an entry with the removeFromCRL reason
+        takes the serial out of the index.  Only the delta is sorted, and
+        it is merged into the packed columns of this index in one pass.
+        """
+        crlNumber, baseCrlNumber, revoked = self._readCrl(certificateList)
+        if baseCrlNumber is None:
+            raise error.PyAsn1Error('not a delta CRL')
+        if self.crlNumber is None or baseCrlNumber > self.crlNumber:
+            raise error.PyAsn1Error(
+                'delta CRL for base %d does not apply to CRL %s' % (
+                    baseCrlNumber, self.crlNumber))
+        if crlNumber is None or crlNumber <= self.crlNumber:
+            raise error.PyAsn1Error(
+                'delta CRL %s is not newer than CRL %d' % (
+                    crlNumber, self.crlNumber))
+
+        # the delta is sorted on its own, and each run of the entries of
+        # this index between two delta serials is copied in one slice
+        removeFromCRL = int(rfc5280.CRLReason('removeFromCRL'))
+        delta = sorted(revoked.items())
+        width = max([self.width] + [_serialWidth(serial) for serial, value in delta])
+        oldSerials = self._serials
+        if width != self.width:
+            oldSerials = b''.join(_encodeSerial(serial, width)
+                                  for serial, revocationDate, reason in self._iterRaw())
+        count = len(self)
+        oldDates = memoryview(self._dates).cast('B')
+        oldReasons = memoryview(self._reasons).cast('B')
+        serials = bytearray()
+        dates = array('q')
+        reasons = array('b')
+        pos = 0
+        for serial, (revocationDate, reason) in delta:
+            key = _encodeSerial(serial, width)
+            n = _bisect(oldSerials, key, width, pos, count)
+            serials += oldSerials[pos * width:n * width]
+            dates.frombytes(oldDates[8 * pos:8 * n])
+            reasons.frombytes(oldReasons[pos:n])
+            pos = n
+            if n < count and oldSerials[n * width:(n + 1) * width] == key:
+                pos += 1
+            if reason != removeFromCRL:
+                serials += key
+                dates.append(revocationDate)
+                reasons.append(reason)
+        serials += oldSerials[pos * width:count * width]
+        dates.frombytes(oldDates[8 * pos:])
+        reasons.frombytes(oldReasons[pos:])
+        oldDates.release()
+        oldReasons.release()
+        return type(self)(bytes(serials), dates, reasons, width, crlNumber)
+
+    def _iterRaw(self):
+        width = self.width
+        for n in range(len(self)):
+            yield (_decodeSerial(self._serials[n * width:(n + 1) * width], width),
+                   self._dates[n], self._reasons[n])
+
+    def _find(self, serial):
+        width = self.width
+        key = _encodeSerial(serial, width)
+        if key is None:
+            return -1
+        serials = self._serials
+        lo = _bisect(serials, key, width, 0, len(self))
+        if lo < len(self) and serials[lo * width:(lo + 1) * width] == key:
+            return lo
+        return -1
+
+    def lookup(self, serial):
+        """Return (revocationDate, reason) for serial, or None.
+
+        The revocationDate is a datetime in UTC, and the reason is the
+        CRLReason value, or None when the entry has no reason code.
+        """
+        n = self._find(serial)
+        if n < 0:
+            return None
+        reason = self._reasons[n]
+        return (datetime.datetime.fromtimestamp(
+                    self._dates[n], datetime.timezone.utc),
+                None if reason < 0 else reason)
+
+    def __contains__(self, serial):
+        return self._find(serial) >= 0
+
+    def __len__(self):
+        return len(self._dates)
+
+    def __iter__(self):
+        """Yield the revoked serial numbers in ascending order."""
+        for serial, revocationDate, reason in self._iterRaw():
+            yield serial
+
+    def save(self, filename):
+        """Write the index to filename, in a form that load() can map."""
+        if self.crlNumber is None:
+            crlNumber = b''
+        else:
+            crlNumber = self.crlNumber.to_bytes(
+                _serialWidth(self.crlNumber), 'big', signed=True)
+        with open(filename, 'wb') as fileObj:
+            fileObj.write(self.indexMagic)
+            fileObj.write(self.indexHeader.pack(
+                self.width, len(crlNumber), len(self)))
+            fileObj.write(crlNumber)
+            fileObj.write(b'\x00' * (-fileObj.tell() % 8))
+            dates = array('q', self._dates)
+            if sys.byteorder != 'little':
+                dates.byteswap()
+            dates.tofile(fileObj)
+            fileObj.write(bytes(self._serials))
+            fileObj.write(bytes(self._reasons))
+
+    @classmethod
+    def load(cls, filename):
+        """Open an index written by save(), mapping the file with mmap.
+
+        On a big-endian host the dates are copied into memory instead.
+        """
+        with open(filename, 'rb') as fileObj:
+            size = fileObj.seek(0, 2)
+            if not size:
+                raise error.PyAsn1Error('empty index file %s' % filename)
+            fileMap = mmap.mmap(fileObj.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            pos = len(cls.indexMagic)
+            if fileMap[:pos] != cls.indexMagic:
+                raise error.PyAsn1Error('not a revocation index: %s' % filename)
+            width, crlNumberLength, count = cls.indexHeader.unpack(
+                fileMap[pos:pos + cls.indexHeader.size])
+            pos += cls.indexHeader.size
+            crlNumber = None
+            if crlNumberLength:
+                crlNumber = int.from_bytes(
+                    fileMap[pos:pos + crlNumberLength], 'big', signed=True)
+            pos += crlNumberLength
+            pos += -pos % 8
+            if pos + count * (9 + width) != size:
+                raise error.PyAsn1Error('truncated revocation index: %s' % filename)
+            view = memoryview(fileMap)
+            if sys.byteorder == 'little':
+                dates = view[pos:pos + 8 * count].cast('q')
+            else:
+                dates = array('q', bytes(view[pos:pos + 8 * count]))
+                dates.byteswap()
+            pos += 8 * count
+            serials = view[pos:pos + width * count]
+            pos += width * count
+            reasons = view[pos:pos + count].cast('b')
+        except Exception:
+            fileMap.close()
+            raise
+
+        index = cls(_MappedSerials(serials), dates, reasons, width, crlNumber)
+        index._map = fileMap
+        return index
+
+    def close(self):
+        """Release the file mapping of an index opened with load()."""
+        if self._map is not None:
+            for column in (self._serials.view, self._dates, self._reasons):
+                if isinstance(column, memoryview):
+                    column.release()
+            self._map.close()
+            self._map = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class _MappedSerials(object):
+    # slices of a memoryview compare only for equality, so return bytes
+    def __init__(self, view):
+        self.view = view
+
+    def __getitem__(self, key):
+        return self.view[key].tobytes()
+
+    def __bytes__(self):
+        return self.view.tobytes()
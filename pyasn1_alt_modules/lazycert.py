@@ -0,0 +1,193 @@
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+# A certificate that is decoded one component at a time, on first access,
+# from an index of the TLV offsets made when it is constructed.  It suits
+# code that forwards most certificates and reads a few fields of each.
+#
+
+from pyasn1 import error
+
+from pyasn1_alt_modules import oids
+from pyasn1_alt_modules import plan
+from pyasn1_alt_modules import rfc5280
+from pyasn1_alt_modules import tlv
+
+_extensionSpecs = oids.OctetsKeyedMap(rfc5280.certificateExtensionsMap)
+
+_specs = dict(
+    (namedType.name, namedType.asn1Object)
+    for namedType in rfc5280.Certificate.componentType.namedTypes)
+
+_specs.update(
+    ('tbsCertificate.' + namedType.name, namedType.asn1Object)
+    for namedType in rfc5280.TBSCertificate.componentType.namedTypes)
+
+_requiredNames = ('serialNumber', 'signature', 'issuer', 'validity', 'subject',
+                  'subjectPublicKeyInfo')
+
+_optionalNames = {
+    0x81: 'issuerUniqueID',
+    0x82: 'subjectUniqueID',
+    0x83: 'extensions',
+}
+
+
+def _children(substrate, start, end):
+    children = []
+    while start < end:
+        key, constructed, valueStart, valueEnd = tlv.readHeader(substrate, start, end)
+        children.append((key, start, valueStart, valueEnd))
+        start = valueEnd
+    return children
+
+
+class LazyCertificate(object):
+    """An X.509 certificate that decodes its components on first access.
+
+    Construction indexes the TLVs of the Certificate and of its
+    TBSCertificate, which checks the outer structure but decodes nothing.
+    Each component is decoded with plan.decode() when it is first read,
+    as the class of the matching rfc5280 component, and the result is
+    kept.  Decoded components are shared by every reader
+    of the certificate, so treat them as read-only.
+    """
+
+    __slots__ = ('substrate', '_spans', '_values', '_extensions')
+
+    def __init__(self, substrate):
+        substrate = bytes(substrate)
+        key, constructed, start, end = tlv.readHeader(substrate, 0, len(substrate))
+        if key != 0x10:
+            raise error.PyAsn1Error('Certificate is not a SEQUENCE')
+        children = _children(substrate, start, end)
+        if len(children) != 3 or children[0][0] != 0x10:
+            raise error.PyAsn1Error('malformed Certificate')
+        spans = {}
+        for name, child in zip(('tbsCertificate', 'signatureAlgorithm', 'signature'),
+                               children):
+            spans[name] = (child[1], child[3])
+        key, start, valueStart, valueEnd = children[0]
+        tbsChildren = _children(substrate, valueStart, valueEnd)
+
+        if tbsChildren and tbsChildren[0][0] == 0x80:
+            key, start, valueStart, valueEnd = tbsChildren.pop(0)
+            spans['tbsCertificate.version'] = (start, valueEnd)
+        if len(tbsChildren) < len(_requiredNames):
+            raise error.PyAsn1Error(
+                'TBSCertificate has %d components' % len(tbsChildren))
+        for name, child in zip(_requiredNames, tbsChildren):
+            spans['tbsCertificate.' + name] = (child[1], child[3])
+        for key, start, valueStart, valueEnd in tbsChildren[len(_requiredNames):]:
+            name = _optionalNames.get(key)
+            if name is None or 'tbsCertificate.' + name in spans:
+                raise error.PyAsn1Error(
+                    'unexpected tag %#x in TBSCertificate' % key)
+            spans['tbsCertificate.' + name] = (start, valueEnd)
+
+        self.substrate = substrate[:end]
+        self._spans = spans
+        self._values = {}
+        self._extensions = None
+
+    def encoding(self, name):
+        """Return the DER of the named component, or None when it is absent.
+
+        The name is 'tbsCertificate', 'signatureAlgorithm', 'signature',
+        or a TBSCertificate component such as 'tbsCertificate.subject'.
+        """
+        try:
+            start, end = self._spans[name]
+        except KeyError:
+            if name not in _specs:
+                raise error.PyAsn1Error('Certificate has no component %s' % name)
+            return None
+        return self.substrate[start:end]
+
+    def component(self, name):
+        """Return the named component decoded, or None when it is absent.
+
+        The names are those of encoding().  An absent version is returned
+        as its DEFAULT, v1.
+        """
+        try:
+            return self._values[name]
+        except KeyError:
+            pass
+        octets = self.encoding(name)
+        asn1Spec = _specs[name]
+        if octets is None:
+            value = None
+            if name == 'tbsCertificate.version':
+                value = asn1Spec.clone('v1')
+        else:
+            value, rest = plan.decode(octets, asn1Spec)
+        self._values[name] = value
+        return value
+
+    version = property(lambda self: self.component('tbsCertificate.version'))
+    serialNumber = property(lambda self: self.component('tbsCertificate.serialNumber'))
+    issuer = property(lambda self: self.component('tbsCertificate.issuer'))
+    validity = property(lambda self: self.component('tbsCertificate.validity'))
+    subject = property(lambda self: self.component('tbsCertificate.subject'))
+    subjectPublicKeyInfo = property(
+        lambda self: self.component('tbsCertificate.subjectPublicKeyInfo'))
+    extensions = property(lambda self: self.component('tbsCertificate.extensions'))
+    signatureAlgorithm = property(lambda self: self.component('signatureAlgorithm'))
+    signature = property(lambda self: self.component('signature'))
+
+    def _indexExtensions(self):
+        if self._extensions is None:
+            self._extensions = {}
+            octets = self.encoding('tbsCertificate.extensions')
+            if octets is not None:
+                key, constructed, start, end = tlv.readHeader(octets, 0, len(octets))
+                key, constructed, start, end = tlv.readHeader(octets, start, end)
+                for key, start, valueStart, valueEnd in _children(octets, start, end):
+                    children = _children(octets, valueStart, valueEnd)
+                    if not 2 <= len(children) <= 3 or children[0][0] != 0x06:
+                        raise error.PyAsn1Error('malformed Extension')
+                    extnOctets = octets[children[0][2]:children[0][3]]
+                    extnID = oids.decodeContents(extnOctets)
+                    critical = (len(children) == 3 and
+                                octets[children[1][2]:children[1][3]] != b'\x00')
+                    key, start, valueStart, valueEnd = children[-1]
+                    self._extensions[extnID] = [
+                        critical, octets[valueStart:valueEnd], None, extnOctets]
+        return self._extensions
+
+    def extensionIDs(self):
+        """Return the extnIDs of the extensions, as tuples, in order."""
+        return list(self._indexExtensions())
+
+    def isCritical(self, extnID):
+        """Return the critical flag of the extension, or None when it is absent."""
+        entry = self._indexExtensions().get(tuple(extnID))
+        return entry and entry[0]
+
+    def extension(self, extnID):
+        """Return the extnValue of the extension with extnID, decoded.
+
+        The value is decoded with the spec in certificateExtensionsMap on
+        first access, and kept.  Returns None when the certificate has no
+        such extension, and the extnValue octets when the map has no spec
+        for the extnID.
+        """
+        entry = self._indexExtensions().get(tuple(extnID))
+        if entry is None:
+            return None
+        if entry[2] is None:
+            asn1Spec = _extensionSpecs.get(entry[3])
+            if asn1Spec is None:
+                entry[2] = entry[1]
+            else:
+                entry[2], rest = plan.decode(entry[1], asn1Spec)
+        return entry[2]
+
+    def toAsn1(self):
+        """Return the whole certificate decoded as an rfc5280.Certificate."""
+        asn1Object, rest = plan.decode(self.substrate, rfc5280.Certificate())
+        return asn1Object
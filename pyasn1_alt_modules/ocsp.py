@@ -0,0 +1,282 @@
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+# Make the DER of many OCSP responses from one prototype, by splicing
+# the values that change into the encoding of the prototype instead of
+# building and encoding rfc6960 objects for every response, and take
+# the CertIDs out of OCSP requests as plain values to look up in an
+# index of the certificates of the responder.
+#
+
+import collections
+import datetime
+
+from pyasn1 import error
+from pyasn1.codec.der.encoder import encode as der_encoder
+from pyasn1.type import univ
+
+from pyasn1_alt_modules import oids
+from pyasn1_alt_modules import rfc6960
+from pyasn1_alt_modules import tlv
+
+_sequence = univ.Sequence.tagSet[0]
+
+_statusTags = {
+    'good': b'\x80\x00',
+    'unknown': b'\x82\x00',
+}
+
+_basicResponseType = der_encoder(rfc6960.id_pkix_ocsp_basic)
+
+
+def _tlv(first, value):
+    return first + tlv.encodeLength(len(value)) + value
+
+
+def _children(substrate, offset, what):
+    children = list(tlv.iterChildren(substrate, offset))
+    if not children:
+        raise error.PyAsn1Error('empty %s' % what)
+    return [(tagObj, substrate[offset:offset + length])
+            for tagObj, offset, length in children]
+
+
+def _generalizedTime(value):
+    if value.tzinfo is not None:
+        value = value.astimezone(datetime.timezone.utc)
+    return b'\x18\x0f' + value.strftime('%Y%m%d%H%M%SZ').encode()
+
+
+def _integer(value):
+    value = int(value)
+    width = ((value if value >= 0 else ~value).bit_length() + 8) // 8
+    return _tlv(b'\x02', value.to_bytes(width, 'big', signed=True))
+
+
+class ResponseTemplate(object):
+    """Make the DER of BasicOCSPResponses that differ from a prototype
+    only in one SingleResponse.
+
+    The prototype is an rfc6960.BasicOCSPResponse, or its DER, with one
+    SingleResponse.  Its encoding is split once around the values that
+    change: the producedAt, the serialNumber of the CertID, the
+    certStatus, the thisUpdate, and the nextUpdate.  The rest, such as
+    the responderID, the CertID hashes, any extensions, the
+    signatureAlgorithm, and the certs, is kept as the prototype has it.
+    tbsResponseData() joins the kept octets and the new values,
+    encoding only the lengths of the SEQUENCEs that hold them, and
+    returns the DER of the ResponseData for the caller to sign.
+    """
+
+    def __init__(self, prototype):
+        if not isinstance(prototype, bytes):
+            prototype = der_encoder(prototype)
+
+        basic = _children(prototype, 0, 'BasicOCSPResponse')
+        if len(basic) not in (3, 4) or basic[0][0] != _sequence:
+            raise error.PyAsn1Error('not a BasicOCSPResponse')
+        self.signatureAlgorithm = basic[1][1]
+        self.certs = len(basic) == 4 and basic[3][1] or b''
+
+        octets = [octets for tagObj, octets in _children(
+            basic[0][1], 0, 'ResponseData')]
+        # an explicit version comes before the responderID
+        start = octets[0][:1] == b'\xa0' and 1 or 0
+        if len(octets) not in (start + 3, start + 4):
+            raise error.PyAsn1Error('malformed ResponseData')
+        self._responseDataHead = b''.join(octets[:start + 1])
+        self._responseDataTail = b''.join(octets[start + 3:])
+
+        responses = _children(octets[start + 2], 0, 'responses')
+        if len(responses) != 1:
+            raise error.PyAsn1Error(
+                'prototype has %d SingleResponses' % len(responses))
+        single = [octets for tagObj, octets in _children(
+            responses[0][1], 0, 'SingleResponse')]
+        if len(single) < 3:
+            raise error.PyAsn1Error('malformed SingleResponse')
+        self._singleResponseTail = b''.join(
+            octets for octets in single[3:] if octets[:1] != b'\xa0')
+
+        certID = [octets for tagObj, octets in _children(single[0], 0, 'CertID')]
+        if len(certID) != 4:
+            raise error.PyAsn1Error('malformed CertID')
+        self._certIDHead = b''.join(certID[:3])
+        self._times = {}
+
+    def _time(self, value):
+        # the responses made together mostly share their times
+        try:
+            return self._times[value]
+        except KeyError:
+            if len(self._times) >= 1024:
+                self._times.clear()
+            octets = self._times[value] = _generalizedTime(value)
+            return octets
+
+    def tbsResponseData(self, serialNumber, thisUpdate, certStatus='good',
+                        nextUpdate=None, producedAt=None, revocationTime=None,
+                        revocationReason=None):
+        """Return the DER of a ResponseData for the values given.
+
+        The times are datetime objects, converted to UTC when they have a
+        tzinfo and otherwise taken as UTC, and are encoded to the second.
+        certStatus is 'good', 'revoked', or 'unknown'; a revoked status
+        takes a revocationTime and, optionally, a revocationReason, the
+        int value of an rfc5280.CRLReason.  producedAt defaults to
+        thisUpdate, and the nextUpdate is left out when it is None.
+        """
+        status = _statusTags.get(certStatus)
+        if status is None:
+            if certStatus != 'revoked':
+                raise error.PyAsn1Error('bad certStatus %r' % (certStatus,))
+            if revocationTime is None:
+                raise error.PyAsn1Error('revoked certStatus needs a revocationTime')
+            status = self._time(revocationTime)
+            if revocationReason is not None:
+                status += b'\xa0\x03\x0a\x01' + bytes((int(revocationReason),))
+            status = _tlv(b'\xa1', status)
+
+        thisUpdate = self._time(thisUpdate)
+        single = [_tlv(b'\x30', self._certIDHead + _integer(serialNumber)),
+                  status, thisUpdate]
+        if nextUpdate is not None:
+            single.append(b'\xa0\x11' + self._time(nextUpdate))
+        single.append(self._singleResponseTail)
+        single = _tlv(b'\x30', b''.join(single))
+
+        if producedAt is None:
+            producedAt = thisUpdate
+        else:
+            producedAt = self._time(producedAt)
+        return _tlv(b'\x30', b''.join((
+            self._responseDataHead, producedAt, _tlv(b'\x30', single),
+            self._responseDataTail)))
+
+    def basicOCSPResponse(self, tbsResponseData, signature):
+        """Return the DER of a BasicOCSPResponse.
+
+        The tbsResponseData is from tbsResponseData(), and the signature
+        is the octets of its signature with the signatureAlgorithm of the
+        prototype.  The certs of the prototype are included.
+        """
+        return _tlv(b'\x30', b''.join((
+            tbsResponseData, self.signatureAlgorithm,
+            _tlv(b'\x03', b'\x00' + signature), self.certs)))
+
+    def ocspResponse(self, tbsResponseData, signature):
+        """Return the DER of a successful OCSPResponse.
+
+        The BasicOCSPResponse from basicOCSPResponse() is the response
+        of its ResponseBytes.
+        """
+        responseBytes = _tlv(b'\x30', _basicResponseType + _tlv(
+            b'\x04', self.basicOCSPResponse(tbsResponseData, signature)))
+        return _tlv(b'\x30', b'\x0a\x01\x00' + _tlv(b'\xa0', responseBytes))
+
+
+class CertID(collections.namedtuple(
+        'CertID', ['hashAlgorithm', 'issuerNameHash', 'issuerKeyHash', 'serialNumber'])):
+    """The values of an rfc6960.CertID, hashable and cheap to compare.
+
+    The hashAlgorithm is the algorithm OID of the AlgorithmIdentifier,
+    the hashes are bytes, and the serialNumber is an int.  The key is
+    (issuerKeyHash, serialNumber), which is what CertIDIndex uses.
+    """
+
+    __slots__ = ()
+
+    @property
+    def key(self):
+        return self[2:]
+
+    @classmethod
+    def fromAsn1(cls, certID):
+        """Return the CertID of a decoded rfc6960.CertID."""
+        return cls(certID['hashAlgorithm']['algorithm'],
+                   certID['issuerNameHash'].asOctets(),
+                   certID['issuerKeyHash'].asOctets(),
+                   int(certID['serialNumber']))
+
+
+def _certID(substrate, pos, end):
+    key, constructed, pos, end = tlv.readHeader(substrate, pos, end)
+    if key != 0x10:
+        raise error.PyAsn1Error('CertID is not a SEQUENCE')
+    key, constructed, algorithmStart, algorithmEnd = tlv.readHeader(substrate, pos, end)
+    oidKey, constructed, oidStart, oidEnd = tlv.readHeader(
+        substrate, algorithmStart, algorithmEnd)
+    nameKey, constructed, nameStart, nameEnd = tlv.readHeader(substrate, algorithmEnd, end)
+    issuerKey, constructed, issuerStart, issuerEnd = tlv.readHeader(substrate, nameEnd, end)
+    serialKey, constructed, serialStart, serialEnd = tlv.readHeader(substrate, issuerEnd, end)
+    if ((key, oidKey, nameKey, issuerKey, serialKey) != (0x10, 0x06, 0x04, 0x04, 0x02) or
+            serialEnd != end):
+        raise error.PyAsn1Error('malformed CertID')
+    return CertID(oids.intern(bytes(substrate[oidStart:oidEnd])),
+                  bytes(substrate[nameStart:nameEnd]),
+                  bytes(substrate[issuerStart:issuerEnd]),
+                  int.from_bytes(substrate[serialStart:serialEnd], 'big', signed=True))
+
+
+def requestCertIDs(substrate):
+    """Return a CertID for each Request of a DER-encoded OCSPRequest.
+
+    Only the TLVs on the way to the CertIDs are walked, so nothing else
+    in the request, such as its extensions or its signature, is decoded
+    or checked.
+    """
+    key, constructed, start, end = tlv.readHeader(substrate, 0, len(substrate))
+    tbsKey, constructed, pos, tbsEnd = tlv.readHeader(substrate, start, end)
+    if (key, tbsKey) != (0x10, 0x10):
+        raise error.PyAsn1Error('not an OCSPRequest')
+    # the requestList follows the optional version and requestorName
+    while True:
+        if pos >= tbsEnd:
+            raise error.PyAsn1Error('TBSRequest has no requestList')
+        key, constructed, pos, listEnd = tlv.readHeader(substrate, pos, tbsEnd)
+        if key == 0x10:
+            break
+        pos = listEnd
+    certIDs = []
+    while pos < listEnd:
+        key, constructed, requestStart, requestEnd = tlv.readHeader(
+            substrate, pos, listEnd)
+        if key != 0x10:
+            raise error.PyAsn1Error('Request is not a SEQUENCE')
+        certIDs.append(_certID(substrate, requestStart, requestEnd))
+        pos = requestEnd
+    return certIDs
+
+
+class CertIDIndex(object):
+    """Values, such as certificate status, keyed by CertID.key.
+
+    A CertID is looked up by its (issuerKeyHash, serialNumber), with
+    one dict lookup.  The issuerKeyHash depends on the hashAlgorithm of
+    the request, so add an entry for each hash algorithm that clients
+    use, or keep one index per hash algorithm.
+    """
+
+    def __init__(self):
+        self._entries = {}
+
+    def add(self, issuerKeyHash, serialNumber, value):
+        self._entries[(bytes(issuerKeyHash), int(serialNumber))] = value
+
+    def get(self, certID, default=None):
+        """Return the value for the CertID, or default when it has none."""
+        return self._entries.get(certID.key, default)
+
+    def lookup(self, certIDs, default=None):
+        """Return the list of values for the CertIDs, in their order."""
+        get = self._entries.get
+        return [get(certID.key, default) for certID in certIDs]
+
+    def __contains__(self, certID):
+        return certID.key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,172 @@
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+# Interning of OBJECT IDENTIFIER values by the content octets of their
+# encoding, so that a decoded OID is the shared constant that keys the
+# opentype maps, and opentype dispatch can be keyed by those octets.
+#
+
+from pyasn1 import error
+from pyasn1.type import univ
+
+from pyasn1_alt_modules import opentypemap
+
+
+def decodeContents(octets):
+    """Return the arcs of the OID with the DER content octets given."""
+    if not octets or octets[-1] & 0x80:
+        raise error.PyAsn1Error('bad OBJECT IDENTIFIER %r' % (octets,))
+    arcs = []
+    arc = 0
+    for octet in octets:
+        if octet == 0x80 and not arc:
+            raise error.PyAsn1Error('Invalid octet 0x80 in OID encoding')
+        arc = (arc << 7) | (octet & 0x7F)
+        if not octet & 0x80:
+            arcs.append(arc)
+            arc = 0
+    first = arcs[0]
+    if first < 40:
+        arcs[0:1] = [0, first]
+    elif first < 80:
+        arcs[0:1] = [1, first - 40]
+    else:
+        arcs[0:1] = [2, first - 80]
+    return tuple(arcs)
+
+
+def encodeContents(arcs):
+    """Return the DER content octets of the OID with the arcs given."""
+    arcs = tuple(arcs)
+    octets = bytearray()
+    for arc in (arcs[0] * 40 + arcs[1],) + arcs[2:]:
+        chunk = [arc & 0x7F]
+        arc >>= 7
+        while arc:
+            chunk.append(0x80 | (arc & 0x7F))
+            arc >>= 7
+        octets.extend(reversed(chunk))
+    return bytes(octets)
+
+
+class InternTable(object):
+    """OID objects of one spec keyed by the content octets of their DER.
+
+    intern() returns the same object for the same octets, so the arcs
+    are parsed once and the hash of the tuple of arcs is computed once.
+    Octets not seen before are parsed and, while the table holds fewer
+    than maxSize entries, kept.  The objects are immutable, like every
+    pyasn1 simple value, and so are safe to share.
+    """
+
+    def __init__(self, asn1Spec=None, maxSize=65536):
+        if asn1Spec is None:
+            asn1Spec = univ.ObjectIdentifier()
+        self.spec = asn1Spec
+        self.maxSize = maxSize
+        self._entries = {}
+
+    def add(self, value):
+        """Make value the object that intern() returns for its octets."""
+        self._entries[encodeContents(value)] = value
+
+    def intern(self, octets):
+        """Return the OID object for the DER content octets given."""
+        try:
+            return self._entries[octets]
+        except KeyError:
+            pass
+        value = self.spec.clone(decodeContents(octets))
+        if len(self._entries) < self.maxSize:
+            self._entries[bytes(octets)] = value
+        return value
+
+    def __len__(self):
+        return len(self._entries)
+
+
+_defaultTable = None
+
+
+def _isPlain(value):
+    return (type(value) is univ.ObjectIdentifier and
+            value.tagSet == univ.ObjectIdentifier.tagSet and
+            not value.subtypeSpec)
+
+
+def refresh():
+    """Add the keys of the opentype maps to the default intern table.
+
+    The keys become the objects that the default table returns, so a
+    decoded OID is the very constant that the map was built with.  The
+    table is filled on first use; call this again after importing
+    modules that add entries to the maps.
+    """
+    table = defaultTable()
+    for typeMap in list(opentypemap.map_of_opentype_maps.values()):
+        keys = list(dict.keys(typeMap)) + list(getattr(typeMap, '_pending', ()))
+        for key in keys:
+            if _isPlain(key):
+                table.add(key)
+
+
+def defaultTable():
+    """Return the intern table of univ.ObjectIdentifier values."""
+    global _defaultTable
+    if _defaultTable is None:
+        _defaultTable = InternTable()
+        refresh()
+    return _defaultTable
+
+
+def intern(octets):
+    """Return the shared univ.ObjectIdentifier for the DER content octets."""
+    return defaultTable().intern(octets)
+
+
+def _size(typeMap):
+    return len(typeMap) + len(getattr(typeMap, '_pending', ()))
+
+
+class OctetsKeyedMap(object):
+    """A view of an opentype map keyed by the content octets of the OIDs.
+
+    The first lookup of some octets interns the OID and looks it up in
+    the map, lazy entries included, and the outcome is kept, so later
+    lookups of the same octets are a single dict lookup.  The misses
+    are forgotten whenever the map gains or loses an entry; a value
+    replaced in the map after it was kept here is not seen until clear()
+    is called.
+    """
+
+    def __init__(self, typeMap):
+        self.typeMap = typeMap
+        self._entries = {}
+        self._misses = set()
+        self._size = _size(typeMap)
+
+    def get(self, octets, default=None):
+        try:
+            return self._entries[octets]
+        except KeyError:
+            pass
+        size = _size(self.typeMap)
+        if size != self._size:
+            self._misses.clear()
+            self._size = size
+        elif octets in self._misses:
+            return default
+        value = self.typeMap.get(intern(octets))
+        if value is None:
+            if len(self._misses) < 4096:
+                self._misses.add(bytes(octets))
+            return default
+        self._entries[bytes(octets)] = value
+        return value
+
+    def clear(self):
+        self._entries.clear()
+        self._misses.clear()
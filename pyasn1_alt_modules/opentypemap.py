@@ -9,11 +9,180 @@
 # License: http://vigilsec.com/pyasn1-alt-modules-license.txt
 #
 
+import importlib
 from collections import defaultdict
+from types import MappingProxyType
 
-map_of_opentype_maps = defaultdict(dict)
+
+class OpenTypeMap(dict):
+    """An opentype map that can also hold lazy entries.
+
+    A lazy entry names the module and the class of the ASN.1 type.  The
+    module is imported and the class is instantiated the first time the
+    entry is looked up, and then the result is stored in the map.  If no
+    class is named, importing the module is expected to add the entry.
+    Until then, the entry is reported by "in" and get(), but not by len(),
+    iteration, keys(), values(), or items().
+    """
+
+    def __init__(self, *args, **kwargs):
+        dict.__init__(self, *args, **kwargs)
+        self._pending = {}
+
+    def register(self, key, moduleName, specName=None):
+        """Register a lazy entry, unless the key already has a value."""
+        if not dict.__contains__(self, key):
+            self._pending[key] = (moduleName, specName, None)
+
+    def __missing__(self, key):
+        try:
+            moduleName, specName, source = self._pending[key]
+        except KeyError:
+            raise KeyError(key) from None
+        module = importlib.import_module(moduleName)
+        if not dict.__contains__(self, key):
+            if specName:
+                self[key] = getattr(module, specName)()
+            elif source is not None:
+                value = source.get(key)
+                if value is not None:
+                    self[key] = value
+        self._pending.pop(key, None)
+        try:
+            return dict.__getitem__(self, key)
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __contains__(self, key):
+        return dict.__contains__(self, key) or key in self._pending
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
+class Registry(object):
+    """A named set of opentype maps.
+
+    The maps can be changed at any time, so they should not be shared
+    between threads while a module import or an update is in progress.
+    Use freeze() to get a snapshot that is safe to share.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.maps = defaultdict(OpenTypeMap)
+
+    def get(self, map_name):
+        """Get the named opentype map, creating an empty one if needed."""
+        return self.maps[map_name]
+
+    def freeze(self):
+        """Return a read-only snapshot of the maps in this registry.
+
+        Lazy entries are resolved first, so every module that they
+        name is imported.
+        """
+        for typeMap in list(self.maps.values()):
+            for key in list(typeMap._pending):
+                typeMap.get(key)
+        return FrozenRegistry(self.name, self.maps)
+
+
+class FrozenRegistry(object):
+    """A read-only snapshot of the opentype maps in a registry.
+
+    The maps never change after the snapshot is taken, so lookups need
+    no locking and the snapshot can be shared between threads.  The
+    specs in the ASN.1 modules still hold the maps of the default
+    registry, so pass openTypes() to the decoder to decode with the
+    snapshot.
+    """
+
+    def __init__(self, name, maps):
+        self.name = name
+        self.maps = MappingProxyType(dict(
+            (map_name, MappingProxyType(dict(typeMap)))
+            for map_name, typeMap in list(maps.items())))
+        self._openTypes = {}
+
+    def get(self, map_name):
+        """Get the named opentype map, which is empty if unknown."""
+        return self.maps.get(map_name, MappingProxyType({}))
+
+    def openTypes(self, *map_names):
+        """Return one read-only map of the entries of the named maps.
+
+        The result is for the openTypes option of the decoder, such as
+        der_decoder(substrate, asn1Spec=spec, openTypes=...), which looks
+        up the value of every open type in it.  A key in more than one of
+        the maps takes its value from the first one named; with no names,
+        every map of the snapshot is merged, in the order of their names.
+        The decoder falls back to the map of the spec, which belongs to
+        the default registry, only for a key that is not in the result.
+        """
+        if not map_names:
+            map_names = tuple(sorted(self.maps))
+        try:
+            return self._openTypes[map_names]
+        except KeyError:
+            pass
+        merged = {}
+        for map_name in reversed(map_names):
+            merged.update(self.get(map_name))
+        return self._openTypes.setdefault(map_names, MappingProxyType(merged))
+
+
+_registries = {'default': Registry('default')}
+
+map_of_opentype_maps = _registries['default'].maps
+
+
+def registry(name='default', base=None):
+    """Get the named registry, creating it if needed.
+
+    A new registry starts with copies of the maps in the base registry,
+    or with no maps if there is no base.  A lazy entry copied from the
+    base is resolved through the base map, since that is the map that
+    the module adds its entries to when it is imported.
+    """
+    try:
+        return _registries[name]
+    except KeyError:
+        pass
+    newRegistry = Registry(name)
+    if base is not None:
+        for map_name, typeMap in base.maps.items():
+            newMap = newRegistry.get(map_name)
+            newMap.update(typeMap)
+            for key, entry in getattr(typeMap, '_pending', {}).items():
+                newMap._pending[key] = entry[:2] + (typeMap,)
+    return _registries.setdefault(name, newRegistry)
 
 
 def get (map_name):
     """Get the named opentype map, creating an empty one if needed."""
     return map_of_opentype_maps[map_name]
+
+
+def enableAutoImport():
+    """Register every key in the generated index as a lazy entry.
+
+    After this call, looking up a key that belongs to a module that has
+    not been imported yet imports that module, which adds the key to
+    the opentype map.
+    """
+    from pyasn1.type import univ
+
+    from pyasn1_alt_modules import _index
+
+    for map_name, keys in _index.opentypeMaps.items():
+        typeMap = get(map_name)
+        for key, moduleName in keys.items():
+            if isinstance(key, str):
+                key = univ.ObjectIdentifier(key)
+            else:
+                key = univ.Integer(key)
+            typeMap.register(key, 'pyasn1_alt_modules.' + moduleName)
@@ -6,7 +6,11 @@
 # License: http://vigilsec.com/pyasn1-alt-modules-license.txt
 #
 import base64
+import mmap
+import os
+import struct
 import sys
+from array import array
 
 stSpam, stHam, stDump = 0, 1, 2
 
@@ -47,6 +51,193 @@ def readPemBlocksFromFile(fileObj, *markers):
     return idx, substrate
 
 
+# Yield (label, substrate, offset) for every block in the file, where
+# label is the text between "-----BEGIN " and "-----", and offset is the
+# position of the BEGIN marker in the data read from the file.  Any
+# label is accepted, and text between blocks is ignored, as is a block
+# that has no END marker before the next BEGIN marker.  The file is
+# read in chunks of chunkSize, and the base64 body of each block is
+# decoded with a single call.  The file may be opened in binary or text
+# mode; text is encoded as UTF-8 to compute the offsets.
+def iterPemBlocksFromFile(fileObj, chunkSize=65536):
+    beginMarker = '-----BEGIN '.encode()
+    dashes = '-----'.encode()
+    buf = bytearray()
+    base = 0
+    pos = 0
+    # the block at pos has no END or BEGIN marker that ends before this
+    # offset, so a block that spans many chunks is searched only once
+    scanned = 0
+    while True:
+        start = buf.find(beginMarker, pos)
+        if start >= 0:
+            labelEnd = buf.find(dashes, start + len(beginMarker))
+            if labelEnd >= 0:
+                label = bytes(buf[start + len(beginMarker):labelEnd])
+                endMarker = '-----END '.encode() + label + dashes
+                end = buf.find(endMarker, max(labelEnd + len(dashes),
+                                              scanned - len(endMarker)))
+                nextStart = buf.find(beginMarker, max(labelEnd, scanned - len(beginMarker)),
+                                     end if end >= 0 else len(buf))
+                if nextStart >= 0:
+                    # unterminated block, skip to the next one
+                    pos = nextStart
+                    scanned = 0
+                    continue
+                if end >= 0:
+                    substrate = base64.b64decode(buf[labelEnd + len(dashes):end])
+                    yield label.decode('latin-1'), substrate, base + start
+                    pos = end + len(endMarker)
+                    scanned = 0
+                    continue
+                scanned = len(buf)
+            keep = start
+        else:
+            keep = max(pos, len(buf) - len(beginMarker) + 1)
+
+        chunk = fileObj.read(chunkSize)
+        if not chunk:
+            break
+        if not isinstance(chunk, bytes):
+            chunk = chunk.encode('utf-8')
+        if keep:
+            # once the start of an incomplete block is at the front, the
+            # chunks are only appended to it
+            del buf[:keep]
+            base += keep
+            scanned = max(scanned - keep, 0)
+        buf += chunk
+        pos = 0
+
+
+class PemBundle(object):
+    """Random access to the blocks of a PEM bundle file.
+
+    The file is mapped with mmap, and the BEGIN and END markers are found
+    with find(), so the file is neither split into lines nor copied.
+    The offset index holds the position of each BEGIN marker, the
+    position of the matching END marker, and a label id, in arrays.
+    Indexing decodes only the base64 body of the requested block, and
+    returns (label, substrate, offset) like iterPemBlocksFromFile().
+
+    The index can be saved next to the file with save().  It is loaded
+    instead of scanning the file when the bundle is opened again, as
+    long as the size and modification time of the file are unchanged.
+    """
+
+    indexMagic = 'PEMIDX1\n'.encode()
+
+    indexHeader = struct.Struct('<QqII')
+
+    def __init__(self, filename, indexFilename=None):
+        self.filename = filename
+        self.indexFilename = indexFilename or filename + '.idx'
+        self._fileObj = open(filename, 'rb')
+        self._stat = os.fstat(self._fileObj.fileno())
+        if self._stat.st_size:
+            self._map = mmap.mmap(
+                self._fileObj.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self._map = ''.encode()
+        if not self._load():
+            self._scan()
+
+    def _scan(self):
+        beginMarker = '-----BEGIN '.encode()
+        dashes = '-----'.encode()
+        labelIds = {}
+        self.labels = []
+        self.offsets = array('Q')
+        self.ends = array('Q')
+        self.labelIds = array('H')
+        pos = 0
+        while True:
+            start = self._map.find(beginMarker, pos)
+            if start < 0:
+                break
+            labelEnd = self._map.find(dashes, start + len(beginMarker))
+            if labelEnd < 0:
+                break
+            label = self._map[start + len(beginMarker):labelEnd]
+            endMarker = '-----END '.encode() + label + dashes
+            end = self._map.find(endMarker, labelEnd + len(dashes))
+            nextStart = self._map.find(
+                beginMarker, labelEnd, end if end >= 0 else len(self._map))
+            if nextStart >= 0:
+                pos = nextStart
+                continue
+            if end < 0:
+                break
+            if label not in labelIds:
+                labelIds[label] = len(self.labels)
+                self.labels.append(label.decode('latin-1'))
+            self.offsets.append(start)
+            self.ends.append(end)
+            self.labelIds.append(labelIds[label])
+            pos = end + len(endMarker)
+
+    def _load(self):
+        try:
+            with open(self.indexFilename, 'rb') as fileObj:
+                if fileObj.read(len(self.indexMagic)) != self.indexMagic:
+                    return False
+                size, mtime, count, labelsLength = self.indexHeader.unpack(
+                    fileObj.read(self.indexHeader.size))
+                if (size, mtime) != (self._stat.st_size, self._stat.st_mtime_ns):
+                    return False
+                labels = fileObj.read(labelsLength).decode('latin-1')
+                self.labels = labels.split('\n') if labels else []
+                self.offsets = array('Q')
+                self.ends = array('Q')
+                self.labelIds = array('H')
+                for column in (self.offsets, self.ends, self.labelIds):
+                    column.fromfile(fileObj, count)
+                    if sys.byteorder != 'little':
+                        column.byteswap()
+        except (OSError, EOFError, struct.error):
+            return False
+        return True
+
+    def save(self):
+        """Write the offset index to indexFilename."""
+        labels = '\n'.join(self.labels).encode('latin-1')
+        with open(self.indexFilename, 'wb') as fileObj:
+            fileObj.write(self.indexMagic)
+            fileObj.write(self.indexHeader.pack(
+                self._stat.st_size, self._stat.st_mtime_ns,
+                len(self.offsets), len(labels)))
+            fileObj.write(labels)
+            for column in (self.offsets, self.ends, self.labelIds):
+                if sys.byteorder != 'little':
+                    column = array(column.typecode, column)
+                    column.byteswap()
+                column.tofile(fileObj)
+
+    def label(self, n):
+        return self.labels[self.labelIds[n]]
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __getitem__(self, n):
+        label = self.label(n)
+        offset = self.offsets[n]
+        bodyStart = offset + len('-----BEGIN ') + len(label) + len('-----')
+        substrate = base64.b64decode(self._map[bodyStart:self.ends[n]])
+        return label, substrate, offset
+
+    def close(self):
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._fileObj.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
 # Backward compatibility routine
 def readPemFromFile(fileObj,
                     startMarker='-----BEGIN CERTIFICATE-----',
@@ -0,0 +1,308 @@
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+# Read the SafeBags of a PKCS #12 PFX one at a time, from an index of
+# the TLV offsets of its AuthenticatedSafe, instead of decoding every
+# SafeContents and every bag value at once, and look the bags up by
+# their localKeyId and friendlyName attributes.
+#
+
+from pyasn1 import error
+from pyasn1.codec.ber.decoder import decode as ber_decoder
+from pyasn1.type import tag
+from pyasn1.type import univ
+
+from pyasn1_alt_modules import oids
+from pyasn1_alt_modules import rfc5652
+from pyasn1_alt_modules import rfc7292
+from pyasn1_alt_modules import tlv
+
+_sequence = univ.Sequence.tagSet[0]
+
+_set = univ.Set.tagSet[0]
+
+_integer = univ.Integer.tagSet[0]
+
+_objectIdentifier = univ.ObjectIdentifier.tagSet[0]
+
+_explicit0 = tag.Tag(tag.tagClassContext, tag.tagFormatConstructed, 0)
+
+
+def _decode(substrate, asn1Spec, **options):
+    asn1Object, rest = ber_decoder(substrate, asn1Spec=asn1Spec, **options)
+    if rest:
+        raise error.PyAsn1Error('%d octets of trailing data' % len(rest))
+    return asn1Object
+
+
+def _children(view, offset, what):
+    try:
+        return list(tlv.iterChildren(view, offset))
+    except IndexError:
+        raise error.SubstrateUnderrunError('short %s' % what)
+
+
+def _value(view, offset):
+    # the contents octets of a string type, joining the segments of the
+    # BER constructed form
+    tagObj, headerLength, valueLength = tlv.decodeHeader(view, offset)
+    if not tagObj.tagFormat:
+        return view[offset + headerLength:offset + headerLength + valueLength]
+    return b''.join(bytes(_value(view, childOffset))
+                    for tagObj, childOffset, length in tlv.iterChildren(view, offset))
+
+
+def _oid(view, child, what):
+    tagObj, offset, length = child
+    if tagObj != _objectIdentifier:
+        raise error.PyAsn1Error('%s is not an OBJECT IDENTIFIER' % what)
+    return oids.intern(bytes(_value(view, offset)))
+
+
+def _explicitContent(view, child, what):
+    # the one TLV inside a [0] EXPLICIT tag, as (tag, offset, length)
+    tagObj, offset, length = child
+    children = _children(view, offset, what)
+    if tagObj != _explicit0 or len(children) != 1:
+        raise error.PyAsn1Error('malformed %s' % what)
+    return children[0]
+
+
+class LazySafeBag(object):
+    """A SafeBag of a PFX, decoded piece by piece on first access.
+
+    Iterating over it, or unpacking it, gives (bagId, attributes,
+    substrate): the bagId, a dict from each attrType in bagAttributes to
+    a list of the encodings of its values, and the encoding of the whole
+    SafeBag.  The attributes are only split into TLVs when first read,
+    and the bag value is only decoded by value().
+    """
+
+    __slots__ = ('bagId', 'substrate', '_valueSpan', '_attributesSpan',
+                 '_attributes', '_value')
+
+    def __init__(self, bagId, substrate, valueSpan, attributesSpan):
+        self.bagId = bagId
+        self.substrate = substrate
+        self._valueSpan = valueSpan
+        self._attributesSpan = attributesSpan
+        self._attributes = None
+        self._value = None
+
+    def __iter__(self):
+        return iter((self.bagId, self.attributes, self.substrate))
+
+    def __repr__(self):
+        return '%s(%s)' % (self.__class__.__name__, self.bagId)
+
+    @property
+    def attributes(self):
+        if self._attributes is None:
+            attributes = {}
+            if self._attributesSpan is not None:
+                substrate = self.substrate
+                for tagObj, offset, length in _children(
+                        substrate, self._attributesSpan, 'bagAttributes'):
+                    children = _children(substrate, offset, 'bag attribute')
+                    if len(children) != 2 or children[1][0] != _set:
+                        raise error.PyAsn1Error('malformed bag attribute')
+                    attrType = _oid(substrate, children[0], 'attrType')
+                    attributes.setdefault(attrType, []).extend(
+                        substrate[valueOffset:valueOffset + valueLength]
+                        for tagObj, valueOffset, valueLength in tlv.iterChildren(
+                            substrate, children[1][1]))
+            self._attributes = attributes
+        return self._attributes
+
+    def _attribute(self, attrType):
+        values = self.attributes.get(attrType)
+        if values:
+            return _value(values[0], 0)
+        return None
+
+    @property
+    def localKeyId(self):
+        """The octets of the localKeyId attribute, or None."""
+        value = self._attribute(rfc7292.pkcs_9_at_localKeyId)
+        return value if value is None else bytes(value)
+
+    @property
+    def friendlyName(self):
+        """The friendlyName attribute as a str, or None."""
+        value = self._attribute(rfc7292.pkcs_9_at_friendlyName)
+        return value if value is None else bytes(value).decode('utf-16-be')
+
+    def value(self):
+        """Return the bag value, decoded with the spec for its bagId.
+
+        The spec comes from pkcs12BagTypeMap, such as rfc7292.CertBag
+        for id_certBag, and open types inside the value are decoded too.
+        The value is kept, so treat it as read-only.  A shrouded key is
+        returned as its EncryptedPrivateKeyInfo, for the caller to
+        decrypt.
+        """
+        if self._value is None:
+            asn1Spec = rfc7292.pkcs12BagTypeMap.get(self.bagId)
+            if asn1Spec is None:
+                raise error.PyAsn1Error('no spec for bagId %s' % self.bagId)
+            start, end = self._valueSpan
+            self._value = _decode(
+                self.substrate[start:end], asn1Spec, decodeOpenTypes=True)
+        return self._value
+
+    def toAsn1(self):
+        """Return the bag decoded as an rfc7292.SafeBag."""
+        return _decode(self.substrate, rfc7292.SafeBag())
+
+
+class PFXReader(object):
+    """Read the SafeBags of a BER or DER PFX without decoding them all.
+
+    Creating the reader decodes the version and the macData, and indexes
+    the ContentInfos of the AuthenticatedSafe without decoding them.
+    Iterating over the reader yields a LazySafeBag for each bag, in the
+    order of the PFX, with the bags of a SafeContentsBag in its place.
+    The SafeContents of a Data ContentInfo is read as it is reached.
+    Any other ContentInfo, such as EncryptedData or EnvelopedData, is
+    passed as an rfc5652.ContentInfo to decrypt, which returns the
+    encoding of the SafeContents, and is then kept; without decrypt,
+    its bags are skipped.  The octets that the MAC covers are in
+    authSafeContent.
+    """
+
+    def __init__(self, substrate, decrypt=None):
+        view = memoryview(substrate)
+        if view.format != 'B' or view.ndim != 1:
+            view = view.cast('B')
+        self.decrypt = decrypt
+
+        children = _children(view, 0, 'PFX')
+        if len(children) not in (2, 3) or children[0][0] != _integer:
+            raise error.PyAsn1Error('not a PFX')
+        tagObj, offset, length = children[0]
+        self.version = int.from_bytes(_value(view, offset), 'big', signed=True)
+        self.macData = None
+        if len(children) == 3:
+            tagObj, offset, length = children[2]
+            self.macData = _decode(
+                bytes(view[offset:offset + length]), rfc7292.MacData())
+
+        authSafe = _children(view, children[1][1], 'authSafe')
+        if (len(authSafe) != 2 or
+                _oid(view, authSafe[0], 'contentType') != rfc5652.id_data):
+            raise error.PyAsn1Error('authSafe is not Data')
+        tagObj, offset, length = _explicitContent(view, authSafe[1], 'authSafe')
+        self.authSafeContent = _value(view, offset)
+
+        self._contentInfos = []
+        for tagObj, offset, length in _children(
+                self.authSafeContent, 0, 'AuthenticatedSafe'):
+            contentInfo = _children(self.authSafeContent, offset, 'ContentInfo')
+            if not contentInfo or contentInfo[0][0] != _objectIdentifier:
+                raise error.PyAsn1Error('malformed ContentInfo')
+            self._contentInfos.append(
+                (_oid(self.authSafeContent, contentInfo[0], 'contentType'),
+                 offset, length, contentInfo))
+        self._safeContents = {}
+        self._index = None
+
+    @property
+    def contentTypes(self):
+        """The contentType of each ContentInfo of the AuthenticatedSafe."""
+        return [contentInfo[0] for contentInfo in self._contentInfos]
+
+    def safeContents(self, idx):
+        """Return the SafeContents encoding of the ContentInfo at idx.
+
+        None is returned for an encrypted ContentInfo when the reader
+        has no decrypt.
+        """
+        try:
+            return self._safeContents[idx]
+        except KeyError:
+            pass
+        contentType, offset, length, children = self._contentInfos[idx]
+        substrate = self.authSafeContent
+        if contentType == rfc5652.id_data:
+            if len(children) != 2:
+                raise error.PyAsn1Error('Data ContentInfo has no content')
+            tagObj, offset, length = _explicitContent(substrate, children[1], 'content')
+            octets = _value(substrate, offset)
+        elif self.decrypt is None:
+            return None
+        else:
+            octets = self.decrypt(_decode(
+                bytes(substrate[offset:offset + length]), rfc5652.ContentInfo()))
+        self._safeContents[idx] = octets
+        return octets
+
+    def _iterBags(self, view):
+        for tagObj, offset, length in _children(view, 0, 'SafeContents'):
+            substrate = bytes(view[offset:offset + length])
+            children = _children(substrate, 0, 'SafeBag')
+            if len(children) not in (2, 3):
+                raise error.PyAsn1Error('malformed SafeBag')
+            bagId = _oid(substrate, children[0], 'bagId')
+            tagObj, valueOffset, valueLength = _explicitContent(
+                substrate, children[1], 'bagValue')
+            if bagId == rfc7292.id_safeContentsBag:
+                for bag in self._iterBags(
+                        memoryview(substrate)[valueOffset:valueOffset + valueLength]):
+                    yield bag
+                continue
+            attributesSpan = None
+            if len(children) == 3:
+                if children[2][0] != _set:
+                    raise error.PyAsn1Error('bagAttributes is not a SET')
+                attributesSpan = children[2][1]
+            yield LazySafeBag(bagId, substrate,
+                              (valueOffset, valueOffset + valueLength), attributesSpan)
+
+    def __iter__(self):
+        for idx in range(len(self._contentInfos)):
+            octets = self.safeContents(idx)
+            if octets is not None:
+                for bag in self._iterBags(memoryview(octets)):
+                    yield bag
+
+    def find(self, localKeyId=None, friendlyName=None, bagId=None):
+        """Return the first bag with all the given values, or None.
+
+        The bags are read in order only until one matches, so nothing
+        after it is read or decrypted.
+        """
+        for bag in self:
+            if ((bagId is None or bag.bagId == bagId) and
+                    (localKeyId is None or bag.localKeyId == localKeyId) and
+                    (friendlyName is None or bag.friendlyName == friendlyName)):
+                return bag
+        return None
+
+    def lookup(self, localKeyId=None, friendlyName=None):
+        """Return the list of bags with the given localKeyId and friendlyName.
+
+        The first call reads every bag into an index of both attributes,
+        so later lookups are dict lookups.
+        """
+        if self._index is None:
+            byLocalKeyId = {}
+            byFriendlyName = {}
+            for bag in self:
+                if bag.localKeyId is not None:
+                    byLocalKeyId.setdefault(bag.localKeyId, []).append(bag)
+                if bag.friendlyName is not None:
+                    byFriendlyName.setdefault(bag.friendlyName, []).append(bag)
+            self._index = byLocalKeyId, byFriendlyName
+        byLocalKeyId, byFriendlyName = self._index
+        if localKeyId is None and friendlyName is None:
+            raise error.PyAsn1Error('give a localKeyId or a friendlyName')
+        bags = None
+        if localKeyId is not None:
+            bags = byLocalKeyId.get(localKeyId, [])
+        if friendlyName is not None:
+            named = byFriendlyName.get(friendlyName, [])
+            bags = named if bags is None else [bag for bag in bags if bag in named]
+        return list(bags)
@@ -0,0 +1,399 @@
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+# Decode plans: the componentType tree of a spec is walked once, and the
+# tags, the optional and defaulted components, and the opentype maps are
+# kept in a tree of nodes that decodes DER without consulting the tag
+# maps again.  The result is the same as that of the pyasn1 DER decoder.
+#
+
+from pyasn1 import error
+from pyasn1.codec.der.decoder import decode as der_decoder
+from pyasn1.type import univ
+
+from pyasn1_alt_modules import oids
+from pyasn1_alt_modules import tlv
+
+_nodes = {}
+
+_plans = {}
+
+
+def _tagKey(tagObj):
+    if tagObj.tagId < 31:
+        return tagObj.tagClass | tagObj.tagId
+    return tagObj.tagClass | (tagObj.tagId << 8)
+
+
+def _keysOf(asn1Spec):
+    superTags = asn1Spec.tagSet.superTags
+    if superTags:
+        return frozenset([_tagKey(superTags[-1])])
+    tagMap = asn1Spec.tagMap
+    if tagMap.defaultType is not None:
+        return None
+    return frozenset(_tagKey(tagSet.superTags[-1]) for tagSet in tagMap.presentTypes)
+
+
+class Node(object):
+    """The decode plan of one spec.
+
+    The keys are the outermost tags the spec can start with, or None
+    when it takes any tag, and inner holds the tags of the explicit
+    tagging layers below the outermost one.
+    """
+
+    def __init__(self, asn1Spec):
+        self.spec = asn1Spec
+        self.keys = _keysOf(asn1Spec)
+        superTags = asn1Spec.tagSet.superTags
+        self.inner = tuple(_tagKey(t) for t in reversed(superTags[:-1]))
+
+    def _unwrap(self, substrate, start, end, constructed):
+        for key in self.inner:
+            innerKey, constructed, start, innerEnd = tlv.readHeader(substrate, start, end)
+            if innerKey != key or innerEnd != end:
+                raise error.PyAsn1Error(
+                    'bad explicit tagging of %s' % self.spec.__class__.__name__)
+        return start, constructed
+
+    def decode(self, substrate, pos, key, start, end, constructed, openTypes):
+        if self.inner:
+            start, constructed = self._unwrap(substrate, start, end, constructed)
+        return self.decodeValue(substrate, start, end, constructed, openTypes)
+
+
+class _PrimitiveNode(Node):
+    def decodeValue(self, substrate, start, end, constructed, openTypes):
+        if constructed:
+            raise error.PyAsn1Error(
+                'constructed encoding of %s' % self.spec.__class__.__name__)
+        return self.spec.clone(self.convert(substrate[start:end]))
+
+
+class _IntegerNode(_PrimitiveNode):
+    @staticmethod
+    def convert(octets):
+        return int.from_bytes(octets, 'big', signed=True)
+
+
+class _BooleanNode(_PrimitiveNode):
+    @staticmethod
+    def convert(octets):
+        if len(octets) != 1 or octets[0] not in (0, 0xFF):
+            raise error.PyAsn1Error('bad DER BOOLEAN %r' % (octets,))
+        return octets[0] and 1 or 0
+
+
+class _BitStringNode(_PrimitiveNode):
+    @staticmethod
+    def convert(octets):
+        if not octets or octets[0] > 7:
+            raise error.PyAsn1Error('bad BIT STRING %r' % (octets,))
+        return univ.BitString.fromOctetString(
+            octets[1:], internalFormat=True, padding=octets[0])
+
+
+class _OctetStringNode(_PrimitiveNode):
+    @staticmethod
+    def convert(octets):
+        return octets
+
+
+class _NullNode(_PrimitiveNode):
+    @staticmethod
+    def convert(octets):
+        if octets:
+            raise error.PyAsn1Error('%d octets in NULL' % len(octets))
+        return ''
+
+
+class _ObjectIdentifierNode(_PrimitiveNode):
+    convert = staticmethod(oids.decodeContents)
+
+    def __init__(self, asn1Spec):
+        _PrimitiveNode.__init__(self, asn1Spec)
+        if oids._isPlain(asn1Spec):
+            self.table = oids.defaultTable()
+        else:
+            self.table = oids.InternTable(asn1Spec, maxSize=4096)
+
+    def decodeValue(self, substrate, start, end, constructed, openTypes):
+        if constructed:
+            raise error.PyAsn1Error(
+                'constructed encoding of %s' % self.spec.__class__.__name__)
+        return self.table.intern(substrate[start:end])
+
+
+class _AnyNode(Node):
+    # like the pyasn1 decoder, a tagged ANY takes any tag, and it holds
+    # the whole TLV when the tag is not its own; an ANY whose tagMap is
+    # narrowed to its own tags, like projection.RawComponent, takes only
+    # those, and holds the contents under all of them
+    def __init__(self, asn1Spec):
+        Node.__init__(self, asn1Spec)
+        self.tagKeys = ()
+        tagMap = asn1Spec.tagMap
+        if tagMap.defaultType is not asn1Spec:
+            self.keys = frozenset(
+                _tagKey(tagSet.superTags[-1]) for tagSet in tagMap.presentTypes)
+            self.tagKeys = self.keys
+        else:
+            if len(asn1Spec.tagSet.superTags) == 1:
+                self.tagKeys = self.keys
+            self.keys = None
+
+    def decode(self, substrate, pos, key, start, end, constructed, openTypes):
+        if key in self.tagKeys:
+            if self.inner:
+                start, constructed = self._unwrap(substrate, start, end, constructed)
+            return self.spec.clone(substrate[start:end])
+        return self.spec.clone(substrate[pos:end])
+
+
+class _FallbackNode(Node):
+    def decode(self, substrate, pos, key, start, end, constructed, openTypes):
+        options = {}
+        if openTypes is not None:
+            options = dict(decodeOpenTypes=True, openTypes=openTypes)
+        asn1Object, rest = der_decoder(
+            substrate[pos:end], asn1Spec=self.spec, **options)
+        return asn1Object
+
+
+class _ChoiceNode(Node):
+    def __init__(self, asn1Spec):
+        Node.__init__(self, asn1Spec)
+        self.alternatives = {}
+        self.default = None
+        for idx, namedType in enumerate(asn1Spec.componentType.namedTypes):
+            node = _node(namedType.asn1Object)
+            if node.keys is None:
+                self.default = (idx, node)
+                continue
+            for key in node.keys:
+                self.alternatives.setdefault(key, (idx, node))
+        if asn1Spec.tagSet.superTags:
+            self.inner += (None,)
+
+    def decode(self, substrate, pos, key, start, end, constructed, openTypes):
+        if self.inner:
+            # a tagged CHOICE holds the alternative inside its tags
+            for innerKey in self.inner[:-1]:
+                innerKey2, constructed, start, innerEnd = tlv.readHeader(
+                    substrate, start, end)
+                if innerKey2 != innerKey or innerEnd != end:
+                    raise error.PyAsn1Error(
+                        'bad explicit tagging of %s' % self.spec.__class__.__name__)
+            pos = start
+            key, constructed, start, innerEnd = tlv.readHeader(substrate, pos, end)
+            if innerEnd != end:
+                raise error.PyAsn1Error(
+                    'trailing data in %s' % self.spec.__class__.__name__)
+        try:
+            idx, node = self.alternatives[key]
+        except KeyError:
+            if self.default is None:
+                raise error.PyAsn1Error(
+                    'no alternative of %s for tag %#x' % (
+                        self.spec.__class__.__name__, key))
+            idx, node = self.default
+        asn1Object = self.spec.clone()
+        asn1Object.setComponentByPosition(
+            idx, node.decode(substrate, pos, key, start, end, constructed,
+                             openTypes), False, False, False)
+        return asn1Object
+
+
+class _SequenceNode(Node):
+    def __init__(self, asn1Spec):
+        Node.__init__(self, asn1Spec)
+        self.components = []
+        self.openTypes = []
+        for idx, namedType in enumerate(asn1Spec.componentType.namedTypes):
+            node = _node(namedType.asn1Object)
+            self.components.append((idx, node.keys, node,
+                                    namedType.isOptional or namedType.isDefaulted))
+            if namedType.openType:
+                self.openTypes.append((idx, namedType))
+
+    def decodeValue(self, substrate, start, end, constructed, openTypes):
+        if not constructed:
+            raise error.PyAsn1Error(
+                'primitive encoding of %s' % self.spec.__class__.__name__)
+        asn1Object = self.spec.clone()
+        asn1Object.clear()
+        components = self.components
+        count = len(components)
+        n = 0
+        pos = start
+        while pos < end:
+            key, constructed, valueStart, valueEnd = tlv.readHeader(substrate, pos, end)
+            while True:
+                if n >= count:
+                    raise error.PyAsn1Error(
+                        'Excessive components decoded at %s' % (
+                            self.spec.__class__.__name__,))
+                idx, keys, node, skippable = components[n]
+                if keys is None or key in keys:
+                    break
+                if not skippable:
+                    raise error.PyAsn1Error(
+                        'tag %#x does not match component %d of %s' % (
+                            key, idx, self.spec.__class__.__name__))
+                n += 1
+            asn1Object.setComponentByPosition(
+                idx, node.decode(substrate, pos, key, valueStart, valueEnd,
+                                 constructed, openTypes), False, False, False)
+            n += 1
+            pos = valueEnd
+        for idx, keys, node, skippable in components[n:]:
+            if not skippable:
+                raise error.PyAsn1Error(
+                    'ASN.1 object %s has uninitialized components' % (
+                        self.spec.__class__.__name__,))
+        if openTypes is not None and self.openTypes:
+            self.decodeOpenTypes(asn1Object, openTypes)
+        return asn1Object
+
+    def decodeOpenTypes(self, asn1Object, openTypes):
+        for idx, namedType in self.openTypes:
+            if namedType.isOptional and not asn1Object.getComponentByPosition(idx).isValue:
+                continue
+            governingValue = asn1Object.getComponentByName(namedType.openType.name)
+            try:
+                openType = openTypes[governingValue]
+            except KeyError:
+                try:
+                    openType = namedType.openType[governingValue]
+                except KeyError:
+                    continue
+            node = _node(openType)
+            containerValue = asn1Object.getComponentByPosition(idx)
+            if containerValue.typeId in (univ.SetOf.typeId, univ.SequenceOf.typeId):
+                for pos in range(len(containerValue)):
+                    containerValue[pos] = _decodeOpenType(
+                        node, containerValue[pos].asOctets(), openTypes)
+            else:
+                asn1Object.setComponentByPosition(idx, _decodeOpenType(
+                    node, containerValue.asOctets(), openTypes))
+
+
+class _SequenceOfNode(Node):
+    def __init__(self, asn1Spec):
+        Node.__init__(self, asn1Spec)
+        self.component = _node(asn1Spec.componentType)
+
+    def decodeValue(self, substrate, start, end, constructed, openTypes):
+        if not constructed:
+            raise error.PyAsn1Error(
+                'primitive encoding of %s' % self.spec.__class__.__name__)
+        asn1Object = self.spec.clone()
+        asn1Object.clear()
+        node = self.component
+        keys = node.keys
+        idx = 0
+        pos = start
+        while pos < end:
+            key, constructed, valueStart, valueEnd = tlv.readHeader(substrate, pos, end)
+            if keys is not None and key not in keys:
+                raise error.PyAsn1Error(
+                    'tag %#x does not match the component of %s' % (
+                        key, self.spec.__class__.__name__))
+            asn1Object.setComponentByPosition(
+                idx, node.decode(substrate, pos, key, valueStart, valueEnd,
+                                 constructed, openTypes), False, False, False)
+            idx += 1
+            pos = valueEnd
+        return asn1Object
+
+
+def _nodeClass(asn1Spec):
+    typeId = asn1Spec.typeId
+    if isinstance(asn1Spec, univ.Any):
+        return _AnyNode
+    if typeId == univ.Choice.typeId:
+        return _ChoiceNode
+    if typeId == univ.Sequence.typeId:
+        if not asn1Spec.componentType:
+            return _FallbackNode
+        return _SequenceNode
+    if typeId in (univ.SequenceOf.typeId, univ.SetOf.typeId):
+        if asn1Spec.componentType is None:
+            return _FallbackNode
+        return _SequenceOfNode
+    if not asn1Spec.tagSet.superTags:
+        return _FallbackNode
+    for specClass, nodeClass in ((univ.Boolean, _BooleanNode),
+                                 (univ.Integer, _IntegerNode),
+                                 (univ.BitString, _BitStringNode),
+                                 (univ.Null, _NullNode),
+                                 (univ.ObjectIdentifier, _ObjectIdentifierNode),
+                                 (univ.OctetString, _OctetStringNode)):
+        if isinstance(asn1Spec, specClass):
+            return nodeClass
+    return _FallbackNode
+
+
+def _node(asn1Spec):
+    try:
+        return _nodes[id(asn1Spec)][1]
+    except KeyError:
+        pass
+    nodeClass = _nodeClass(asn1Spec)
+    node = nodeClass.__new__(nodeClass)
+    # registered before it is filled in, for specs that refer to themselves
+    _nodes[id(asn1Spec)] = (asn1Spec, node)
+    node.__init__(asn1Spec)
+    return node
+
+
+def compileSpec(asn1Spec):
+    """Return the decode plan of asn1Spec, building it on first use.
+
+    The plan is cached by the class of asn1Spec and its tagSet,
+    componentType, and subtypeSpec, so every rfc5280.Certificate(), for
+    example, shares one plan.
+    """
+    key = (type(asn1Spec), asn1Spec.tagSet,
+           id(getattr(asn1Spec, 'componentType', None)), id(asn1Spec.subtypeSpec))
+    try:
+        return _plans[key][1]
+    except KeyError:
+        pass
+    node = _node(asn1Spec)
+    _plans[key] = (asn1Spec, node)
+    return node
+
+
+def _decodeFirst(node, substrate, openTypes):
+    key, constructed, start, end = tlv.readHeader(substrate, 0, len(substrate))
+    if node.keys is not None and key not in node.keys:
+        raise error.PyAsn1Error('tag %#x does not match %s' % (
+            key, node.spec.__class__.__name__))
+    return node.decode(substrate, 0, key, start, end, constructed, openTypes), end
+
+
+def _decodeOpenType(node, substrate, openTypes):
+    asn1Object, end = _decodeFirst(node, substrate, openTypes)
+    return asn1Object
+
+
+def decode(substrate, asn1Spec, decodeOpenTypes=False, openTypes=None):
+    """Decode DER with the plan of asn1Spec, like der_decoder().
+
+    Returns (asn1Object, rest).  The decodeOpenTypes and openTypes
+    options have the same meaning as for der_decoder().  Types without a
+    plan of their own, such as REAL or SET, are decoded by der_decoder()
+    as part of the plan.
+    """
+    substrate = bytes(substrate)
+    if decodeOpenTypes or openTypes:
+        openTypes = openTypes or {}
+    else:
+        openTypes = None
+    asn1Object, end = _decodeFirst(compileSpec(asn1Spec), substrate, openTypes)
+    return asn1Object, substrate[end:]
@@ -0,0 +1,93 @@
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+# Field projection for the SEQUENCE and SET specs in this package, so
+# that a decode builds only the requested components.
+#
+
+from pyasn1 import error
+from pyasn1.type import namedtype
+from pyasn1.type import tagmap
+from pyasn1.type import univ
+
+
+class RawComponent(univ.Any):
+    """The undecoded contents of a component left out of a projection.
+
+    Unlike univ.Any, it matches only its own tags, so it can stand in
+    for a component next to optional ones.
+    """
+
+    @property
+    def tagMap(self):
+        return tagmap.TagMap({self.tagSet: self})
+
+
+def _rawComponent(namedType):
+    asn1Object = namedType.asn1Object
+    tagSet = asn1Object.tagSet
+    if not tagSet:
+        presentTypes = asn1Object.tagMap.presentTypes
+        if len(presentTypes) != 1 or asn1Object.tagMap.defaultType is not None:
+            # a CHOICE of several types can only be located by decoding it
+            return namedType
+        tagSet = list(presentTypes)[0]
+    if namedType.isOptional or namedType.isDefaulted:
+        return namedtype.OptionalNamedType(
+            namedType.name, RawComponent(tagSet=tagSet))
+    return namedtype.NamedType(namedType.name, RawComponent(tagSet=tagSet))
+
+
+def _project(asn1Spec, tree, path):
+    if asn1Spec.typeId not in (univ.Sequence.typeId, univ.Set.typeId):
+        raise error.PyAsn1Error(
+            'cannot project into %s at %s' % (asn1Spec.__class__.__name__, path))
+
+    names = set(namedType.name for namedType in asn1Spec.componentType.namedTypes)
+    for name in tree:
+        if name not in names:
+            raise error.PyAsn1Error('%s has no component %s' % (
+                asn1Spec.__class__.__name__, path + name))
+
+    namedTypes = []
+    for namedType in asn1Spec.componentType.namedTypes:
+        if namedType.name not in tree:
+            namedTypes.append(_rawComponent(namedType))
+        elif tree[namedType.name]:
+            namedTypes.append(namedType.__class__(
+                namedType.name,
+                _project(namedType.asn1Object, tree[namedType.name],
+                         path + namedType.name + '.'),
+                openType=namedType.openType))
+        else:
+            namedTypes.append(namedType)
+
+    return asn1Spec.clone(componentType=namedtype.NamedTypes(*namedTypes))
+
+
+def projectSpec(asn1Spec, *paths):
+    """Return a copy of asn1Spec that decodes only the given components.
+
+    Each path names a component with dots, such as
+    'tbsCertificate.serialNumber' for rfc5280.Certificate, and that
+    component is decoded in full.  Components that are not on any path
+    are left undecoded as a RawComponent, which holds the contents under
+    the tags of the component, so the DER encoder returns the original
+    octets.  A CHOICE of several types, such as Time, can only be
+    located by decoding it, so it is always decoded.  Components on the
+    way to a path keep their class, so a projected object is used like a
+    fully decoded one.
+
+    Building the projection walks the spec, so reuse the result for
+    every decode.
+    """
+    tree = {}
+    for path in paths:
+        node = tree
+        for name in path.split('.'):
+            node = node.setdefault(name, {})
+
+    return _project(asn1Spec, tree, '')
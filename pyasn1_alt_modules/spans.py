@@ -0,0 +1,161 @@
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+# Locate the octets that a signature or a message digest covers in the
+# original encoding, so they can be hashed without encoding the decoded
+# object again.  The spans are memoryview slices of the substrate.
+#
+
+from pyasn1 import error
+from pyasn1.codec.der.decoder import decode as der_decoder
+from pyasn1.type import tag
+
+from pyasn1_alt_modules import tlv
+
+_context0 = tag.Tag(tag.tagClassContext, tag.tagFormatConstructed, 0)
+
+
+def _view(substrate):
+    view = memoryview(substrate)
+    if view.format != 'B' or view.ndim != 1:
+        view = view.cast('B')
+    return view
+
+
+def _children(view, offset=0):
+    return list(tlv.iterChildren(view, offset))
+
+
+def tbsSpan(substrate):
+    """Return the to-be-signed component of a SIGNED structure.
+
+    That is the first component of the outer SEQUENCE, such as the
+    TBSCertificate of a Certificate, the TBSCertList of a CertificateList,
+    or the ResponseData of a BasicOCSPResponse.  The span includes the
+    tag and length octets, as the signature does.
+    """
+    view = _view(substrate)
+    children = _children(view)
+    if not children:
+        raise error.PyAsn1Error('empty SIGNED structure')
+    tagObj, offset, length = children[0]
+    return view[offset:offset + length]
+
+
+def signedAttrsSpans(substrate):
+    """Return the signedAttrs of each SignerInfo of a CMS SignedData.
+
+    The list has one entry per SignerInfo, in order, and the entry is
+    None when the SignerInfo has no signedAttrs.  The span is encoded
+    with the [0] IMPLICIT tag, while the signature covers the encoding
+    with the SET OF tag, so hash b'\\x31' and then span[1:].
+    """
+    view = _view(substrate)
+    children = _children(view)
+    if len(children) < 4:
+        raise error.PyAsn1Error('SignedData has %d components' % len(children))
+    tagObj, offset, length = children[-1]
+    spans = []
+    for tagObj, offset, length in _children(view, offset):
+        signerInfo = _children(view, offset)
+        if len(signerInfo) > 3 and signerInfo[3][0] == _context0:
+            tagObj, offset, length = signerInfo[3]
+            spans.append(view[offset:offset + length])
+        else:
+            spans.append(None)
+    return spans
+
+
+def _octetStringChunks(view, offset):
+    tagObj, headerLength, valueLength = tlv.decodeHeader(view, offset)
+    if tagObj.tagFormat == tag.tagFormatSimple:
+        return [view[offset + headerLength:offset + headerLength + valueLength]]
+    chunks = []
+    for tagObj, offset, length in tlv.iterChildren(view, offset):
+        chunks.extend(_octetStringChunks(view, offset))
+    return chunks
+
+
+def eContentSpans(substrate):
+    """Return the eContent octets of a CMS SignedData.
+
+    The message digest covers the value octets of the eContent OCTET
+    STRING, without its tag and length octets.  A DER encoding has them
+    in one span; a BER constructed OCTET STRING has one span for each
+    primitive segment.  The list is empty when the content is detached.
+    """
+    view = _view(substrate)
+    children = _children(view)
+    if len(children) < 3:
+        raise error.PyAsn1Error('SignedData has %d components' % len(children))
+    tagObj, offset, length = children[2]
+    encapContentInfo = _children(view, offset)
+    if len(encapContentInfo) < 2:
+        return []
+    tagObj, offset, length = encapContentInfo[1]
+    if tagObj != _context0:
+        raise error.PyAsn1Error('unexpected %s in EncapsulatedContentInfo' % (tagObj,))
+    eContent = _children(view, offset)
+    if (len(eContent) != 1 or eContent[0][0].tagClass != tag.tagClassUniversal or
+            eContent[0][0].tagId != 4):
+        raise error.PyAsn1Error('eContent is not an OCTET STRING')
+    return _octetStringChunks(view, eContent[0][1])
+
+
+def _signedDataSpans(view):
+    # a constructed eContent has no one span to give, so its segments
+    # are given as a list, under a key of their own
+    spans = {}
+    chunks = eContentSpans(view)
+    if len(chunks) == 1:
+        spans['encapContentInfo.eContent'] = chunks[0]
+    elif chunks:
+        spans['encapContentInfo.eContent.segments'] = chunks
+    for idx, span in enumerate(signedAttrsSpans(view)):
+        if span is not None:
+            spans['signerInfos.%d.signedAttrs' % idx] = span
+    return spans
+
+
+spanLocators = {
+    ('pyasn1_alt_modules.rfc5280', 'Certificate'):
+        lambda view: {'tbsCertificate': tbsSpan(view)},
+    ('pyasn1_alt_modules.rfc5280', 'CertificateList'):
+        lambda view: {'tbsCertList': tbsSpan(view)},
+    ('pyasn1_alt_modules.rfc6960', 'BasicOCSPResponse'):
+        lambda view: {'tbsResponseData': tbsSpan(view)},
+    ('pyasn1_alt_modules.rfc5652', 'SignedData'): _signedDataSpans,
+}
+
+
+def decode(substrate, asn1Spec, **options):
+    """Decode with the DER decoder and locate the signed components.
+
+    Returns (asn1Object, rest, spans), where spans maps the dotted path
+    of each signed component, such as 'tbsCertificate' or
+    'signerInfos.0.signedAttrs', to a memoryview of the substrate.  The
+    asn1Spec is looked up in spanLocators by module and class name;
+    other specs are decoded with no spans.  The substrate can be bytes,
+    bytearray, memoryview, or mmap, and the spans share its memory.
+
+    The eContent of a SignedData is under 'encapContentInfo.eContent'
+    when it is one OCTET STRING.  When it is a constructed OCTET STRING,
+    'encapContentInfo.eContent.segments' has instead the list of spans
+    that eContentSpans() returns, which the message digest covers in
+    order.  Neither key is there when the content is detached.
+    """
+    view = _view(substrate)
+    if isinstance(substrate, bytes):
+        asn1Object, rest = der_decoder(substrate, asn1Spec=asn1Spec, **options)
+    else:
+        asn1Object, rest = der_decoder(bytes(view), asn1Spec=asn1Spec, **options)
+
+    locator = spanLocators.get(
+        (type(asn1Spec).__module__, type(asn1Spec).__name__))
+    if locator is None:
+        return asn1Object, rest, {}
+
+    return asn1Object, rest, locator(view[:len(view) - len(rest)])
@@ -0,0 +1,201 @@
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+# Helpers that work on the tag and length octets of BER and DER
+# encodings without decoding the values, such as splitting a file of
+# back-to-back DER objects into one slice per object.
+#
+
+from pyasn1 import error
+from pyasn1.type import tag
+
+
+def decodeHeader(substrate, offset=0):
+    """Decode the identifier and length octets of the TLV at offset.
+
+    Returns (tag, headerLength, valueLength), where tag is a pyasn1
+    tag.Tag and valueLength is None for the BER indefinite form.
+    """
+    end = len(substrate)
+    if offset >= end:
+        raise error.SubstrateUnderrunError('no TLV at offset %d' % offset)
+
+    first = substrate[offset]
+    pos = offset + 1
+    tagId = first & 0x1F
+    if tagId == 0x1F:
+        tagId = 0
+        while True:
+            if pos >= end:
+                raise error.SubstrateUnderrunError('short tag at offset %d' % offset)
+            octet = substrate[pos]
+            pos += 1
+            tagId = (tagId << 7) | (octet & 0x7F)
+            if not octet & 0x80:
+                break
+
+    if pos >= end:
+        raise error.SubstrateUnderrunError('no length at offset %d' % offset)
+    octet = substrate[pos]
+    pos += 1
+    if octet < 0x80:
+        valueLength = octet
+    elif octet == 0x80:
+        if not first & tag.tagFormatConstructed:
+            raise error.PyAsn1Error(
+                'indefinite length for primitive TLV at offset %d' % offset)
+        valueLength = None
+    elif octet == 0xFF:
+        raise error.PyAsn1Error('reserved length octet at offset %d' % offset)
+    else:
+        size = octet & 0x7F
+        if pos + size > end:
+            raise error.SubstrateUnderrunError('short length at offset %d' % offset)
+        valueLength = int.from_bytes(bytes(substrate[pos:pos + size]), 'big')
+        pos += size
+
+    return (tag.Tag(first & 0xC0, first & tag.tagFormatConstructed, tagId),
+            pos - offset, valueLength)
+
+
+def readHeader(substrate, pos, end):
+    """Read the identifier and length octets of the DER TLV at pos.
+
+    Returns (key, constructed, valueStart, valueEnd), for walking the
+    TLVs of an encoding with plain ints.  The key is the first octet
+    without its constructed bit for a low tag number, and the class
+    bits or'ed with the tag number shifted left by 8 for a high one.
+    constructed is the constructed bit of the first octet, and the
+    value must end by end.  The definite length form is required.
+    """
+    offset = pos
+    try:
+        first = substrate[pos]
+        pos += 1
+        tagId = first & 0x1F
+        if tagId == 0x1F:
+            tagId = 0
+            while True:
+                octet = substrate[pos]
+                pos += 1
+                tagId = (tagId << 7) | (octet & 0x7F)
+                if not octet & 0x80:
+                    break
+            key = (first & 0xC0) | (tagId << 8)
+        else:
+            key = first & 0xDF
+        length = substrate[pos]
+    except IndexError:
+        raise error.SubstrateUnderrunError('short TLV header at offset %d' % offset)
+    pos += 1
+    if length & 0x80:
+        size = length & 0x7F
+        if not size:
+            raise error.PyAsn1Error('indefinite length in DER')
+        if pos + size > end:
+            raise error.SubstrateUnderrunError('short length at offset %d' % offset)
+        length = int.from_bytes(substrate[pos:pos + size], 'big')
+        pos += size
+    if pos + length > end:
+        raise error.SubstrateUnderrunError(
+            '%d octets needed, %d left' % (length, end - pos))
+    return key, first & 0x20, pos, pos + length
+
+
+def encodeLength(length):
+    """Return the DER length octets for a value of length octets."""
+    if length < 0x80:
+        return bytes((length,))
+    octets = length.to_bytes((length.bit_length() + 7) // 8, 'big')
+    return bytes((0x80 | len(octets),)) + octets
+
+
+def tlvLength(substrate, offset=0):
+    """Return the number of octets in the TLV at offset.
+
+    The BER indefinite form is measured by walking the nested TLVs up to
+    the end-of-contents octets.
+    """
+    tagObj, headerLength, valueLength = decodeHeader(substrate, offset)
+    if valueLength is None:
+        pos = offset + headerLength
+        while True:
+            if substrate[pos:pos + 2] == b'\x00\x00':
+                return pos + 2 - offset
+            pos += tlvLength(substrate, pos)
+    if offset + headerLength + valueLength > len(substrate):
+        raise error.SubstrateUnderrunError(
+            'TLV at offset %d runs past the end of the substrate' % offset)
+    return headerLength + valueLength
+
+
+def iterChildren(substrate, offset=0):
+    """Yield (tag, offset, length) for each TLV inside the one at offset.
+
+    The TLV at offset must be constructed.  Either length form is
+    accepted, and the end-of-contents octets are not yielded.
+    """
+    tagObj, headerLength, valueLength = decodeHeader(substrate, offset)
+    if not tagObj.tagFormat:
+        raise error.PyAsn1Error('primitive TLV at offset %d' % offset)
+    pos = offset + headerLength
+    end = None if valueLength is None else pos + valueLength
+    while pos != end:
+        if end is None and substrate[pos:pos + 2] == b'\x00\x00':
+            return
+        length = tlvLength(substrate, pos)
+        yield decodeHeader(substrate, pos)[0], pos, length
+        pos += length
+        if end is not None and pos > end:
+            raise error.PyAsn1Error(
+                'TLV at offset %d runs past its parent' % (pos - length))
+
+
+def splitTlvs(substrate):
+    """Yield a memoryview of each TLV in back-to-back encodings.
+
+    The slices share the memory of substrate, which can be bytes,
+    bytearray, memoryview, or mmap, so nothing is copied.  Only the tag
+    and length octets of the outermost TLVs are examined.  The pyasn1
+    decoder needs bytes, so use bytes() on a slice when it is decoded.
+    """
+    view = memoryview(substrate)
+    if view.format != 'B' or view.ndim != 1:
+        view = view.cast('B')
+    pos = 0
+    end = len(view)
+    while pos < end:
+        length = tlvLength(view, pos)
+        yield view[pos:pos + length]
+        pos += length
+
+
+def readTlvsFromFile(fileObj):
+    """Yield the octets of each TLV in a file of back-to-back encodings.
+
+    Only one TLV is held in memory at a time.  For a file on disk,
+    splitTlvs() over an mmap of the file avoids the copies.
+    """
+    while True:
+        header = fileObj.read(2)
+        if not header:
+            return
+        while True:
+            try:
+                tagObj, headerLength, valueLength = decodeHeader(header)
+                break
+            except error.SubstrateUnderrunError:
+                octet = fileObj.read(1)
+                if not octet:
+                    raise
+                header += octet
+        if valueLength is None:
+            raise error.PyAsn1Error(
+                'indefinite length is not supported when reading from a file')
+        value = fileObj.read(headerLength + valueLength - len(header))
+        if len(header) + len(value) < headerLength + valueLength:
+            raise error.SubstrateUnderrunError('short TLV at end of file')
+        yield header + value
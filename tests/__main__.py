@@ -8,7 +8,21 @@
 import unittest
 
 suite = unittest.TestLoader().loadTestsFromNames(
-    ['tests.test_pem.suite',
+    ['tests.test_alphabet.suite',
+     'tests.test_bulk.suite',
+     'tests.test_cache.suite',
+     'tests.test_certview.suite',
+     'tests.test_cmsstream.suite',
+     'tests.test_codegen.suite',
+     'tests.test_crl.suite',
+     'tests.test_index.suite',
+     'tests.test_lazycert.suite',
+     'tests.test_ocsp.suite',
+     'tests.test_oids.suite',
+     'tests.test_pem.suite',
+     'tests.test_pkcs12.suite',
+     'tests.test_plan.suite',
+     'tests.test_projection.suite',
      'tests.test_rfc2040.suite',
      'tests.test_rfc2314.suite',
      'tests.test_rfc2315.suite',
@@ -215,7 +229,9 @@ suite = unittest.TestLoader().loadTestsFromNames(
      'tests.test_rfc9939.suite',
      'tests.test_rfc9977.suite',
      'tests.test_rfc9999.suite',
-     'tests.test_rfc10002.suite']
+     'tests.test_rfc10002.suite',
+     'tests.test_spans.suite',
+     'tests.test_tlv.suite']
 )
 
 
@@ -0,0 +1,85 @@
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+import random
+import string
+import sys
+import unittest
+
+from pyasn1.type import char
+from pyasn1.type import constraint
+from pyasn1.type import error
+
+from pyasn1_alt_modules import alphabet
+from pyasn1_alt_modules import rfc9286
+
+
+class PermittedAlphabetConstraintTestCase(unittest.TestCase):
+    alphabets = (
+        tuple(string.ascii_letters + string.digits + '-_.'),
+        tuple('0123456789#*'),
+        tuple(string.printable),
+        ('^', ']', '\\', '-', '[', 'x'),
+        ('é', '中', 'a'),
+        ('ab', 'c'),
+    )
+
+    def accepts(self, permittedAlphabet, value):
+        try:
+            permittedAlphabet(value)
+        except error.ValueConstraintError:
+            return False
+        return True
+
+    def testSameAsPyasn1(self):
+        rand = random.Random(9286)
+        for values in self.alphabets:
+            expected = constraint.PermittedAlphabetConstraint(*values)
+            actual = alphabet.PermittedAlphabetConstraint(*values)
+            characters = ''.join(values) + '+:\nè'
+            samples = ['', 'ab', 'abc', b'ab'] + [
+                ''.join(rand.choice(characters) for _ in range(rand.randint(1, 8)))
+                for _ in range(500)]
+            for value in samples:
+                self.assertEqual(self.accepts(expected, value),
+                                 self.accepts(actual, value), repr(value))
+
+    def testCompare(self):
+        values = tuple('0123456789')
+        expected = constraint.PermittedAlphabetConstraint(*values)
+        actual = alphabet.PermittedAlphabetConstraint(*values)
+
+        self.assertEqual(expected, actual)
+        self.assertEqual(hash(expected), hash(actual))
+
+        actual -= alphabet.PermittedAlphabetConstraint('0')
+
+        self.assertIsInstance(actual, alphabet.PermittedAlphabetConstraint)
+        self.assertFalse(self.accepts(actual, '10'))
+        self.assertTrue(self.accepts(actual, '19'))
+
+    def testFileAndHash(self):
+        # the specs keep the pyasn1 constraint; a caller opts in by
+        # subtyping with this one
+        stock = rfc9286.FileAndHash.componentType['file'].asn1Object
+        for subtypeSpec in stock.subtypeSpec:
+            if isinstance(subtypeSpec, constraint.PermittedAlphabetConstraint):
+                break
+
+        self.assertNotIsInstance(subtypeSpec, alphabet.PermittedAlphabetConstraint)
+
+        fileName = char.IA5String().subtype(
+            subtypeSpec=alphabet.PermittedAlphabetConstraint(*subtypeSpec))
+
+        self.assertEqual('a-b_c.roa', fileName.clone('a-b_c.roa'))
+        self.assertRaises(error.ValueConstraintError, fileName.clone, 'a b.roa')
+        self.assertRaises(error.ValueConstraintError, fileName.clone, 'a/b.roa')
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == '__main__':
+    result = unittest.TextTestRunner(verbosity=2).run(suite)
+    sys.exit(not result.wasSuccessful())
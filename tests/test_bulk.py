@@ -0,0 +1,114 @@
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+import sys
+import unittest
+
+from pyasn1 import error
+from pyasn1.codec.der.encoder import encode as der_encoder
+from pyasn1.type import tag
+
+from pyasn1_alt_modules import bulk
+from pyasn1_alt_modules import pem
+from pyasn1_alt_modules import projection
+from pyasn1_alt_modules import rfc5280
+from pyasn1_alt_modules import tlv
+
+
+def serialNumber(asn1Object):
+    return int(asn1Object['tbsCertificate']['serialNumber'])
+
+
+def signatureParameters(asn1Object):
+    return type(asn1Object['signatureAlgorithm']['parameters']).__name__
+
+
+class DecodeAllTestCase(unittest.TestCase):
+    cert_pem_text = """\
+MIIC5zCCAlACAQEwDQYJKoZIhvcNAQEFBQAwgbsxJDAiBgNVBAcTG1ZhbGlDZXJ0
+IFZhbGlkYXRpb24gTmV0d29yazEXMBUGA1UEChMOVmFsaUNlcnQsIEluYy4xNTAz
+BgNVBAsTLFZhbGlDZXJ0IENsYXNzIDMgUG9saWN5IFZhbGlkYXRpb24gQXV0aG9y
+aXR5MSEwHwYDVQQDExhodHRwOi8vd3d3LnZhbGljZXJ0LmNvbS8xIDAeBgkqhkiG
+9w0BCQEWEWluZm9AdmFsaWNlcnQuY29tMB4XDTk5MDYyNjAwMjIzM1oXDTE5MDYy
+NjAwMjIzM1owgbsxJDAiBgNVBAcTG1ZhbGlDZXJ0IFZhbGlkYXRpb24gTmV0d29y
+azEXMBUGA1UEChMOVmFsaUNlcnQsIEluYy4xNTAzBgNVBAsTLFZhbGlDZXJ0IENs
+YXNzIDMgUG9saWN5IFZhbGlkYXRpb24gQXV0aG9yaXR5MSEwHwYDVQQDExhodHRw
+Oi8vd3d3LnZhbGljZXJ0LmNvbS8xIDAeBgkqhkiG9w0BCQEWEWluZm9AdmFsaWNl
+cnQuY29tMIGfMA0GCSqGSIb3DQEBAQUAA4GNADCBiQKBgQDjmFGWHOjVsQaBalfD
+cnWTq8+epvzzFlLWLU2fNUSoLgRNB0mKOCn1dzfnt6td3zZxFJmP3MKS8edgkpfs
+2Ejcv8ECIMYkpChMMFp2bbFc893enhBxoYjHW5tBbcqwuI4V7q0zK89HBFx1cQqY
+JJgpp0lZpd34t0NiYfPT4tBVPwIDAQABMA0GCSqGSIb3DQEBBQUAA4GBAFa7AliE
+Zwgs3x/be0kz9dNnnfS0ChCzycUs4pJqcXgn8nCDQtM+z6lU9PHYkhaM0QTLS6vJ
+n0WuPIqpsHEzXcjFV9+vqDWzf4mH6eglkrh/hXqu1rweN1gqZ8mRzyqBPu3GOd/A
+PhmcGcwTTYJBtYze4D1gCCAPRX5ron+jjBXu
+"""
+
+    crl_pem_text = """\
+MIIBVjCBwAIBATANBgkqhkiG9w0BAQUFADB+MQswCQYDVQQGEwJBVTETMBEGA1UE
+CBMKU29tZS1TdGF0ZTEhMB8GA1UEChMYSW50ZXJuZXQgV2lkZ2l0cyBQdHkgTHRk
+MRUwEwYDVQQDEwxzbm1wbGFicy5jb20xIDAeBgkqhkiG9w0BCQEWEWluZm9Ac25t
+cGxhYnMuY29tFw0xMjA0MTExMzQwNTlaFw0xMjA1MTExMzQwNTlaoA4wDDAKBgNV
+HRQEAwIBATANBgkqhkiG9w0BAQUFAAOBgQC1D/wwnrcY/uFBHGc6SyoYss2kn+nY
+RTwzXmmldbNTCQ03x5vkWGGIaRJdN8QeCzbEi7gpgxgpxAx6Y5WkxkMQ1UPjNM5n
+DGVDOtR0dskFrrbHuNpWqWrDaBN0/ryZiWKjr9JRbrpkHgVY29I1gLooQ6IHuKHY
+vjnIhxTFoCb5vA==
+"""
+
+    def setUp(self):
+        self.cert = pem.readBase64fromText(self.cert_pem_text)
+        self.crl = pem.readBase64fromText(self.crl_pem_text)
+
+    def testDecodeAll(self):
+        results = list(bulk.decodeAll(
+            [self.cert] * 5, rfc5280.Certificate, der_encoder,
+            maxWorkers=2, chunkSize=2))
+
+        self.assertEqual([self.cert] * 5, results)
+
+    def testTransform(self):
+        substrates = tlv.splitTlvs(self.cert * 7)
+        results = list(bulk.decodeAll(
+            substrates, rfc5280.Certificate(), serialNumber,
+            maxWorkers=2, chunkSize=3))
+
+        self.assertEqual([1] * 7, results)
+
+    def testOpenTypes(self):
+        results = list(bulk.decodeAll(
+            [self.cert] * 2, rfc5280.Certificate, signatureParameters,
+            autoImport=True, decodeOpenTypes=True, maxWorkers=1))
+
+        self.assertEqual(['Null', 'Null'], results)
+
+    def testDecodeError(self):
+        results = bulk.decodeAll(
+            [self.cert, self.crl], rfc5280.Certificate, serialNumber,
+            maxWorkers=1)
+
+        self.assertRaises(error.PyAsn1Error, list, results)
+
+    def testCustomizedSpec(self):
+        for asn1Spec in (projection.projectSpec(
+                             rfc5280.Certificate(), 'tbsCertificate.serialNumber'),
+                         rfc5280.Certificate().subtype(
+                             implicitTag=tag.Tag(tag.tagClassContext,
+                                                 tag.tagFormatConstructed, 0))):
+            results = bulk.decodeAll(
+                [self.cert], asn1Spec, serialNumber, maxWorkers=1)
+
+            self.assertRaises(error.PyAsn1Error, list, results)
+
+    def testEmptyInput(self):
+        self.assertEqual(
+            [], list(bulk.decodeAll([], rfc5280.Certificate, serialNumber,
+                                    maxWorkers=1)))
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == '__main__':
+    result = unittest.TextTestRunner(verbosity=2).run(suite)
+    sys.exit(not result.wasSuccessful())
@@ -0,0 +1,251 @@
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+import sys
+import unittest
+
+from pyasn1 import error
+from pyasn1.codec.der.decoder import decode as der_decoder
+from pyasn1.codec.der.encoder import encode as der_encoder
+from pyasn1.type import univ
+
+from pyasn1_alt_modules import cache
+from pyasn1_alt_modules import pem
+from pyasn1_alt_modules import projection
+from pyasn1_alt_modules import rfc5280
+from pyasn1_alt_modules import rfc5652
+
+
+class DecodeCacheTestCase(unittest.TestCase):
+    pem_text = """\
+MIIHSgYJKoZIhvcNAQcCoIIHOzCCBzcCAQMxDTALBglghkgBZQMEAgEwgbYGCyqGSIb3DQEJEAEc
+oIGmBIGjPD94bWwgdmVyc2lvbj0nMS4wJyBlbmNvZGluZz0nVVRGLTgnPz4KPG1lc3NhZ2UgeG1s
+bnM9Imh0dHA6Ly93d3cuYXBuaWMubmV0L3NwZWNzL3Jlc2NlcnRzL3VwLWRvd24vIiByZWNpcGll
+bnQ9IlJHbmV0LU9VIiBzZW5kZXI9Im92c0NBIiB0eXBlPSJsaXN0IiB2ZXJzaW9uPSIxIi8+CqCC
+AxYwggMSMIIB+qADAgECAgICTTANBgkqhkiG9w0BAQsFADAhMR8wHQYDVQQDExZvdnNDQSBCUEtJ
+IHJlc291cmNlIENBMB4XDTIxMDEyMTAzMzAwNVoXDTIxMDMyMjAzMzAwNVowMzExMC8GA1UEAxMo
+QzM2MTU4MTFDOTg2MDgwODlGRUQ3QTc5NzE0NUFFNzczOEE2NUMzMTCCASIwDQYJKoZIhvcNAQEB
+BQADggEPADCCAQoCggEBAPqmJfF5uCDfj1gLxAgiU+PBYwlxoOHET1oIf4fdyE/7P2FBJI9oxngB
+rhlqdvd8ef/gSZ6MksKs9/FQGRKtv54zOfl2nFmraP9T6VdoXaxbcmuY22EvPOJ85IVXVUEAJOQi
+M5GskTLlAiSHQziCI+/ve4f8ojGU6Vtav/a+W713/UhPrTj2WwksC/Pu37smIv5pkxXJnyR3Dpoh
+jwV79Qm4dDRLakZy9HsZ8wHSP6HH8qovBCXGU/7mpXFWzzrL0NaKI3uqGcJjQLwx3UE0g/NWwYv3
+t52HpwRV5hiiQZB+4OiRI7OmLlQJH82TDoHOdLRIER9mRBwEamMQTQbx8f8CAwEAAaNCMEAwHQYD
+VR0OBBYEFMNhWBHJhggIn+16eXFFrnc4plwxMB8GA1UdIwQYMBaAFMKR3eNCo3tIwJ7BNnpcKxLT
+ruUaMA0GCSqGSIb3DQEBCwUAA4IBAQCY5tDRD3vOgi2NSP7TeYOiYYVQwNum35jbIdXGSAVwBSsZ
+/j73/M0vzHzqKXOotHy/lGnNFUXDxydO9P3ZXPSfUVIY0yjZdMYa31xxT3D3wNgqFxJ9R0JzLk/p
+ANtKy01CGWUnrmY3sU0t81bGbAalYsnfd54rKsQKywZiaw2iuT8EFlZNq+oUx9hVuc9S/G/kHzZQ
+MLHO0iELIyUxrMNYn/0GXj77oA+Ixbd7InY3/CbrogYwRzkm+XDmHeh6DihdhMTr9ipx83Wu9Oy3
+plZbw6KmbCv7HywYASQq5KpRsHQPyX3EUzOh5A9Nge2tosTrGNNc0K2xsxwYmLO5mu5HoYIBoDCC
+AZwwgYUCAQEwDQYJKoZIhvcNAQELBQAwITEfMB0GA1UEAxMWb3ZzQ0EgQlBLSSByZXNvdXJjZSBD
+QRcNMjEwMTIxMDMzMDA1WhcNMjEwMTIyMDQzMDA1WqAwMC4wHwYDVR0jBBgwFoAUwpHd40Kje0jA
+nsE2elwrEtOu5RowCwYDVR0UBAQCAgSXMA0GCSqGSIb3DQEBCwUAA4IBAQA/ZWgZ9E8JOksCkhVv
+VBEDIONm6hKY30rg2Ry0bRvZQ8KGlItB7nkO1MRZN+FDP5B7cRjKK814WAjIzLEg7+uqpEUv6zyk
+NXAYlCptDqBGTnFiFYEsd7AkxcCY332c5ZAqikTs8v5fn78HA+Gda3hCJmkDZWvop61LQyTgYPnt
+wk83fV8CBZ5il502ePT8yYpgWUPSHraSiHw9y8Sh7KL2dUuYzaOVD5FllP0Vjbh6Y8HyeJNfefXd
+gU85n+/jRgYmTZf6HqnUh4Uj+os5VG8qep7cCYXl0fopq9tB78uuBCASN8CrOZE+01I6mQtdLClO
+jJXSI0MJgEahSqiMxnOMMYIBqjCCAaYCAQOAFMNhWBHJhggIn+16eXFFrnc4plwxMAsGCWCGSAFl
+AwQCAaBrMBoGCSqGSIb3DQEJAzENBgsqhkiG9w0BCRABHDAcBgkqhkiG9w0BCQUxDxcNMjEwMTIx
+MjIwMDIxWjAvBgkqhkiG9w0BCQQxIgQgqTVNWNOGNThLE4cyQFln/dUkN+WlT005oaVkHQ9rip8w
+DQYJKoZIhvcNAQEBBQAEggEAoEsmgmdUPbJyOd/9uG0E+b6YdB3LAEzWY2q1pNgNn5DXvV0ZQdeS
+WlcZXXr15ijXe7uyKTVPouvrINeHx3M8UQQ6IMjo6QIP8Q/80HpFWR/jwYgXGD6W8eVVKbmal4fg
+VGSNsLLzxSW0b0l+cDud99WaDxBkI+UJgOpDwgaxKlpb0J0r01cTZ3mGyNg1V67Z5UaqJXGKnspf
+oeJDQYwjDTOPV6BTBMddrUQEUAGuG4slIH9qtlf0jo76iuZq26FVDftCPhXC7lAL7oQC0yoIjcur
+J3DaFmF8obzBv328Fs29I7bOpWxLnqnxy2fcnVFkKteWzCdLXTHItJHUrcRgWQ==
+"""
+
+    def setUp(self):
+        substrate = pem.readBase64fromText(self.pem_text)
+        contentInfo, rest = der_decoder(substrate, asn1Spec=rfc5652.ContentInfo())
+        self.signedData = contentInfo['content'].asOctets()
+        asn1Object, rest = der_decoder(self.signedData, asn1Spec=rfc5652.SignedData())
+        self.asn1Object = asn1Object
+        self.cert = der_encoder(asn1Object['certificates'][0]['certificate'])
+        self.crl = der_encoder(asn1Object['crls'][0]['crl'])
+
+    def testDecode(self):
+        decodeCache = cache.DecodeCache()
+        first, rest = decodeCache.decode(self.cert + b'\x05\x00', rfc5280.Certificate())
+
+        self.assertEqual(b'\x05\x00', rest)
+        self.assertEqual(self.cert, der_encoder(first))
+
+        second, rest = decodeCache.decode(self.cert, rfc5280.Certificate())
+
+        self.assertIs(first, second)
+        self.assertFalse(rest)
+        self.assertEqual((1, 1, 0, 1024, 1), decodeCache.info())
+
+        decodeCache.decode(self.cert, rfc5280.Certificate(), decodeOpenTypes=True)
+        decodeCache.decode(self.crl, rfc5280.CertificateList())
+
+        self.assertEqual(3, len(decodeCache))
+
+        decodeCache.clear()
+
+        self.assertEqual((0, 0, 0, 1024, 0), decodeCache.info())
+
+    def testEviction(self):
+        decodeCache = cache.DecodeCache(maxSize=2)
+        decodeCache.decode(self.cert, rfc5280.Certificate())
+        decodeCache.decode(self.crl, rfc5280.CertificateList())
+        decodeCache.decode(self.cert, rfc5280.Certificate())
+        decodeCache.decode(self.cert, rfc5280.Certificate(), decodeOpenTypes=True)
+
+        info = decodeCache.info()
+
+        self.assertEqual((1, 3, 1, 2), info[:4])
+
+        decodeCache.decode(self.cert, rfc5280.Certificate())
+
+        self.assertEqual(2, decodeCache.info().hits)
+
+        decodeCache.decode(self.crl, rfc5280.CertificateList())
+
+        self.assertEqual(4, decodeCache.info().misses)
+
+    def testProjection(self):
+        decodeCache = cache.DecodeCache()
+        asn1Spec = projection.projectSpec(
+            rfc5280.Certificate(), 'tbsCertificate.serialNumber')
+        projected, rest = decodeCache.decode(self.cert, asn1Spec)
+        full, rest = decodeCache.decode(self.cert, rfc5280.Certificate())
+
+        self.assertIsNot(projected, full)
+        self.assertIsInstance(projected['tbsCertificate']['subject'],
+                              projection.RawComponent)
+        self.assertIsInstance(full['tbsCertificate']['subject'], rfc5280.Name)
+        self.assertIs(full, decodeCache.decode(self.cert, rfc5280.Certificate())[0])
+        self.assertIs(projected, decodeCache.decode(self.cert, asn1Spec)[0])
+        self.assertEqual((2, 2), decodeCache.info()[:2])
+
+    def testFifoEviction(self):
+        decodeCache = cache.DecodeCache(maxSize=2, policy='fifo')
+        decodeCache.decode(self.cert, rfc5280.Certificate())
+        decodeCache.decode(self.crl, rfc5280.CertificateList())
+        decodeCache.decode(self.cert, rfc5280.Certificate())
+        decodeCache.decode(self.cert, rfc5280.Certificate(), decodeOpenTypes=True)
+
+        self.assertEqual((1, 3, 1, 2), decodeCache.info()[:4])
+
+        decodeCache.decode(self.crl, rfc5280.CertificateList())
+        decodeCache.decode(self.cert, rfc5280.Certificate())
+
+        self.assertEqual((2, 4, 2, 2), decodeCache.info()[:4])
+
+        self.assertRaises(error.PyAsn1Error, cache.DecodeCache, policy='arc')
+
+    def testDecodeSignedData(self):
+        decodeCache = cache.DecodeCache()
+        first, rest = cache.decodeSignedData(self.signedData, decodeCache)
+
+        self.assertFalse(rest)
+        self.assertIsInstance(first, rfc5652.SignedData)
+        self.assertEqual(self.signedData, der_encoder(first))
+
+        second, rest = cache.decodeSignedData(self.signedData, decodeCache)
+
+        self.assertIs(first['certificates'][0]['certificate'],
+                      second['certificates'][0]['certificate'])
+        self.assertIs(first['crls'][0]['crl'], second['crls'][0]['crl'])
+        self.assertEqual((2, 2), decodeCache.info()[:2])
+
+    def testDecodeSignedDataNoCertificates(self):
+        signedData = rfc5652.SignedData()
+        for name in ('version', 'digestAlgorithms', 'encapContentInfo', 'crls',
+                     'signerInfos'):
+            signedData[name] = self.asn1Object[name]
+        substrate = der_encoder(signedData)
+        decodeCache = cache.DecodeCache()
+        asn1Object, rest = cache.decodeSignedData(substrate, decodeCache)
+
+        self.assertFalse(asn1Object['certificates'].isValue)
+        self.assertEqual(substrate, der_encoder(asn1Object))
+        self.assertEqual(1, len(decodeCache))
+
+
+class NameCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        substrate = pem.readBase64fromText(DecodeCacheTestCase.pem_text)
+        contentInfo, rest = der_decoder(substrate, asn1Spec=rfc5652.ContentInfo())
+        signedData, rest = der_decoder(
+            contentInfo['content'], asn1Spec=rfc5652.SignedData())
+        self.tbsCertificate = signedData['certificates'][0]['certificate']['tbsCertificate']
+
+    def makeName(self, *attributes):
+        name = rfc5280.Name()
+        rdnSequence = name['rdnSequence']
+        for attributeType, value in attributes:
+            atv = rfc5280.AttributeTypeAndValue()
+            atv['type'] = attributeType
+            atv['value'] = der_encoder(value)
+            rdn = rfc5280.RelativeDistinguishedName()
+            rdn.append(atv)
+            rdnSequence.append(rdn)
+        return name
+
+    def testIntern(self):
+        nameCache = cache.NameCache()
+        issuer = der_encoder(self.tbsCertificate['issuer'])
+        first = nameCache.intern(issuer + b'\x05\x00')
+
+        self.assertIsInstance(first.asn1Object, rfc5280.Name)
+        self.assertEqual(issuer, der_encoder(first.asn1Object))
+
+        second = nameCache.intern(self.tbsCertificate['issuer'])
+
+        self.assertIs(first, second)
+        self.assertEqual((1, 1, 0, 4096, 1), nameCache.info())
+        self.assertEqual({first.canonical: 'issuer'}.get(second.canonical), 'issuer')
+
+    def testOpenTypes(self):
+        nameCache = cache.NameCache()
+        interned = nameCache.intern(self.tbsCertificate['subject'])
+
+        for rdn in interned.asn1Object['rdnSequence']:
+            for atv in rdn:
+                self.assertIn(atv['type'], rfc5280.certificateAttributesMap)
+                self.assertNotIsInstance(atv['value'], univ.Any)
+
+    def testCanonical(self):
+        nameCache = cache.NameCache()
+        printable = rfc5280.X520CommonName()
+        printable['printableString'] = 'Example  CA'
+        utf8 = rfc5280.X520CommonName()
+        utf8['utf8String'] = ' example ca'
+        first = nameCache.intern(self.makeName(
+            (rfc5280.id_at_countryName, rfc5280.X520countryName('US')),
+            (rfc5280.id_at_commonName, printable)))
+        second = nameCache.intern(self.makeName(
+            (rfc5280.id_at_countryName, rfc5280.X520countryName('us')),
+            (rfc5280.id_at_commonName, utf8)))
+
+        self.assertIsNot(first, second)
+        self.assertEqual(first.canonical, second.canonical)
+        self.assertEqual(
+            ((((2, 5, 4, 6), ('s', 'us')),), (((2, 5, 4, 3), ('s', 'example ca')),)),
+            first.canonical)
+
+        third = nameCache.intern(self.makeName(
+            (rfc5280.id_at_commonName, printable),
+            (rfc5280.id_at_countryName, rfc5280.X520countryName('US'))))
+
+        self.assertNotEqual(first.canonical, third.canonical)
+
+    def testEviction(self):
+        nameCache = cache.NameCache(maxSize=1)
+        nameCache.intern(self.tbsCertificate['issuer'])
+        nameCache.intern(self.tbsCertificate['subject'])
+        nameCache.intern(self.tbsCertificate['issuer'])
+
+        self.assertEqual((0, 3, 2, 1, 1), nameCache.info())
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == '__main__':
+    result = unittest.TextTestRunner(verbosity=2).run(suite)
+    sys.exit(not result.wasSuccessful())
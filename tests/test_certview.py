@@ -0,0 +1,141 @@
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+import datetime
+import sys
+import unittest
+
+from pyasn1 import error
+from pyasn1.codec.der.decoder import decode as der_decoder
+from pyasn1.codec.der.encoder import encode as der_encoder
+
+from pyasn1_alt_modules import certview
+from pyasn1_alt_modules import pem
+from pyasn1_alt_modules import rfc5280
+
+
+class CertificateViewTestCase(unittest.TestCase):
+    pem_text = """\
+MIIDEjCCAfqgAwIBAgICAk0wDQYJKoZIhvcNAQELBQAwITEfMB0GA1UEAxMWb3Zz
+Q0EgQlBLSSByZXNvdXJjZSBDQTAeFw0yMTAxMjEwMzMwMDVaFw0yMTAzMjIwMzMw
+MDVaMDMxMTAvBgNVBAMTKEMzNjE1ODExQzk4NjA4MDg5RkVEN0E3OTcxNDVBRTc3
+MzhBNjVDMzEwggEiMA0GCSqGSIb3DQEBAQUAA4IBDwAwggEKAoIBAQD6piXxebgg
+349YC8QIIlPjwWMJcaDhxE9aCH+H3chP+z9hQSSPaMZ4Aa4Zanb3fHn/4EmejJLC
+rPfxUBkSrb+eMzn5dpxZq2j/U+lXaF2sW3JrmNthLzzifOSFV1VBACTkIjORrJEy
+5QIkh0M4giPv73uH/KIxlOlbWr/2vlu9d/1IT6049lsJLAvz7t+7JiL+aZMVyZ8k
+dw6aIY8Fe/UJuHQ0S2pGcvR7GfMB0j+hx/KqLwQlxlP+5qVxVs86y9DWiiN7qhnC
+Y0C8Md1BNIPzVsGL97edh6cEVeYYokGQfuDokSOzpi5UCR/Nkw6BznS0SBEfZkQc
+BGpjEE0G8fH/AgMBAAGjQjBAMB0GA1UdDgQWBBTDYVgRyYYICJ/tenlxRa53OKZc
+MTAfBgNVHSMEGDAWgBTCkd3jQqN7SMCewTZ6XCsS067lGjANBgkqhkiG9w0BAQsF
+AAOCAQEAmObQ0Q97zoItjUj+03mDomGFUMDbpt+Y2yHVxkgFcAUrGf4+9/zNL8x8
+6ilzqLR8v5RpzRVFw8cnTvT92Vz0n1FSGNMo2XTGGt9ccU9w98DYKhcSfUdCcy5P
+6QDbSstNQhllJ65mN7FNLfNWxmwGpWLJ33eeKyrECssGYmsNork/BBZWTavqFMfY
+VbnPUvxv5B82UDCxztIhCyMlMazDWJ/9Bl4++6APiMW3eyJ2N/wm66IGMEc5Jvlw
+5h3oeg4oXYTE6/YqcfN1rvTst6ZWW8Oipmwr+x8sGAEkKuSqUbB0D8l9xFMzoeQP
+TYHtraLE6xjTXNCtsbMcGJizuZruRw==
+"""
+
+    v1_pem_text = """\
+MIIC5zCCAlACAQEwDQYJKoZIhvcNAQEFBQAwgbsxJDAiBgNVBAcTG1ZhbGlDZXJ0
+IFZhbGlkYXRpb24gTmV0d29yazEXMBUGA1UEChMOVmFsaUNlcnQsIEluYy4xNTAz
+BgNVBAsTLFZhbGlDZXJ0IENsYXNzIDMgUG9saWN5IFZhbGlkYXRpb24gQXV0aG9y
+aXR5MSEwHwYDVQQDExhodHRwOi8vd3d3LnZhbGljZXJ0LmNvbS8xIDAeBgkqhkiG
+9w0BCQEWEWluZm9AdmFsaWNlcnQuY29tMB4XDTk5MDYyNjAwMjIzM1oXDTE5MDYy
+NjAwMjIzM1owgbsxJDAiBgNVBAcTG1ZhbGlDZXJ0IFZhbGlkYXRpb24gTmV0d29y
+azEXMBUGA1UEChMOVmFsaUNlcnQsIEluYy4xNTAzBgNVBAsTLFZhbGlDZXJ0IENs
+YXNzIDMgUG9saWN5IFZhbGlkYXRpb24gQXV0aG9yaXR5MSEwHwYDVQQDExhodHRw
+Oi8vd3d3LnZhbGljZXJ0LmNvbS8xIDAeBgkqhkiG9w0BCQEWEWluZm9AdmFsaWNl
+cnQuY29tMIGfMA0GCSqGSIb3DQEBAQUAA4GNADCBiQKBgQDjmFGWHOjVsQaBalfD
+cnWTq8+epvzzFlLWLU2fNUSoLgRNB0mKOCn1dzfnt6td3zZxFJmP3MKS8edgkpfs
+2Ejcv8ECIMYkpChMMFp2bbFc893enhBxoYjHW5tBbcqwuI4V7q0zK89HBFx1cQqY
+JJgpp0lZpd34t0NiYfPT4tBVPwIDAQABMA0GCSqGSIb3DQEBBQUAA4GBAFa7AliE
+Zwgs3x/be0kz9dNnnfS0ChCzycUs4pJqcXgn8nCDQtM+z6lU9PHYkhaM0QTLS6vJ
+n0WuPIqpsHEzXcjFV9+vqDWzf4mH6eglkrh/hXqu1rweN1gqZ8mRzyqBPu3GOd/A
+PhmcGcwTTYJBtYze4D1gCCAPRX5ron+jjBXu
+"""
+
+    def setUp(self):
+        self.substrate = pem.readBase64fromText(self.pem_text)
+
+    def testDecode(self):
+        view, rest = certview.decode(self.substrate + b'\x05\x00')
+        self.assertEqual(b'\x05\x00', rest)
+
+        tbsCertificate = view.tbsCertificate
+        self.assertEqual(2, tbsCertificate.version)
+        self.assertEqual(589, tbsCertificate.serialNumber)
+        self.assertEqual((1, 2, 840, 113549, 1, 1, 11),
+                         tbsCertificate.signature.algorithm)
+        self.assertEqual(b'\x05\x00', tbsCertificate.signature.parameters)
+        self.assertEqual(((((2, 5, 4, 3), b'\x13\x16ovsCA BPKI resource CA'),),),
+                         tbsCertificate.issuer.rdnSequence)
+        self.assertEqual(
+            (datetime.datetime(2021, 1, 21, 3, 30, 5, tzinfo=datetime.timezone.utc),
+             datetime.datetime(2021, 3, 22, 3, 30, 5, tzinfo=datetime.timezone.utc)),
+            tbsCertificate.validity())
+        self.assertEqual(270, len(tbsCertificate.subjectPublicKeyInfo.subjectPublicKey))
+        self.assertIsNone(tbsCertificate.issuerUniqueID)
+        self.assertEqual(2, len(tbsCertificate.extensions))
+        self.assertEqual(256, len(view.signature))
+
+    def testExtension(self):
+        view, rest = certview.decode(self.substrate)
+        extension = view.tbsCertificate.extension(tuple(rfc5280.id_ce_subjectKeyIdentifier))
+        self.assertFalse(extension.critical)
+        self.assertEqual(bytes.fromhex('c3615811c98608089fed7a797145ae7738a65c31'),
+                         extension.decodeValue())
+        self.assertIsNone(view.tbsCertificate.extension((1, 2, 3)))
+
+    def testToAsn1(self):
+        view, rest = certview.decode(self.substrate)
+        self.assertEqual(self.substrate, view.encode())
+
+        asn1Object = view.toAsn1()
+        self.assertIsInstance(asn1Object, rfc5280.Certificate)
+        self.assertEqual(589, asn1Object['tbsCertificate']['serialNumber'])
+        self.assertEqual(self.substrate, der_encoder(asn1Object))
+
+    def testFromAsn1(self):
+        asn1Object, rest = der_decoder(self.substrate, asn1Spec=rfc5280.Certificate())
+        view, rest = certview.decode(self.substrate)
+        self.assertEqual(view, certview.Certificate.fromAsn1(asn1Object))
+        self.assertEqual(hash(view), hash(certview.Certificate.fromAsn1(asn1Object)))
+
+    def testSerialNumber(self):
+        view, rest = certview.decode(self.substrate)
+        for serialNumber, octets in ((127, b'\x02\x01\x7f'), (128, b'\x02\x02\x00\x80'),
+                                     (-128, b'\x02\x01\x80'), (-129, b'\x02\x02\xff\x7f'),
+                                     (0, b'\x02\x01\x00'), (-1, b'\x02\x01\xff')):
+            other = view._replace(tbsCertificate=view.tbsCertificate._replace(
+                serialNumber=serialNumber))
+            substrate = other.encode()
+            # the serialNumber follows the explicit version
+            self.assertIn(b'\xa0\x03\x02\x01\x02' + octets, substrate)
+            self.assertEqual(other, certview.decode(substrate)[0])
+
+    def testVersion1(self):
+        substrate = pem.readBase64fromText(self.v1_pem_text)
+        view, rest = certview.decode(substrate)
+        self.assertEqual(0, view.tbsCertificate.version)
+        self.assertIsNone(view.tbsCertificate.extensions)
+        self.assertEqual(substrate, view.encode())
+
+    def testReadOnly(self):
+        view, rest = certview.decode(self.substrate)
+        self.assertRaises(AttributeError, setattr, view, 'signature', b'')
+        self.assertRaises(AttributeError, setattr, view, 'other', b'')
+
+    def testMalformed(self):
+        self.assertRaises(error.SubstrateUnderrunError, certview.decode,
+                          self.substrate[:-1])
+        self.assertRaises(error.PyAsn1Error, certview.decode, b'\x30\x03\x02\x01\x01')
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == '__main__':
+    result = unittest.TextTestRunner(verbosity=2).run(suite)
+    sys.exit(not result.wasSuccessful())
@@ -0,0 +1,279 @@
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+import hashlib
+import io
+import sys
+import unittest
+
+from pyasn1 import error
+from pyasn1.codec.ber.decoder import decode as ber_decoder
+from pyasn1.codec.der.decoder import decode as der_decoder
+from pyasn1.codec.der.encoder import encode as der_encoder
+from pyasn1.type import univ
+
+from pyasn1_alt_modules import cmsstream
+from pyasn1_alt_modules import pem
+from pyasn1_alt_modules import rfc5083
+from pyasn1_alt_modules import rfc5480
+from pyasn1_alt_modules import rfc5652
+
+
+class ReadSignedDataTestCase(unittest.TestCase):
+    roa_pem_text = """\
+MIIGvwYJKoZIhvcNAQcCoIIGsDCCBqwCAQMxDTALBglghkgBZQMEAgEwKgYLKoZIhvcNAQkQ
+ARigGwQZMBcCAwDj+zAQMA4EAgABMAgwBgMEAJMcLaCCBLwwggS4MIIDoKADAgECAgIGGDAN
+BgkqhkiG9w0BAQsFADAzMTEwLwYDVQQDEyg2ZDZmYmZhOTc1M2RiOGQ4NDY0MzNkYjUzNTFk
+OWE5ZWMwN2M5NmJkMB4XDTE5MDgyMDAwNDkyOVoXDTIwMDcwMTAwMDAwMFowMzExMC8GA1UE
+AxMoNUI4M0REODdERTlBQzdDNkUzNEI4NzdERjUwMUEyQjEyMzBBODFCNDCCASIwDQYJKoZI
+hvcNAQEBBQADggEPADCCAQoCggEBAJcnDgSUtiQeelGQsTx2Ou5cgmfq6KPSEgMz/XyZrRzj
+wcqUQ/DyMYHyRJK8umKZjfMu+rItoPSkE26Wi9PcSnfuY+SyS9chTAtNOGMES6MbtHjNTmBF
+Xar5CFGM8teLIRHlCcScesgSR7q2eKgQ+cLiLTZnol0Mpmuf2NIs+V63Y4Hn/T7QOoudg9nU
+tmsh31hUN4jIENEXFvNDovkray25rl9aqFfW+dtkoNtdJjp367nNXCdp3GdE/3z0SIqT8wnh
+F67tgR22mwzex3umteQBwmM+iR28vuHL4E5jwRKBoiEgGPYqq7gbfkcoFtR3AV6QGKSK2aJU
+mUi+9VheS78CAwEAAaOCAdQwggHQMB0GA1UdDgQWBBRbg92H3prHxuNLh331AaKxIwqBtDAf
+BgNVHSMEGDAWgBRtb7+pdT242EZDPbU1HZqewHyWvTAYBgNVHSABAf8EDjAMMAoGCCsGAQUF
+Bw4CMFAGA1UdHwRJMEcwRaBDoEGGP3JzeW5jOi8vY2EucmcubmV0L3Jwa2kvUkduZXQtT1Uv
+YlctX3FYVTl1TmhHUXoyMU5SMmFuc0I4bHIwLmNybDBkBggrBgEFBQcBAQRYMFYwVAYIKwYB
+BQUHMAKGSHJzeW5jOi8vcnBraS5yaXBlLm5ldC9yZXBvc2l0b3J5L0RFRkFVTFQvYlctX3FY
+VTl1TmhHUXoyMU5SMmFuc0I4bHIwLmNlcjAOBgNVHQ8BAf8EBAMCB4AwgYoGCCsGAQUFBwEL
+BH4wfDBLBggrBgEFBQcwC4Y/cnN5bmM6Ly9jYS5yZy5uZXQvcnBraS9SR25ldC1PVS9XNFBk
+aDk2YXg4YmpTNGQ5OVFHaXNTTUtnYlEucm9hMC0GCCsGAQUFBzANhiFodHRwczovL2NhLnJn
+Lm5ldC9ycmRwL25vdGlmeS54bWwwHwYIKwYBBQUHAQcBAf8EEDAOMAwEAgABMAYDBACTHC0w
+DQYJKoZIhvcNAQELBQADggEBAKhhoJ3XtHejvG6XkFaCTxJci10gOgNvvPFWqz+CfOX2LmB0
+N3QhYjLiAZbfYSOxNReyL4bWDK/tpZgVA2VHuS8GB8fI8+nauQUiP38orVXKAbcUUxo7UkEM
+HxQ5T61FtXrEZx8hgKTlsfof0G2Q+baSJzNV2MIUgHmSszL4Mx/fHUXv8b7l/5mZQbdv3cZ9
+SbODHD0iOVAzK3fmHeuA4roSOk4mBQDWNRY1Ok+xH/HMDQdoOVtbfy57TZI2W7O2uxfElKvx
+fBeEc9TOaWqDz0xvmJ6bdZnmWRuvqW1475mhxi0s/I4eE2ZdaCinvrgrglBp/jpZi1jitY14
+dx+A1PMxggGqMIIBpgIBA4AUW4Pdh96ax8bjS4d99QGisSMKgbQwCwYJYIZIAWUDBAIBoGsw
+GgYJKoZIhvcNAQkDMQ0GCyqGSIb3DQEJEAEYMBwGCSqGSIb3DQEJBTEPFw0xOTA4MjAwMDQ5
+MjlaMC8GCSqGSIb3DQEJBDEiBCCfuHnOmhF2iBF3JXMOnoZCJzmE+Tcf8b+zObvDUpUddzAN
+BgkqhkiG9w0BAQEFAASCAQBDlJIMKCqWsFV/tQj/XvpSJUxJybG+zwjrUKm4yTKv8QEGOzOD
+aIL6irSOhhXeax6Lw0P2J7x+L3jGW1we1qWslumEDTr9kTE+kN/6rZuptUhwdrXcu3p9G6gJ
+mAUQtzqe2jRN1T3eSBfz1CNU3C7+jSHXOc+4Tea5mKiVddsjotYHXX0PbSCS/ZZ1yzdeES0o
+KWhXhW9ogS0bwtXWVTrciSekaRpp2n/pqcVEDxWg/5NpPiDlPNrRL/9eTEHFp940RAUfhbBh
+pbC2J02N0KgxUJxIJnGnpZ7rXKpG4jMiTVry7XB9bnFxCvZGBdjQW1Hagrfpl2TiVxQFvJWl
+IzU1
+"""
+
+    def setUp(self):
+        self.substrate = pem.readBase64fromText(self.roa_pem_text)
+        contentInfo, rest = der_decoder(self.substrate, asn1Spec=rfc5652.ContentInfo())
+        self.contentInfo = contentInfo
+        self.signedData, rest = der_decoder(
+            contentInfo['content'], asn1Spec=rfc5652.SignedData())
+        self.eContent = self.signedData['encapContentInfo']['eContent'].asOctets()
+        signedAttrs = self.signedData['signerInfos'][0]['signedAttrs']
+        for attribute in signedAttrs:
+            if attribute['attrType'] == rfc5652.id_messageDigest:
+                self.messageDigest = attribute['attrValues'][0].asOctets()[2:]
+
+    def checkResult(self, result):
+        self.assertEqual(len(self.eContent), result.eContentLength)
+        self.assertEqual({rfc5480.id_sha256: self.messageDigest}, result.digests)
+
+        signedData = result.signedData
+
+        self.assertIsInstance(signedData, rfc5652.SignedData)
+        self.assertFalse(signedData['encapContentInfo']['eContent'].isValue)
+        self.assertEqual(
+            self.signedData['encapContentInfo']['eContentType'],
+            signedData['encapContentInfo']['eContentType'])
+        for name in ('version', 'digestAlgorithms', 'certificates', 'signerInfos'):
+            self.assertEqual(der_encoder(self.signedData[name]),
+                             der_encoder(signedData[name]))
+
+    def testDer(self):
+        chunks = []
+        hasher = hashlib.sha256()
+        result = cmsstream.readSignedData(
+            io.BytesIO(self.substrate), sinks=[chunks.append, hasher], chunkSize=4)
+
+        self.checkResult(result)
+        self.assertEqual(self.eContent, b''.join(chunks))
+        self.assertEqual(4, max(len(chunk) for chunk in chunks))
+        self.assertEqual(self.messageDigest, hasher.digest())
+
+    def berSignedData(self):
+        # indefinite lengths, with the 25 octets of eContent in segments
+        # and the last two inside a nested constructed OCTET STRING
+        eContent = self.eContent
+        segments = (b'\x04\x07' + eContent[:7] + b'\x04\x07' + eContent[7:14] +
+                    b'\x24\x0f\x04\x06' + eContent[14:20] + b'\x04\x05' + eContent[20:])
+        signedData = self.signedData
+        return (b'\x30\x80' + der_encoder(signedData['version']) +
+                der_encoder(signedData['digestAlgorithms']) +
+                b'\x30\x80' + der_encoder(signedData['encapContentInfo']['eContentType']) +
+                b'\xa0\x80\x24\x80' + segments + b'\x00\x00' * 3 +
+                der_encoder(signedData['certificates']) +
+                der_encoder(signedData['signerInfos']) + b'\x00\x00')
+
+    def testBerIndefiniteLength(self):
+        signedData = self.berSignedData()
+        contentInfo = (b'\x30\x80' + der_encoder(rfc5652.id_signedData) +
+                       b'\xa0\x80' + signedData + b'\x00\x00\x00\x00')
+        for substrate in (contentInfo, signedData):
+            chunks = []
+            result = cmsstream.readSignedData(
+                io.BytesIO(substrate), sinks=[chunks.append])
+
+            self.checkResult(result)
+            self.assertEqual(self.eContent, b''.join(chunks))
+            self.assertEqual([7, 7, 6, 5], [len(chunk) for chunk in chunks])
+
+    def testDetachedContent(self):
+        signedData = self.signedData.clone()
+        for name in ('version', 'digestAlgorithms', 'certificates', 'signerInfos'):
+            signedData[name] = self.signedData[name]
+        signedData['encapContentInfo']['eContentType'] = \
+            self.signedData['encapContentInfo']['eContentType']
+        chunks = []
+        result = cmsstream.readSignedData(
+            io.BytesIO(der_encoder(signedData)), sinks=[chunks.append])
+
+        self.assertIsNone(result.eContentLength)
+        self.assertEqual({}, result.digests)
+        self.assertFalse(chunks)
+        self.assertEqual(der_encoder(signedData), der_encoder(result.signedData))
+
+    def testErrors(self):
+        self.assertRaises(error.SubstrateUnderrunError, cmsstream.readSignedData,
+                          io.BytesIO(self.substrate[:-1]))
+
+        data = rfc5652.ContentInfo()
+        data['contentType'] = rfc5652.id_data
+        data['content'] = der_encoder(univ.OctetString(b'abc'))
+
+        self.assertRaises(error.PyAsn1Error, cmsstream.readSignedData,
+                          io.BytesIO(der_encoder(data)))
+
+
+class EnvelopedDataWriterTestCase(unittest.TestCase):
+    env_pem_text = """\
+MIIBpwYJKoZIhvcNAQcDoIIBmDCCAZQCAQAxggFTMIIBTwIBADCBgTBtMR8wHQYD
+VQQDDBZHb3N0UjM0MTAtMjAwMSBleGFtcGxlMRIwEAYDVQQKDAlDcnlwdG9Qcm8x
+CzAJBgNVBAYTAlJVMSkwJwYJKoZIhvcNAQkBFhpHb3N0UjM0MTAtMjAwMUBleGFt
+cGxlLmNvbQIQK/XGHsIRvRfH3NRiZrQuITAcBgYqhQMCAhMwEgYHKoUDAgIkAAYH
+KoUDAgIeAQSBpzCBpDAoBCBqL6ghBpVon5/kR6qey2EVK35BYLxdjfv1PSgbGJr5
+dQQENm2Yt6B4BgcqhQMCAh8BoGMwHAYGKoUDAgITMBIGByqFAwICJAAGByqFAwIC
+HgEDQwAEQE0rLzOQ5tyj3VUqzd/g7/sx93N+Tv+/eImKK8PNMZQESw5gSJYf28dd
+Em/askCKd7W96vLsNMsjn5uL3Z4SwPYECJeV4ywrrSsMMDgGCSqGSIb3DQEHATAd
+BgYqhQMCAhUwEwQIvBCLHwv/NCkGByqFAwICHwGADKqOch3uT7Mu4w+hNw==
+"""
+
+    auth_env_pem_text = """\
+MIICdQIBADGCAiekggIjBgsqhkiG9w0BCRANATCCAhICAQAEE3B0Zi1rbWM6MTM2MTQxMjIx
+MTIwDQYLKoZIhvcNAQkQAzAwCwYJYIZIAWUDBAEtMIIBsDCCAawCAQKAFJ7rZ8m5WnTUTS8W
+OWaA6AG1y6ScMA0GCSqGSIb3DQEBAQUABIIBgHfnHNqDbyyql2NqX6UQggelWMTjwzJJ1L2e
+rbsj1bIAGmpIsUijw+fX8VOS7v1C9ui2Md9NFgCfkmKLo8T/jELqrk7MpMu09G5zDgeXzJfQ
+DFc115wbrWAUU3XP7XIb6TNOc3xtq4UxA5V6jNUK2XyWKpjzOtM7gm0VWIJGVVlYu+u32LQc
+CjRFb87kvOY/WEnjxQpCW8g+4V747Ud97dYpMub7TLJiRNZkdHnq8xEGKlXjVHSgc10lhphe
+1kFGeCpfJEsqjtN7YsVzf65ri9Z+3FJ1IO4cnMDbzGhyRXkS7a0k58/miJbSj88PvzKNSURw
+pu4YHMQQX/mjT2ey1SY4ihPMuxxgTdCa04L0UxaRr7xAucz3n2UWShelm3IIjnWRlYdXypnX
+vKvwCLoeh5mJwUl1JNFPCQkQ487cKRyobUyNgXQKT4ZDHCgXciwsX5nTsom87Ixp5vqSDJ+D
+hXA0r/Caiu1vnY5X9GLHSkqgXkgqgUuu0LfcsQERD8psfQQogbiuZDqJmYt1Iau/pkuGfmee
+qeiM3aeQ4NZf9AFZUVWBGArPNHrvVDA3BgkqhkiG9w0BBwEwGwYJYIZIAWUDBAEuMA4EDMr+
+ur76ztut3sr4iIANmvLRbyFUf87+2bPvLQQMoOWSXMGE4BckY8RM
+"""
+
+    def setUp(self):
+        substrate = pem.readBase64fromText(self.env_pem_text)
+        contentInfo, rest = der_decoder(substrate, asn1Spec=rfc5652.ContentInfo())
+        self.envelopedData, rest = der_decoder(
+            contentInfo['content'], asn1Spec=rfc5652.EnvelopedData())
+        self.envSubstrate = contentInfo['content'].asOctets()
+
+        substrate = pem.readBase64fromText(self.auth_env_pem_text)
+        self.authEnvelopedData, rest = der_decoder(
+            substrate, asn1Spec=rfc5083.AuthEnvelopedData())
+        self.authEnvSubstrate = substrate
+
+    def chunks(self, octets, size):
+        return [octets[idx:idx + size] for idx in range(0, len(octets), size)]
+
+    def checkWrite(self, envelope, name, substrate, contentInfo):
+        encryptedContent = envelope[name]['encryptedContent'].asOctets()
+        fileObj = io.BytesIO()
+        length = cmsstream.writeEnvelopedData(
+            fileObj, envelope, self.chunks(encryptedContent, 5),
+            contentInfo=contentInfo)
+        octets = fileObj.getvalue()
+
+        self.assertEqual(len(encryptedContent), length)
+        self.assertEqual(b'\x30\x80', octets[:2])
+
+        if contentInfo:
+            # the pyasn1 BER decoder drops the end-of-contents octets
+            # inside an indefinite length ANY, so take the content apart
+            prefix = b'\x30\x80' + der_encoder(rfc5652.id_envelopedData) + b'\xa0\x80'
+            self.assertEqual(prefix, octets[:len(prefix)])
+            self.assertEqual(b'\x00' * 4, octets[-4:])
+            octets = octets[len(prefix):-4]
+
+        asn1Object, rest = ber_decoder(octets, asn1Spec=envelope.clone())
+
+        self.assertFalse(rest)
+        self.assertEqual(substrate, der_encoder(asn1Object))
+
+    def testEnvelopedData(self):
+        self.checkWrite(self.envelopedData, 'encryptedContentInfo',
+                        self.envSubstrate, contentInfo=True)
+
+    def testAuthEnvelopedData(self):
+        self.checkWrite(self.authEnvelopedData, 'authEncryptedContentInfo',
+                        self.authEnvSubstrate, contentInfo=False)
+
+        fileObj = io.BytesIO()
+        cmsstream.writeEnvelopedData(fileObj, self.authEnvelopedData, [b'abc'])
+        contentInfo, rest = ber_decoder(
+            fileObj.getvalue(), asn1Spec=rfc5652.ContentInfo())
+
+        self.assertEqual(rfc5083.id_ct_authEnvelopedData, contentInfo['contentType'])
+
+    def testSegments(self):
+        fileObj = io.BytesIO()
+        writer = cmsstream.EnvelopedDataWriter(
+            fileObj, self.envelopedData, contentInfo=False)
+        start = len(fileObj.getvalue())
+        for chunk in (b'a' * 3, b'', b'b' * 200):
+            writer.write(chunk)
+
+        self.assertEqual(b'\x04\x03aaa\x04\x81\xc8' + b'b' * 200,
+                         fileObj.getvalue()[start:])
+        self.assertEqual(203, writer.length)
+
+        writer.close()
+        self.assertRaises(error.PyAsn1Error, writer.write, b'c')
+
+    def testLateComponents(self):
+        # the mac is only known once all of the content has been written
+        envelope = self.authEnvelopedData
+        fileObj = io.BytesIO()
+        writer = cmsstream.EnvelopedDataWriter(fileObj, envelope, contentInfo=False)
+        writer.write(envelope['authEncryptedContentInfo']['encryptedContent'].asOctets())
+        final = envelope.clone()
+        final['mac'] = b'0123456789ab'
+        writer.close(final)
+        asn1Object, rest = ber_decoder(fileObj.getvalue(), asn1Spec=envelope.clone())
+
+        self.assertEqual(b'0123456789ab', asn1Object['mac'])
+
+    def testErrors(self):
+        self.assertRaises(error.PyAsn1Error, cmsstream.EnvelopedDataWriter,
+                          io.BytesIO(), rfc5652.SignedData())
+
+        envelope = rfc5652.EnvelopedData()
+        envelope['version'] = self.envelopedData['version']
+
+        self.assertRaises(error.PyAsn1Error, cmsstream.EnvelopedDataWriter,
+                          io.BytesIO(), envelope)
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == '__main__':
+    result = unittest.TextTestRunner(verbosity=2).run(suite)
+    sys.exit(not result.wasSuccessful())
@@ -0,0 +1,149 @@
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+import glob
+import os
+import re
+import sys
+import unittest
+
+from pyasn1 import error
+from pyasn1.codec.der.decoder import decode as der_decoder
+from pyasn1.codec.der.encoder import encode as der_encoder
+
+from pyasn1_alt_modules import codegen
+from pyasn1_alt_modules import pem
+from pyasn1_alt_modules import projection
+from pyasn1_alt_modules import rfc3161
+from pyasn1_alt_modules import rfc5280
+from pyasn1_alt_modules import rfc5652
+from pyasn1_alt_modules import rfc6960
+
+
+def _decodes(substrate, asn1Spec):
+    try:
+        asn1Object, rest = der_decoder(substrate, asn1Spec=asn1Spec)
+    except error.PyAsn1Error:
+        return None
+    if rest:
+        return None
+    return asn1Object
+
+
+def readVectors():
+    """Return [(spec class, substrate)] for every vector in the tests."""
+    vectors = []
+    testDir = os.path.dirname(os.path.abspath(__file__))
+    for filename in sorted(glob.glob(os.path.join(testDir, 'test_*.py'))):
+        with open(filename) as fileObj:
+            text = fileObj.read()
+        for match in re.finditer(r'"""\\\n([A-Za-z0-9+/=\n]+)"""', text):
+            try:
+                substrate = pem.readBase64fromText(match.group(1))
+            except Exception:
+                continue
+            for specClass in (rfc5280.Certificate, rfc5280.CertificateList,
+                              rfc5652.SignedData, rfc6960.BasicOCSPResponse,
+                              rfc3161.TSTInfo):
+                if _decodes(substrate, specClass()) is not None:
+                    vectors.append((specClass, substrate))
+            contentInfo = _decodes(substrate, rfc5652.ContentInfo())
+            timeStampResp = _decodes(substrate, rfc3161.TimeStampResp())
+            if timeStampResp is not None and timeStampResp['timeStampToken'].isValue:
+                contentInfo = timeStampResp['timeStampToken']
+            if (contentInfo is not None and
+                    contentInfo['contentType'] == rfc5652.id_signedData):
+                content = contentInfo['content'].asOctets()
+                signedData = _decodes(content, rfc5652.SignedData())
+                if signedData is None:
+                    continue
+                vectors.append((rfc5652.SignedData, content))
+                encap = signedData['encapContentInfo']
+                if encap['eContentType'] == rfc3161.id_ct_TSTInfo:
+                    vectors.append((rfc3161.TSTInfo, encap['eContent'].asOctets()))
+            ocspResponse = _decodes(substrate, rfc6960.OCSPResponse())
+            if ocspResponse is not None and ocspResponse['responseBytes'].isValue:
+                vectors.append((rfc6960.BasicOCSPResponse,
+                                ocspResponse['responseBytes']['response'].asOctets()))
+    return vectors
+
+
+class GeneratedDecodersTestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.vectors = readVectors()
+
+    def setUp(self):
+        # prettyPrint() shows some public keys as very long integers
+        if hasattr(sys, 'set_int_max_str_digits'):
+            self.maxDigits = sys.get_int_max_str_digits()
+            sys.set_int_max_str_digits(0)
+
+    def tearDown(self):
+        if hasattr(sys, 'set_int_max_str_digits'):
+            sys.set_int_max_str_digits(self.maxDigits)
+
+    def testGeneratedModuleIsCurrent(self):
+        filename = os.path.join(
+            os.path.dirname(codegen.__file__), '_decoders.py')
+        with open(filename) as fileObj:
+            self.assertEqual(codegen.generate(), fileObj.read())
+
+    def testConformance(self):
+        counts = {}
+        for specClass, substrate in self.vectors:
+            decoder = codegen.decoderFor(specClass())
+            self.assertIsNotNone(decoder, specClass.__name__)
+            asn1Object, end = decoder(substrate)
+            expected, rest = der_decoder(substrate, asn1Spec=specClass())
+            self.assertEqual(len(substrate) - len(rest), end)
+            self.assertEqual(expected.prettyPrint(), asn1Object.prettyPrint())
+            self.assertEqual(der_encoder(expected), der_encoder(asn1Object))
+            counts[specClass] = counts.get(specClass, 0) + 1
+        self.assertEqual(5, len(counts))
+
+    def testFallback(self):
+        for specClass, substrate in self.vectors:
+            if specClass is rfc5280.Certificate:
+                break
+        decoder = codegen.decoderFor(rfc5280.Certificate())
+        self.assertRaises(error.PyAsn1Error, decoder, substrate[:-1])
+        self.assertRaises(error.PyAsn1Error, codegen.decode,
+                          substrate[:-1], rfc5280.Certificate())
+
+        asn1Object, rest = codegen.decode(
+            substrate + b'\x05\x00', rfc5280.Certificate(), decodeOpenTypes=True)
+        self.assertEqual(b'\x05\x00', rest)
+        self.assertEqual(substrate, der_encoder(asn1Object))
+
+    def testStaleSpec(self):
+        asn1Spec = projection.projectSpec(
+            rfc5280.Certificate(), 'tbsCertificate.serialNumber')
+        self.assertIsNone(codegen.decoderFor(asn1Spec))
+        self.assertNotEqual(codegen.fingerprint(rfc5280.Certificate()),
+                            codegen.fingerprint(asn1Spec))
+
+        # without a generated decoder, the projected spec goes to plan
+        for specClass, substrate in self.vectors:
+            if specClass is not rfc5280.Certificate:
+                continue
+            for paths in (['tbsCertificate.serialNumber'],
+                          ['tbsCertificate.subject', 'tbsCertificate.extensions']):
+                asn1Spec = projection.projectSpec(rfc5280.Certificate(), *paths)
+                asn1Object, rest = codegen.decode(substrate, asn1Spec)
+                expected, rest = der_decoder(substrate, asn1Spec=asn1Spec)
+                self.assertEqual(expected.prettyPrint(), asn1Object.prettyPrint())
+
+    def testNoGeneratedDecoder(self):
+        self.assertIsNone(codegen.decoderFor(rfc5280.AlgorithmIdentifier()))
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == '__main__':
+    result = unittest.TextTestRunner(verbosity=2).run(suite)
+    sys.exit(not result.wasSuccessful())
@@ -0,0 +1,268 @@
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+import datetime
+import os
+import sys
+import tempfile
+import unittest
+
+from pyasn1 import error
+from pyasn1.codec.der.decoder import decode as der_decoder
+from pyasn1.codec.der.encoder import encode as der_encoder
+from pyasn1.type import univ
+from pyasn1.type import useful
+
+from pyasn1_alt_modules import crl
+from pyasn1_alt_modules import pem
+from pyasn1_alt_modules import rfc5280
+
+
+def revokedEntry(serial, utcTime, reason=None):
+    revoked = rfc5280.TBSCertList.componentType['revokedCertificates'].asn1Object
+    entry = revoked.componentType.clone()
+    entry['userCertificate'] = serial
+    entry['revocationDate']['utcTime'] = utcTime
+    if reason:
+        extension = rfc5280.Extension()
+        extension['extnID'] = rfc5280.id_ce_cRLReasons
+        extension['extnValue'] = der_encoder(rfc5280.CRLReason(reason))
+        invalidity = rfc5280.Extension()
+        invalidity['extnID'] = rfc5280.id_ce_invalidityDate
+        invalidity['extnValue'] = der_encoder(
+            useful.GeneralizedTime('20120410000000Z'))
+        entry['crlEntryExtensions'].extend([extension, invalidity])
+    return entry
+
+
+class CertificateListReaderTestCase(unittest.TestCase):
+    pem_text = """\
+MIIBVjCBwAIBATANBgkqhkiG9w0BAQUFADB+MQswCQYDVQQGEwJBVTETMBEGA1UE
+CBMKU29tZS1TdGF0ZTEhMB8GA1UEChMYSW50ZXJuZXQgV2lkZ2l0cyBQdHkgTHRk
+MRUwEwYDVQQDEwxzbm1wbGFicy5jb20xIDAeBgkqhkiG9w0BCQEWEWluZm9Ac25t
+cGxhYnMuY29tFw0xMjA0MTExMzQwNTlaFw0xMjA1MTExMzQwNTlaoA4wDDAKBgNV
+HRQEAwIBATANBgkqhkiG9w0BAQUFAAOBgQC1D/wwnrcY/uFBHGc6SyoYss2kn+nY
+RTwzXmmldbNTCQ03x5vkWGGIaRJdN8QeCzbEi7gpgxgpxAx6Y5WkxkMQ1UPjNM5n
+DGVDOtR0dskFrrbHuNpWqWrDaBN0/ryZiWKjr9JRbrpkHgVY29I1gLooQ6IHuKHY
+vjnIhxTFoCb5vA==
+"""
+
+    def setUp(self):
+        substrate = pem.readBase64fromText(self.pem_text)
+        self.asn1Object, rest = der_decoder(
+            substrate, asn1Spec=rfc5280.CertificateList())
+
+    def addEntries(self, count):
+        revoked = self.asn1Object['tbsCertList']['revokedCertificates']
+        for serial in range(count):
+            reason = 'keyCompromise' if serial % 2 else None
+            revoked.append(revokedEntry(
+                serial * 1000003 - 5, '120411%06dZ' % (serial % 100000), reason))
+        return der_encoder(self.asn1Object)
+
+    def testNoEntries(self):
+        reader = crl.CertificateListReader(der_encoder(self.asn1Object))
+
+        self.assertEqual([], list(reader))
+        self.assertEqual(der_encoder(self.asn1Object['tbsCertList']),
+                         der_encoder(reader.tbsCertList))
+        self.assertEqual(self.asn1Object['signatureAlgorithm'],
+                         reader.signatureAlgorithm)
+        self.assertEqual(self.asn1Object['signature'], reader.signature)
+
+    def testEntries(self):
+        substrate = self.addEntries(50)
+        reader = crl.CertificateListReader(substrate)
+        entries = list(reader)
+
+        self.assertEqual(50, len(entries))
+        self.assertFalse(reader.tbsCertList['revokedCertificates'].isValue)
+        self.assertEqual(self.asn1Object['tbsCertList']['issuer'],
+                         reader.tbsCertList['issuer'])
+        self.assertEqual(der_encoder(self.asn1Object['tbsCertList']['crlExtensions']),
+                         der_encoder(reader.tbsCertList['crlExtensions']))
+
+        full, rest = der_decoder(substrate, asn1Spec=rfc5280.CertificateList())
+
+        for (serial, revocationDate, extensions), entry in zip(
+                entries, full['tbsCertList']['revokedCertificates']):
+            self.assertEqual(int(entry['userCertificate']), serial)
+            self.assertEqual(
+                entry['revocationDate']['utcTime'].asDateTime, revocationDate)
+
+        serial, revocationDate, extensions = entries[0]
+
+        self.assertEqual(-5, serial)
+        self.assertEqual({}, extensions)
+
+        serial, revocationDate, extensions = entries[1]
+
+        self.assertEqual(datetime.datetime(2012, 4, 11, 0, 0, 1,
+                                           tzinfo=revocationDate.tzinfo),
+                         revocationDate)
+        self.assertEqual('keyCompromise',
+                         str(extensions[rfc5280.id_ce_cRLReasons]))
+        self.assertEqual(2012, extensions[rfc5280.id_ce_invalidityDate].asDateTime.year)
+
+    def testUnknownEntryExtension(self):
+        extension = rfc5280.Extension()
+        extension['extnID'] = univ.ObjectIdentifier('1.3.6.1.4.1.99999.1')
+        extension['extnValue'] = b'\x05\x00'
+        extensions = rfc5280.Extensions()
+        extensions.append(extension)
+
+        values = crl.entryExtensions(extensions)
+
+        self.assertEqual(b'\x05\x00', values[extension['extnID']])
+
+    def testNotACertificateList(self):
+        substrate = der_encoder(self.asn1Object['tbsCertList'])
+
+        self.assertRaises(
+            error.PyAsn1Error, crl.CertificateListReader, substrate)
+
+
+class RevocationIndexTestCase(unittest.TestCase):
+    pem_text = CertificateListReaderTestCase.pem_text
+
+    def setUp(self):
+        substrate = pem.readBase64fromText(self.pem_text)
+        self.asn1Object, rest = der_decoder(
+            substrate, asn1Spec=rfc5280.CertificateList())
+        revoked = self.asn1Object['tbsCertList']['revokedCertificates']
+        revoked.append(revokedEntry(2 ** 159 - 1, '120411000000Z', 'superseded'))
+        revoked.append(revokedEntry(-3, '120411000001Z'))
+        for serial in range(100, 0, -1):
+            revoked.append(revokedEntry(serial, '120411000002Z', 'keyCompromise'))
+        self.index = crl.RevocationIndex.fromCertificateList(self.asn1Object)
+
+    def deltaCrl(self, baseCrlNumber, crlNumber, entries):
+        asn1Object, rest = der_decoder(
+            pem.readBase64fromText(self.pem_text),
+            asn1Spec=rfc5280.CertificateList())
+        tbsCertList = asn1Object['tbsCertList']
+        tbsCertList['crlExtensions'] = tbsCertList['crlExtensions'].clone()
+        for extnID, value in ((rfc5280.id_ce_cRLNumber,
+                               rfc5280.CRLNumber(crlNumber)),
+                              (rfc5280.id_ce_deltaCRLIndicator,
+                               rfc5280.BaseCRLNumber(baseCrlNumber))):
+            extension = rfc5280.Extension()
+            extension['extnID'] = extnID
+            extension['extnValue'] = der_encoder(value)
+            tbsCertList['crlExtensions'].append(extension)
+        tbsCertList['revokedCertificates'].extend(entries)
+        substrate = der_encoder(asn1Object)
+        return crl.CertificateListReader(substrate)
+
+    def testLookup(self):
+        index = self.index
+
+        self.assertEqual(102, len(index))
+        self.assertEqual(20, index.width)
+        self.assertEqual(1, index.crlNumber)
+        self.assertEqual([-3] + list(range(1, 101)) + [2 ** 159 - 1], list(index))
+
+        revocationDate, reason = index.lookup(2 ** 159 - 1)
+
+        self.assertEqual(datetime.datetime(2012, 4, 11, tzinfo=datetime.timezone.utc),
+                         revocationDate)
+        self.assertEqual(int(rfc5280.CRLReason('superseded')), reason)
+        self.assertIsNone(index.lookup(-3)[1])
+        self.assertIn(50, index)
+        self.assertNotIn(0, index)
+        self.assertNotIn(101, index)
+        self.assertNotIn(2 ** 200, index)
+
+    def testReader(self):
+        reader = crl.CertificateListReader(der_encoder(self.asn1Object))
+        index = crl.RevocationIndex.fromCertificateList(reader)
+
+        self.assertEqual(list(self.index), list(index))
+        self.assertEqual(self.index.lookup(7), index.lookup(7))
+
+    def testSaveLoad(self):
+        with tempfile.TemporaryDirectory() as tempDir:
+            filename = os.path.join(tempDir, 'crl.idx')
+            self.index.save(filename)
+
+            with crl.RevocationIndex.load(filename) as index:
+                self.assertEqual(list(self.index), list(index))
+                self.assertEqual(1, index.crlNumber)
+                for serial in (-3, 1, 100, 2 ** 159 - 1):
+                    self.assertEqual(self.index.lookup(serial), index.lookup(serial))
+                self.assertNotIn(0, index)
+
+                index.save(filename + '.copy')
+
+            with open(filename, 'rb') as fileObj:
+                original = fileObj.read()
+            with open(filename + '.copy', 'rb') as fileObj:
+                self.assertEqual(original, fileObj.read())
+
+            with open(filename, 'wb') as fileObj:
+                fileObj.write(original[:-1])
+
+            self.assertRaises(error.PyAsn1Error, crl.RevocationIndex.load, filename)
+
+    def testMerge(self):
+        delta = self.deltaCrl(1, 2, [
+            revokedEntry(101, '120412000000Z', 'keyCompromise'),
+            revokedEntry(50, '120412000000Z', 'removeFromCRL'),
+            revokedEntry(-3, '120412000000Z', 'cessationOfOperation')])
+        index = self.index.merge(delta)
+
+        self.assertEqual(2, index.crlNumber)
+        self.assertEqual(102, len(index))
+        self.assertIn(101, index)
+        self.assertNotIn(50, index)
+        self.assertEqual(int(rfc5280.CRLReason('cessationOfOperation')),
+                         index.lookup(-3)[1])
+        self.assertEqual(len(self.index), 102)
+
+        self.assertRaises(error.PyAsn1Error, index.merge, self.deltaCrl(3, 4, []))
+        self.assertRaises(error.PyAsn1Error, index.merge, self.deltaCrl(1, 2, []))
+        self.assertRaises(error.PyAsn1Error, index.merge, self.asn1Object)
+        self.assertRaises(
+            error.PyAsn1Error, crl.RevocationIndex.fromCertificateList, delta)
+
+
+    def testMergeEntries(self):
+        entries = [revokedEntry(serial, '120412000000Z', 'affiliationChanged')
+                   for serial in (-4, 1, 2, 51, 2 ** 159 - 1, 2 ** 159, 2 ** 200)]
+        entries += [revokedEntry(serial, '120412000000Z', 'removeFromCRL')
+                    for serial in (-3, 3, 100, 1000)]
+        delta = self.deltaCrl(1, 2, entries)
+        expected = dict((serial, self.index.lookup(serial)) for serial in self.index)
+        for serial, revocationDate, values in delta:
+            reason = int(values[rfc5280.id_ce_cRLReasons])
+            if reason == rfc5280.CRLReason('removeFromCRL'):
+                expected.pop(serial, None)
+            else:
+                expected[serial] = (revocationDate, reason)
+
+        with tempfile.TemporaryDirectory() as tempDir:
+            filename = os.path.join(tempDir, 'crl.idx')
+            self.index.save(filename)
+            with crl.RevocationIndex.load(filename) as mapped:
+                for base in (self.index, mapped):
+                    index = base.merge(delta)
+
+                    self.assertEqual(26, index.width)
+                    self.assertEqual(sorted(expected), list(index))
+                    for serial in expected:
+                        self.assertEqual(expected[serial], index.lookup(serial))
+
+                    index = index.merge(self.deltaCrl(2, 3, [
+                        revokedEntry(0, '120413000000Z')]))
+
+                    self.assertEqual(sorted(list(expected) + [0]), list(index))
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == '__main__':
+    result = unittest.TextTestRunner(verbosity=2).run(suite)
+    sys.exit(not result.wasSuccessful())
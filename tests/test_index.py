@@ -0,0 +1,72 @@
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+import importlib
+import os
+import subprocess
+import sys
+import unittest
+
+import pyasn1_alt_modules
+from pyasn1_alt_modules import _index
+from pyasn1_alt_modules import opentypemap
+
+
+class ModuleIndexTestCase(unittest.TestCase):
+
+    def testIndexIsCurrent(self):
+        pkgdir = os.path.dirname(pyasn1_alt_modules.__file__)
+        expected = sorted(
+            name[:-3] for name in os.listdir(pkgdir)
+            if name.endswith('.py') and not name.startswith('_'))
+
+        self.assertEqual(expected, list(_index.modules))
+
+    def testOpenTypeMapsIndexIsCurrent(self):
+        for name in _index.modules:
+            importlib.import_module('pyasn1_alt_modules.' + name)
+
+        for mapName, keys in _index.opentypeMaps.items():
+            typeMap = opentypemap.get(mapName)
+            actual = set(
+                str(key) if hasattr(key, 'asTuple')
+                else int(key) for key in typeMap)
+
+            self.assertEqual(set(keys), actual, mapName)
+
+
+class LazyFacadeTestCase(unittest.TestCase):
+
+    def runPython(self, script):
+        topdir = os.path.dirname(os.path.dirname(pyasn1_alt_modules.__file__))
+        return subprocess.check_output(
+            [sys.executable, '-c', script], cwd=topdir).strip()
+
+    def testBareImportIsLazy(self):
+        script = ('import sys, pyasn1_alt_modules; '
+                  'print(sorted(x for x in sys.modules '
+                  'if x.startswith("pyasn1_alt_modules.rfc")))')
+        self.assertEqual(b'[]', self.runPython(script))
+
+    def testAttributeAccess(self):
+        script = ('import sys, pyasn1_alt_modules; '
+                  'print(pyasn1_alt_modules.rfc5280.Certificate.__name__, '
+                  '"pyasn1_alt_modules.rfc5652" in sys.modules)')
+        self.assertEqual(b'Certificate False', self.runPython(script))
+
+    def testDir(self):
+        self.assertIn('rfc5280', dir(pyasn1_alt_modules))
+        self.assertIn('opentypemap', dir(pyasn1_alt_modules))
+
+    def testUnknownAttribute(self):
+        self.assertRaises(AttributeError, getattr, pyasn1_alt_modules, 'rfc0')
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == '__main__':
+    result = unittest.TextTestRunner(verbosity=2).run(suite)
+    sys.exit(not result.wasSuccessful())
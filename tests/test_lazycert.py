@@ -0,0 +1,133 @@
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+import sys
+import unittest
+
+from pyasn1 import error
+from pyasn1.codec.der.decoder import decode as der_decoder
+from pyasn1.codec.der.encoder import encode as der_encoder
+
+from pyasn1_alt_modules import lazycert
+from pyasn1_alt_modules import pem
+from pyasn1_alt_modules import rfc5280
+
+
+class LazyCertificateTestCase(unittest.TestCase):
+    pem_text = """\
+MIIDEjCCAfqgAwIBAgICAk0wDQYJKoZIhvcNAQELBQAwITEfMB0GA1UEAxMWb3Zz
+Q0EgQlBLSSByZXNvdXJjZSBDQTAeFw0yMTAxMjEwMzMwMDVaFw0yMTAzMjIwMzMw
+MDVaMDMxMTAvBgNVBAMTKEMzNjE1ODExQzk4NjA4MDg5RkVEN0E3OTcxNDVBRTc3
+MzhBNjVDMzEwggEiMA0GCSqGSIb3DQEBAQUAA4IBDwAwggEKAoIBAQD6piXxebgg
+349YC8QIIlPjwWMJcaDhxE9aCH+H3chP+z9hQSSPaMZ4Aa4Zanb3fHn/4EmejJLC
+rPfxUBkSrb+eMzn5dpxZq2j/U+lXaF2sW3JrmNthLzzifOSFV1VBACTkIjORrJEy
+5QIkh0M4giPv73uH/KIxlOlbWr/2vlu9d/1IT6049lsJLAvz7t+7JiL+aZMVyZ8k
+dw6aIY8Fe/UJuHQ0S2pGcvR7GfMB0j+hx/KqLwQlxlP+5qVxVs86y9DWiiN7qhnC
+Y0C8Md1BNIPzVsGL97edh6cEVeYYokGQfuDokSOzpi5UCR/Nkw6BznS0SBEfZkQc
+BGpjEE0G8fH/AgMBAAGjQjBAMB0GA1UdDgQWBBTDYVgRyYYICJ/tenlxRa53OKZc
+MTAfBgNVHSMEGDAWgBTCkd3jQqN7SMCewTZ6XCsS067lGjANBgkqhkiG9w0BAQsF
+AAOCAQEAmObQ0Q97zoItjUj+03mDomGFUMDbpt+Y2yHVxkgFcAUrGf4+9/zNL8x8
+6ilzqLR8v5RpzRVFw8cnTvT92Vz0n1FSGNMo2XTGGt9ccU9w98DYKhcSfUdCcy5P
+6QDbSstNQhllJ65mN7FNLfNWxmwGpWLJ33eeKyrECssGYmsNork/BBZWTavqFMfY
+VbnPUvxv5B82UDCxztIhCyMlMazDWJ/9Bl4++6APiMW3eyJ2N/wm66IGMEc5Jvlw
+5h3oeg4oXYTE6/YqcfN1rvTst6ZWW8Oipmwr+x8sGAEkKuSqUbB0D8l9xFMzoeQP
+TYHtraLE6xjTXNCtsbMcGJizuZruRw==
+"""
+
+    v1_pem_text = """\
+MIIC5zCCAlACAQEwDQYJKoZIhvcNAQEFBQAwgbsxJDAiBgNVBAcTG1ZhbGlDZXJ0
+IFZhbGlkYXRpb24gTmV0d29yazEXMBUGA1UEChMOVmFsaUNlcnQsIEluYy4xNTAz
+BgNVBAsTLFZhbGlDZXJ0IENsYXNzIDMgUG9saWN5IFZhbGlkYXRpb24gQXV0aG9y
+aXR5MSEwHwYDVQQDExhodHRwOi8vd3d3LnZhbGljZXJ0LmNvbS8xIDAeBgkqhkiG
+9w0BCQEWEWluZm9AdmFsaWNlcnQuY29tMB4XDTk5MDYyNjAwMjIzM1oXDTE5MDYy
+NjAwMjIzM1owgbsxJDAiBgNVBAcTG1ZhbGlDZXJ0IFZhbGlkYXRpb24gTmV0d29y
+azEXMBUGA1UEChMOVmFsaUNlcnQsIEluYy4xNTAzBgNVBAsTLFZhbGlDZXJ0IENs
+YXNzIDMgUG9saWN5IFZhbGlkYXRpb24gQXV0aG9yaXR5MSEwHwYDVQQDExhodHRw
+Oi8vd3d3LnZhbGljZXJ0LmNvbS8xIDAeBgkqhkiG9w0BCQEWEWluZm9AdmFsaWNl
+cnQuY29tMIGfMA0GCSqGSIb3DQEBAQUAA4GNADCBiQKBgQDjmFGWHOjVsQaBalfD
+cnWTq8+epvzzFlLWLU2fNUSoLgRNB0mKOCn1dzfnt6td3zZxFJmP3MKS8edgkpfs
+2Ejcv8ECIMYkpChMMFp2bbFc893enhBxoYjHW5tBbcqwuI4V7q0zK89HBFx1cQqY
+JJgpp0lZpd34t0NiYfPT4tBVPwIDAQABMA0GCSqGSIb3DQEBBQUAA4GBAFa7AliE
+Zwgs3x/be0kz9dNnnfS0ChCzycUs4pJqcXgn8nCDQtM+z6lU9PHYkhaM0QTLS6vJ
+n0WuPIqpsHEzXcjFV9+vqDWzf4mH6eglkrh/hXqu1rweN1gqZ8mRzyqBPu3GOd/A
+PhmcGcwTTYJBtYze4D1gCCAPRX5ron+jjBXu
+"""
+
+    def setUp(self):
+        self.substrate = pem.readBase64fromText(self.pem_text)
+        self.asn1Object, rest = der_decoder(
+            self.substrate, asn1Spec=rfc5280.Certificate())
+
+    def testComponents(self):
+        certificate = lazycert.LazyCertificate(self.substrate)
+        self.assertFalse(certificate._values)
+
+        tbsCertificate = self.asn1Object['tbsCertificate']
+        self.assertEqual(589, certificate.serialNumber)
+        self.assertEqual('v3', certificate.version.prettyPrint())
+        for name in ('issuer', 'validity', 'subject', 'subjectPublicKeyInfo',
+                     'extensions'):
+            self.assertEqual(der_encoder(tbsCertificate[name]),
+                             der_encoder(getattr(certificate, name)))
+        self.assertEqual(self.asn1Object['signature'], certificate.signature)
+        self.assertEqual(der_encoder(tbsCertificate['signature']),
+                         der_encoder(certificate.component('tbsCertificate.signature')))
+        self.assertIs(certificate.subject, certificate.subject)
+
+    def testEncoding(self):
+        certificate = lazycert.LazyCertificate(self.substrate + b'\x05\x00')
+        self.assertEqual(self.substrate, certificate.substrate)
+        self.assertEqual(der_encoder(self.asn1Object['tbsCertificate']),
+                         certificate.encoding('tbsCertificate'))
+        self.assertIsNone(certificate.encoding('tbsCertificate.issuerUniqueID'))
+        self.assertRaises(error.PyAsn1Error, certificate.encoding, 'subject')
+
+    def testExtension(self):
+        certificate = lazycert.LazyCertificate(self.substrate)
+        self.assertEqual([tuple(rfc5280.id_ce_subjectKeyIdentifier),
+                          tuple(rfc5280.id_ce_authorityKeyIdentifier)],
+                         certificate.extensionIDs())
+
+        keyIdentifier = certificate.extension(rfc5280.id_ce_subjectKeyIdentifier)
+        self.assertIsInstance(keyIdentifier, rfc5280.SubjectKeyIdentifier)
+        self.assertEqual(bytes.fromhex('c3615811c98608089fed7a797145ae7738a65c31'),
+                         keyIdentifier)
+        self.assertIs(keyIdentifier,
+                      certificate.extension(tuple(rfc5280.id_ce_subjectKeyIdentifier)))
+        self.assertFalse(certificate.isCritical(rfc5280.id_ce_subjectKeyIdentifier))
+
+        authorityKeyIdentifier = certificate.extension(
+            rfc5280.id_ce_authorityKeyIdentifier)
+        self.assertEqual(bytes.fromhex('c291dde342a37b48c09ec1367a5c2b12d3aee51a'),
+                         authorityKeyIdentifier['keyIdentifier'])
+
+        self.assertIsNone(certificate.extension(rfc5280.id_ce_basicConstraints))
+        self.assertIsNone(certificate.isCritical(rfc5280.id_ce_basicConstraints))
+
+    def testVersion1(self):
+        substrate = pem.readBase64fromText(self.v1_pem_text)
+        certificate = lazycert.LazyCertificate(substrate)
+        self.assertEqual('v1', certificate.version.prettyPrint())
+        self.assertIsNone(certificate.extensions)
+        self.assertEqual([], certificate.extensionIDs())
+        self.assertIsNone(certificate.extension(rfc5280.id_ce_basicConstraints))
+
+    def testToAsn1(self):
+        certificate = lazycert.LazyCertificate(self.substrate)
+        self.assertEqual(self.substrate, der_encoder(certificate.toAsn1()))
+
+    def testMalformed(self):
+        self.assertRaises(error.SubstrateUnderrunError,
+                          lazycert.LazyCertificate, self.substrate[:-1])
+        self.assertRaises(error.PyAsn1Error, lazycert.LazyCertificate,
+                          b'\x30\x03\x02\x01\x01')
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == '__main__':
+    result = unittest.TextTestRunner(verbosity=2).run(suite)
+    sys.exit(not result.wasSuccessful())
@@ -0,0 +1,229 @@
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+import datetime
+import sys
+import unittest
+
+from pyasn1 import error
+from pyasn1.codec.der.decoder import decode as der_decoder
+from pyasn1.codec.der.encoder import encode as der_encoder
+
+from pyasn1_alt_modules import ocsp
+from pyasn1_alt_modules import pem
+from pyasn1_alt_modules import rfc5480
+from pyasn1_alt_modules import rfc6960
+
+
+class ResponseTemplateTestCase(unittest.TestCase):
+    ocsp_resp_pem_text = """\
+MIIEvQoBAKCCBLYwggSyBgkrBgEFBQcwAQEEggSjMIIEnzCCAQ+hgYAwfjELMAkGA1UEBhMCQVUx
+EzARBgNVBAgTClNvbWUtU3RhdGUxITAfBgNVBAoTGEludGVybmV0IFdpZGdpdHMgUHR5IEx0ZDEV
+MBMGA1UEAxMMc25tcGxhYnMuY29tMSAwHgYJKoZIhvcNAQkBFhFpbmZvQHNubXBsYWJzLmNvbRgP
+MjAxMjA0MTExNDA5MjJaMFQwUjA9MAkGBSsOAwIaBQAEFLdmsxX0LkOSjTdofXdwRl6mmDfCBBSS
+pHUspJ6+gUTrefyKxZWl6xB1cwIENd70z4IAGA8yMDEyMDQxMTE0MDkyMlqhIzAhMB8GCSsGAQUF
+BzABAgQSBBBjdJOiIW9EKJGELNNf/rdAMA0GCSqGSIb3DQEBBQUAA4GBADk7oRiCy4ew1u0N52QL
+RFpW+tdb0NfkV2Xyu+HChKiTThZPr9ZXalIgkJ1w3BAnzhbB0JX/zq7Pf8yEz/OrQ4GGH7HyD3Vg
+PkMu+J6I3A2An+bUQo99AmCbZ5/tSHtDYQMQt3iNbv1fk0yvDmh7UdKuXUNSyJdHeg27dMNy4k8A
+oIIC9TCCAvEwggLtMIICVqADAgECAgEBMA0GCSqGSIb3DQEBBQUAMH4xCzAJBgNVBAYTAkFVMRMw
+EQYDVQQIEwpTb21lLVN0YXRlMSEwHwYDVQQKExhJbnRlcm5ldCBXaWRnaXRzIFB0eSBMdGQxFTAT
+BgNVBAMTDHNubXBsYWJzLmNvbTEgMB4GCSqGSIb3DQEJARYRaW5mb0Bzbm1wbGFicy5jb20wHhcN
+MTIwNDExMTMyNTM1WhcNMTMwNDExMTMyNTM1WjB+MQswCQYDVQQGEwJBVTETMBEGA1UECBMKU29t
+ZS1TdGF0ZTEhMB8GA1UEChMYSW50ZXJuZXQgV2lkZ2l0cyBQdHkgTHRkMRUwEwYDVQQDEwxzbm1w
+bGFicy5jb20xIDAeBgkqhkiG9w0BCQEWEWluZm9Ac25tcGxhYnMuY29tMIGfMA0GCSqGSIb3DQEB
+AQUAA4GNADCBiQKBgQDDDU5HOnNV8I2CojxB8ilIWRHYQuaAjnjrETMOprouDHFXnwWqQo/I3m0b
+XYmocrh9kDefb+cgc7+eJKvAvBqrqXRnU38DmQU/zhypCftGGfP8xjuBZ1n23lR3hplN1yYA0J2X
+SgBaAg6e8OsKf1vcX8Es09rDo8mQpt4G2zR56wIDAQABo3sweTAJBgNVHRMEAjAAMCwGCWCGSAGG
++EIBDQQfFh1PcGVuU1NMIEdlbmVyYXRlZCBDZXJ0aWZpY2F0ZTAdBgNVHQ4EFgQU8Ys2dpJFLMHl
+yY57D4BNmlqnEcYwHwYDVR0jBBgwFoAU8Ys2dpJFLMHlyY57D4BNmlqnEcYwDQYJKoZIhvcNAQEF
+BQADgYEAWR0uFJVlQId6hVpUbgXFTpywtNitNXFiYYkRRv77McSJqLCa/c1wnuLmqcFcuRUK0oN6
+8ZJDP2HDDKe8MCZ8+sx+CF54eM8VCgN9uQ9XyE7x9XrXDd3Uw9RJVaWSIezkNKNeBE0lDM2jUjC4
+HAESdf7nebz1wtqAOXE1jWF/y8g=
+"""
+
+    def setUp(self):
+        self.substrate = pem.readBase64fromText(self.ocsp_resp_pem_text)
+        ocspResponse, rest = der_decoder(self.substrate, asn1Spec=rfc6960.OCSPResponse())
+        self.basic = ocspResponse['responseBytes']['response'].asOctets()
+        self.basicOCSPResponse, rest = der_decoder(
+            self.basic, asn1Spec=rfc6960.BasicOCSPResponse())
+        self.template = ocsp.ResponseTemplate(self.basic)
+
+    def expected(self, serialNumber, thisUpdate, certStatus='good', nextUpdate=None,
+                 producedAt=None, revocationTime=None, revocationReason=None):
+        tbsResponseData, rest = der_decoder(
+            der_encoder(self.basicOCSPResponse['tbsResponseData']),
+            asn1Spec=rfc6960.ResponseData())
+        tbsResponseData['producedAt'] = producedAt or thisUpdate
+        single = tbsResponseData['responses'][0]
+        single['certID']['serialNumber'] = serialNumber
+        single['thisUpdate'] = thisUpdate
+        if nextUpdate:
+            single['nextUpdate'] = nextUpdate
+        status = rfc6960.CertStatus()
+        if certStatus == 'revoked':
+            status['revoked']['revocationTime'] = revocationTime
+            if revocationReason is not None:
+                status['revoked']['revocationReason'] = revocationReason
+        else:
+            status[certStatus] = status.componentType[certStatus].asn1Object.clone('')
+        single['certStatus'] = status
+        return der_encoder(tbsResponseData)
+
+    def testPrototype(self):
+        tbsResponseData = self.template.tbsResponseData(
+            903804111, datetime.datetime(2012, 4, 11, 14, 9, 22), 'unknown')
+        signature = self.basicOCSPResponse['signature'].asOctets()
+
+        self.assertEqual(der_encoder(self.basicOCSPResponse['tbsResponseData']),
+                         tbsResponseData)
+        self.assertEqual(self.basic,
+                         self.template.basicOCSPResponse(tbsResponseData, signature))
+        self.assertEqual(self.substrate,
+                         self.template.ocspResponse(tbsResponseData, signature))
+
+    def testSameAsPyasn1(self):
+        thisUpdate = datetime.datetime(2026, 10, 18, 12, 0, 0)
+        nextUpdate = datetime.datetime(2026, 10, 25, 12, 0, 0)
+        revocationTime = datetime.datetime(2026, 1, 2, 3, 4, 5)
+        # not -128, which pyasn1 encodes in two octets
+        for serialNumber in (0, 1, 127, 128, 255, 256, -1, -129,
+                             0x7f << 150, 2 ** 159 - 1):
+            for certStatus, reason in (('good', None), ('unknown', None),
+                                       ('revoked', None), ('revoked', 1)):
+                for next in (None, nextUpdate):
+                    self.assertEqual(
+                        self.expected(
+                            serialNumber, '20261018120000Z', certStatus,
+                            next and '20261025120000Z', '20261018120100Z',
+                            '20260102030405Z', reason),
+                        self.template.tbsResponseData(
+                            serialNumber, thisUpdate, certStatus, next,
+                            thisUpdate + datetime.timedelta(minutes=1),
+                            revocationTime, reason))
+
+    def testTimeZone(self):
+        thisUpdate = datetime.datetime(
+            2026, 10, 18, 14, 0, 0, 999999,
+            tzinfo=datetime.timezone(datetime.timedelta(hours=2)))
+        tbsResponseData, rest = der_decoder(
+            self.template.tbsResponseData(5, thisUpdate),
+            asn1Spec=rfc6960.ResponseData())
+
+        self.assertEqual('20261018120000Z', tbsResponseData['producedAt'])
+        self.assertEqual('20261018120000Z', tbsResponseData['responses'][0]['thisUpdate'])
+
+    def testErrors(self):
+        thisUpdate = datetime.datetime(2026, 10, 18)
+
+        self.assertRaises(error.PyAsn1Error, self.template.tbsResponseData,
+                          1, thisUpdate, 'bad')
+        self.assertRaises(error.PyAsn1Error, self.template.tbsResponseData,
+                          1, thisUpdate, 'revoked')
+
+        basicOCSPResponse = self.basicOCSPResponse.clone()
+        for name in ('tbsResponseData', 'signatureAlgorithm', 'signature'):
+            basicOCSPResponse[name] = self.basicOCSPResponse[name]
+        responses = basicOCSPResponse['tbsResponseData']['responses']
+        responses.append(responses[0])
+
+        self.assertRaises(error.PyAsn1Error, ocsp.ResponseTemplate, basicOCSPResponse)
+        self.assertRaises(error.PyAsn1Error, ocsp.ResponseTemplate,
+                          der_encoder(self.basicOCSPResponse['signatureAlgorithm']))
+
+
+class RequestCertIDsTestCase(unittest.TestCase):
+    ocsp_req_pem_text = """\
+MGowaDBBMD8wPTAJBgUrDgMCGgUABBS3ZrMV9C5Dko03aH13cEZeppg3wgQUkqR1LKSevoFE63n8
+isWVpesQdXMCBDXe9M+iIzAhMB8GCSsGAQUFBzABAgQSBBBjdJOiIW9EKJGELNNf/rdA
+"""
+
+    def setUp(self):
+        self.substrate = pem.readBase64fromText(self.ocsp_req_pem_text)
+        self.ocspRequest, rest = der_decoder(
+            self.substrate, asn1Spec=rfc6960.OCSPRequest())
+
+    def expected(self, ocspRequest):
+        return [ocsp.CertID.fromAsn1(request['reqCert'])
+                for request in ocspRequest['tbsRequest']['requestList']]
+
+    def makeRequest(self, serialNumbers):
+        # a request with a requestorName before the requestList, and
+        # extensions after each CertID and after the requestList
+        prototype = self.ocspRequest['tbsRequest']['requestList'][0]
+        ocspRequest = rfc6960.OCSPRequest()
+        tbsRequest = ocspRequest['tbsRequest']
+        tbsRequest['requestorName']['dNSName'] = 'ocsp.example'
+        for serialNumber in serialNumbers:
+            request = rfc6960.Request()
+            request['reqCert']['hashAlgorithm']['algorithm'] = rfc5480.id_sha256
+            request['reqCert']['issuerNameHash'] = bytes(32)
+            request['reqCert']['issuerKeyHash'] = bytes(range(32))
+            request['reqCert']['serialNumber'] = serialNumber
+            if serialNumber % 2:
+                request['singleRequestExtensions'].extend(
+                    self.ocspRequest['tbsRequest']['requestExtensions'])
+            tbsRequest['requestList'].append(request)
+        tbsRequest['requestList'].append(prototype)
+        tbsRequest['requestExtensions'] = \
+            self.ocspRequest['tbsRequest']['requestExtensions']
+        return der_encoder(ocspRequest)
+
+    def testCertIDs(self):
+        certIDs = ocsp.requestCertIDs(self.substrate)
+
+        self.assertEqual(self.expected(self.ocspRequest), certIDs)
+        self.assertEqual(903804111, certIDs[0].serialNumber)
+        self.assertEqual(rfc5480.id_sha1, certIDs[0].hashAlgorithm)
+        self.assertEqual((certIDs[0].issuerKeyHash, 903804111), certIDs[0].key)
+
+        substrate = self.makeRequest([0, 1, 128, 2 ** 159 - 1, 0x1234567890])
+        ocspRequest, rest = der_decoder(substrate, asn1Spec=rfc6960.OCSPRequest())
+        certIDs = ocsp.requestCertIDs(memoryview(substrate))
+
+        self.assertEqual(self.expected(ocspRequest), certIDs)
+        self.assertEqual(6, len(set(certIDs)))
+
+    def testIndex(self):
+        certIDs = ocsp.requestCertIDs(self.makeRequest(range(100)))
+        index = ocsp.CertIDIndex()
+        for serialNumber in range(0, 100, 2):
+            index.add(bytes(range(32)), serialNumber, 'good')
+
+        self.assertEqual(50, len(index))
+        self.assertIn(certIDs[0], index)
+        self.assertNotIn(certIDs[1], index)
+        self.assertEqual('good', index.get(certIDs[98]))
+        self.assertEqual('unknown', index.get(certIDs[99], 'unknown'))
+        self.assertEqual(['good', None] * 50 + [None], index.lookup(certIDs))
+
+        index.add(certIDs[-1].issuerKeyHash, certIDs[-1].serialNumber, 'revoked')
+
+        self.assertEqual('revoked', index.get(certIDs[-1]))
+
+    def testErrors(self):
+        self.assertRaises(error.SubstrateUnderrunError, ocsp.requestCertIDs,
+                          self.substrate[:-1])
+        self.assertRaises(error.SubstrateUnderrunError, ocsp.requestCertIDs, b'\x30')
+
+        request = self.ocspRequest['tbsRequest']['requestList'][0]
+
+        self.assertRaises(error.PyAsn1Error, ocsp.requestCertIDs,
+                          der_encoder(request['reqCert']))
+
+        # a TBSRequest with requestExtensions and no requestList
+        substrate = der_encoder(self.ocspRequest['tbsRequest']['requestExtensions'])
+        substrate = b'\x30' + bytes((len(substrate),)) + substrate
+
+        self.assertRaises(error.PyAsn1Error, ocsp.requestCertIDs,
+                          b'\x30' + bytes((len(substrate),)) + substrate)
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == '__main__':
+    result = unittest.TextTestRunner(verbosity=2).run(suite)
+    sys.exit(not result.wasSuccessful())
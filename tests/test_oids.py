@@ -0,0 +1,93 @@
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+import sys
+import unittest
+
+from pyasn1 import error
+from pyasn1.codec.der.encoder import encode as der_encoder
+from pyasn1.type import univ
+
+from pyasn1_alt_modules import oids
+from pyasn1_alt_modules import opentypemap
+from pyasn1_alt_modules import plan
+from pyasn1_alt_modules import rfc5280
+
+
+class OidsTestCase(unittest.TestCase):
+
+    def testContents(self):
+        for arcs in ((1, 2, 840, 113549, 1, 1, 11), (2, 5, 29, 17), (0, 9),
+                     (2, 999, 3), (1, 3, 6, 1, 4, 1, 311, 21, 20)):
+            octets = oids.encodeContents(arcs)
+
+            self.assertEqual(der_encoder(univ.ObjectIdentifier(arcs))[2:], octets)
+            self.assertEqual(arcs, oids.decodeContents(octets))
+
+        for octets in (b'', b'\x2b\x86', b'\x2b\x80\x01'):
+            self.assertRaises(error.PyAsn1Error, oids.decodeContents, octets)
+
+    def testIntern(self):
+        octets = oids.encodeContents(rfc5280.id_ce_subjectAltName)
+
+        self.assertIs(rfc5280.id_ce_subjectAltName, oids.intern(octets))
+
+        octets = oids.encodeContents((1, 2, 3, 4, 5, 6, 7))
+        first = oids.intern(octets)
+
+        self.assertEqual((1, 2, 3, 4, 5, 6, 7), first)
+        self.assertIs(first, oids.intern(octets))
+
+    def testInternTable(self):
+        asn1Spec = rfc5280.AttributeType()
+        table = oids.InternTable(asn1Spec, maxSize=1)
+        first = table.intern(b'\x55\x04\x03')
+
+        self.assertIsInstance(first, rfc5280.AttributeType)
+        self.assertEqual(rfc5280.id_at_commonName, first)
+        self.assertIs(first, table.intern(b'\x55\x04\x03'))
+        self.assertIsNot(table.intern(b'\x55\x04\x06'), table.intern(b'\x55\x04\x06'))
+        self.assertEqual(1, len(table))
+
+        table.add(rfc5280.id_at_countryName)
+
+        self.assertIs(rfc5280.id_at_countryName, table.intern(b'\x55\x04\x06'))
+
+    def testPlanDecode(self):
+        algorithm = rfc5280.AlgorithmIdentifier()
+        algorithm['algorithm'] = rfc5280.id_ce_keyUsage
+        first, rest = plan.decode(der_encoder(algorithm), rfc5280.AlgorithmIdentifier())
+        second, rest = plan.decode(der_encoder(algorithm), rfc5280.AlgorithmIdentifier())
+
+        self.assertIs(rfc5280.id_ce_keyUsage, first['algorithm'])
+        self.assertIs(first['algorithm'], second['algorithm'])
+
+    def testOctetsKeyedMap(self):
+        typeMap = oids.OctetsKeyedMap(rfc5280.certificateExtensionsMap)
+        octets = oids.encodeContents(rfc5280.id_ce_basicConstraints)
+
+        self.assertIsInstance(typeMap.get(octets), rfc5280.BasicConstraints)
+        self.assertIs(typeMap.get(octets), typeMap.get(octets))
+        self.assertIsNone(typeMap.get(oids.encodeContents((1, 2, 3, 4))))
+        self.assertEqual(0, typeMap.get(oids.encodeContents((1, 2, 3, 4)), 0))
+
+    def testOctetsKeyedMapGrows(self):
+        openTypeMap = opentypemap.OpenTypeMap()
+        typeMap = oids.OctetsKeyedMap(openTypeMap)
+        octets = oids.encodeContents((1, 2, 3, 4, 8))
+
+        self.assertIsNone(typeMap.get(octets))
+
+        openTypeMap[univ.ObjectIdentifier((1, 2, 3, 4, 8))] = univ.Integer()
+
+        self.assertIsInstance(typeMap.get(octets), univ.Integer)
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == '__main__':
+    result = unittest.TextTestRunner(verbosity=2).run(suite)
+    sys.exit(not result.wasSuccessful())
@@ -5,10 +5,21 @@
 # Copyright (c) 2021-2026, Vigil Security, LLC
 # License: http://vigilsec.com/pyasn1-alt-modules-license.txt
 #
+import os
+import subprocess
 import sys
 import unittest
 
+from pyasn1.codec.der.decoder import decode as der_decoder
+from pyasn1.codec.der.encoder import encode as der_encoder
+from pyasn1.type import namedtype
+from pyasn1.type import opentype
+from pyasn1.type import univ
+
+import pyasn1_alt_modules
 from pyasn1_alt_modules import opentypemap
+from pyasn1_alt_modules import pem
+from pyasn1_alt_modules import rfc5280
 
 
 class OpenTypeMapManagerTestCase(unittest.TestCase):
@@ -34,6 +45,197 @@ class OpenTypeMapManagerTestCase(unittest.TestCase):
         self.assertEqual('mapValue1new', opentypemap.get('testMap')['mapKey1'])
 
 
+class LazyOpenTypeMapTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.lazyMap = opentypemap.OpenTypeMap()
+        self.lazyMap.register(rfc5280.id_ce_keyUsage,
+            'pyasn1_alt_modules.rfc5280', 'KeyUsage')
+
+    def testLazyEntry(self):
+        self.assertIn(rfc5280.id_ce_keyUsage, self.lazyMap)
+        self.assertEqual(0, len(self.lazyMap))
+
+        spec = self.lazyMap[rfc5280.id_ce_keyUsage]
+
+        self.assertIsInstance(spec, rfc5280.KeyUsage)
+        self.assertEqual(1, len(self.lazyMap))
+        self.assertIs(spec, self.lazyMap[rfc5280.id_ce_keyUsage])
+        self.assertIs(spec, self.lazyMap.get(rfc5280.id_ce_keyUsage))
+
+    def testMissingEntry(self):
+        self.assertNotIn(rfc5280.id_ce_basicConstraints, self.lazyMap)
+        self.assertIsNone(self.lazyMap.get(rfc5280.id_ce_basicConstraints))
+        self.assertRaises(KeyError, self.lazyMap.__getitem__,
+            rfc5280.id_ce_basicConstraints)
+
+    def testValueTakesPrecedence(self):
+        self.lazyMap[rfc5280.id_ce_subjectKeyIdentifier] = univ.OctetString()
+        self.lazyMap.register(rfc5280.id_ce_subjectKeyIdentifier,
+            'pyasn1_alt_modules.rfc5280', 'KeyUsage')
+
+        self.assertIsInstance(
+            self.lazyMap[rfc5280.id_ce_subjectKeyIdentifier], univ.OctetString)
+
+    def testDecodeOpenType(self):
+        extension = univ.Sequence(componentType=namedtype.NamedTypes(
+            namedtype.NamedType('extnID', univ.ObjectIdentifier()),
+            namedtype.NamedType('extnValue', univ.Any(),
+                openType=opentype.OpenType('extnID', self.lazyMap))))
+
+        keyUsage = rfc5280.KeyUsage('digitalSignature')
+        extension['extnID'] = rfc5280.id_ce_keyUsage
+        extension['extnValue'] = der_encoder(keyUsage)
+        substrate = der_encoder(extension)
+
+        asn1Object, rest = der_decoder(substrate,
+            asn1Spec=extension.clone(), decodeOpenTypes=True)
+
+        self.assertFalse(rest)
+        self.assertEqual(keyUsage, asn1Object['extnValue'])
+        self.assertEqual(substrate, der_encoder(asn1Object))
+
+    def testImportOnLookup(self):
+        script = (
+            'import sys; '
+            'from pyasn1.type import univ; '
+            'from pyasn1_alt_modules import opentypemap; '
+            'm = opentypemap.get("testLazyMap"); '
+            'oid = univ.ObjectIdentifier("1.3.6.1.5.5.7.1.12"); '
+            'm.register(oid, "pyasn1_alt_modules.rfc3709", "LogotypeExtn"); '
+            'print("pyasn1_alt_modules.rfc3709" in sys.modules, '
+            'type(m[oid]).__name__, '
+            '"pyasn1_alt_modules.rfc3709" in sys.modules)')
+        topdir = os.path.dirname(os.path.dirname(pyasn1_alt_modules.__file__))
+        output = subprocess.check_output(
+            [sys.executable, '-c', script], cwd=topdir)
+
+        self.assertEqual(b'False LogotypeExtn True', output.strip())
+
+
+class RegistryTestCase(unittest.TestCase):
+    pem_text = """\
+MIIBVjCBwAIBATANBgkqhkiG9w0BAQUFADB+MQswCQYDVQQGEwJBVTETMBEGA1UE
+CBMKU29tZS1TdGF0ZTEhMB8GA1UEChMYSW50ZXJuZXQgV2lkZ2l0cyBQdHkgTHRk
+MRUwEwYDVQQDEwxzbm1wbGFicy5jb20xIDAeBgkqhkiG9w0BCQEWEWluZm9Ac25t
+cGxhYnMuY29tFw0xMjA0MTExMzQwNTlaFw0xMjA1MTExMzQwNTlaoA4wDDAKBgNV
+HRQEAwIBATANBgkqhkiG9w0BAQUFAAOBgQC1D/wwnrcY/uFBHGc6SyoYss2kn+nY
+RTwzXmmldbNTCQ03x5vkWGGIaRJdN8QeCzbEi7gpgxgpxAx6Y5WkxkMQ1UPjNM5n
+DGVDOtR0dskFrrbHuNpWqWrDaBN0/ryZiWKjr9JRbrpkHgVY29I1gLooQ6IHuKHY
+vjnIhxTFoCb5vA==
+"""
+
+    def testDefaultRegistry(self):
+        self.assertIs(opentypemap.registry(), opentypemap.registry('default'))
+        self.assertIs(rfc5280.certificateExtensionsMap,
+            opentypemap.registry().get('certificateExtensionsMap'))
+        self.assertIs(opentypemap.get('certificateExtensionsMap'),
+            opentypemap.registry().get('certificateExtensionsMap'))
+
+    def testProfile(self):
+        profile = opentypemap.registry('testProfile',
+            base=opentypemap.registry())
+        profileMap = profile.get('certificateExtensionsMap')
+        profileMap[rfc5280.id_ce_keyUsage] = univ.BitString()
+
+        self.assertIs(profile, opentypemap.registry('testProfile'))
+        self.assertIsInstance(profileMap[rfc5280.id_ce_basicConstraints],
+            rfc5280.BasicConstraints)
+        self.assertIsInstance(
+            rfc5280.certificateExtensionsMap[rfc5280.id_ce_keyUsage],
+            rfc5280.KeyUsage)
+
+        frozen = profile.freeze()
+        frozenMap = frozen.get('certificateExtensionsMap')
+        profileMap[rfc5280.id_ce_keyUsage] = univ.OctetString()
+
+        self.assertEqual('testProfile', frozen.name)
+        self.assertEqual(univ.BitString.tagSet,
+            frozenMap[rfc5280.id_ce_keyUsage].tagSet)
+        with self.assertRaises(TypeError):
+            frozenMap[rfc5280.id_ce_keyUsage] = rfc5280.KeyUsage()
+        self.assertEqual(0, len(frozen.get('noSuchMap')))
+
+    def testFreezeResolvesLazyEntries(self):
+        lazyRegistry = opentypemap.registry('testLazyRegistry')
+        lazyRegistry.get('testMap').register(rfc5280.id_ce_keyUsage,
+            'pyasn1_alt_modules.rfc5280', 'KeyUsage')
+
+        frozen = lazyRegistry.freeze()
+
+        self.assertIsInstance(
+            frozen.get('testMap')[rfc5280.id_ce_keyUsage], rfc5280.KeyUsage)
+
+    def testDecodeWithFrozenMap(self):
+        profile = opentypemap.registry('testDecodeProfile')
+        profile.get('algorithmIdentifierMap').update({
+            univ.ObjectIdentifier('1.2.840.113549.1.1.5'): univ.Null(''),
+        })
+        frozen = profile.freeze()
+
+        substrate = pem.readBase64fromText(self.pem_text)
+        asn1Object, rest = der_decoder(substrate,
+            asn1Spec=rfc5280.CertificateList(),
+            openTypes=frozen.get('algorithmIdentifierMap'),
+            decodeOpenTypes=True)
+
+        self.assertFalse(rest)
+        self.assertEqual(univ.Null(''),
+            asn1Object['signatureAlgorithm']['parameters'])
+        self.assertEqual(substrate, der_encoder(asn1Object))
+
+    def testDecodeWithOpenTypes(self):
+        profile = opentypemap.registry('testOpenTypesProfile',
+            base=opentypemap.registry())
+        profileMap = profile.get('algorithmIdentifierMap')
+        profileMap[univ.ObjectIdentifier('1.2.840.113549.1.1.5')] = univ.Null('')
+        frozen = profile.freeze()
+        openTypes = frozen.openTypes(
+            'algorithmIdentifierMap', 'certificateExtensionsMap')
+
+        profileMap[univ.ObjectIdentifier('1.2.840.113549.1.1.5')] = univ.Integer()
+        profile.get('certificateExtensionsMap')[rfc5280.id_ce_cRLNumber] = \
+            univ.OctetString()
+
+        self.assertIs(openTypes, frozen.openTypes(
+            'algorithmIdentifierMap', 'certificateExtensionsMap'))
+        self.assertIn(rfc5280.id_ce_cRLNumber, openTypes)
+        with self.assertRaises(TypeError):
+            openTypes[rfc5280.id_ce_cRLNumber] = univ.OctetString()
+
+        substrate = pem.readBase64fromText(self.pem_text)
+        asn1Object, rest = der_decoder(substrate,
+            asn1Spec=rfc5280.CertificateList(),
+            openTypes=openTypes, decodeOpenTypes=True)
+
+        self.assertFalse(rest)
+        self.assertEqual(univ.Null(''),
+            asn1Object['signatureAlgorithm']['parameters'])
+        self.assertEqual(substrate, der_encoder(asn1Object))
+
+
+class AutoImportTestCase(unittest.TestCase):
+
+    def testAutoImport(self):
+        script = (
+            'import sys; '
+            'from pyasn1.type import univ; '
+            'from pyasn1_alt_modules import opentypemap; '
+            'from pyasn1_alt_modules import rfc5280; '
+            'opentypemap.enableAutoImport(); '
+            'm = rfc5280.certificateExtensionsMap; '
+            'oid = univ.ObjectIdentifier("1.3.6.1.5.5.7.1.7"); '
+            'print("pyasn1_alt_modules.rfc3779" in sys.modules, oid in m, '
+            'type(m[oid]).__name__, '
+            '"pyasn1_alt_modules.rfc3779" in sys.modules, '
+            'm.get(univ.ObjectIdentifier("1.2.3.4")))')
+        topdir = os.path.dirname(os.path.dirname(pyasn1_alt_modules.__file__))
+        output = subprocess.check_output(
+            [sys.executable, '-c', script], cwd=topdir)
+
+        self.assertEqual(b'False True IPAddrBlocks True None', output.strip())
+
+
 suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
 
 if __name__ == '__main__':
@@ -5,8 +5,14 @@
 # Copyright (c) 2021-2026, Vigil Security, LLC
 # License: http://vigilsec.com/pyasn1-alt-modules-license.txt
 #
+import base64
+import io
+import os
+import shutil
 import sys
+import tempfile
 import unittest
+from unittest import mock
 
 from pyasn1_alt_modules import pem
 
@@ -96,6 +102,144 @@ GGbx7DI=
         self.assertEqual(bytes(expected), binary)
 
 
+class PemBlocksTestCase(unittest.TestCase):
+    pem_text = PemTestCase.pem_text
+
+    def setUp(self):
+        self.substrate = pem.readBase64fromText(self.pem_text)
+        self.bundle = ''.join([
+            'Bag Attributes\n',
+            '-----BEGIN CERTIFICATE REQUEST-----\n',
+            self.pem_text,
+            '-----END CERTIFICATE REQUEST-----\n',
+            '\n',
+            '-----BEGIN X509 CRL-----\r\n',
+            self.pem_text.replace('\n', '\r\n'),
+            '-----END X509 CRL-----\r\n',
+            '-----BEGIN TRUNCATED-----\n',
+            self.pem_text,
+            '-----BEGIN CERTIFICATE-----\n',
+            self.pem_text,
+            '-----END CERTIFICATE-----\n',
+            '-----BEGIN TRUNCATED-----\n',
+            self.pem_text,
+        ])
+
+    def checkBlocks(self, blocks):
+        self.assertEqual(3, len(blocks))
+        self.assertEqual(('CERTIFICATE REQUEST', self.substrate, 15), blocks[0])
+        self.assertEqual('X509 CRL', blocks[1][0])
+        self.assertEqual(self.substrate, blocks[1][1])
+        self.assertEqual(self.bundle.index('-----BEGIN X509'), blocks[1][2])
+        self.assertEqual(('CERTIFICATE', self.substrate,
+            self.bundle.index('-----BEGIN CERTIFICATE-----')), blocks[2])
+
+    def testBinaryFile(self):
+        fileObj = io.BytesIO(self.bundle.encode())
+        self.checkBlocks(list(pem.iterPemBlocksFromFile(fileObj)))
+
+    def testTextFile(self):
+        fileObj = io.StringIO(self.bundle)
+        self.checkBlocks(list(pem.iterPemBlocksFromFile(fileObj)))
+
+    def testSmallChunks(self):
+        for chunkSize in (1, 7, 64):
+            fileObj = io.BytesIO(self.bundle.encode())
+            self.checkBlocks(list(
+                pem.iterPemBlocksFromFile(fileObj, chunkSize=chunkSize)))
+
+    def testLargeBlock(self):
+        # the END marker falls at every offset within a chunk of 64
+        for size in range(3000, 3192, 3):
+            substrate = bytes(range(256)) * (size // 256) + bytes(size % 256)
+            bundle = ''.join([
+                'x' * 100,
+                '-----BEGIN LARGE-----\n',
+                base64.encodebytes(substrate).decode(),
+                '-----END LARGE-----\n',
+                '-----BEGIN CERTIFICATE-----\n',
+                self.pem_text,
+                '-----END CERTIFICATE-----\n',
+            ])
+            blocks = list(pem.iterPemBlocksFromFile(
+                io.BytesIO(bundle.encode()), chunkSize=64))
+
+            self.assertEqual([('LARGE', substrate, 100),
+                              ('CERTIFICATE', self.substrate,
+                               bundle.index('-----BEGIN CERTIFICATE'))], blocks)
+
+    def testMatchesLineReader(self):
+        fileObj = io.StringIO(self.bundle)
+        idx, substrate = pem.readPemBlocksFromFile(fileObj,
+            ('-----BEGIN CERTIFICATE REQUEST-----',
+             '-----END CERTIFICATE REQUEST-----'))
+
+        label, der, offset = next(pem.iterPemBlocksFromFile(
+            io.StringIO(self.bundle)))
+
+        self.assertEqual(0, idx)
+        self.assertEqual(substrate, der)
+
+    def testEmptyFile(self):
+        self.assertEqual([], list(pem.iterPemBlocksFromFile(io.BytesIO())))
+
+
+class PemBundleTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmpdir, 'bundle.pem')
+        self.bundle = PemBlocksTestCase('testBinaryFile')
+        self.bundle.setUp()
+        with open(self.filename, 'w') as fileObj:
+            fileObj.write(self.bundle.bundle)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def testScan(self):
+        with open(self.filename, 'rb') as fileObj:
+            expected = list(pem.iterPemBlocksFromFile(fileObj))
+
+        with pem.PemBundle(self.filename) as bundle:
+            self.assertEqual(3, len(bundle))
+            self.assertEqual(expected, list(bundle))
+            self.assertEqual('X509 CRL', bundle.label(1))
+            self.assertEqual(expected[2], bundle[-1])
+            self.assertRaises(IndexError, bundle.__getitem__, 3)
+
+    def testSavedIndex(self):
+        with pem.PemBundle(self.filename) as bundle:
+            bundle.save()
+            expected = list(bundle)
+
+        self.assertTrue(os.path.exists(self.filename + '.idx'))
+
+        with mock.patch.object(pem.PemBundle, '_scan',
+                               side_effect=AssertionError('rescanned')):
+            with pem.PemBundle(self.filename) as bundle:
+                self.assertEqual(expected, list(bundle))
+
+    def testStaleIndex(self):
+        with pem.PemBundle(self.filename) as bundle:
+            bundle.save()
+
+        with open(self.filename, 'a') as fileObj:
+            fileObj.write('-----BEGIN CERTIFICATE-----\n')
+            fileObj.write(PemTestCase.pem_text)
+            fileObj.write('-----END CERTIFICATE-----\n')
+
+        with pem.PemBundle(self.filename) as bundle:
+            self.assertEqual(4, len(bundle))
+            self.assertEqual('CERTIFICATE', bundle[3][0])
+
+    def testEmptyFile(self):
+        open(self.filename, 'w').close()
+
+        with pem.PemBundle(self.filename) as bundle:
+            self.assertEqual(0, len(bundle))
+
+
 suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
 
 if __name__ == '__main__':
@@ -0,0 +1,246 @@
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+import sys
+import unittest
+
+from pyasn1 import error
+from pyasn1.codec.der.decoder import decode as der_decoder
+from pyasn1.codec.der.encoder import encode as der_encoder
+from pyasn1.type import univ
+
+from pyasn1_alt_modules import pem
+from pyasn1_alt_modules import pkcs12
+from pyasn1_alt_modules import rfc5652
+from pyasn1_alt_modules import rfc7292
+
+
+class PFXReaderTestCase(unittest.TestCase):
+    pfx_pem_text = """\
+MIIJ0wIBAzCCCY8GCSqGSIb3DQEHAaCCCYAEggl8MIIJeDCCBggGCSqGSIb3DQEHAaCCBfkE
+ggX1MIIF8TCCBe0GCyqGSIb3DQEMCgECoIIE/jCCBPowHAYKKoZIhvcNAQwBAzAOBAjuq0/+
+0pyutQICB9AEggTYZe/mYBpmkDvKsve4EwIVwo1TNv4ldyx1qHZW2Ih6qQCY+Nv1Mnv9we0z
+UTl4p3tQzCPWXnrSA82IgOdotLIez4YwXrgiKhcIkSSL+2yCmAoM+qkjiAIKq+l3UJ6Xhafe
+2Kg4Ek/0RkHpe6GwjTtdefkpXpZgccMEopOtKQMLJWsDM7p77x/amn6yIk2tpskKqUY/4n8Y
+xEiTWcRtTthYqZQIt+q94nKLYpt0o880SVOfvdEqp5KII7cTg60GJL+n6oN6hmP0bsAMvnk9
+1f8/lFKMi9tsNU/KnUhbDVpjJwBQkhgbqBx6GdtoqSLSlYNPVM0wlntwm1JhH4ybiQ5sNzqO
+7FlWC5bcYwkvOlx1gGrshY5jK/WjbA4paBpxSkgobJReirY9BeqITnvokXlub4tehHhM20Ik
+42pKa3kGaHmowvzflxqE+oysW5Oa9XbZxBCfkOMJ70o4hqa+n66+E/uKcN9NbKbTo3zt3xdt
+6ypOwHb74t5OcWaGx3EZsw0n0/V+WoLSpXOBwpx08+1yh7LV29aNQ0oEzVVkF6YYRQZtdIMe
+s3xB2i6sjLal21ntk7iBzMJwVoi524SAZ/oW8SuDAn1c93AWWwKZLALv5V3FZ2pDiQXArcfz
+DH2d5HJyNx7OlvKzNgEngwSyEC1XbjnOsZVUqGFENuDTa/brH4oEJHEkyWTyDudrz8iCEO80
+e1PE4qqJ5CllN0CSVWqz4CxGDFIQXzR6ohn8f3dR3+DAaLYvAjBVMLJjk7+nfnB2L0HpanhT
+Fz9AxPPIDf5pBQQwM14l8wKjEHIyfqclupeKNokBUr1ykioPyCr3nf4Rqe0Z4EKIY4OCpW6n
+hrkWHmvF7OKR+bnuSk3jnBxjSN0Ivy5q9q3fntYrhscMGGR73umfi8Z29tM1vSP9jBZvirAo
+geGf/sfOI0ewRvJf/5abnNg/78Zyk8WmlAHVFzNGcM3u3vhnNpTIVRuUyVkdSmOdbzeSfmqQ
+2HPCEdC9HNm25KJt1pD6v6aP3Tw7qGl+tZyps7VB2i+a+UGcwQcClcoXcPSdG7Z1gBTzSr84
+MuVPYlePuo1x+UwppSK3rM8ET6KqhGmESH5lKadvs8vdT6c407PfLcfxyAGzjH091prk2oRJ
+xB3oQAYcKvkuMcM6FSLJC263Dj+pe1GGEexk1AoysYe67tK0sB66hvbd92HcyWhW8/vI2/PM
+bX+OeEb7q+ugnsP+BmF/btWXn9AxfUqNWstyInKTn+XpqFViMIOG4e2xC4u/IvzG3VrTWUHF
+4pspH3k7GB/EOLvtbsR0uacBFlsColJy0FaWT9rrdueU3YEiIRCC8LGi1XpUa8f5adeBKWN+
+eRTrrF4o7uoNeGlnwZ7ebnb7k18Q0GRzzzTZPoMM4L703svfE/eNYWFHLY4NDQKSYgeum365
+WAfZpHOX7YOc6oRGrGB+QuGoyikTTDO8xpcEmb8vDz4ZwHhN0PS056LNJeMoI0A/5DJb3e10
+i1txlM48sbZBuIEIeixr52nwG4LuxqXGqShKaTfOrFxHjx4kI4/dp9dN/k8TGFsLWjuIgMJI
+6nRHbWrxB3F0XKXagtLLep1MDwDwAuCyiW2YC0JzRvsJViIgjDA+eiHX0O6/8xiK9dzMQpIz
+TVHSEqFlhORp0DGB2zATBgkqhkiG9w0BCRUxBgQEAQAAADBXBgkqhkiG9w0BCRQxSh5IADMA
+ZgA3ADEAYQBmADYANQAtADEANgA4ADcALQA0ADQANABhAC0AOQBmADQANgAtAGMAOABiAGUA
+MQA5ADQAYwAzAGUAOABlMGsGCSsGAQQBgjcRATFeHlwATQBpAGMAcgBvAHMAbwBmAHQAIABF
+AG4AaABhAG4AYwBlAGQAIABDAHIAeQBwAHQAbwBnAHIAYQBwAGgAaQBjACAAUAByAG8AdgBp
+AGQAZQByACAAdgAxAC4AMDCCA2gGCSqGSIb3DQEHAaCCA1kEggNVMIIDUTCCA00GCyqGSIb3
+DQEMCgEDoIIDJTCCAyEGCiqGSIb3DQEJFgGgggMRBIIDDTCCAwkwggHxoAMCAQICEDbt9oc6
+oQinRwE1826MiBEwDQYJKoZIhvcNAQEFBQAwFDESMBAGA1UEAxMJYW5vbnltb3VzMCAXDTE2
+MDcxOTIyMDAwMVoYDzIxMTYwNjI1MjIwMDAxWjAUMRIwEAYDVQQDEwlhbm9ueW1vdXMwggEi
+MA0GCSqGSIb3DQEBAQUAA4IBDwAwggEKAoIBAQC8trBCTBjXXA4OgSO5nRTOU5T86ObCgc71
+J2oCuUigSddcTDzebaD0wcyAgf101hAdwMKQ9DvrK0nGvm7FAMnnUuVeATafKgshLuUTUUfK
+jx4Xif4LoS0/ev4BiOI5a1MlIRZ7T5Cyjg8bvuympzMuinQ/j1RPLIV0VGU2HuDxuuP3O898
+GqZ3+F6Al5CUcwmOX9zCs91JdN/ZFZ05SXIpHQuyPSPUX5Vy8F1ZeJ8VG3nkbemfFlVkuKQq
+vteL9mlT7z95rVZgGB3nUZL0tOB68eMcffA9zUksOmeTi5M6jnBcNeX2Jh9jS3YYd+IEliZm
+mggQG7kPta8f+NqezL77AgMBAAGjVTBTMBUGA1UdJQQOMAwGCisGAQQBgjcKAwQwLwYDVR0R
+BCgwJqAkBgorBgEEAYI3FAIDoBYMFGFub255bW91c0B3aW5kb3dzLXgAMAkGA1UdEwQCMAAw
+DQYJKoZIhvcNAQEFBQADggEBALh+4qmNPzC6M8BW9/SC2ACQxxPh06GQUGx0D+GLYnp61ErZ
+OtKyKdFh+uZWpu5vyYYAHCLXP7VdS/JhJy677ynAPjXiC/LAzrTNvGs74HDotD966Hiyy0Qr
+ospFGiplHGRA5vXA2CiKSX+0HrVkN7rhk5PYkc6R+/cdosd+QZ8lkEa9yDWc5l//vWEbzwVy
+mJf/PRf8NTkWAK6SPV7Y37j1mhkJjOH9VkRxNrd6kcihRa4u0ImXaXEsec77ER0so31DKCrP
+m+rqZPj9NZSIYP3sMGJ4Bmm/n2YRdeaUzTdocfD3TRnKxs65DSgpiSq1gmtsXM7jAPs/Egrg
+tbWEypgxFTATBgkqhkiG9w0BCRUxBgQEAQAAADA7MB8wBwYFKw4DAhoEFKVgj/32UdEyuQcB
+rqr03dPnboinBBSU7mxdpB5LTCvorCI8Tk5OMiUzjgICB9A=
+"""
+
+    keyId = b'\x01\x00\x00\x00'
+
+    keyName = '3f71af65-1687-444a-9f46-c8be194c3e8e'
+
+    def setUp(self):
+        self.substrate = pem.readBase64fromText(self.pfx_pem_text)
+        self.pfx, rest = der_decoder(self.substrate, asn1Spec=rfc7292.PFX())
+        self.authSafe, rest = der_decoder(
+            der_decoder(self.pfx['authSafe']['content'], asn1Spec=univ.OctetString())[0],
+            asn1Spec=rfc7292.AuthenticatedSafe())
+        self.safeContents = []
+        for contentInfo in self.authSafe:
+            octets, rest = der_decoder(contentInfo['content'], asn1Spec=univ.OctetString())
+            self.safeContents.append(
+                der_decoder(octets, asn1Spec=rfc7292.SafeContents())[0])
+
+    def encryptedData(self, safeContents):
+        # an EncryptedData whose encryptedContent is the SafeContents
+        # itself, with the decrypt below as its cipher
+        encryptedData = rfc5652.EncryptedData()
+        encryptedData['version'] = 0
+        encryptedContentInfo = encryptedData['encryptedContentInfo']
+        encryptedContentInfo['contentType'] = rfc5652.id_data
+        encryptedContentInfo['contentEncryptionAlgorithm']['algorithm'] = \
+            rfc7292.pbeWithSHAAnd40BitRC2_CBC
+        encryptedContentInfo['encryptedContent'] = der_encoder(safeContents)
+        contentInfo = rfc5652.ContentInfo()
+        contentInfo['contentType'] = rfc5652.id_encryptedData
+        contentInfo['content'] = der_encoder(encryptedData)
+        return contentInfo
+
+    def decrypt(self, contentInfo):
+        self.decrypted.append(contentInfo['contentType'])
+        encryptedData, rest = der_decoder(
+            contentInfo['content'], asn1Spec=rfc5652.EncryptedData())
+        return encryptedData['encryptedContentInfo']['encryptedContent'].asOctets()
+
+    def makePfx(self, authSafe):
+        pfx = self.pfx.clone()
+        pfx['version'] = self.pfx['version']
+        pfx['authSafe']['contentType'] = rfc5652.id_data
+        pfx['authSafe']['content'] = der_encoder(univ.OctetString(der_encoder(authSafe)))
+        return der_encoder(pfx)
+
+    def testIterate(self):
+        reader = pkcs12.PFXReader(self.substrate)
+
+        self.assertEqual(3, reader.version)
+        self.assertEqual(2000, reader.macData['iterations'])
+        self.assertEqual([rfc5652.id_data] * 2, reader.contentTypes)
+
+        bags = list(reader)
+        expected = [bag for safeContents in self.safeContents for bag in safeContents]
+
+        self.assertEqual(len(expected), len(bags))
+
+        for bag, safeBag in zip(bags, expected):
+            bagId, attributes, substrate = bag
+
+            self.assertEqual(safeBag['bagId'], bagId)
+            self.assertEqual(der_encoder(safeBag), substrate)
+            self.assertEqual(der_encoder(safeBag), der_encoder(bag.toAsn1()))
+            self.assertEqual(
+                [attribute['attrType'] for attribute in safeBag['bagAttributes']],
+                list(attributes))
+            for attribute in safeBag['bagAttributes']:
+                self.assertEqual(
+                    [value.asOctets() for value in attribute['attrValues']],
+                    attributes[attribute['attrType']])
+            self.assertEqual(self.keyId, bag.localKeyId)
+
+        self.assertEqual(rfc7292.id_pkcs8ShroudedKeyBag, bags[0].bagId)
+        self.assertEqual(self.keyName, bags[0].friendlyName)
+        self.assertIsInstance(bags[0].value(), rfc7292.PKCS8ShroudedKeyBag)
+        self.assertEqual(
+            2000, bags[0].value()['encryptionAlgorithm']['parameters']['iterations'])
+
+        self.assertEqual(rfc7292.id_certBag, bags[1].bagId)
+        self.assertIsNone(bags[1].friendlyName)
+        self.assertIsInstance(bags[1].value(), rfc7292.CertBag)
+        self.assertIs(bags[1].value(), bags[1].value())
+
+    def testLookup(self):
+        reader = pkcs12.PFXReader(self.substrate)
+        keyBag = reader.find(localKeyId=self.keyId)
+
+        self.assertEqual(rfc7292.id_pkcs8ShroudedKeyBag, keyBag.bagId)
+        self.assertEqual(
+            rfc7292.id_certBag,
+            reader.find(localKeyId=self.keyId, bagId=rfc7292.id_certBag).bagId)
+        self.assertIsNone(reader.find(friendlyName='nothing'))
+
+        bags = reader.lookup(localKeyId=self.keyId)
+
+        self.assertEqual([rfc7292.id_pkcs8ShroudedKeyBag, rfc7292.id_certBag],
+                         [bag.bagId for bag in bags])
+        self.assertEqual([bags[0]], reader.lookup(friendlyName=self.keyName))
+        self.assertEqual(
+            [bags[0]], reader.lookup(localKeyId=self.keyId, friendlyName=self.keyName))
+        self.assertEqual([], reader.lookup(localKeyId=b'\x02'))
+        self.assertRaises(error.PyAsn1Error, reader.lookup)
+
+    def testDecryptOnDemand(self):
+        keyBags, certBags = self.safeContents
+
+        # the CertBag inside a SafeContentsBag, inside an EncryptedData
+        nested = rfc7292.SafeBag()
+        nested['bagId'] = rfc7292.id_safeContentsBag
+        nested['bagValue'] = der_encoder(certBags)
+        outer = rfc7292.SafeContents()
+        outer.append(nested)
+
+        authSafe = rfc7292.AuthenticatedSafe()
+        authSafe.append(self.authSafe[0])
+        authSafe.append(self.encryptedData(outer))
+        substrate = self.makePfx(authSafe)
+
+        self.decrypted = []
+        reader = pkcs12.PFXReader(substrate, decrypt=self.decrypt)
+
+        self.assertEqual([rfc5652.id_data, rfc5652.id_encryptedData],
+                         reader.contentTypes)
+        self.assertEqual(rfc7292.id_pkcs8ShroudedKeyBag,
+                         reader.find(localKeyId=self.keyId).bagId)
+        self.assertEqual([], self.decrypted)
+
+        bag = reader.find(bagId=rfc7292.id_certBag)
+
+        self.assertEqual(der_encoder(certBags[0]), bag.substrate)
+        self.assertEqual([rfc5652.id_encryptedData], self.decrypted)
+
+        self.assertEqual(2, len(reader.lookup(localKeyId=self.keyId)))
+        self.assertEqual([rfc5652.id_encryptedData], self.decrypted)
+
+        reader = pkcs12.PFXReader(substrate)
+
+        self.assertIsNone(reader.safeContents(1))
+        self.assertEqual([rfc7292.id_pkcs8ShroudedKeyBag],
+                         [bag.bagId for bag in reader])
+
+    def testBer(self):
+        # indefinite lengths, with the AuthenticatedSafe in two segments
+        authSafe = der_encoder(self.authSafe)
+        substrate = (
+            b'\x30\x80' + der_encoder(self.pfx['version']) +
+            b'\x30\x80' + der_encoder(rfc5652.id_data) + b'\xa0\x80\x24\x80' +
+            der_encoder(univ.OctetString(authSafe[:100])) +
+            der_encoder(univ.OctetString(authSafe[100:])) + b'\x00\x00' * 3 +
+            der_encoder(self.pfx['macData']) + b'\x00\x00')
+        reader = pkcs12.PFXReader(substrate)
+
+        self.assertEqual(authSafe, reader.authSafeContent)
+        self.assertEqual(
+            [der_encoder(bag) for safeContents in self.safeContents for bag in safeContents],
+            [bag.substrate for bag in reader])
+
+    def testErrors(self):
+        self.assertRaises(error.PyAsn1Error, pkcs12.PFXReader,
+                          der_encoder(self.pfx['macData']))
+        self.assertRaises(error.SubstrateUnderrunError, pkcs12.PFXReader,
+                          self.substrate[:-1])
+
+        pfx = self.pfx.clone()
+        pfx['version'] = 3
+        pfx['authSafe']['contentType'] = rfc5652.id_signedData
+        pfx['authSafe']['content'] = self.pfx['authSafe']['content']
+
+        self.assertRaises(error.PyAsn1Error, pkcs12.PFXReader, der_encoder(pfx))
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == '__main__':
+    result = unittest.TextTestRunner(verbosity=2).run(suite)
+    sys.exit(not result.wasSuccessful())
@@ -0,0 +1,151 @@
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+import sys
+import unittest
+
+from pyasn1 import error
+from pyasn1.codec.der.decoder import decode as der_decoder
+from pyasn1.codec.der.encoder import encode as der_encoder
+from pyasn1.type import univ
+
+from pyasn1_alt_modules import pem
+from pyasn1_alt_modules import plan
+from pyasn1_alt_modules import projection
+from pyasn1_alt_modules import rfc5280
+from pyasn1_alt_modules import rfc5652
+
+
+class DecodePlanTestCase(unittest.TestCase):
+    pem_text = """\
+MIIHSgYJKoZIhvcNAQcCoIIHOzCCBzcCAQMxDTALBglghkgBZQMEAgEwgbYGCyqGSIb3DQEJEAEc
+oIGmBIGjPD94bWwgdmVyc2lvbj0nMS4wJyBlbmNvZGluZz0nVVRGLTgnPz4KPG1lc3NhZ2UgeG1s
+bnM9Imh0dHA6Ly93d3cuYXBuaWMubmV0L3NwZWNzL3Jlc2NlcnRzL3VwLWRvd24vIiByZWNpcGll
+bnQ9IlJHbmV0LU9VIiBzZW5kZXI9Im92c0NBIiB0eXBlPSJsaXN0IiB2ZXJzaW9uPSIxIi8+CqCC
+AxYwggMSMIIB+qADAgECAgICTTANBgkqhkiG9w0BAQsFADAhMR8wHQYDVQQDExZvdnNDQSBCUEtJ
+IHJlc291cmNlIENBMB4XDTIxMDEyMTAzMzAwNVoXDTIxMDMyMjAzMzAwNVowMzExMC8GA1UEAxMo
+QzM2MTU4MTFDOTg2MDgwODlGRUQ3QTc5NzE0NUFFNzczOEE2NUMzMTCCASIwDQYJKoZIhvcNAQEB
+BQADggEPADCCAQoCggEBAPqmJfF5uCDfj1gLxAgiU+PBYwlxoOHET1oIf4fdyE/7P2FBJI9oxngB
+rhlqdvd8ef/gSZ6MksKs9/FQGRKtv54zOfl2nFmraP9T6VdoXaxbcmuY22EvPOJ85IVXVUEAJOQi
+M5GskTLlAiSHQziCI+/ve4f8ojGU6Vtav/a+W713/UhPrTj2WwksC/Pu37smIv5pkxXJnyR3Dpoh
+jwV79Qm4dDRLakZy9HsZ8wHSP6HH8qovBCXGU/7mpXFWzzrL0NaKI3uqGcJjQLwx3UE0g/NWwYv3
+t52HpwRV5hiiQZB+4OiRI7OmLlQJH82TDoHOdLRIER9mRBwEamMQTQbx8f8CAwEAAaNCMEAwHQYD
+VR0OBBYEFMNhWBHJhggIn+16eXFFrnc4plwxMB8GA1UdIwQYMBaAFMKR3eNCo3tIwJ7BNnpcKxLT
+ruUaMA0GCSqGSIb3DQEBCwUAA4IBAQCY5tDRD3vOgi2NSP7TeYOiYYVQwNum35jbIdXGSAVwBSsZ
+/j73/M0vzHzqKXOotHy/lGnNFUXDxydO9P3ZXPSfUVIY0yjZdMYa31xxT3D3wNgqFxJ9R0JzLk/p
+ANtKy01CGWUnrmY3sU0t81bGbAalYsnfd54rKsQKywZiaw2iuT8EFlZNq+oUx9hVuc9S/G/kHzZQ
+MLHO0iELIyUxrMNYn/0GXj77oA+Ixbd7InY3/CbrogYwRzkm+XDmHeh6DihdhMTr9ipx83Wu9Oy3
+plZbw6KmbCv7HywYASQq5KpRsHQPyX3EUzOh5A9Nge2tosTrGNNc0K2xsxwYmLO5mu5HoYIBoDCC
+AZwwgYUCAQEwDQYJKoZIhvcNAQELBQAwITEfMB0GA1UEAxMWb3ZzQ0EgQlBLSSByZXNvdXJjZSBD
+QRcNMjEwMTIxMDMzMDA1WhcNMjEwMTIyMDQzMDA1WqAwMC4wHwYDVR0jBBgwFoAUwpHd40Kje0jA
+nsE2elwrEtOu5RowCwYDVR0UBAQCAgSXMA0GCSqGSIb3DQEBCwUAA4IBAQA/ZWgZ9E8JOksCkhVv
+VBEDIONm6hKY30rg2Ry0bRvZQ8KGlItB7nkO1MRZN+FDP5B7cRjKK814WAjIzLEg7+uqpEUv6zyk
+NXAYlCptDqBGTnFiFYEsd7AkxcCY332c5ZAqikTs8v5fn78HA+Gda3hCJmkDZWvop61LQyTgYPnt
+wk83fV8CBZ5il502ePT8yYpgWUPSHraSiHw9y8Sh7KL2dUuYzaOVD5FllP0Vjbh6Y8HyeJNfefXd
+gU85n+/jRgYmTZf6HqnUh4Uj+os5VG8qep7cCYXl0fopq9tB78uuBCASN8CrOZE+01I6mQtdLClO
+jJXSI0MJgEahSqiMxnOMMYIBqjCCAaYCAQOAFMNhWBHJhggIn+16eXFFrnc4plwxMAsGCWCGSAFl
+AwQCAaBrMBoGCSqGSIb3DQEJAzENBgsqhkiG9w0BCRABHDAcBgkqhkiG9w0BCQUxDxcNMjEwMTIx
+MjIwMDIxWjAvBgkqhkiG9w0BCQQxIgQgqTVNWNOGNThLE4cyQFln/dUkN+WlT005oaVkHQ9rip8w
+DQYJKoZIhvcNAQEBBQAEggEAoEsmgmdUPbJyOd/9uG0E+b6YdB3LAEzWY2q1pNgNn5DXvV0ZQdeS
+WlcZXXr15ijXe7uyKTVPouvrINeHx3M8UQQ6IMjo6QIP8Q/80HpFWR/jwYgXGD6W8eVVKbmal4fg
+VGSNsLLzxSW0b0l+cDud99WaDxBkI+UJgOpDwgaxKlpb0J0r01cTZ3mGyNg1V67Z5UaqJXGKnspf
+oeJDQYwjDTOPV6BTBMddrUQEUAGuG4slIH9qtlf0jo76iuZq26FVDftCPhXC7lAL7oQC0yoIjcur
+J3DaFmF8obzBv328Fs29I7bOpWxLnqnxy2fcnVFkKteWzCdLXTHItJHUrcRgWQ==
+"""
+
+    def setUp(self):
+        self.substrate = pem.readBase64fromText(self.pem_text)
+        contentInfo, rest = der_decoder(
+            self.substrate, asn1Spec=rfc5652.ContentInfo())
+        self.signedData = contentInfo['content'].asOctets()
+        signedData, rest = der_decoder(
+            self.signedData, asn1Spec=rfc5652.SignedData())
+        self.cert = der_encoder(signedData['certificates'][0]['certificate'])
+        self.crl = der_encoder(signedData['crls'][0]['crl'])
+
+    def assertSameDecode(self, substrate, asn1Spec, **options):
+        expected, expectedRest = der_decoder(substrate, asn1Spec=asn1Spec, **options)
+        asn1Object, rest = plan.decode(substrate, asn1Spec, **options)
+        self.assertEqual(expectedRest, rest)
+        self.assertEqual(expected.prettyPrint(), asn1Object.prettyPrint())
+        self.assertEqual(substrate[:len(substrate) - len(rest)],
+                         der_encoder(asn1Object))
+        return asn1Object
+
+    def testCertificate(self):
+        asn1Object = self.assertSameDecode(self.cert, rfc5280.Certificate())
+        self.assertEqual(589, asn1Object['tbsCertificate']['serialNumber'])
+
+    def testCertificateList(self):
+        self.assertSameDecode(self.crl, rfc5280.CertificateList())
+
+    def testSignedData(self):
+        self.assertSameDecode(self.signedData, rfc5652.SignedData())
+
+    def testOpenTypes(self):
+        asn1Object = self.assertSameDecode(
+            self.substrate, rfc5652.ContentInfo(), decodeOpenTypes=True)
+        self.assertIsInstance(asn1Object['content'], rfc5652.SignedData)
+        signerInfo = asn1Object['content']['signerInfos'][0]
+        for attribute in signerInfo['signedAttrs']:
+            self.assertTrue(attribute['attrValues'][0].isValue)
+            self.assertNotIsInstance(attribute['attrValues'][0], univ.Any)
+
+    def testProjectedSpec(self):
+        # the unique IDs stay undecoded between subjectPublicKeyInfo and
+        # the extensions, so each RawComponent must only take its own tag
+        names = ('version', 'serialNumber', 'signature', 'issuer', 'validity',
+                 'subject', 'subjectPublicKeyInfo', 'extensions')
+        for paths in (['tbsCertificate.' + name for name in names],
+                      ['tbsCertificate.serialNumber'],
+                      ['tbsCertificate.extensions'],
+                      ['tbsCertificate.subject']):
+            asn1Spec = projection.projectSpec(rfc5280.Certificate(), *paths)
+            asn1Object = self.assertSameDecode(self.cert, asn1Spec)
+            tbsCertificate = asn1Object['tbsCertificate']
+
+            self.assertFalse(tbsCertificate['issuerUniqueID'].isValue)
+            self.assertTrue(tbsCertificate['extensions'].isValue)
+
+    def testRest(self):
+        self.assertSameDecode(self.cert + b'\x05\x00', rfc5280.Certificate())
+
+    def testPlanCache(self):
+        self.assertIs(plan.compileSpec(rfc5280.Certificate()),
+                      plan.compileSpec(rfc5280.Certificate()))
+
+    def testUnderrun(self):
+        self.assertRaises(error.SubstrateUnderrunError, plan.decode,
+                          self.cert[:-10], rfc5280.Certificate())
+        self.assertRaises(error.SubstrateUnderrunError, plan.decode,
+                          self.cert[:3], rfc5280.Certificate())
+
+    def testTagMismatch(self):
+        self.assertRaises(error.PyAsn1Error, plan.decode,
+                          self.crl, rfc5280.Certificate())
+
+    def testMissingComponent(self):
+        substrate = der_encoder(univ.Sequence().setComponentByPosition(
+            0, univ.Integer(1)))
+        self.assertRaises(error.PyAsn1Error, plan.decode,
+                          substrate, rfc5280.AlgorithmIdentifier())
+
+    def testIndefiniteLength(self):
+        self.assertRaises(error.PyAsn1Error, plan.decode,
+                          b'\x30\x80\x06\x03\x55\x04\x03\x00\x00',
+                          rfc5280.AlgorithmIdentifier())
+
+    def testBoolean(self):
+        self.assertTrue(plan.decode(b'\x01\x01\xff', univ.Boolean())[0])
+        self.assertRaises(error.PyAsn1Error, plan.decode,
+                          b'\x01\x01\x01', univ.Boolean())
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == '__main__':
+    result = unittest.TextTestRunner(verbosity=2).run(suite)
+    sys.exit(not result.wasSuccessful())
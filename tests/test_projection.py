@@ -0,0 +1,116 @@
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+import sys
+import unittest
+
+from pyasn1 import error
+from pyasn1.codec.der.decoder import decode as der_decoder
+from pyasn1.codec.der.encoder import encode as der_encoder
+
+from pyasn1_alt_modules import pem
+from pyasn1_alt_modules import projection
+from pyasn1_alt_modules import rfc5280
+
+
+class ProjectSpecTestCase(unittest.TestCase):
+    pem_text = """\
+MIIDpjCCA0ygAwIBAgIUY8xt3l0B9nIPWSpjs0hDJUJZmCkwCwYJYIZIAWUDBAMC
+MD8xCzAJBgNVBAYTAlVTMQswCQYDVQQIEwJWQTEQMA4GA1UEBxMHSGVybmRvbjER
+MA8GA1UEChMIQm9ndXMgQ0EwHhcNMTkxMDIwMjAxMjMwWhcNMjAxMDE5MjAxMjMw
+WjBwMQswCQYDVQQGEwJVUzELMAkGA1UECBMCVkExEDAOBgNVBAcTB0hlcm5kb24x
+EDAOBgNVBAoTB0V4YW1wbGUxDjAMBgNVBAsTBUFsaWNlMSAwHgYJKoZIhvcNAQkB
+FhFhbGljZUBleGFtcGxlLmNvbTCCAbYwggErBgcqhkjOOAQBMIIBHgKBgQCLpR53
+xHfe+SiknAK/L9lm/ZO1109c9iYkriPIW/5MMlM+qc/tdRkKpG6ELIpfXTPtKCJm
+zqqVIyTmAJryyE8Xw0Ie2mzYPU5ULvKmllQkjTsWgPGgQBkciZ0AW9ggD9VwZilg
+4qh3iSO7T97hVQFnpCh6vm8pOH6UP/5kpr9ZJQIVANzdbztBJlJfqCB1t4h/NvSu
+wCFvAoGAITP+jhYk9Rngd98l+5ccgauQ+cLEUBgNG2Wq56zBXQbLou6eKkQi7ecL
+NiRmExq3IU3LOj426wSxL72Kw6FPyOEv3edIFkJJEHL4Z+ZJeVe//dzya0ddOJ7k
+k6qNF2ic+viD/5Vm8yRyKiig2uHH/MgIesLdZnvbzvX+f/P0z50DgYQAAoGALAUl
+jkOi1PxjjFVvhGfK95yIsrfbfcIEKUBaTs9NR2rbGWUeP+93paoXwP39X9wrJx2M
+SWeHWhWKszNgoiyqYT0k4R9mem3WClotxOvB5fHfwIp2kQYvE7H0/TPdGhfUpHQG
+YpyLQgT6L80meSKMFnu4VXGzOANhWDxu3JxiADCjgZQwgZEwCwYDVR0PBAQDAgeA
+MEIGCWCGSAGG+EIBDQQ1FjNUaGlzIGNlcnRpZmljYXRlIGNhbm5vdCBiZSB0cnVz
+dGVkIGZvciBhbnkgcHVycG9zZS4wHQYDVR0OBBYEFO37wHcauyc03rDc6cDRRsHz
+gcK+MB8GA1UdIwQYMBaAFM1IZQGDsqYHWwb+I4EMxHPk0bU4MAsGCWCGSAFlAwQD
+AgNHADBEAiBBRbfMzLi7+SVyO8SM3xxwUsMf/k1B+Nkvf1kBTfCfGwIgSAx/6mI+
+pNqdXqZZGESXy1MT1aBc4ynPGLFUr2r7cPY=
+"""
+
+    def setUp(self):
+        self.substrate = pem.readBase64fromText(self.pem_text)
+        self.full, rest = der_decoder(
+            self.substrate, asn1Spec=rfc5280.Certificate())
+
+    def decode(self, *paths):
+        asn1Spec = projection.projectSpec(rfc5280.Certificate(), *paths)
+        asn1Object, rest = der_decoder(self.substrate, asn1Spec=asn1Spec)
+
+        self.assertFalse(rest)
+        self.assertIsInstance(asn1Object, rfc5280.Certificate)
+        self.assertEqual(self.substrate, der_encoder(asn1Object))
+
+        return asn1Object
+
+    def testSerialNumber(self):
+        asn1Object = self.decode('tbsCertificate.serialNumber')
+        tbs = asn1Object['tbsCertificate']
+
+        self.assertIsInstance(tbs, rfc5280.TBSCertificate)
+        self.assertEqual(
+            self.full['tbsCertificate']['serialNumber'], tbs['serialNumber'])
+
+        for name in ('version', 'issuer', 'subject', 'subjectPublicKeyInfo',
+                     'extensions'):
+            self.assertIsInstance(tbs[name], projection.RawComponent)
+
+        self.assertIsInstance(
+            asn1Object['signatureAlgorithm'], projection.RawComponent)
+
+    def testRawComponent(self):
+        tbs = self.decode('tbsCertificate.serialNumber')['tbsCertificate']
+        subject, rest = der_decoder(
+            der_encoder(tbs['subject']), asn1Spec=rfc5280.Name())
+
+        self.assertFalse(rest)
+        self.assertEqual(self.full['tbsCertificate']['subject'], subject)
+
+    def testExtensions(self):
+        tbs = self.decode('tbsCertificate.issuer',
+                          'tbsCertificate.extensions')['tbsCertificate']
+
+        self.assertEqual(self.full['tbsCertificate']['issuer'], tbs['issuer'])
+        self.assertIn(rfc5280.id_ce_subjectKeyIdentifier,
+                      [extn['extnID'] for extn in tbs['extensions']])
+        self.assertIsInstance(tbs['subject'], projection.RawComponent)
+
+    def testNestedPath(self):
+        tbs = self.decode('tbsCertificate.validity.notAfter')['tbsCertificate']
+
+        self.assertEqual(
+            self.full['tbsCertificate']['validity']['notAfter'],
+            tbs['validity']['notAfter'])
+
+    def testNoPaths(self):
+        asn1Object = self.decode()
+
+        self.assertIsInstance(
+            asn1Object['tbsCertificate'], projection.RawComponent)
+
+    def testBadPath(self):
+        self.assertRaises(
+            error.PyAsn1Error, projection.projectSpec, rfc5280.Certificate(),
+            'tbsCertificate.serial')
+        self.assertRaises(
+            error.PyAsn1Error, projection.projectSpec, rfc5280.Certificate(),
+            'tbsCertificate.serialNumber.value')
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == '__main__':
+    result = unittest.TextTestRunner(verbosity=2).run(suite)
+    sys.exit(not result.wasSuccessful())
@@ -0,0 +1,208 @@
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+import sys
+import unittest
+
+from pyasn1.codec.ber.encoder import encode as ber_encoder
+from pyasn1.codec.der.decoder import decode as der_decoder
+from pyasn1.codec.der.encoder import encode as der_encoder
+from pyasn1.type import univ
+
+from pyasn1_alt_modules import pem
+from pyasn1_alt_modules import rfc5280
+from pyasn1_alt_modules import rfc5652
+from pyasn1_alt_modules import rfc6960
+from pyasn1_alt_modules import spans
+
+
+class TbsSpanTestCase(unittest.TestCase):
+    cert_pem_text = """\
+MIIC5zCCAlACAQEwDQYJKoZIhvcNAQEFBQAwgbsxJDAiBgNVBAcTG1ZhbGlDZXJ0
+IFZhbGlkYXRpb24gTmV0d29yazEXMBUGA1UEChMOVmFsaUNlcnQsIEluYy4xNTAz
+BgNVBAsTLFZhbGlDZXJ0IENsYXNzIDMgUG9saWN5IFZhbGlkYXRpb24gQXV0aG9y
+aXR5MSEwHwYDVQQDExhodHRwOi8vd3d3LnZhbGljZXJ0LmNvbS8xIDAeBgkqhkiG
+9w0BCQEWEWluZm9AdmFsaWNlcnQuY29tMB4XDTk5MDYyNjAwMjIzM1oXDTE5MDYy
+NjAwMjIzM1owgbsxJDAiBgNVBAcTG1ZhbGlDZXJ0IFZhbGlkYXRpb24gTmV0d29y
+azEXMBUGA1UEChMOVmFsaUNlcnQsIEluYy4xNTAzBgNVBAsTLFZhbGlDZXJ0IENs
+YXNzIDMgUG9saWN5IFZhbGlkYXRpb24gQXV0aG9yaXR5MSEwHwYDVQQDExhodHRw
+Oi8vd3d3LnZhbGljZXJ0LmNvbS8xIDAeBgkqhkiG9w0BCQEWEWluZm9AdmFsaWNl
+cnQuY29tMIGfMA0GCSqGSIb3DQEBAQUAA4GNADCBiQKBgQDjmFGWHOjVsQaBalfD
+cnWTq8+epvzzFlLWLU2fNUSoLgRNB0mKOCn1dzfnt6td3zZxFJmP3MKS8edgkpfs
+2Ejcv8ECIMYkpChMMFp2bbFc893enhBxoYjHW5tBbcqwuI4V7q0zK89HBFx1cQqY
+JJgpp0lZpd34t0NiYfPT4tBVPwIDAQABMA0GCSqGSIb3DQEBBQUAA4GBAFa7AliE
+Zwgs3x/be0kz9dNnnfS0ChCzycUs4pJqcXgn8nCDQtM+z6lU9PHYkhaM0QTLS6vJ
+n0WuPIqpsHEzXcjFV9+vqDWzf4mH6eglkrh/hXqu1rweN1gqZ8mRzyqBPu3GOd/A
+PhmcGcwTTYJBtYze4D1gCCAPRX5ron+jjBXu
+"""
+
+    crl_pem_text = """\
+MIIBVjCBwAIBATANBgkqhkiG9w0BAQUFADB+MQswCQYDVQQGEwJBVTETMBEGA1UE
+CBMKU29tZS1TdGF0ZTEhMB8GA1UEChMYSW50ZXJuZXQgV2lkZ2l0cyBQdHkgTHRk
+MRUwEwYDVQQDEwxzbm1wbGFicy5jb20xIDAeBgkqhkiG9w0BCQEWEWluZm9Ac25t
+cGxhYnMuY29tFw0xMjA0MTExMzQwNTlaFw0xMjA1MTExMzQwNTlaoA4wDDAKBgNV
+HRQEAwIBATANBgkqhkiG9w0BAQUFAAOBgQC1D/wwnrcY/uFBHGc6SyoYss2kn+nY
+RTwzXmmldbNTCQ03x5vkWGGIaRJdN8QeCzbEi7gpgxgpxAx6Y5WkxkMQ1UPjNM5n
+DGVDOtR0dskFrrbHuNpWqWrDaBN0/ryZiWKjr9JRbrpkHgVY29I1gLooQ6IHuKHY
+vjnIhxTFoCb5vA==
+"""
+
+    ocsp_resp_pem_text = """\
+MIIEvQoBAKCCBLYwggSyBgkrBgEFBQcwAQEEggSjMIIEnzCCAQ+hgYAwfjELMAkGA1UEBhMCQVUx
+EzARBgNVBAgTClNvbWUtU3RhdGUxITAfBgNVBAoTGEludGVybmV0IFdpZGdpdHMgUHR5IEx0ZDEV
+MBMGA1UEAxMMc25tcGxhYnMuY29tMSAwHgYJKoZIhvcNAQkBFhFpbmZvQHNubXBsYWJzLmNvbRgP
+MjAxMjA0MTExNDA5MjJaMFQwUjA9MAkGBSsOAwIaBQAEFLdmsxX0LkOSjTdofXdwRl6mmDfCBBSS
+pHUspJ6+gUTrefyKxZWl6xB1cwIENd70z4IAGA8yMDEyMDQxMTE0MDkyMlqhIzAhMB8GCSsGAQUF
+BzABAgQSBBBjdJOiIW9EKJGELNNf/rdAMA0GCSqGSIb3DQEBBQUAA4GBADk7oRiCy4ew1u0N52QL
+RFpW+tdb0NfkV2Xyu+HChKiTThZPr9ZXalIgkJ1w3BAnzhbB0JX/zq7Pf8yEz/OrQ4GGH7HyD3Vg
+PkMu+J6I3A2An+bUQo99AmCbZ5/tSHtDYQMQt3iNbv1fk0yvDmh7UdKuXUNSyJdHeg27dMNy4k8A
+oIIC9TCCAvEwggLtMIICVqADAgECAgEBMA0GCSqGSIb3DQEBBQUAMH4xCzAJBgNVBAYTAkFVMRMw
+EQYDVQQIEwpTb21lLVN0YXRlMSEwHwYDVQQKExhJbnRlcm5ldCBXaWRnaXRzIFB0eSBMdGQxFTAT
+BgNVBAMTDHNubXBsYWJzLmNvbTEgMB4GCSqGSIb3DQEJARYRaW5mb0Bzbm1wbGFicy5jb20wHhcN
+MTIwNDExMTMyNTM1WhcNMTMwNDExMTMyNTM1WjB+MQswCQYDVQQGEwJBVTETMBEGA1UECBMKU29t
+ZS1TdGF0ZTEhMB8GA1UEChMYSW50ZXJuZXQgV2lkZ2l0cyBQdHkgTHRkMRUwEwYDVQQDEwxzbm1w
+bGFicy5jb20xIDAeBgkqhkiG9w0BCQEWEWluZm9Ac25tcGxhYnMuY29tMIGfMA0GCSqGSIb3DQEB
+AQUAA4GNADCBiQKBgQDDDU5HOnNV8I2CojxB8ilIWRHYQuaAjnjrETMOprouDHFXnwWqQo/I3m0b
+XYmocrh9kDefb+cgc7+eJKvAvBqrqXRnU38DmQU/zhypCftGGfP8xjuBZ1n23lR3hplN1yYA0J2X
+SgBaAg6e8OsKf1vcX8Es09rDo8mQpt4G2zR56wIDAQABo3sweTAJBgNVHRMEAjAAMCwGCWCGSAGG
++EIBDQQfFh1PcGVuU1NMIEdlbmVyYXRlZCBDZXJ0aWZpY2F0ZTAdBgNVHQ4EFgQU8Ys2dpJFLMHl
+yY57D4BNmlqnEcYwHwYDVR0jBBgwFoAU8Ys2dpJFLMHlyY57D4BNmlqnEcYwDQYJKoZIhvcNAQEF
+BQADgYEAWR0uFJVlQId6hVpUbgXFTpywtNitNXFiYYkRRv77McSJqLCa/c1wnuLmqcFcuRUK0oN6
+8ZJDP2HDDKe8MCZ8+sx+CF54eM8VCgN9uQ9XyE7x9XrXDd3Uw9RJVaWSIezkNKNeBE0lDM2jUjC4
+HAESdf7nebz1wtqAOXE1jWF/y8g=
+"""
+
+    def testCertificate(self):
+        substrate = bytearray(pem.readBase64fromText(self.cert_pem_text))
+        asn1Object, rest, found = spans.decode(substrate, rfc5280.Certificate())
+
+        self.assertFalse(rest)
+        self.assertEqual(['tbsCertificate'], list(found))
+        self.assertIs(substrate, found['tbsCertificate'].obj)
+        self.assertEqual(der_encoder(asn1Object['tbsCertificate']),
+                         bytes(found['tbsCertificate']))
+
+    def testCertificateList(self):
+        substrate = pem.readBase64fromText(self.crl_pem_text)
+        asn1Object, rest, found = spans.decode(substrate, rfc5280.CertificateList())
+
+        self.assertFalse(rest)
+        self.assertEqual(der_encoder(asn1Object['tbsCertList']),
+                         bytes(found['tbsCertList']))
+
+    def testBasicOCSPResponse(self):
+        substrate = pem.readBase64fromText(self.ocsp_resp_pem_text)
+        ocspResponse, rest = der_decoder(substrate, asn1Spec=rfc6960.OCSPResponse())
+        response = ocspResponse['responseBytes']['response'].asOctets()
+        asn1Object, rest, found = spans.decode(response, rfc6960.BasicOCSPResponse())
+
+        self.assertFalse(rest)
+        self.assertEqual(der_encoder(asn1Object['tbsResponseData']),
+                         bytes(found['tbsResponseData']))
+        self.assertEqual(bytes(found['tbsResponseData']),
+                         bytes(spans.tbsSpan(response)))
+
+    def testOtherSpec(self):
+        substrate = der_encoder(univ.Integer(5))
+        asn1Object, rest, found = spans.decode(substrate, univ.Integer())
+
+        self.assertEqual(5, asn1Object)
+        self.assertEqual({}, found)
+
+
+class SignedDataSpansTestCase(unittest.TestCase):
+    pem_text = """\
+MIIEJQYJKoZIhvcNAQcCoIIEFjCCBBICAQMxCzAJBgUrDgMCGgUAMIIDAgYIKwYBBQUHDAKgggL0
+BIIC8DCCAuwweDB2AgECBgorBgEEAYI3CgoBMWUwYwIBADADAgEBMVkwVwYJKwYBBAGCNxUUMUow
+SAIBBQwZcGl0dWNoYTEuZW1lYS5ocHFjb3JwLm5ldAwMRU1FQVxwaXR1Y2hhDBpDTUNSZXFHZW5l
+cmF0b3IudnNob3N0LmV4ZTCCAmqgggJmAgEBMIICXzCCAcgCAQAwADCBnzANBgkqhkiG9w0BAQEF
+AAOBjQAwgYkCgYEA0jm7SSSm2wyEAzuNKtFZFJKo91SrJq9wQwEhEKHDavZwMQOm1rZ2PF8NWCEb
+PqrhToQ7rtiGLSZa4dF4bzgmBqQ9aoSfEX4jISt31Vy+skHidXjHHpbsjT24NPhrZgANivL7CxD6
+Ft+s7qS1gL4HRm2twQkqSwOLrE/q2QeXl2UCAwEAAaCCAR0wGgYKKwYBBAGCNw0CAzEMFgo2LjIu
+OTIwMC4yMD4GCSqGSIb3DQEJDjExMC8wHQYDVR0OBBYEFMW2skn88gxhONWZQA4sWGBDb68yMA4G
+A1UdDwEB/wQEAwIHgDBXBgkrBgEEAYI3FRQxSjBIAgEFDBlwaXR1Y2hhMS5lbWVhLmhwcWNvcnAu
+bmV0DAxFTUVBXHBpdHVjaGEMGkNNQ1JlcUdlbmVyYXRvci52c2hvc3QuZXhlMGYGCisGAQQBgjcN
+AgIxWDBWAgECHk4ATQBpAGMAcgBvAHMAbwBmAHQAIABTAHQAcgBvAG4AZwAgAEMAcgB5AHAAdABv
+AGcAcgBhAHAAaABpAGMAIABQAHIAbwB2AGkAZABlAHIDAQAwDQYJKoZIhvcNAQEFBQADgYEAJZlu
+mxjtCxSOQi27jsVdd3y8NSIlzNv0b3LqmzvAly6L+CstXcnuG2MPQqPH9R7tbJonGUniBQO9sQ7C
+KhYWj2gfhiEkSID82lV5chINVUFKoUlSiEhWr0tPGgvOaqdsKQcrHfzrsBbFkhDqrFSVy7Yivbnh
+qYszKrOjJKiiCPMwADAAMYH5MIH2AgEDgBTFtrJJ/PIMYTjVmUAOLFhgQ2+vMjAJBgUrDgMCGgUA
+oD4wFwYJKoZIhvcNAQkDMQoGCCsGAQUFBwwCMCMGCSqGSIb3DQEJBDEWBBTFTkK/OifaFjwqHiJu
+xM7qXcg/VzANBgkqhkiG9w0BAQEFAASBgKfC6jOi1Wgy4xxDCQVK9+e5tktL8wE/j2cb9JSqq+aU
+5UxEgXEw7q7BoYZCAzcxMRriGzakXr8aXHcgkRJ7XcFvLPUjpmGg9SOZ2sGW4zQdWAwImN/i8loc
+xicQmJP+VoMHo/ZpjFY9fYCjNZUArgKsEwK/s+p9yrVVeB1Nf8Mn
+"""
+
+    def setUp(self):
+        substrate = pem.readBase64fromText(self.pem_text)
+        contentInfo, rest = der_decoder(substrate, asn1Spec=rfc5652.ContentInfo())
+        self.substrate = contentInfo['content'].asOctets()
+
+    def testDecode(self):
+        asn1Object, rest, found = spans.decode(self.substrate, rfc5652.SignedData())
+
+        self.assertFalse(rest)
+        self.assertEqual(['encapContentInfo.eContent', 'signerInfos.0.signedAttrs'],
+                         sorted(found))
+
+        eContent = asn1Object['encapContentInfo']['eContent']
+
+        self.assertEqual(eContent.asOctets(), bytes(found['encapContentInfo.eContent']))
+
+        signedAttrs = rfc5652.SignedAttributes()
+        signedAttrs.extend(asn1Object['signerInfos'][0]['signedAttrs'])
+        span = found['signerInfos.0.signedAttrs']
+
+        self.assertEqual(der_encoder(signedAttrs), b'\x31' + bytes(span[1:]))
+
+    def testSignedAttrsAbsent(self):
+        asn1Object, rest = der_decoder(self.substrate, asn1Spec=rfc5652.SignedData())
+        signerInfo = rfc5652.SignerInfo()
+        for name in ('version', 'sid', 'digestAlgorithm', 'signatureAlgorithm',
+                     'signature'):
+            signerInfo[name] = asn1Object['signerInfos'][0][name]
+        asn1Object['signerInfos'].append(signerInfo)
+        found = spans.signedAttrsSpans(der_encoder(asn1Object))
+
+        self.assertEqual(2, len(found))
+        self.assertEqual(1, found.count(None))
+
+    def testConstructedEContent(self):
+        asn1Object, rest = der_decoder(self.substrate, asn1Spec=rfc5652.SignedData())
+        substrate = ber_encoder(asn1Object, defMode=False, maxChunkSize=100)
+        chunks = spans.eContentSpans(substrate)
+        eContent = asn1Object['encapContentInfo']['eContent'].asOctets()
+
+        self.assertEqual(8, len(chunks))
+        self.assertEqual(eContent, b''.join(bytes(chunk) for chunk in chunks))
+        self.assertEqual(len(spans.signedAttrsSpans(substrate)), 1)
+
+        substrate = ber_encoder(asn1Object, maxChunkSize=100)
+        asn1Object, rest, found = spans.decode(substrate, rfc5652.SignedData())
+
+        self.assertEqual(['encapContentInfo.eContent.segments', 'signerInfos.0.signedAttrs'],
+                         sorted(found))
+        self.assertEqual(eContent, b''.join(
+            bytes(chunk) for chunk in found['encapContentInfo.eContent.segments']))
+
+    def testDetachedContent(self):
+        asn1Object, rest = der_decoder(self.substrate, asn1Spec=rfc5652.SignedData())
+        eContentType = asn1Object['encapContentInfo']['eContentType']
+        asn1Object['encapContentInfo'] = rfc5652.EncapsulatedContentInfo()
+        asn1Object['encapContentInfo']['eContentType'] = eContentType
+
+        substrate = der_encoder(asn1Object)
+
+        self.assertEqual([], spans.eContentSpans(substrate))
+        self.assertEqual(['signerInfos.0.signedAttrs'],
+                         sorted(spans.decode(substrate, rfc5652.SignedData())[2]))
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == '__main__':
+    result = unittest.TextTestRunner(verbosity=2).run(suite)
+    sys.exit(not result.wasSuccessful())
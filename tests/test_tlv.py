@@ -0,0 +1,163 @@
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+import io
+import sys
+import unittest
+
+from pyasn1 import error
+from pyasn1.codec.ber.encoder import encode as ber_encoder
+from pyasn1.codec.der.decoder import decode as der_decoder
+from pyasn1.codec.der.encoder import encode as der_encoder
+from pyasn1.type import tag
+from pyasn1.type import univ
+
+from pyasn1_alt_modules import pem
+from pyasn1_alt_modules import rfc5280
+from pyasn1_alt_modules import tlv
+
+
+class TlvTestCase(unittest.TestCase):
+    cert_pem_text = """\
+MIIC5zCCAlACAQEwDQYJKoZIhvcNAQEFBQAwgbsxJDAiBgNVBAcTG1ZhbGlDZXJ0
+IFZhbGlkYXRpb24gTmV0d29yazEXMBUGA1UEChMOVmFsaUNlcnQsIEluYy4xNTAz
+BgNVBAsTLFZhbGlDZXJ0IENsYXNzIDMgUG9saWN5IFZhbGlkYXRpb24gQXV0aG9y
+aXR5MSEwHwYDVQQDExhodHRwOi8vd3d3LnZhbGljZXJ0LmNvbS8xIDAeBgkqhkiG
+9w0BCQEWEWluZm9AdmFsaWNlcnQuY29tMB4XDTk5MDYyNjAwMjIzM1oXDTE5MDYy
+NjAwMjIzM1owgbsxJDAiBgNVBAcTG1ZhbGlDZXJ0IFZhbGlkYXRpb24gTmV0d29y
+azEXMBUGA1UEChMOVmFsaUNlcnQsIEluYy4xNTAzBgNVBAsTLFZhbGlDZXJ0IENs
+YXNzIDMgUG9saWN5IFZhbGlkYXRpb24gQXV0aG9yaXR5MSEwHwYDVQQDExhodHRw
+Oi8vd3d3LnZhbGljZXJ0LmNvbS8xIDAeBgkqhkiG9w0BCQEWEWluZm9AdmFsaWNl
+cnQuY29tMIGfMA0GCSqGSIb3DQEBAQUAA4GNADCBiQKBgQDjmFGWHOjVsQaBalfD
+cnWTq8+epvzzFlLWLU2fNUSoLgRNB0mKOCn1dzfnt6td3zZxFJmP3MKS8edgkpfs
+2Ejcv8ECIMYkpChMMFp2bbFc893enhBxoYjHW5tBbcqwuI4V7q0zK89HBFx1cQqY
+JJgpp0lZpd34t0NiYfPT4tBVPwIDAQABMA0GCSqGSIb3DQEBBQUAA4GBAFa7AliE
+Zwgs3x/be0kz9dNnnfS0ChCzycUs4pJqcXgn8nCDQtM+z6lU9PHYkhaM0QTLS6vJ
+n0WuPIqpsHEzXcjFV9+vqDWzf4mH6eglkrh/hXqu1rweN1gqZ8mRzyqBPu3GOd/A
+PhmcGcwTTYJBtYze4D1gCCAPRX5ron+jjBXu
+"""
+
+    crl_pem_text = """\
+MIIBVjCBwAIBATANBgkqhkiG9w0BAQUFADB+MQswCQYDVQQGEwJBVTETMBEGA1UE
+CBMKU29tZS1TdGF0ZTEhMB8GA1UEChMYSW50ZXJuZXQgV2lkZ2l0cyBQdHkgTHRk
+MRUwEwYDVQQDEwxzbm1wbGFicy5jb20xIDAeBgkqhkiG9w0BCQEWEWluZm9Ac25t
+cGxhYnMuY29tFw0xMjA0MTExMzQwNTlaFw0xMjA1MTExMzQwNTlaoA4wDDAKBgNV
+HRQEAwIBATANBgkqhkiG9w0BAQUFAAOBgQC1D/wwnrcY/uFBHGc6SyoYss2kn+nY
+RTwzXmmldbNTCQ03x5vkWGGIaRJdN8QeCzbEi7gpgxgpxAx6Y5WkxkMQ1UPjNM5n
+DGVDOtR0dskFrrbHuNpWqWrDaBN0/ryZiWKjr9JRbrpkHgVY29I1gLooQ6IHuKHY
+vjnIhxTFoCb5vA==
+"""
+
+    def setUp(self):
+        self.cert = pem.readBase64fromText(self.cert_pem_text)
+        self.crl = pem.readBase64fromText(self.crl_pem_text)
+        self.bundle = self.cert + self.crl + self.cert
+
+    def testDecodeHeader(self):
+        tagObj, headerLength, valueLength = tlv.decodeHeader(self.cert)
+
+        self.assertEqual(univ.Sequence.tagSet[0], tagObj)
+        self.assertEqual(4, headerLength)
+        self.assertEqual(len(self.cert) - 4, valueLength)
+
+        tagObj, headerLength, valueLength = tlv.decodeHeader(self.cert, 4)
+
+        self.assertEqual(univ.Sequence.tagSet[0], tagObj)
+
+    def testDecodeHeaderHighTag(self):
+        value = univ.Integer(7).subtype(
+            implicitTag=tag.Tag(tag.tagClassContext, tag.tagFormatSimple, 200))
+        substrate = der_encoder(value)
+
+        self.assertEqual((value.tagSet[0], 4, 1), tlv.decodeHeader(substrate))
+
+    def testReadHeader(self):
+        key, constructed, start, end = tlv.readHeader(self.cert, 0, len(self.cert))
+
+        self.assertEqual((0x10, 0x20, 4, len(self.cert)), (key, constructed, start, end))
+        self.assertEqual(0x10, tlv.readHeader(self.cert, start, end)[0])
+
+        value = univ.Integer(7).subtype(
+            implicitTag=tag.Tag(tag.tagClassContext, tag.tagFormatSimple, 200))
+        substrate = der_encoder(value)
+
+        self.assertEqual((0x80 | (200 << 8), 0, 4, 5),
+                         tlv.readHeader(substrate, 0, len(substrate)))
+
+        for substrate in (b'', b'\x30', b'\x1f\x81', b'\x04\x82\x01', b'\x04\x02\x00'):
+            self.assertRaises(error.SubstrateUnderrunError,
+                              tlv.readHeader, substrate, 0, len(substrate))
+        self.assertRaises(error.SubstrateUnderrunError,
+                          tlv.readHeader, self.cert, 0, len(self.cert) - 1)
+        self.assertRaises(error.PyAsn1Error, tlv.readHeader, b'\x30\x80\x00\x00', 0, 4)
+
+    def testEncodeLength(self):
+        for length in (0, 0x7F, 0x80, 0xFF, 0x100, 0x10000):
+            substrate = der_encoder(univ.OctetString(b'x' * length))
+            self.assertEqual(substrate[1:-length or None], tlv.encodeLength(length))
+
+    def testIndefiniteLength(self):
+        value = univ.SequenceOf(componentType=univ.OctetString())
+        value.extend([univ.OctetString(b'abc'), univ.OctetString(b'')])
+        substrate = ber_encoder(value, defMode=False)
+
+        self.assertIsNone(tlv.decodeHeader(substrate)[2])
+        self.assertEqual(len(substrate), tlv.tlvLength(substrate + b'\x05\x00'))
+
+    def testSplitTlvs(self):
+        slices = list(tlv.splitTlvs(self.bundle))
+
+        self.assertEqual(3, len(slices))
+        self.assertTrue(all(isinstance(x, memoryview) for x in slices))
+        self.assertEqual([self.cert, self.crl, self.cert], [bytes(x) for x in slices])
+
+        asn1Object, rest = der_decoder(
+            bytes(slices[1]), asn1Spec=rfc5280.CertificateList())
+
+        self.assertFalse(rest)
+        self.assertEqual(self.crl, der_encoder(asn1Object))
+
+    def testSplitTruncated(self):
+        slices = tlv.splitTlvs(self.bundle[:-1])
+
+        self.assertEqual(self.cert, bytes(next(slices)))
+        self.assertEqual(self.crl, bytes(next(slices)))
+        self.assertRaises(error.SubstrateUnderrunError, next, slices)
+
+    def testIterChildren(self):
+        children = list(tlv.iterChildren(self.crl))
+
+        self.assertEqual(3, len(children))
+        self.assertEqual([univ.Sequence.tagSet[0], univ.Sequence.tagSet[0],
+                          univ.BitString.tagSet[0]], [x[0] for x in children])
+        self.assertEqual(4, children[0][1])
+        self.assertEqual(len(self.crl), sum(x[2] for x in children) + 4)
+
+        value = univ.SequenceOf(componentType=univ.OctetString())
+        value.extend([univ.OctetString(b'abc'), univ.OctetString(b'')])
+        substrate = ber_encoder(value, defMode=False)
+
+        self.assertEqual([(univ.OctetString.tagSet[0], 2, 5),
+                          (univ.OctetString.tagSet[0], 7, 2)],
+                         list(tlv.iterChildren(substrate)))
+        self.assertRaises(error.PyAsn1Error, list,
+                          tlv.iterChildren(der_encoder(univ.Integer(1))))
+
+    def testReadTlvsFromFile(self):
+        tlvs = list(tlv.readTlvsFromFile(io.BytesIO(self.bundle)))
+
+        self.assertEqual([self.cert, self.crl, self.cert], tlvs)
+
+        tlvs = tlv.readTlvsFromFile(io.BytesIO(self.cert[:-1]))
+
+        self.assertRaises(error.SubstrateUnderrunError, next, tlvs)
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == '__main__':
+    result = unittest.TextTestRunner(verbosity=2).run(suite)
+    sys.exit(not result.wasSuccessful())
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+# Measure the throughput of bulk.decodeAll() on certificates as the
+# number of worker processes grows, against a plain decode loop.
+#
+# Usage: python tools/bench_bulk.py [number-of-certificates]
+#
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pyasn1.codec.der.decoder import decode as der_decoder
+
+from pyasn1_alt_modules import bulk
+from pyasn1_alt_modules import pem
+from pyasn1_alt_modules import rfc5280
+
+from bench_pem import pem_text
+
+
+def serialNumber(asn1Object):
+    return int(asn1Object['tbsCertificate']['serialNumber'])
+
+
+def main(count):
+    substrates = [pem.readBase64fromText(pem_text)] * count
+
+    start = time.perf_counter()
+    for substrate in substrates:
+        serialNumber(der_decoder(substrate, asn1Spec=rfc5280.Certificate())[0])
+    elapsed = time.perf_counter() - start
+    print('%-12s %8.3f s %10.0f certs/s' % ('serial loop', elapsed, count / elapsed))
+
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        start = time.perf_counter()
+        for result in bulk.decodeAll(substrates, rfc5280.Certificate,
+                                     serialNumber, maxWorkers=workers):
+            pass
+        elapsed = time.perf_counter() - start
+        print('%-12s %8.3f s %10.0f certs/s' % (
+            '%d workers' % workers, elapsed, count / elapsed))
+        workers *= 2
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000))
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+# Compare the memory held by decoded rfc5280.Certificate objects with
+# that held by certview.Certificate views of the same certificates, as
+# measured by tracemalloc, over every certificate found in the test
+# vectors.
+#
+# Usage: python tools/bench_certview.py [number-of-copies]
+#
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pyasn1.codec.der.decoder import decode as der_decoder
+
+from bench_projection import testCertificates
+
+from pyasn1_alt_modules import certview
+from pyasn1_alt_modules import rfc5280
+
+
+def measure(decoder, substrates):
+    start = time.perf_counter()
+    for substrate in substrates:
+        decoder(substrate)
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    held = [decoder(substrate) for substrate in substrates]
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del held
+    return size, elapsed
+
+
+def main(copies):
+    certificates = testCertificates()
+    substrates = [bytes(bytearray(substrate))
+                  for _ in range(copies) for substrate in certificates]
+    encoded = sum(len(substrate) for substrate in substrates)
+    count = len(substrates)
+    print('%d certificates, %.0f octets of DER each' % (count, encoded / count))
+
+    # decode once first, so that the one-time costs are not counted
+    der_decoder(certificates[0], asn1Spec=rfc5280.Certificate())
+    certview.decode(certificates[0])
+
+    for name, decoder in (
+            ('rfc5280.Certificate', lambda substrate: der_decoder(
+                substrate, asn1Spec=rfc5280.Certificate())[0]),
+            ('certview.Certificate', lambda substrate: certview.decode(substrate)[0])):
+        size, elapsed = measure(decoder, substrates)
+        print('%-22s %10.0f octets/cert %8.0f certs/s' % (
+            name, size / count, count / elapsed))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 10))
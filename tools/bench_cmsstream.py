@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+# Read a BER SignedData with a large indefinite-length eContent with
+# cmsstream.readSignedData(), from a file object that makes up the
+# encoding as it is read, and show the rate, and then the peak memory
+# that tracemalloc sees in a second run.  Then write an EnvelopedData
+# with as much encryptedContent with cmsstream.EnvelopedDataWriter, in
+# the same way.
+#
+# Usage: python tools/bench_cmsstream.py [megabytes-of-content]
+#
+import hashlib
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pyasn1.codec.der.encoder import encode as der_encoder
+
+from pyasn1_alt_modules import cmsstream
+from pyasn1_alt_modules import rfc5280
+from pyasn1_alt_modules import rfc5480
+from pyasn1_alt_modules import rfc5652
+from pyasn1_alt_modules import rfc3565
+
+SEGMENT = 1000
+
+
+class _GeneratedFile(object):
+    # a file object that reads from an iterator of byte strings
+
+    def __init__(self, pieces):
+        self.pieces = iter(pieces)
+        self.buffer = b''
+
+    def read(self, size):
+        while len(self.buffer) < size:
+            piece = next(self.pieces, None)
+            if piece is None:
+                break
+            self.buffer += piece
+        octets, self.buffer = self.buffer[:size], self.buffer[size:]
+        return octets
+
+
+def signedDataPieces(segments):
+    algorithm = rfc5280.AlgorithmIdentifier()
+    algorithm['algorithm'] = rfc5480.id_sha256
+    digestAlgorithms = rfc5652.DigestAlgorithmIdentifiers()
+    digestAlgorithms.append(algorithm)
+    yield (b'\x30\x80\x06\x09\x2a\x86\x48\x86\xf7\x0d\x01\x07\x02\xa0\x80\x30\x80' +
+           der_encoder(rfc5652.CMSVersion(1)) + der_encoder(digestAlgorithms) +
+           b'\x30\x80' + der_encoder(rfc5652.id_data) + b'\xa0\x80\x24\x80')
+    segment = b'\x04\x82' + SEGMENT.to_bytes(2, 'big') + bytes(SEGMENT)
+    for _ in range(segments):
+        yield segment
+    yield b'\x00\x00' * 3 + b'\x31\x00' + b'\x00\x00' * 3
+
+
+class _NullFile(object):
+    # a file object that counts what is written to it
+
+    def __init__(self):
+        self.length = 0
+
+    def write(self, octets):
+        self.length += len(octets)
+
+
+def envelopedData():
+    envelope = rfc5652.EnvelopedData()
+    envelope['version'] = 2
+    recipientInfo = rfc5652.RecipientInfo()
+    kekri = recipientInfo['kekri']
+    kekri['version'] = 4
+    kekri['kekid']['keyIdentifier'] = b'kek'
+    kekri['keyEncryptionAlgorithm']['algorithm'] = rfc3565.id_aes128_wrap
+    kekri['encryptedKey'] = bytes(24)
+    envelope['recipientInfos'].append(recipientInfo)
+    encryptedContentInfo = envelope['encryptedContentInfo']
+    encryptedContentInfo['contentType'] = rfc5652.id_data
+    algorithm = encryptedContentInfo['contentEncryptionAlgorithm']
+    algorithm['algorithm'] = rfc3565.id_aes128_CBC
+    algorithm['parameters'] = der_encoder(rfc3565.AES_IV(bytes(16)))
+    return envelope
+
+
+def writeEnvelopedData(segments):
+    fileObj = _NullFile()
+    segment = bytes(SEGMENT)
+    length = cmsstream.writeEnvelopedData(
+        fileObj, envelopedData(), (segment for _ in range(segments)))
+    return length, fileObj.length
+
+
+def main(megabytes):
+    segments = megabytes * 1000000 // SEGMENT
+    start = time.perf_counter()
+    result = cmsstream.readSignedData(_GeneratedFile(signedDataPieces(segments)))
+    elapsed = time.perf_counter() - start
+
+    expected = hashlib.sha256(bytes(SEGMENT * segments)).digest()
+    assert result.digests[rfc5480.id_sha256] == expected
+    print('%d octets of eContent in %.2f s, %.1f MB/s' % (
+        result.eContentLength, elapsed, result.eContentLength / elapsed / 1e6))
+
+    tracemalloc.start()
+    cmsstream.readSignedData(_GeneratedFile(signedDataPieces(segments)))
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print('peak %.1f kB traced' % (peak / 1e3))
+
+    start = time.perf_counter()
+    length, written = writeEnvelopedData(segments)
+    elapsed = time.perf_counter() - start
+    print('%d octets of encryptedContent, %d written in %.2f s, %.1f MB/s' % (
+        length, written, elapsed, length / elapsed / 1e6))
+
+    tracemalloc.start()
+    writeEnvelopedData(segments)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print('peak %.1f kB traced' % (peak / 1e3))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 100))
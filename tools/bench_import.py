@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+# Measure the startup cost of the package with "python -X importtime".
+#
+# For each module, a fresh interpreter imports it and the self and
+# cumulative times reported for that module are printed, along with
+# the cost of the bare package import and of importing every module.
+#
+# Usage: python tools/bench_import.py [module ...]
+#
+import os
+import subprocess
+import sys
+
+TOPDIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+sys.path.insert(0, TOPDIR)
+
+from pyasn1_alt_modules._index import modules
+
+
+def importTime(statement, target):
+    """Return (self, cumulative) import time in usec of the target module."""
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        capture_output=True, text=True, check=True, cwd=TOPDIR)
+    for line in proc.stderr.splitlines():
+        fields = [x.strip() for x in line.split('|')]
+        if len(fields) == 3 and fields[2] == target:
+            return int(fields[0].split(':')[1]), int(fields[1])
+    return 0, 0
+
+
+def main(names):
+    print('%-36s %10s %10s' % ('module', 'self(us)', 'cumul(us)'))
+
+    target = 'pyasn1_alt_modules'
+    print('%-36s %10d %10d' % ((target,) + importTime('import ' + target, target)))
+
+    for name in names or modules:
+        target = 'pyasn1_alt_modules.' + name
+        print('%-36s %10d %10d' % ((target,) + importTime('import ' + target, target)))
+
+    statement = '; '.join('import pyasn1_alt_modules.%s' % x for x in modules)
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        capture_output=True, text=True, check=True, cwd=TOPDIR)
+    total = sum(int(line.split('|')[0].split(':')[1])
+                for line in proc.stderr.splitlines()
+                if line.rstrip().endswith(tuple('.' + x for x in modules)))
+    print('%-36s %10d' % ('all %d modules (self)' % len(modules), total))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+# Compare a full decode of rfc5280.Certificate with constructing a
+# lazycert.LazyCertificate, alone and followed by reading the subject or
+# one extension, over every certificate found in the test vectors.
+#
+# Usage: python tools/bench_lazycert.py [number-of-rounds]
+#
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pyasn1.codec.der.decoder import decode as der_decoder
+
+from bench_projection import testCertificates
+
+from pyasn1_alt_modules import lazycert
+from pyasn1_alt_modules import rfc5280
+
+READERS = (
+    ('full decode', lambda substrate: der_decoder(
+        substrate, asn1Spec=rfc5280.Certificate())),
+    ('construct', lazycert.LazyCertificate),
+    ('construct + subject',
+     lambda substrate: lazycert.LazyCertificate(substrate).subject),
+    ('construct + basicConstraints',
+     lambda substrate: lazycert.LazyCertificate(substrate).extension(
+         rfc5280.id_ce_basicConstraints)),
+)
+
+
+def main(rounds):
+    certificates = testCertificates()
+    print('%d certificates, %d rounds' % (len(certificates), rounds))
+
+    for name, reader in READERS:
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for substrate in certificates:
+                reader(substrate)
+        elapsed = time.perf_counter() - start
+        count = rounds * len(certificates)
+        print('%-30s %10.1f us/cert' % (name, elapsed / count * 1e6))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 10))
@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+# Decode an RPKI manifest with many file names, using rfc9286.Manifest,
+# whose file names are checked with the pyasn1 PermittedAlphabetConstraint,
+# and a copy of it that uses alphabet.PermittedAlphabetConstraint.
+# The best time of the rounds is shown.
+#
+# Usage: python tools/bench_manifest.py [number-of-entries [number-of-rounds]]
+#
+import gc
+import hashlib
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pyasn1.codec.der.decoder import decode as der_decoder
+from pyasn1.type import char
+from pyasn1.type import constraint
+from pyasn1.type import namedtype
+from pyasn1.type import univ
+
+from pyasn1_alt_modules import alphabet
+from pyasn1_alt_modules import plan
+from pyasn1_alt_modules import rfc9286
+
+
+def _alphabetManifest():
+    fileName = rfc9286.FileAndHash.componentType['file'].asn1Object
+    for subtypeSpec in fileName.subtypeSpec:
+        if isinstance(subtypeSpec, constraint.PermittedAlphabetConstraint):
+            alphabetFileName = char.IA5String().subtype(subtypeSpec=(
+                alphabet.PermittedAlphabetConstraint(*subtypeSpec)))
+
+    class FileAndHash(univ.Sequence):
+        componentType = namedtype.NamedTypes(
+            namedtype.NamedType('file', alphabetFileName),
+            namedtype.NamedType('hash', univ.BitString()))
+
+    fileList = rfc9286.Manifest.componentType['fileList'].asn1Object
+
+    class Manifest(univ.Sequence):
+        componentType = namedtype.NamedTypes(*[
+            namedType.name == 'fileList' and namedtype.NamedType(
+                'fileList', fileList.clone(componentType=FileAndHash())) or namedType
+            for namedType in rfc9286.Manifest.componentType.namedTypes])
+
+    return Manifest
+
+
+def _tlv(tag, value):
+    length = len(value)
+    if length < 0x80:
+        return bytes([tag, length]) + value
+    octets = length.to_bytes((length.bit_length() + 7) // 8, 'big')
+    return bytes([tag, 0x80 | len(octets)]) + octets + value
+
+
+def makeManifest(entries):
+    fileList = b''.join(
+        _tlv(0x30, _tlv(0x16, ('%040X.roa' % n).encode()) +
+             _tlv(0x03, b'\x00' + hashlib.sha256(b'%d' % n).digest()))
+        for n in range(entries))
+    return _tlv(0x30, _tlv(0x02, b'\x01') +
+                _tlv(0x18, b'20260101000000Z') + _tlv(0x18, b'20260102000000Z') +
+                _tlv(0x06, bytes.fromhex('608648016503040201')) +
+                _tlv(0x30, fileList))
+
+
+def main(entries, rounds):
+    substrate = makeManifest(entries)
+    alphabetManifest = _alphabetManifest()
+    print('%d entries, %d octets' % (entries, len(substrate)))
+
+    fileNames = ['%040X.roa' % n for n in range(entries)]
+    for label, specClass in (('pyasn1 alphabet', rfc9286.Manifest),
+                             ('alphabet.py', alphabetManifest)):
+        fileList = specClass.componentType['fileList'].asn1Object
+        fileName = fileList.componentType.componentType['file'].asn1Object
+        start = time.perf_counter()
+        for value in fileNames:
+            fileName.subtypeSpec(value)
+        elapsed = time.perf_counter() - start
+        print('%-12s %-16s %7.3f s %6.2f us/entry' % (
+            'constraint', label, elapsed, elapsed / entries * 1e6))
+
+    specs = (('pyasn1 alphabet', rfc9286.Manifest), ('alphabet.py', alphabetManifest))
+    for name, decoder in (
+            ('der_decoder', lambda substrate, asn1Spec: der_decoder(
+                substrate, asn1Spec=asn1Spec)),
+            ('plan', plan.decode)):
+        best = {}
+        for _ in range(rounds):
+            for label, specClass in specs:
+                gc.collect()
+                start = time.perf_counter()
+                asn1Object, rest = decoder(substrate, specClass())
+                elapsed = time.perf_counter() - start
+                assert len(asn1Object['fileList']) == entries
+                del asn1Object
+                best[label] = min(best.get(label, elapsed), elapsed)
+        for label, specClass in specs:
+            print('%-12s %-16s %7.3f s %6.2f us/entry' % (
+                name, label, best[label], best[label] / entries * 1e6))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 50000,
+                  int(sys.argv[2]) if len(sys.argv) > 2 else 3))
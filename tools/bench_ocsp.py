@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+# Make the tbsResponseData of many OCSP responses by building and
+# encoding rfc6960 objects, and with ocsp.ResponseTemplate, and show
+# the rate of each.  Then look up the status of each CertID in a batch
+# of OCSPRequests, decoded as rfc6960 objects, and with
+# ocsp.requestCertIDs() and ocsp.CertIDIndex.
+#
+# Usage: python tools/bench_ocsp.py [responses [requests [certids-per-request]]]
+#
+import datetime
+import hashlib
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pyasn1.codec.der.decoder import decode as der_decoder
+from pyasn1.codec.der.encoder import encode as der_encoder
+from pyasn1.type import univ
+
+from pyasn1_alt_modules import ocsp
+from pyasn1_alt_modules import rfc4055
+from pyasn1_alt_modules import rfc5480
+from pyasn1_alt_modules import rfc6960
+
+ISSUER_NAME_HASH = hashlib.sha1(b'issuer name').digest()
+
+ISSUER_KEY_HASH = hashlib.sha1(b'issuer key').digest()
+
+
+def statuses(count):
+    # every tenth certificate is revoked
+    thisUpdate = datetime.datetime(2026, 10, 18, 12, 0, 0)
+    nextUpdate = thisUpdate + datetime.timedelta(days=7)
+    revocationTime = datetime.datetime(2026, 1, 2, 3, 4, 5)
+    for n in range(count):
+        serialNumber = 0x4000000000000000 + n * 7919
+        if n % 10:
+            yield serialNumber, thisUpdate, 'good', nextUpdate, None
+        else:
+            yield serialNumber, thisUpdate, 'revoked', nextUpdate, revocationTime
+
+
+def buildTbsResponseData(serialNumber, thisUpdate, certStatus, nextUpdate,
+                         revocationTime):
+    tbsResponseData = rfc6960.ResponseData()
+    tbsResponseData['responderID']['byKey'] = ISSUER_KEY_HASH
+    tbsResponseData['producedAt'] = thisUpdate.strftime('%Y%m%d%H%M%SZ')
+    single = rfc6960.SingleResponse()
+    certID = single['certID']
+    certID['hashAlgorithm']['algorithm'] = rfc5480.id_sha1
+    certID['issuerNameHash'] = ISSUER_NAME_HASH
+    certID['issuerKeyHash'] = ISSUER_KEY_HASH
+    certID['serialNumber'] = serialNumber
+    status = single['certStatus']
+    if certStatus == 'revoked':
+        status['revoked']['revocationTime'] = revocationTime.strftime('%Y%m%d%H%M%SZ')
+    else:
+        status['good'] = status.componentType['good'].asn1Object.clone('')
+    single['thisUpdate'] = thisUpdate.strftime('%Y%m%d%H%M%SZ')
+    single['nextUpdate'] = nextUpdate.strftime('%Y%m%d%H%M%SZ')
+    tbsResponseData['responses'].append(single)
+    return der_encoder(tbsResponseData)
+
+
+def prototype():
+    tbsResponseData, rest = der_decoder(
+        buildTbsResponseData(*next(statuses(1))), asn1Spec=rfc6960.ResponseData())
+    basicOCSPResponse = rfc6960.BasicOCSPResponse()
+    basicOCSPResponse['tbsResponseData'] = tbsResponseData
+    basicOCSPResponse['signatureAlgorithm']['algorithm'] = \
+        rfc4055.sha256WithRSAEncryption
+    basicOCSPResponse['signature'] = univ.BitString.fromOctetString(bytes(256))
+    return basicOCSPResponse
+
+
+def _tlv(tag, value):
+    length = len(value)
+    if length < 0x80:
+        return bytes([tag, length]) + value
+    octets = length.to_bytes((length.bit_length() + 7) // 8, 'big')
+    return bytes([tag, 0x80 | len(octets)]) + octets + value
+
+
+def makeRequests(count, perRequest):
+    algorithm = rfc6960.AlgorithmIdentifier()
+    algorithm['algorithm'] = rfc5480.id_sha1
+    certIDHead = (der_encoder(algorithm) + _tlv(0x04, ISSUER_NAME_HASH) +
+                  _tlv(0x04, ISSUER_KEY_HASH))
+    entries = [
+        _tlv(0x30, _tlv(0x30, certIDHead + der_encoder(univ.Integer(serialNumber))))
+        for serialNumber, thisUpdate, certStatus, nextUpdate, revocationTime
+        in statuses(count)]
+    return [_tlv(0x30, _tlv(0x30, _tlv(0x30, b''.join(entries[idx:idx + perRequest]))))
+            for idx in range(0, count, perRequest)]
+
+
+def lookupDecoded(requests, table):
+    found = []
+    for substrate in requests:
+        ocspRequest, rest = der_decoder(substrate, asn1Spec=rfc6960.OCSPRequest())
+        for request in ocspRequest['tbsRequest']['requestList']:
+            certID = request['reqCert']
+            found.append(table.get(
+                (certID['issuerKeyHash'].asOctets(), int(certID['serialNumber']))))
+    return found
+
+
+def lookupIndexed(requests, index):
+    found = []
+    for substrate in requests:
+        found.extend(index.lookup(ocsp.requestCertIDs(substrate)))
+    return found
+
+
+def benchRequests(count, perRequest):
+    requests = makeRequests(count, perRequest)
+    table = {}
+    index = ocsp.CertIDIndex()
+    for serialNumber, thisUpdate, certStatus, nextUpdate, revocationTime in statuses(count):
+        table[(ISSUER_KEY_HASH, serialNumber)] = certStatus
+        index.add(ISSUER_KEY_HASH, serialNumber, certStatus)
+    print('%d CertIDs in %d OCSPRequests, %d octets' % (
+        count, len(requests), sum(len(request) for request in requests)))
+
+    times = {}
+    for label, lookup, statusTable in (('rfc6960', lookupDecoded, table),
+                                       ('requestCertIDs', lookupIndexed, index)):
+        start = time.perf_counter()
+        found = lookup(requests, statusTable)
+        times[label] = time.perf_counter() - start
+        assert found == [value[2] for value in statuses(count)]
+        print('%-14s %7.3f s %8.2f us/CertID' % (
+            label, times[label], times[label] / count * 1e6))
+    print('speedup %.0fx' % (times['rfc6960'] / times['requestCertIDs']))
+
+
+def main(count, requests, perRequest):
+    template = ocsp.ResponseTemplate(prototype())
+    values = list(statuses(count))
+    for value in values[:100]:
+        assert buildTbsResponseData(*value) == template.tbsResponseData(
+            value[0], value[1], value[2], value[3], revocationTime=value[4])
+
+    start = time.perf_counter()
+    for value in values:
+        buildTbsResponseData(*value)
+    built = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for serialNumber, thisUpdate, certStatus, nextUpdate, revocationTime in values:
+        template.tbsResponseData(serialNumber, thisUpdate, certStatus, nextUpdate,
+                                 revocationTime=revocationTime)
+    spliced = time.perf_counter() - start
+
+    for label, elapsed in (('rfc6960', built), ('template', spliced)):
+        print('%-10s %7.3f s %8.2f us/response %9.0f responses/s' % (
+            label, elapsed, elapsed / count * 1e6, count / elapsed))
+    print('speedup %.0fx' % (built / spliced))
+
+    benchRequests(requests, perRequest)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000,
+                  int(sys.argv[2]) if len(sys.argv) > 2 else 10000,
+                  int(sys.argv[3]) if len(sys.argv) > 3 else 10))
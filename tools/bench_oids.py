@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+# Compare ways of finding the spec of a certificate extension in
+# certificateExtensionsMap from the content octets of its extnID, over
+# every extension of every certificate found in the test vectors.
+#
+# Usage: python tools/bench_oids.py [number-of-rounds]
+#
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pyasn1.type import univ
+
+from bench_projection import testCertificates
+
+from pyasn1_alt_modules import lazycert
+from pyasn1_alt_modules import oids
+from pyasn1_alt_modules import rfc5280
+
+_extensionSpecs = oids.OctetsKeyedMap(rfc5280.certificateExtensionsMap)
+
+DISPATCHERS = (
+    ('parse arcs + ObjectIdentifier', lambda octets:
+     rfc5280.certificateExtensionsMap.get(
+         univ.ObjectIdentifier(oids.decodeContents(octets)))),
+    ('oids.intern()', lambda octets:
+     rfc5280.certificateExtensionsMap.get(oids.intern(octets))),
+    ('oids.OctetsKeyedMap', _extensionSpecs.get),
+)
+
+
+def main(rounds):
+    extnIDs = []
+    for substrate in testCertificates():
+        certificate = lazycert.LazyCertificate(substrate)
+        for extnID in certificate.extensionIDs():
+            extnIDs.append(oids.encodeContents(extnID))
+    print('%d extensions, %d rounds' % (len(extnIDs), rounds))
+
+    for name, dispatch in DISPATCHERS:
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for octets in extnIDs:
+                dispatch(octets)
+        elapsed = time.perf_counter() - start
+        count = rounds * len(extnIDs)
+        print('%-30s %10.0f ns/extension' % (name, elapsed / count * 1e9))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 100))
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+# Compare reading every block of a large PEM bundle with repeated calls
+# to pem.readPemFromFile(), with pem.iterPemBlocksFromFile(), and with
+# pem.PemBundle, then time reopening a PemBundle from its saved index.
+#
+# Usage: python tools/bench_pem.py [number-of-blocks]
+#
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pyasn1_alt_modules import pem
+
+pem_text = """\
+MIIC5zCCAlACAQEwDQYJKoZIhvcNAQEFBQAwgbsxJDAiBgNVBAcTG1ZhbGlDZXJ0
+IFZhbGlkYXRpb24gTmV0d29yazEXMBUGA1UEChMOVmFsaUNlcnQsIEluYy4xNTAz
+BgNVBAsTLFZhbGlDZXJ0IENsYXNzIDMgUG9saWN5IFZhbGlkYXRpb24gQXV0aG9y
+aXR5MSEwHwYDVQQDExhodHRwOi8vd3d3LnZhbGljZXJ0LmNvbS8xIDAeBgkqhkiG
+9w0BCQEWEWluZm9AdmFsaWNlcnQuY29tMB4XDTk5MDYyNjAwMjIzM1oXDTE5MDYy
+NjAwMjIzM1owgbsxJDAiBgNVBAcTG1ZhbGlDZXJ0IFZhbGlkYXRpb24gTmV0d29y
+azEXMBUGA1UEChMOVmFsaUNlcnQsIEluYy4xNTAzBgNVBAsTLFZhbGlDZXJ0IENs
+YXNzIDMgUG9saWN5IFZhbGlkYXRpb24gQXV0aG9yaXR5MSEwHwYDVQQDExhodHRw
+Oi8vd3d3LnZhbGljZXJ0LmNvbS8xIDAeBgkqhkiG9w0BCQEWEWluZm9AdmFsaWNl
+cnQuY29tMIGfMA0GCSqGSIb3DQEBAQUAA4GNADCBiQKBgQDjmFGWHOjVsQaBalfD
+cnWTq8+epvzzFlLWLU2fNUSoLgRNB0mKOCn1dzfnt6td3zZxFJmP3MKS8edgkpfs
+2Ejcv8ECIMYkpChMMFp2bbFc893enhBxoYjHW5tBbcqwuI4V7q0zK89HBFx1cQqY
+JJgpp0lZpd34t0NiYfPT4tBVPwIDAQABMA0GCSqGSIb3DQEBBQUAA4GBAFa7AliE
+Zwgs3x/be0kz9dNnnfS0ChCzycUs4pJqcXgn8nCDQtM+z6lU9PHYkhaM0QTLS6vJ
+n0WuPIqpsHEzXcjFV9+vqDWzf4mH6eglkrh/hXqu1rweN1gqZ8mRzyqBPu3GOd/A
+PhmcGcwTTYJBtYze4D1gCCAPRX5ron+jjBXu
+"""
+
+
+def writeBundle(fileObj, count):
+    block = ('# Subject: ValiCert Class 3\n'
+             '-----BEGIN CERTIFICATE-----\n' + pem_text +
+             '-----END CERTIFICATE-----\n\n')
+    for _ in range(count):
+        fileObj.write(block)
+
+
+def lineReader(filename):
+    count = 0
+    with open(filename) as fileObj:
+        while pem.readPemFromFile(fileObj):
+            count += 1
+    return count
+
+
+def streamReader(filename):
+    count = 0
+    with open(filename, 'rb') as fileObj:
+        for label, substrate, offset in pem.iterPemBlocksFromFile(fileObj):
+            count += 1
+    return count
+
+
+def bundleReader(filename):
+    with pem.PemBundle(filename) as bundle:
+        for label, substrate, offset in bundle:
+            pass
+        bundle.save()
+        return len(bundle)
+
+
+def bundleReopen(filename):
+    with pem.PemBundle(filename) as bundle:
+        label, substrate, offset = bundle[len(bundle) // 2]
+        return 1
+
+
+def main(count):
+    with tempfile.NamedTemporaryFile('w', suffix='.pem', delete=False) as fileObj:
+        writeBundle(fileObj, count)
+        filename = fileObj.name
+
+    try:
+        print('%d blocks, %.1f MB' % (count, os.path.getsize(filename) / 1e6))
+        for name, reader in (('readPemFromFile loop', lineReader),
+                             ('iterPemBlocksFromFile', streamReader),
+                             ('PemBundle', bundleReader),
+                             ('PemBundle reopen + [n/2]', bundleReopen)):
+            start = time.perf_counter()
+            blocks = reader(filename)
+            elapsed = time.perf_counter() - start
+            print('%-26s %8.4f s %10.0f blocks/s' % (name, elapsed, blocks / elapsed))
+    finally:
+        os.unlink(filename)
+        if os.path.exists(filename + '.idx'):
+            os.unlink(filename + '.idx')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000))
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+# Make a PFX with many CertBags, each with a localKeyId, and a shrouded
+# key bag at the end, and fetch the key with pkcs12.PFXReader.find()
+# and by decoding the whole PFX with the DER decoder.
+#
+# Usage: python tools/bench_pkcs12.py [number-of-bags [number-of-rounds]]
+#
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pyasn1.codec.der.decoder import decode as der_decoder
+from pyasn1.codec.der.encoder import encode as der_encoder
+from pyasn1.type import univ
+
+from pyasn1_alt_modules import pkcs12
+from pyasn1_alt_modules import rfc5652
+from pyasn1_alt_modules import rfc7292
+
+from bench_projection import testCertificates
+
+
+def _bag(bagId, value, keyId):
+    bag = rfc7292.SafeBag()
+    bag['bagId'] = bagId
+    bag['bagValue'] = der_encoder(value)
+    attribute = rfc7292.PKCS12Attribute()
+    attribute['attrType'] = rfc7292.pkcs_9_at_localKeyId
+    attribute['attrValues'].append(der_encoder(univ.OctetString(keyId)))
+    bag['bagAttributes'].append(attribute)
+    return bag
+
+
+def makePfx(bags):
+    certificates = testCertificates()
+    safeContents = rfc7292.SafeContents()
+    for n in range(bags):
+        certBag = rfc7292.CertBag()
+        certBag['certId'] = rfc7292.x509Certificate['certId']
+        certBag['certValue'] = der_encoder(
+            univ.OctetString(certificates[n % len(certificates)]))
+        safeContents.append(_bag(rfc7292.id_certBag, certBag, b'%d' % n))
+
+    shroudedKey = rfc7292.PKCS8ShroudedKeyBag()
+    shroudedKey['encryptionAlgorithm']['algorithm'] = \
+        rfc7292.pbeWithSHAAnd3_KeyTripleDES_CBC
+    shroudedKey['encryptedData'] = bytes(1200)
+    safeContents.append(_bag(rfc7292.id_pkcs8ShroudedKeyBag, shroudedKey, b'key'))
+
+    contentInfo = rfc5652.ContentInfo()
+    contentInfo['contentType'] = rfc5652.id_data
+    contentInfo['content'] = der_encoder(univ.OctetString(der_encoder(safeContents)))
+    authSafe = rfc7292.AuthenticatedSafe()
+    authSafe.append(contentInfo)
+
+    pfx = rfc7292.PFX()
+    pfx['version'] = 3
+    pfx['authSafe']['contentType'] = rfc5652.id_data
+    pfx['authSafe']['content'] = der_encoder(univ.OctetString(der_encoder(authSafe)))
+    return der_encoder(pfx)
+
+
+def eagerFind(substrate, keyId):
+    pfx, rest = der_decoder(substrate, asn1Spec=rfc7292.PFX())
+    octets, rest = der_decoder(pfx['authSafe']['content'], asn1Spec=univ.OctetString())
+    authSafe, rest = der_decoder(octets, asn1Spec=rfc7292.AuthenticatedSafe())
+    for contentInfo in authSafe:
+        octets, rest = der_decoder(contentInfo['content'], asn1Spec=univ.OctetString())
+        safeContents, rest = der_decoder(
+            octets, asn1Spec=rfc7292.SafeContents(), decodeOpenTypes=True)
+        for bag in safeContents:
+            for attribute in bag['bagAttributes']:
+                if (attribute['attrType'] == rfc7292.pkcs_9_at_localKeyId and
+                        attribute['attrValues'][0] == keyId):
+                    return bag['bagValue']
+
+
+def lazyFind(substrate, keyId):
+    return pkcs12.PFXReader(substrate).find(localKeyId=keyId).value()
+
+
+def main(bags, rounds):
+    substrate = makePfx(bags)
+    print('%d bags, %d octets' % (bags + 1, len(substrate)))
+    assert (der_encoder(eagerFind(substrate, b'key')) ==
+            der_encoder(lazyFind(substrate, b'key')))
+    for label, find in (('der_decoder', eagerFind), ('PFXReader', lazyFind)):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            find(substrate, b'key')
+        elapsed = (time.perf_counter() - start) / rounds
+        print('%-12s %8.2f ms per key' % (label, elapsed * 1e3))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 50,
+                  int(sys.argv[2]) if len(sys.argv) > 2 else 20))
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+# Compare the DER decoder with plan.decode() and with the generated
+# decoders of codegen.decode() for the hot types, over
+# every Certificate, CertificateList, SignedData, BasicOCSPResponse, and
+# TSTInfo found in the test vectors.
+#
+# Usage: python tools/bench_plan.py [number-of-rounds]
+#
+import glob
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pyasn1.codec.der.decoder import decode as der_decoder
+
+from pyasn1_alt_modules import codegen
+from pyasn1_alt_modules import pem
+from pyasn1_alt_modules import plan
+from pyasn1_alt_modules import rfc3161
+from pyasn1_alt_modules import rfc5280
+from pyasn1_alt_modules import rfc5652
+from pyasn1_alt_modules import rfc6960
+
+
+def _decodes(substrate, asn1Spec):
+    try:
+        asn1Object, rest = der_decoder(substrate, asn1Spec=asn1Spec)
+    except Exception:
+        return None
+    if rest:
+        return None
+    return asn1Object
+
+
+def testVectors():
+    topDir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    vectors = dict((specClass, []) for specClass in (
+        rfc5280.Certificate, rfc5280.CertificateList, rfc5652.SignedData,
+        rfc6960.BasicOCSPResponse, rfc3161.TSTInfo))
+    for filename in sorted(glob.glob(os.path.join(topDir, 'tests', 'test_*.py'))):
+        with open(filename) as fileObj:
+            text = fileObj.read()
+        for match in re.finditer(r'"""\\\n([A-Za-z0-9+/=\n]+)"""', text):
+            try:
+                substrate = pem.readBase64fromText(match.group(1))
+            except Exception:
+                continue
+            for specClass in (rfc5280.Certificate, rfc5280.CertificateList):
+                if _decodes(substrate, specClass()) is not None:
+                    vectors[specClass].append(substrate)
+            contentInfo = _decodes(substrate, rfc5652.ContentInfo())
+            timeStampResp = _decodes(substrate, rfc3161.TimeStampResp())
+            if (timeStampResp is not None and
+                    timeStampResp['timeStampToken'].isValue):
+                contentInfo = timeStampResp['timeStampToken']
+            if (contentInfo is not None and
+                    contentInfo['contentType'] == rfc5652.id_signedData):
+                content = contentInfo['content'].asOctets()
+                signedData = _decodes(content, rfc5652.SignedData())
+                if signedData is not None:
+                    vectors[rfc5652.SignedData].append(content)
+                    encap = signedData['encapContentInfo']
+                    if (encap['eContentType'] == rfc3161.id_ct_TSTInfo and
+                            encap['eContent'].isValue):
+                        vectors[rfc3161.TSTInfo].append(
+                            encap['eContent'].asOctets())
+            ocspResponse = _decodes(substrate, rfc6960.OCSPResponse())
+            if (ocspResponse is not None and
+                    ocspResponse['responseBytes'].isValue):
+                vectors[rfc6960.BasicOCSPResponse].append(
+                    ocspResponse['responseBytes']['response'].asOctets())
+    return vectors
+
+
+def timeDecoder(decoder, specClass, substrates, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for substrate in substrates:
+            decoder(substrate, specClass())
+    return time.perf_counter() - start
+
+
+def main(rounds):
+    vectors = testVectors()
+    print('%d rounds' % rounds)
+
+    for specClass, substrates in vectors.items():
+        if not substrates:
+            continue
+        plan.compileSpec(specClass())
+        derTime = timeDecoder(
+            lambda substrate, asn1Spec: der_decoder(substrate, asn1Spec=asn1Spec),
+            specClass, substrates, rounds)
+        planTime = timeDecoder(plan.decode, specClass, substrates, rounds)
+        codegenTime = timeDecoder(codegen.decode, specClass, substrates, rounds)
+        count = rounds * len(substrates)
+        print('%-18s %4d objects  der_decoder %6.0f/s  plan %6.0f/s %5.2fx'
+              '  codegen %6.0f/s %5.2fx' % (
+                  specClass.__name__, len(substrates), count / derTime,
+                  count / planTime, derTime / planTime,
+                  count / codegenTime, derTime / codegenTime))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 10))
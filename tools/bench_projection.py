@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+# Compare a full decode of rfc5280.Certificate with decodes that are
+# projected onto a few fields, over every certificate found in the
+# test vectors.
+#
+# Usage: python tools/bench_projection.py [number-of-rounds]
+#
+import glob
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pyasn1.codec.der.decoder import decode as der_decoder
+
+from pyasn1_alt_modules import pem
+from pyasn1_alt_modules import projection
+from pyasn1_alt_modules import rfc5280
+
+PROJECTIONS = (
+    ('full decode', None),
+    ('serialNumber', ('tbsCertificate.serialNumber',)),
+    ('issuer + serialNumber', ('tbsCertificate.issuer',
+                               'tbsCertificate.serialNumber')),
+    ('extensions', ('tbsCertificate.extensions',)),
+)
+
+
+def testCertificates():
+    topDir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    certificates = []
+    for filename in sorted(glob.glob(os.path.join(topDir, 'tests', 'test_*.py'))):
+        with open(filename) as fileObj:
+            text = fileObj.read()
+        for match in re.finditer(r'"""\\\n([A-Za-z0-9+/=\n]+)"""', text):
+            try:
+                substrate = pem.readBase64fromText(match.group(1))
+                asn1Object, rest = der_decoder(
+                    substrate, asn1Spec=rfc5280.Certificate())
+            except Exception:
+                continue
+            if not rest:
+                certificates.append(substrate)
+    return certificates
+
+
+def main(rounds):
+    certificates = testCertificates()
+    print('%d certificates, %d rounds' % (len(certificates), rounds))
+
+    for name, paths in PROJECTIONS:
+        if paths is None:
+            asn1Spec = rfc5280.Certificate()
+        else:
+            asn1Spec = projection.projectSpec(rfc5280.Certificate(), *paths)
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for substrate in certificates:
+                der_decoder(substrate, asn1Spec=asn1Spec)
+        elapsed = time.perf_counter() - start
+        count = rounds * len(certificates)
+        print('%-22s %8.3f s %10.0f certs/s' % (name, elapsed, count / elapsed))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 10))
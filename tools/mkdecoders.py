@@ -0,0 +1,35 @@
+#!/usr/bin/env python
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+# Regenerate pyasn1_alt_modules/_decoders.py, which holds the generated
+# DER decoders used by codegen.decode() for the specs listed in
+# codegen.DEFAULT_SPECS.  Run it again after changing any of those specs;
+# until then codegen.decode() notices the changed fingerprint and uses
+# the generic plan.decode() for them.
+#
+# Usage: python tools/mkdecoders.py
+#
+import os
+import sys
+
+TOPDIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+sys.path.insert(0, TOPDIR)
+
+from pyasn1_alt_modules import codegen
+
+
+def main():
+    filename = os.path.join(TOPDIR, 'pyasn1_alt_modules', '_decoders.py')
+    with open(filename, 'w') as fileObj:
+        fileObj.write(codegen.generate())
+    print('wrote %s' % filename)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
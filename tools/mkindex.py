@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+# Regenerate pyasn1_alt_modules/_index.py, which holds:
+#
+#  - the list of modules used by the lazy-loading package facade, and
+#  - for every opentype map, the module that registers each key.
+#
+# The modules are imported one at a time in dependency order, and the
+# keys that appear in the opentype maps after each import are credited
+# to that module.
+#
+# Usage: python tools/mkindex.py
+#
+import ast
+import importlib
+import os
+import sys
+
+TOPDIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PKGDIR = os.path.join(TOPDIR, 'pyasn1_alt_modules')
+
+PKGNAME = 'pyasn1_alt_modules'
+
+HEADER = """\
+#
+# This file is part of pyasn1-alt-modules software.
+#
+# Copyright (c) 2021-2026, Vigil Security, LLC
+# License: http://vigilsec.com/pyasn1-alt-modules-license.txt
+#
+# Generated by tools/mkindex.py -- do not edit.
+#
+"""
+
+
+def listModules():
+    """Return the sorted names of the public modules in the package."""
+    return sorted(
+        name[:-3] for name in os.listdir(PKGDIR)
+        if name.endswith('.py') and not name.startswith('_'))
+
+
+def moduleDependencies(name):
+    """Return the package modules imported by the named module."""
+    with open(os.path.join(PKGDIR, name + '.py'), 'rb') as fileObj:
+        tree = ast.parse(fileObj.read())
+
+    deps = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.module:
+            if node.module == PKGNAME:
+                deps.update(alias.name for alias in node.names)
+            elif node.module.startswith(PKGNAME + '.'):
+                deps.add(node.module[len(PKGNAME) + 1:])
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.name.startswith(PKGNAME + '.'):
+                    deps.add(alias.name[len(PKGNAME) + 1:])
+
+    deps.discard(name)
+    return sorted(deps)
+
+
+def dependencyOrder(modules):
+    """Return the modules so that each one follows its dependencies."""
+    order = []
+    seen = set()
+
+    def visit(name):
+        if name in seen:
+            return
+        seen.add(name)
+        for dep in moduleDependencies(name):
+            visit(dep)
+        order.append(name)
+
+    for name in modules:
+        visit(name)
+
+    return order
+
+
+def indexOpenTypeMaps(modules):
+    """Return {map name: {key: module name}} for all opentype maps."""
+    sys.path.insert(0, TOPDIR)
+
+    from pyasn1_alt_modules import opentypemap
+
+    index = {}
+    for name in dependencyOrder(modules):
+        before = dict((mapName, set(typeMap))
+                      for mapName, typeMap in opentypemap.map_of_opentype_maps.items())
+
+        importlib.import_module(PKGNAME + '.' + name)
+
+        for mapName, typeMap in opentypemap.map_of_opentype_maps.items():
+            for key in set(typeMap) - before.get(mapName, set()):
+                index.setdefault(mapName, {})[key] = name
+
+    return index
+
+
+def renderKey(key):
+    if hasattr(key, 'asTuple'):
+        return "'%s'" % '.'.join(str(x) for x in key)
+    return '%d' % int(key)
+
+
+def sortKey(key):
+    if hasattr(key, 'asTuple'):
+        return tuple(key)
+    return (int(key),)
+
+
+def render(modules, opentypeMaps):
+    lines = [HEADER, 'modules = (']
+    lines.extend("    '%s'," % name for name in modules)
+    lines.append(')')
+    lines.append('')
+    lines.append('opentypeMaps = {')
+    for mapName in sorted(opentypeMaps):
+        typeMap = opentypeMaps[mapName]
+        lines.append("    '%s': {" % mapName)
+        lines.extend("        %s: '%s'," % (renderKey(key), typeMap[key])
+                     for key in sorted(typeMap, key=sortKey))
+        lines.append('    },')
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+def main():
+    modules = listModules()
+    text = render(modules, indexOpenTypeMaps(modules))
+    filename = os.path.join(PKGDIR, '_index.py')
+    with open(filename, 'w') as fileObj:
+        fileObj.write(text)
+    print('wrote %s' % filename)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())